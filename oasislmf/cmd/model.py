@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import functools
 import io
 import json
 import os
@@ -21,6 +22,15 @@ from ..utils.peril import PerilAreasIndex
 from ..utils.values import get_utctimestamp
 
 from ..keys.lookup import OasisLookupFactory
+from ..keys.remote import (
+    DEFAULT_REMOTE_KEYS_BATCH_SIZE,
+    DEFAULT_REMOTE_KEYS_MAX_IN_FLIGHT,
+    RemoteKeysLookup,
+)
+from ..keys.server import (
+    LookupClient,
+    LookupServer,
+)
 
 from .cleaners import as_path
 
@@ -54,6 +64,14 @@ class GeneratePerilAreasRtreeFileIndexCmd(OasisBaseCommand):
             '-f', '--index-file-path', default=None,
             help='Index file path (no file extension required)',
         )
+        parser.add_argument(
+            '-w', '--workers', default=None, type=int,
+            help='Number of processes to use to compute non-rectangular peril area polygons',
+        )
+        parser.add_argument(
+            '-p', '--payload-store', action='store_true', default=None,
+            help='Write the index entry objects to a memory-mapped payload store (<index file path>.payload) instead of the index',
+        )
 
     def action(self, args):
         """
@@ -136,6 +154,10 @@ class GeneratePerilAreasRtreeFileIndexCmd(OasisBaseCommand):
         index_props = peril_config.get('rtree_index')
         index_props.pop('filename')
 
+        workers = inputs.get('workers')
+
+        payload_store = bool(inputs.get('payload_store') or peril_config.get('payload_store'))
+
         self.logger.info(
             '\nGenerating Rtree file index {}.{{idx,dat}} from peril areas (area peril) '
             'file {}'
@@ -155,7 +177,9 @@ class GeneratePerilAreasRtreeFileIndexCmd(OasisBaseCommand):
             area_poly_coords_seq_start_idx=area_poly_coords_seq_start_idx,
             area_reg_poly_radius=area_reg_poly_radius,
             index_fp=index_fp,
-            index_props=index_props
+            index_props=index_props,
+            workers=(int(workers) if workers else None),
+            payload_store=payload_store
         )
 
         self.logger.info('\nSuccessfully generated index files {}.{{idx.dat}}'.format(index_fp))
@@ -345,6 +369,17 @@ class GenerateKeysCmd(OasisBaseCommand):
     ::
 
         LocID,PerilID,CoverageID,Message
+
+    With the ``bin`` keys format the keys file is instead a binary keys file -
+    a small header followed by fixed-width little-endian integer records
+    (loc. ID, peril ID, coverage type ID, area peril ID, vulnerability ID),
+    which can be read back without any parsing of values - and the keys
+    errors file is an Oasis keys errors file.
+
+    Keys can also be generated with a remote model keys server, given by its
+    URL (``--keys-server-url``) and the model version file path - the
+    locations are posted to the server in batches, with the number of
+    batches in flight at a time set by ``--keys-server-max-in-flight``.
     """
     formatter_class = RawDescriptionHelpFormatter
 
@@ -363,8 +398,18 @@ class GenerateKeysCmd(OasisBaseCommand):
         parser.add_argument('-d', '--keys-data-path', default=None, help='Keys data directory path')
         parser.add_argument('-v', '--model-version-file-path', default=None, help='Model version file path')
         parser.add_argument('-l', '--lookup-package-path', default=None, help='Keys data directory path')
-        parser.add_argument('-f', '--keys-format', choices=['oasis', 'json'], help='Keys records / files output format')
+        parser.add_argument('-f', '--keys-format', choices=['oasis', 'json', 'bin'], help='Keys records / files output format - `bin` writes a binary keys file (and an Oasis keys errors file)')
         parser.add_argument('-x', '--model-exposures-file-path', default=None, help='Keys records file output format')
+        parser.add_argument('-w', '--workers', default=None, type=int, help='Number of lookup worker processes')
+        parser.add_argument('-s', '--lookup-stats-file-path', default=None, help='Lookup stats (timings, counts) JSON file path')
+        parser.add_argument('-u', '--lookup-server-socket-path', default=None, help='Socket path of a running lookup server (see `oasislmf model serve-lookup`) to use instead of creating the lookup')
+        parser.add_argument('-c', '--chunk-size', default=None, type=int, help='Number of locations to read and look up at a time (by default all the locations are read at once)')
+        parser.add_argument('-r', '--incremental', action='store_true', default=None, help='Only look up locations which are new or have changed since the keys file was last generated with this option, and carry forward the keys of the other locations')
+        parser.add_argument('-o', '--spatial-order', action='store_true', default=None, help='Look up the locations in a spatial (Hilbert curve) order of their coordinates, for locality of the peril areas index queries - the keys are written in the original location order, so the keys of all the locations (or of each chunk, with `--chunk-size`) are held in memory')
+        parser.add_argument('-t', '--tiled', action='store_true', default=None, help='Split the locations between the lookup workers by spatial tiles, with each worker querying a sub-index of the peril areas intersecting its tiles - the keys of all the locations (or of each chunk, with `--chunk-size`) are held in memory')
+        parser.add_argument('--keys-server-url', default=None, help='URL of a remote model keys server to post the locations to, in batches, instead of creating the lookup (requires the model version file path)')
+        parser.add_argument('-b', '--keys-server-batch-size', default=None, type=int, help='Number of locations per keys server request')
+        parser.add_argument('--keys-server-max-in-flight', default=None, type=int, help='Maximum number of concurrent keys server requests')
 
     def action(self, args):
         """
@@ -375,46 +420,170 @@ class GenerateKeysCmd(OasisBaseCommand):
         """
         inputs = InputValues(args)
 
-        lookup_config_fp = as_path(inputs.get('lookup_config_file_path', required=False, is_path=True), 'Lookup config JSON file path',)
+        lookup_server_socket_path = as_path(inputs.get('lookup_server_socket_path', required=False, is_path=True), 'Lookup server socket path', preexists=False)
+
+        lookup_config_fp = as_path(inputs.get('lookup_config_file_path', required=False, is_path=True), 'Lookup config JSON file path', preexists=(not lookup_server_socket_path))
 
         keys_data_path = as_path(inputs.get('keys_data_path', required=False, is_path=True), 'Keys data path', preexists=False)
         model_version_file_path = as_path(inputs.get('model_version_file_path', required=False, is_path=True), 'Model version file path', preexists=False)
         lookup_package_path = as_path(inputs.get('lookup_package_path', required=False, is_path=True), 'Lookup package path', preexists=False)
 
-        if not (lookup_config_fp or (keys_data_path and model_version_file_path and lookup_package_path)):
-            raise OasisException('Either the lookup config JSON file path or the keys data path + model version file path + lookup package path must be provided')
+        keys_server_url = inputs.get('keys_server_url', required=False)
+
+        if not (lookup_server_socket_path or lookup_config_fp or (keys_server_url and model_version_file_path) or (keys_data_path and model_version_file_path and lookup_package_path)):
+            raise OasisException('Either the lookup server socket path, the lookup config JSON file path, the keys server URL + model version file path or the keys data path + model version file path + lookup package path must be provided')
 
         model_exposures_file_path = as_path(inputs.get('model_exposures_file_path', required=True, is_path=True), 'Model exposures')
 
         keys_format = inputs.get('keys_format', default='oasis')
 
-        self.logger.info('\nGetting model info and lookup')
-        model_info, lookup = OasisLookupFactory.create(
-            lookup_config_fp=lookup_config_fp,
-            model_keys_data_path=keys_data_path,
-            model_version_file_path=model_version_file_path,
-            lookup_package_path=lookup_package_path
-        )
+        # The lookup server's own number of workers applies unless set here
+        workers = inputs.get('workers', default=(None if lookup_server_socket_path else 1))
+        workers = int(workers) if workers is not None else None
+
+        lookup_stats_file_path = as_path(inputs.get('lookup_stats_file_path', required=False, is_path=True), 'Lookup stats file path', preexists=False)
+
+        incremental = bool(inputs.get('incremental', default=False, required=False))
+
+        chunk_size = inputs.get('chunk_size', required=False)
+        chunk_size = int(chunk_size) if chunk_size else None
+
+        spatial_order = bool(inputs.get('spatial_order', default=False, required=False))
+        tiled = bool(inputs.get('tiled', default=False, required=False))
+
+        if incremental and lookup_server_socket_path:
+            raise OasisException('Incremental keys generation is not supported with a lookup server')
+
+        if (chunk_size or spatial_order or tiled) and lookup_server_socket_path:
+            raise OasisException('The chunk size, spatial order and tiled lookup options are not supported with a lookup server')
+
+        if lookup_server_socket_path:
+            self.logger.info('\nGetting model info from lookup server on socket {}'.format(lookup_server_socket_path))
+            lookup = LookupClient(lookup_server_socket_path)
+            model_info = lookup.info()
+        elif keys_server_url:
+            self.logger.info('\nGetting model info, and keys server lookup for {}'.format(keys_server_url))
+            model_info = OasisLookupFactory.get_model_info(as_path(model_version_file_path, 'Model version file path', preexists=True))
+            lookup = RemoteKeysLookup(
+                keys_server_url,
+                batch_size=(inputs.get('keys_server_batch_size', required=False) or DEFAULT_REMOTE_KEYS_BATCH_SIZE),
+                max_in_flight=(inputs.get('keys_server_max_in_flight', required=False) or DEFAULT_REMOTE_KEYS_MAX_IN_FLIGHT)
+            )
+        else:
+            self.logger.info('\nGetting model info and lookup')
+            model_info, lookup = OasisLookupFactory.create(
+                lookup_config_fp=lookup_config_fp,
+                model_keys_data_path=keys_data_path,
+                model_version_file_path=model_version_file_path,
+                lookup_package_path=lookup_package_path,
+                workers=workers
+            )
         self.logger.info('\t{}, {}'.format(model_info, lookup))
 
         utcnow = get_utctimestamp(fmt='%Y%m%d%H%M%S')
 
-        default_keys_file_name = '{}-{}-{}-keys-{}.{}'.format(model_info['supplier_id'].lower(), model_info['model_id'].lower(), model_info['model_version'], utcnow, 'csv' if keys_format == 'oasis' else 'json')
-        default_keys_errors_file_name = '{}-{}-{}-keys-errors-{}.{}'.format(model_info['supplier_id'].lower(), model_info['model_id'].lower(), model_info['model_version'], utcnow, 'csv' if keys_format == 'oasis' else 'json')
+        default_keys_file_name = '{}-{}-{}-keys-{}.{}'.format(model_info['supplier_id'].lower(), model_info['model_id'].lower(), model_info['model_version'], utcnow, {'oasis': 'csv', 'bin': 'bin'}.get(keys_format, 'json'))
+        default_keys_errors_file_name = '{}-{}-{}-keys-errors-{}.{}'.format(model_info['supplier_id'].lower(), model_info['model_id'].lower(), model_info['model_version'], utcnow, 'json' if keys_format == 'json' else 'csv')
 
         keys_file_path = as_path(inputs.get('keys_file_path', default=default_keys_file_name.format(utcnow), required=False, is_path=True), 'Keys file path', preexists=False)
         keys_errors_file_path = as_path(inputs.get('keys_errors_file_path', default=default_keys_errors_file_name.format(utcnow), required=False, is_path=True), 'Keys errors file path', preexists=False)
 
         self.logger.info('\nSaving keys records to file')
-        f1, n1, f2, n2 = OasisLookupFactory.save_results(
-            lookup,
+        save_results = lookup.save_results if lookup_server_socket_path else functools.partial(OasisLookupFactory.save_results, lookup, incremental=incremental, chunksize=chunk_size, spatial_order=spatial_order, tiled=tiled)
+        f1, n1, f2, n2 = save_results(
             keys_file_path,
             errors_fp=keys_errors_file_path,
             model_exposures_fp=model_exposures_file_path,
-            format=keys_format
+            format=keys_format,
+            workers=workers,
+            stats_fp=lookup_stats_file_path
         )
         self.logger.info('\n{} successful results saved to keys file {}'.format(n1, f1))
         self.logger.info('\n{} unsuccessful results saved to keys errors file {}'.format(n2, f2))
+        if lookup_stats_file_path:
+            self.logger.info('\nLookup stats saved to file {}'.format(lookup_stats_file_path))
+
+
+class ServeLookupCmd(OasisBaseCommand):
+    """
+    Runs a keys lookup server - the lookup for a model is created once, as
+    for ``oasislmf model generate-keys``, and then serves lookup requests
+    on a local Unix socket until stopped (with Ctrl-C, or a ``shutdown``
+    request). Keys can then be generated with the lookup server by passing
+    the socket path to ``oasislmf model generate-keys`` with the
+    ``--lookup-server-socket-path`` option, which avoids the lookup startup
+    cost (loading the lookup package, vulnerabilities and peril areas index)
+    on every run.
+
+    Calling syntax is::
+
+        oasislmf model serve-lookup
+            -u <socket path>
+            -g <lookup config JSON file path>
+            [-w <number of lookup worker processes per request>]
+
+    or, for a model lookup package::
+
+        oasislmf model serve-lookup
+            -u <socket path>
+            -d <keys data path>
+            -v <model version file path>
+            -l <lookup package path>
+    """
+    formatter_class = RawDescriptionHelpFormatter
+
+    def add_args(self, parser):
+        """
+        Adds arguments to the argument parser.
+
+        :param parser: The argument parser object
+        :type parser: ArgumentParser
+        """
+        super(self.__class__, self).add_args(parser)
+
+        parser.add_argument('-u', '--lookup-server-socket-path', default=None, help='Lookup server socket path')
+        parser.add_argument('-g', '--lookup-config-file-path', default=None, help='Lookup config JSON file path')
+        parser.add_argument('-d', '--keys-data-path', default=None, help='Keys data directory path')
+        parser.add_argument('-v', '--model-version-file-path', default=None, help='Model version file path')
+        parser.add_argument('-l', '--lookup-package-path', default=None, help='Lookup package path')
+        parser.add_argument('-w', '--workers', default=None, type=int, help='Number of lookup worker processes per request')
+
+    def action(self, args):
+        """
+        Creates the lookup for a model and serves lookup requests.
+
+        :param args: The arguments from the command line
+        :type args: Namespace
+        """
+        inputs = InputValues(args)
+
+        socket_path = as_path(inputs.get('lookup_server_socket_path', required=True, is_path=True), 'Lookup server socket path', preexists=False)
+
+        lookup_config_fp = as_path(inputs.get('lookup_config_file_path', required=False, is_path=True), 'Lookup config JSON file path',)
+
+        keys_data_path = as_path(inputs.get('keys_data_path', required=False, is_path=True), 'Keys data path', preexists=False)
+        model_version_file_path = as_path(inputs.get('model_version_file_path', required=False, is_path=True), 'Model version file path', preexists=False)
+        lookup_package_path = as_path(inputs.get('lookup_package_path', required=False, is_path=True), 'Lookup package path', preexists=False)
+
+        if not (lookup_config_fp or (keys_data_path and model_version_file_path and lookup_package_path)):
+            raise OasisException('Either the lookup config JSON file path or the keys data path + model version file path + lookup package path must be provided')
+
+        workers = int(inputs.get('workers', default=1))
+
+        self.logger.info('\nGetting model info and lookup')
+        model_info, lookup = OasisLookupFactory.create(
+            lookup_config_fp=lookup_config_fp,
+            model_keys_data_path=keys_data_path,
+            model_version_file_path=model_version_file_path,
+            lookup_package_path=lookup_package_path
+        )
+        self.logger.info('\t{}, {}'.format(model_info, lookup))
+
+        server = LookupServer(socket_path, lookup, model_info=model_info, workers=workers)
+
+        self.logger.info('\nServing lookup requests on socket {} (Ctrl-C to stop)'.format(socket_path))
+        server.serve()
+        self.logger.info('\nLookup server stopped')
 
 
 class GenerateOasisFilesCmd(OasisBaseCommand):
@@ -768,6 +937,7 @@ class ModelsCmd(OasisBaseCommand):
         'transform-source-to-canonical': TransformSourceToCanonicalFileCmd,
         'transform-canonical-to-model': TransformCanonicalToModelFileCmd,
         'generate-keys': GenerateKeysCmd,
+        'serve-lookup': ServeLookupCmd,
         'generate-oasis-files': GenerateOasisFilesCmd,
         'generate-losses': GenerateLossesCmd,
         'run': RunCmd,
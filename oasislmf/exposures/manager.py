@@ -479,10 +479,7 @@ class OasisExposuresManager(implements(OasisExposuresManagerInterface)):
             canexp_df = canexp_df.where(canexp_df.notnull(), None)
             canexp_df.columns = canexp_df.columns.str.lower()
 
-        with io.open(keys_file_path, 'r', encoding='utf-8') as kf:
-            keys_df = pd.read_csv(kf, float_precision='high')
-            keys_df = keys_df.where(keys_df.notnull(), None)
-            keys_df.columns = keys_df.columns.str.lower()
+        keys_df = OasisLookupFactory.read_keys_file(keys_file_path)
 
         tiv_fields = tuple(
             sorted(
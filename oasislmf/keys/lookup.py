@@ -5,34 +5,44 @@ from __future__ import unicode_literals, absolute_import
 __all__ = [
     'OasisBaseLookup',
     'OasisBaseKeysLookup',
+    'ParallelKeysLookup',
     'OasisLookup',
     'OasisPerilLookup',
     'OasisVulnerabilityLookup',
-    'OasisLookupFactory'
+    'OasisLookupFactory',
+    'KeysFileWriter',
+    'read_keys_bin_file'
 ]
 
 import builtins
 import csv
+import hashlib
 import imp
 import importlib
 import io
 import itertools
 import json
+import multiprocessing
 import os
 import re
 import sys
+import tempfile
 import types
 import uuid
+import zipfile
 
 from collections import OrderedDict
 
+import numpy as np
 import pandas as pd
 import six
 
 from shapely.geometry import (
     box,
     Point,
+    Polygon,
 )
+from shapely.prepared import prep
 
 from shapely import speedups as shapely_speedups
 
@@ -43,23 +53,67 @@ from rtree.core import RTreeError
 
 import six
 
-from ..utils.data import get_dataframe
+from ..utils.cache import LRUCache
+from ..utils.data import (
+    get_dataframe,
+    get_dataframe_chunks,
+)
 from ..utils.exceptions import OasisException
 from ..utils.log import oasis_log
 from ..utils.peril import (
     DEFAULT_RTREE_INDEX_PROPS,
+    get_hilbert_keys,
+    get_points_covered,
+    PerilAreasGridIndex,
     PerilAreasIndex,
+    PerilAreasPayloadStore,
+)
+from ..utils.stats import (
+    LookupStats,
+    NULL_TIMER,
 )
 from ..utils.status import (
+    KEYS_ERROR_COORDS_OUT_OF_BOUNDS,
+    KEYS_ERROR_INVALID_COORDS,
+    KEYS_ERROR_OUTSIDE_PERIL_AREAS,
     KEYS_STATUS_FAIL,
     KEYS_STATUS_NOMATCH,
     KEYS_STATUS_SUCCESS,
 )
 from ..utils.values import is_string
+from ..utils.vulnerability import VulnerabilityTable
 
 
 UNKNOWN_ID = -1
 
+DEFAULT_KEYS_WRITE_BATCH_SIZE = 10000
+
+# Binary keys files (``bin`` format) are a fixed-size header, holding a
+# magic string, the format version, the record size and the number of
+# records, followed by fixed-width little-endian keys records. Location IDs
+# are unsigned, as generated IDs for locations without IDs are random 64-bit
+# integers
+KEYS_BIN_FILE_MAGIC = b'OASISKEY'
+KEYS_BIN_FILE_VERSION = 1
+
+KEYS_BIN_HEADER_DTYPE = np.dtype([
+    (str('magic'), 'S8'),
+    (str('version'), '<u4'),
+    (str('record_size'), '<u4'),
+    (str('count'), '<u8'),
+])
+
+KEYS_BIN_DTYPE = np.dtype([
+    (str('loc_id'), '<u8'),
+    (str('peril_id'), '<i4'),
+    (str('coverage_type'), '<i4'),
+    (str('area_peril_id'), '<i8'),
+    (str('vulnerability_id'), '<i4'),
+])
+
+DEFAULT_PERIL_LOOKUP_CACHE_SIZE = 100000
+DEFAULT_PERIL_LOOKUP_CACHE_PRECISION = 5
+
 def as_path(value, name, preexists=True):
     """
     Processes the path and returns the absolute path.
@@ -88,6 +142,496 @@ def as_path(value, name, preexists=True):
     return value
 
 
+# Lookup instance and exposures shards used by forked lookup worker
+# processes - these are set in the parent process before the worker pool
+# is created, so that each worker inherits them, including any loaded
+# peril areas index and vulnerabilities, without having to reload them
+_worker_lookup = None
+_worker_shards = None
+
+# Boxes of the spatial tiles of each shard, for tiled lookup workers
+_worker_tile_boxes = None
+
+DEFAULT_LOOKUP_TILES_PER_WORKER = 4
+
+
+def _bulk_lookup_shard(i):
+    if getattr(_worker_lookup, 'stats', None) is None:
+        return list(_worker_lookup.bulk_lookup(_worker_shards[i])), None
+
+    stats = _worker_lookup.enable_stats(LookupStats())
+    return list(_worker_lookup.bulk_lookup(_worker_shards[i])), stats.as_dict()
+
+
+def _bulk_lookup_tiles_shard(i):
+    lookup = _worker_lookup
+    peril_lookup = getattr(lookup, 'peril_lookup', lookup)
+
+    stats = lookup.enable_stats(LookupStats()) if getattr(lookup, 'stats', None) is not None else None
+
+    index = peril_lookup.peril_areas_index
+    with (stats.timer('peril.tile_index_build') if stats is not None else NULL_TIMER):
+        sub_index = index.get_sub_index(_worker_tile_boxes[i], areas_table=peril_lookup.areas_table)
+    if stats is not None:
+        stats.incr('peril.tile_index_entries', sub_index.num_entries)
+
+    peril_lookup.peril_areas_index, peril_lookup.peril_areas_nearest_index = sub_index, index
+    try:
+        results = list(lookup.bulk_lookup(_worker_shards[i]))
+    finally:
+        peril_lookup.peril_areas_index, peril_lookup.peril_areas_nearest_index = index, None
+        sub_index.close()
+
+    return results, (stats.as_dict() if stats is not None else None)
+
+
+def get_location_tile_shards(x, y, bounds, shards, tiles_per_shard=DEFAULT_LOOKUP_TILES_PER_WORKER):
+    """
+    Splits points, with the coordinates in the float arrays ``x`` and ``y``,
+    into at most ``shards`` spatially compact shards - the box ``bounds =
+    (minx, miny, maxx, maxy)`` is split into a grid of about ``shards *
+    tiles_per_shard`` square tiles, the points are assigned to the tiles
+    containing them (or the nearest tiles, for points outside the box or
+    with null coordinates), and the tiles, in the Hilbert curve order of the
+    grid, are split into runs with about the same number of points.
+
+    Returns a list of pairs ``(positions, boxes)``, one for each non-empty
+    shard, where ``positions`` is an array of the positions of the points
+    in the shard, in their original order, and ``boxes`` is the list of
+    the (slightly padded) boxes of the tiles of the shard with any points.
+    """
+    n = len(x)
+    minx, miny, maxx, maxy = bounds
+
+    k = max(int(np.ceil(np.sqrt(shards * tiles_per_shard))), 1)
+    w = ((maxx - minx) or 1.0) / k
+    h = ((maxy - miny) or 1.0) / k
+
+    with np.errstate(invalid='ignore'):
+        cols = np.clip(np.nan_to_num(np.floor((np.asarray(x, dtype=np.float64) - minx) / w)), 0, k - 1).astype(np.int64)
+        rows = np.clip(np.nan_to_num(np.floor((np.asarray(y, dtype=np.float64) - miny) / h)), 0, k - 1).astype(np.int64)
+    tile_ids = rows * k + cols
+
+    counts = np.bincount(tile_ids, minlength=k * k)
+    tiles = np.arange(k * k)
+    tile_order = np.argsort(
+        get_hilbert_keys(tiles % k + 0.5, tiles // k + 0.5, (0, 0, k, k), order=max(int(np.ceil(np.log2(k))), 1)),
+        kind='mergesort'
+    )
+
+    tile_shards = np.empty(k * k, dtype=np.int64)
+    tile_shards[tile_order] = (np.cumsum(counts[tile_order]) - counts[tile_order]) * shards // max(n, 1)
+    loc_shards = tile_shards[tile_ids]
+
+    pad = 1e-9 * max(w, h)
+    res = []
+    for shard in np.unique(loc_shards).tolist():
+        positions = np.flatnonzero(loc_shards == shard)
+        shard_tiles = np.unique(tile_ids[positions])
+        res.append((positions, [
+            (minx + c * w - pad, miny + r * h - pad, minx + (c + 1) * w + pad, miny + (r + 1) * h + pad)
+            for r, c in zip((shard_tiles // k).tolist(), (shard_tiles % k).tolist())
+        ]))
+
+    return res
+
+
+def _tiled_shards(lookup, loc_df, workers, tiles_per_worker):
+    """
+    Returns the spatial tile shards (see ``get_location_tile_shards``) of
+    a locations dataframe for a tiled lookup, or ``None`` if the lookup
+    does not have an Rtree peril areas index and location coordinates.
+    """
+    peril_lookup = getattr(lookup, 'peril_lookup', lookup)
+    try:
+        index = peril_lookup.peril_areas_index
+        x_col, y_col = peril_lookup.loc_coords_x_col, peril_lookup.loc_coords_y_col
+        bounds = peril_lookup.peril_areas_boundary.bounds
+    except AttributeError:
+        return None
+
+    if not isinstance(index, PerilAreasIndex):
+        return None
+
+    _coords = lambda col: (
+        pd.to_numeric(loc_df[col], errors='coerce').values if col in loc_df.columns
+        else np.full(len(loc_df), np.nan)
+    )
+
+    return get_location_tile_shards(_coords(x_col), _coords(y_col), bounds, workers, tiles_per_shard=tiles_per_worker)
+
+
+def bulk_lookup_in_workers(lookup, loc_df, workers, tiled=False, tiles_per_worker=DEFAULT_LOOKUP_TILES_PER_WORKER):
+    """
+    Runs the bulk lookup of a lookup instance for a locations dataframe in
+    ``workers`` forked processes, with each process handling a contiguous
+    shard of the dataframe. Results are generated in the same order as
+    for a single process bulk lookup of the whole dataframe.
+
+    If ``tiled`` is true, and the lookup has an Rtree peril areas index,
+    then the locations are instead split into spatially compact shards of
+    tiles (see ``get_location_tile_shards``, with about
+    ``tiles_per_worker`` tiles per worker), and each worker queries a
+    memory based sub-index with only the peril areas intersecting the
+    tiles of its shard (see ``PerilAreasIndex.get_sub_index``) - nearest
+    area queries still use the full index. The results are the same, in
+    the same order, but are only generated once all the shards are done,
+    so all the results of the dataframe are then held in memory.
+
+    If the platform does not support forking processes then the lookup is
+    run in the current process. If stats are enabled for the lookup then
+    the stats recorded in the worker processes are merged into its stats.
+    """
+    global _worker_lookup, _worker_shards
+
+    try:
+        ctx = multiprocessing.get_context('fork')
+    except AttributeError:
+        ctx = multiprocessing
+    except ValueError:
+        ctx = None
+
+    if not ctx or workers < 2 or len(loc_df) < 2:
+        for r in lookup.bulk_lookup(loc_df):
+            yield r
+        return
+
+    tile_shards = _tiled_shards(lookup, loc_df, workers, tiles_per_worker) if tiled else None
+
+    if tile_shards is not None:
+        for r in _bulk_lookup_tiles_in_workers(ctx, lookup, loc_df, tile_shards):
+            yield r
+        return
+
+    bounds = np.linspace(0, len(loc_df), min(workers, len(loc_df)) + 1).astype(int)
+
+    _worker_lookup = lookup
+    _worker_shards = [loc_df.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+    pool = ctx.Pool(len(_worker_shards))
+    try:
+        for results, stats in pool.imap(_bulk_lookup_shard, range(len(_worker_shards))):
+            if stats:
+                lookup.stats.merge(stats)
+            for r in results:
+                yield r
+    finally:
+        pool.terminate()
+        pool.join()
+        _worker_lookup = _worker_shards = None
+
+
+def _bulk_lookup_tiles_in_workers(ctx, lookup, loc_df, tile_shards):
+    global _worker_lookup, _worker_shards, _worker_tile_boxes
+
+    loc_id_col = lookup.loc_id_col
+    n = len(loc_df)
+
+    # The areas table is loaded before the workers are forked, so that they
+    # share it, and the shard locations are keyed by their positions (in
+    # the ID column, the only location column of the lookup records), so
+    # that the results can be put back in the location order - the original
+    # IDs are restored as they are
+    getattr(lookup, 'peril_lookup', lookup).areas_table
+
+    _worker_lookup = lookup
+    _worker_shards = []
+    for positions, _ in tile_shards:
+        shard_df = loc_df.iloc[positions].copy(deep=True)
+        shard_df[loc_id_col] = positions + 1
+        _worker_shards.append(shard_df)
+    _worker_tile_boxes = [boxes for _, boxes in tile_shards]
+
+    loc_results = [[] for _ in range(n)]
+
+    pool = ctx.Pool(len(_worker_shards))
+    try:
+        for results, stats in pool.imap(_bulk_lookup_tiles_shard, range(len(_worker_shards))):
+            if stats:
+                lookup.stats.merge(stats)
+            for r in results:
+                loc_results[int(r[loc_id_col]) - 1].append(r)
+    finally:
+        pool.terminate()
+        pool.join()
+        _worker_lookup = _worker_shards = _worker_tile_boxes = None
+
+    for loc_id, results in zip(get_location_ids(loc_df, loc_id_col), loc_results):
+        for r in results:
+            r[loc_id_col] = loc_id
+            yield r
+
+
+# Keys lookup class and constructor arguments, and locations shards, used by
+# forked parallel keys lookup worker processes - each worker creates its own
+# lookup instance once, in the pool initializer
+_worker_keys_lookup_args = None
+_worker_keys_lookup = None
+
+
+def _init_keys_lookup_worker():
+    global _worker_keys_lookup
+
+    lookup_class, lookup_kwargs = _worker_keys_lookup_args
+    _worker_keys_lookup = lookup_class(**lookup_kwargs)
+
+
+def _process_locations_shard(i):
+    return list(_worker_keys_lookup.process_locations(_worker_shards[i]) or [])
+
+
+def _batches(seq, size):
+    it = iter(seq)
+    while True:
+        batch = list(itertools.islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def get_location_ids(loc_df, loc_id_col):
+    """
+    Returns the location IDs of a locations dataframe as a list, with
+    random 64-bit IDs generated only for missing (null) IDs - IDs such as
+    ``0`` are kept as they are. The bulk lookups and the results reordering
+    of ``OasisLookupFactory`` all use these IDs, so that the ID of a location
+    does not depend on how it was looked up.
+    """
+    if loc_id_col not in loc_df.columns:
+        return [int(uuid.UUID(bytes=os.urandom(16)).hex[:16], 16) for _ in range(len(loc_df))]
+
+    return [
+        int(uuid.UUID(bytes=os.urandom(16)).hex[:16], 16) if pd.isnull(loc_id) else loc_id
+        for loc_id in loc_df[loc_id_col].tolist()
+    ]
+
+
+def get_location_groups(loc_df, cols):
+    """
+    Groups the rows of a locations dataframe which have the same values in
+    the given columns (null values are treated as equal, and missing columns
+    are ignored). Returns a pair ``(first, codes)`` of integer arrays where
+    ``first`` is the positions of the first row of each group, in order of
+    first appearance, and ``codes[i]`` is the group of the ``i``-th row.
+    """
+    n = len(loc_df)
+    codes = np.zeros(n, dtype=np.int64)
+
+    for col in cols:
+        if col not in loc_df.columns:
+            continue
+        col_codes, uniques = pd.factorize(loc_df[col])
+        codes, _ = pd.factorize(codes * (len(uniques) + 1) + (col_codes + 1))
+        codes = codes.astype(np.int64)
+
+    _, first = np.unique(codes, return_index=True)
+
+    return first, codes
+
+
+def get_location_hashes(loc_df, cols=None):
+    """
+    Returns an array of per-row content hashes (``uint64``) of the values of
+    the given columns of a locations dataframe (by default all columns) -
+    missing columns are ignored. Integer and boolean columns are hashed as
+    floats, so that the hashes of a row do not depend on whether a numeric
+    column was read as an integer or a float column.
+    """
+    cols = sorted(col for col in (loc_df.columns if cols is None else cols) if col in loc_df.columns)
+
+    if not cols:
+        return np.zeros(len(loc_df), dtype=np.uint64)
+
+    return pd.util.hash_pandas_object(
+        pd.DataFrame(OrderedDict(
+            (col, loc_df[col].astype(np.float64) if loc_df[col].dtype.kind in 'iub' else loc_df[col])
+            for col in cols
+        )),
+        index=False
+    ).values
+
+
+def _keys_bin_header(count):
+    header = np.zeros(1, dtype=KEYS_BIN_HEADER_DTYPE)
+    header['magic'] = KEYS_BIN_FILE_MAGIC
+    header['version'] = KEYS_BIN_FILE_VERSION
+    header['record_size'] = KEYS_BIN_DTYPE.itemsize
+    header['count'] = count
+    return header
+
+
+def read_keys_bin_file(fp):
+    """
+    Reads a binary keys file (see ``KeysFileWriter``) - returns the keys
+    records as a structured array of ``KEYS_BIN_DTYPE`` (with the fields
+    ``loc_id``, ``peril_id``, ``coverage_type``, ``area_peril_id`` and
+    ``vulnerability_id``).
+    """
+    with io.open(fp, 'rb') as f:
+        buf = f.read(KEYS_BIN_HEADER_DTYPE.itemsize)
+        header = np.frombuffer(buf, dtype=KEYS_BIN_HEADER_DTYPE) if len(buf) == KEYS_BIN_HEADER_DTYPE.itemsize else []
+
+        if not (
+            len(header) and header['magic'][0] == KEYS_BIN_FILE_MAGIC and
+            header['version'][0] == KEYS_BIN_FILE_VERSION and
+            header['record_size'][0] == KEYS_BIN_DTYPE.itemsize
+        ):
+            raise OasisException('{} is not a binary keys file, or has an unsupported format version'.format(fp))
+
+        count = int(header['count'][0])
+        buf = f.read(count * KEYS_BIN_DTYPE.itemsize)
+        records = (
+            np.frombuffer(buf, dtype=KEYS_BIN_DTYPE, count=len(buf) // KEYS_BIN_DTYPE.itemsize) if len(buf) >= KEYS_BIN_DTYPE.itemsize
+            else np.zeros(0, dtype=KEYS_BIN_DTYPE)
+        )
+
+    if len(records) != count:
+        raise OasisException('Incomplete binary keys file {}: {} of {} records found'.format(fp, len(records), count))
+
+    return records
+
+
+def is_keys_bin_file(fp):
+    """
+    Whether a file is a binary keys file (starts with the binary keys file
+    magic string).
+    """
+    with io.open(fp, 'rb') as f:
+        return f.read(len(KEYS_BIN_FILE_MAGIC)) == KEYS_BIN_FILE_MAGIC
+
+
+class KeysFileWriter(object):
+    """
+    Incremental writer of keys records to a file - either an Oasis keys or
+    keys errors file (``oasis``), for which the heading row, an ordered dict
+    of record keys and column headers, must be given, a JSON file
+    (``json``) listing the records, or a binary keys file (``bin``) of
+    fixed-width integer records (see ``KEYS_BIN_DTYPE``), for which the
+    heading row of the Oasis keys file must be given, to map the record
+    keys to the binary record fields. Records are appended to the file in
+    batches with ``write``, so that only the current batch needs to be held
+    in memory, and the file is completed by ``close``. The files written are
+    the same as those written from a list of all the records by the
+    factory ``write_*`` methods.
+
+    The records are written to a temporary file in the same directory,
+    which is only renamed to the output file path by ``close`` - if writing
+    fails then ``abort`` removes the temporary file (as does leaving a
+    ``with`` block for the writer with an exception), and any existing file
+    at the output file path is left as it was.
+    """
+    def __init__(self, output_file_path, format='oasis', heading_row=None):
+        if format not in ('oasis', 'json', 'bin',):
+            raise OasisException("Unrecognised keys file output format - valid formats are 'oasis', 'json' or 'bin'")
+
+        self.output_file_path = output_file_path
+        self.format = format
+        self.heading_row = heading_row
+        self.count = 0
+
+        fd, self._tmp_fp = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(output_file_path)),
+            prefix='.{}.'.format(os.path.basename(output_file_path)),
+            suffix='.tmp'
+        )
+        os.close(fd)
+
+        try:
+            if format == 'oasis':
+                self._write_frame([heading_row], mode='w')
+            elif format == 'bin':
+                with io.open(self._tmp_fp, 'wb') as f:
+                    f.write(_keys_bin_header(0).tobytes())
+            else:
+                with io.open(self._tmp_fp, 'w', encoding='utf-8') as f:
+                    f.write(u'[')
+        except Exception:
+            self.abort()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.abort()
+
+    def _write_bin(self, records):
+        keys = list(self.heading_row)
+        try:
+            arr = np.array([tuple(int(r[k]) for k in keys) for r in records], dtype=KEYS_BIN_DTYPE)
+        except (KeyError, TypeError, ValueError, OverflowError) as e:
+            raise OasisException('Keys records can only be written to a binary keys file if they have integer {} values: {}'.format(keys, e))
+
+        with io.open(self._tmp_fp, 'ab') as f:
+            f.write(arr.tobytes())
+
+    def _write_frame(self, records, mode='a'):
+        pd.DataFrame(
+            columns=self.heading_row.keys(),
+            data=records,
+            dtype=object
+        ).to_csv(
+            self._tmp_fp,
+            mode=mode,
+            index=False,
+            encoding='utf-8',
+            header=False,
+        )
+
+    def write(self, records):
+        """
+        Appends a batch (list) of keys records to the file.
+        """
+        if not records:
+            return
+
+        if self.format == 'oasis':
+            self._write_frame(records)
+        elif self.format == 'bin':
+            self._write_bin(records)
+        else:
+            with io.open(self._tmp_fp, 'a', encoding='utf-8') as f:
+                f.write(u''.join(
+                    u'{}\n    {}'.format(
+                        u',' if (self.count or i) else u'',
+                        json.dumps(r, sort_keys=True, indent=4, ensure_ascii=False).replace('\n', '\n    ')
+                    ) for i, r in enumerate(records)
+                ))
+
+        self.count += len(records)
+
+    def close(self):
+        """
+        Completes the file, and renames it to the output file path - returns
+        a pair ``(p, n)`` where ``p`` is the file path and ``n`` is the number
+        of records written.
+        """
+        try:
+            if self.format == 'json':
+                with io.open(self._tmp_fp, 'a', encoding='utf-8') as f:
+                    f.write(u'\n]' if self.count else u']')
+            elif self.format == 'bin':
+                with io.open(self._tmp_fp, 'r+b') as f:
+                    f.write(_keys_bin_header(self.count).tobytes())
+
+            # ``os.replace`` is not available in Python 2, where ``os.rename``
+            # replaces an existing file on POSIX systems
+            getattr(os, 'replace', os.rename)(self._tmp_fp, self.output_file_path)
+        except Exception:
+            self.abort()
+            raise
+
+        return self.output_file_path, self.count
+
+    def abort(self):
+        """
+        Removes the temporary file of an incomplete file.
+        """
+        if os.path.exists(self._tmp_fp):
+            os.remove(self._tmp_fp)
+
+
 class OasisBaseLookup(object):
 
     @oasis_log()
@@ -117,6 +661,8 @@ class OasisBaseLookup(object):
 
         self._coverage_type_col = peril_config.get('coverage_type_col') or 'coverage_type'
 
+        self.stats = None
+
         self.__tweak_config_data__()
 
     def __tweak_config_data__(self):
@@ -157,6 +703,31 @@ class OasisBaseLookup(object):
     def coverage_type_col(self):
         return self._coverage_type_col
 
+    @property
+    def lookup_cols(self):
+        """
+        The location columns which the lookup results depend on, other than
+        the location ID column - locations with the same values in these
+        columns get the same lookup results. ``None`` if not known.
+        """
+        return None
+
+    def enable_stats(self, stats=None):
+        """
+        Turns on the recording of lookup stats - phase timings, index query
+        candidate counts and lookup status counts - in the given
+        ``LookupStats`` record, or a new one if none is given. Returns the
+        record, which is also available as the ``stats`` attribute.
+        """
+        self.stats = stats if stats is not None else LookupStats()
+        return self.stats
+
+    def disable_stats(self):
+        self.stats = None
+
+    def _timer(self, phase):
+        return self.stats.timer(phase) if self.stats is not None else NULL_TIMER
+
     def lookup(self, loc, peril_id, coverage_type, **kwargs):
         """
         Lookup for an individual location item, which could be a dict or a
@@ -268,6 +839,81 @@ class OasisBaseKeysLookup(object):  # pragma: no cover
         return KEYS_STATUS_SUCCESS
 
 
+class ParallelKeysLookup(object):
+    """
+    Adapter for running a model keys lookup class (an ``OasisBaseKeysLookup``
+    subclass) in parallel - ``process_locations`` splits the locations
+    dataframe into ``workers`` contiguous shards, and runs the
+    ``process_locations`` of the lookup class on each shard in a pool of
+    forked processes, each of which creates its own instance of the lookup
+    class, with the given constructor arguments, once. The records are
+    generated in the same order as for a single lookup instance, so the
+    adapter can be used wherever the lookup instance is, e.g. with
+    ``OasisLookupFactory.get_keys``.
+
+    If the platform does not support forking processes, or there is only
+    one worker, the locations are processed by an instance of the lookup
+    class created in the current process.
+    """
+    def __init__(self, lookup_class, workers, **lookup_kwargs):
+        self.lookup_class = lookup_class
+        self.workers = workers
+        self.lookup_kwargs = lookup_kwargs
+        self._lookup = None
+
+    def __getattr__(self, name):
+        # Lookup attributes which are constructor arguments (e.g. the
+        # supplier and model name) are available without creating a lookup
+        try:
+            return self.__dict__['lookup_kwargs'][name]
+        except KeyError:
+            raise AttributeError(name)
+
+    @property
+    def lookup(self):
+        """
+        The lookup class instance of the current process - created on first
+        access.
+        """
+        if self._lookup is None:
+            self._lookup = self.lookup_class(**self.lookup_kwargs)
+        return self._lookup
+
+    def process_locations(self, loc_df):
+        """
+        Generates the records of the lookup class ``process_locations`` for
+        the locations dataframe, processed in shards by the worker processes.
+        """
+        global _worker_keys_lookup_args, _worker_shards
+
+        try:
+            ctx = multiprocessing.get_context('fork')
+        except AttributeError:
+            ctx = multiprocessing
+        except ValueError:
+            ctx = None
+
+        if not ctx or not self.workers or self.workers < 2 or len(loc_df) < 2:
+            for r in (self.lookup.process_locations(loc_df) or []):
+                yield r
+            return
+
+        bounds = np.linspace(0, len(loc_df), min(self.workers, len(loc_df)) + 1).astype(int)
+
+        _worker_keys_lookup_args = (self.lookup_class, self.lookup_kwargs)
+        _worker_shards = [loc_df.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+        pool = ctx.Pool(len(_worker_shards), initializer=_init_keys_lookup_worker)
+        try:
+            for records in pool.imap(_process_locations_shard, range(len(_worker_shards))):
+                for r in records:
+                    yield r
+        finally:
+            pool.terminate()
+            pool.join()
+            _worker_keys_lookup_args = _worker_shards = None
+
+
 class OasisLookupFactory(object):
     """
     A factory class to load and run keys lookup services for different
@@ -305,44 +951,74 @@ class OasisLookupFactory(object):
         return lookup_package
 
     @classmethod
-    def get_lookup_class_instance(cls, lookup_package, keys_data_path, model_info):
+    def get_lookup_class_instance(cls, lookup_package, keys_data_path, model_info, workers=None):
         """
         Get the keys lookup class instance.
+
+        If the optional keyword argument ``workers`` is greater than 1 then a
+        ``ParallelKeysLookup`` adapter for the keys lookup class is returned
+        instead, which runs the lookup in that many worker processes.
         """
         klc = getattr(lookup_package, '{}KeysLookup'.format(model_info['model_id']))
 
-        return klc(
+        lookup_kwargs = dict(
             keys_data_directory=keys_data_path,
             supplier=model_info['supplier_id'],
             model_name=model_info['model_id'],
             model_version=model_info['model_version']
         )
 
+        if workers and workers > 1:
+            return ParallelKeysLookup(klc, workers, **lookup_kwargs)
+
+        return klc(**lookup_kwargs)
+
     @classmethod
-    def get_model_exposures(cls, model_exposures=None, model_exposures_file_path=None):
+    def get_model_exposures(cls, model_exposures=None, model_exposures_file_path=None, chunksize=None):
         """
         Get the model exposures/location file data as a pandas dataframe given
-        either the path of the model exposures file or the string contents of
-        such a file.
+        either the path of the model exposures file, the string contents of
+        such a file, or a list of location records (dicts), as sent to a
+        keys lookup server (see ``LookupClient.get_results``).
+
+        If the optional keyword argument ``chunksize`` is given then the data
+        is read in chunks of at most that many rows, and an iterator of
+        dataframes of the chunks is returned instead. The chunks keep the
+        column data types of the file - null values are not converted to
+        ``None``, which would make every column an object column.
         """
         if model_exposures_file_path:
-            loc_df = pd.read_csv(os.path.abspath(model_exposures_file_path), float_precision='high')
+            src = os.path.abspath(model_exposures_file_path)
+        elif model_exposures and isinstance(model_exposures, six.string_types):
+            src = six.StringIO(model_exposures)
         elif model_exposures:
-            loc_df = pd.read_csv(six.StringIO(model_exposures), float_precision='high')
+            src = None
         else:
             raise OasisException('Either model_exposures_file_path or model_exposures must be specified')
 
+        if src is None:
+            loc_df = pd.DataFrame(list(model_exposures))
+            if chunksize:
+                return cls._model_exposures_chunks(loc_df.iloc[i:i + chunksize] for i in range(0, len(loc_df), chunksize))
+        elif chunksize:
+            return cls._model_exposures_chunks(pd.read_csv(src, float_precision='high', chunksize=chunksize))
+        else:
+            loc_df = pd.read_csv(src, float_precision='high')
+
         loc_df = loc_df.where(loc_df.notnull(), None)
         loc_df.columns = loc_df.columns.str.lower()
 
         return loc_df
 
     @classmethod
-    def write_oasis_keys_file(cls, records, output_file_path, id_col='id'):
-        """
-        Writes an Oasis keys file from an iterable of keys records.
-        """
-        heading_row = OrderedDict([
+    def _model_exposures_chunks(cls, reader):
+        for loc_df in reader:
+            loc_df.columns = loc_df.columns.str.lower()
+            yield loc_df
+
+    @classmethod
+    def oasis_keys_heading_row(cls, id_col='id'):
+        return OrderedDict([
             (id_col, 'LocID'),
             ('peril_id', 'PerilID'),
             ('coverage_type', 'CoverageTypeID'),
@@ -350,51 +1026,170 @@ class OasisLookupFactory(object):
             ('vulnerability_id', 'VulnerabilityID'),
         ])
 
-        pd.DataFrame(
-            columns=heading_row.keys(),
-            data=[heading_row] + records,
-        ).to_csv(
-            output_file_path,
-            index=False,
-            encoding='utf-8',
-            header=False,
-        )
-
-        return output_file_path, len(records)
-
     @classmethod
-    def write_oasis_keys_errors_file(cls, records, output_file_path, id_col='id'):
-        """
-        Writes an Oasis keys errors file from an iterable of keys records.
-        """
-        heading_row = OrderedDict([
+    def oasis_keys_errors_heading_row(cls, id_col='id'):
+        return OrderedDict([
             (id_col, 'LocID'),
             ('peril_id', 'PerilID'),
             ('coverage_type', 'CoverageTypeID'),
             ('message', 'Message'),
         ])
 
-        pd.DataFrame(
-            columns=heading_row.keys(),
-            data=[heading_row] + records,
-        ).to_csv(
-            output_file_path,
-            index=False,
-            encoding='utf-8',
-            header=False,
-        )
+    @classmethod
+    def write_oasis_keys_file(cls, records, output_file_path, id_col='id', batch_size=DEFAULT_KEYS_WRITE_BATCH_SIZE):
+        """
+        Writes an Oasis keys file from an iterable of keys records.
+        """
+        with KeysFileWriter(output_file_path, heading_row=cls.oasis_keys_heading_row(id_col)) as writer:
+            for batch in _batches(records, batch_size):
+                writer.write(batch)
+
+            return writer.close()
+
+    @classmethod
+    def write_oasis_keys_errors_file(cls, records, output_file_path, id_col='id', batch_size=DEFAULT_KEYS_WRITE_BATCH_SIZE):
+        """
+        Writes an Oasis keys errors file from an iterable of keys records.
+        """
+        with KeysFileWriter(output_file_path, heading_row=cls.oasis_keys_errors_heading_row(id_col)) as writer:
+            for batch in _batches(records, batch_size):
+                writer.write(batch)
 
-        return output_file_path, len(records)
+            return writer.close()
 
     @classmethod
-    def write_json_keys_file(cls, records, output_file_path):
+    def write_json_keys_file(cls, records, output_file_path, batch_size=DEFAULT_KEYS_WRITE_BATCH_SIZE):
         """
         Writes the keys records as a simple list to file.
         """
-        with io.open(output_file_path, 'w', encoding='utf-8') as f:
-            f.write(u'{}'.format(json.dumps(records, sort_keys=True, indent=4, ensure_ascii=False)))
+        with KeysFileWriter(output_file_path, format='json') as writer:
+            for batch in _batches(records, batch_size):
+                writer.write(batch)
+
+            return writer.close()
+
+    @classmethod
+    def write_bin_keys_file(cls, records, output_file_path, id_col='id', batch_size=DEFAULT_KEYS_WRITE_BATCH_SIZE):
+        """
+        Writes a binary keys file (see ``KeysFileWriter``) from an iterable of
+        keys records.
+        """
+        with KeysFileWriter(output_file_path, format='bin', heading_row=cls.oasis_keys_heading_row(id_col)) as writer:
+            for batch in _batches(records, batch_size):
+                writer.write(batch)
+
+            return writer.close()
+
+    @classmethod
+    def read_keys_file(cls, keys_file_path):
+        """
+        Reads an Oasis keys file or a binary keys file as a dataframe with
+        the (lowercased) Oasis keys file column headers as column names -
+        ``locid``, ``perilid``, ``coveragetypeid``, ``areaperilid`` and
+        ``vulnerabilityid``. Binary keys files are read without any parsing
+        of values, and have integer columns.
+        """
+        if is_keys_bin_file(keys_file_path):
+            records = read_keys_bin_file(keys_file_path)
+            return pd.DataFrame(OrderedDict(
+                (heading.lower(), records[field]) for field, heading in zip(
+                    KEYS_BIN_DTYPE.names,
+                    six.itervalues(cls.oasis_keys_heading_row())
+                )
+            ))
+
+        with io.open(keys_file_path, 'r', encoding='utf-8') as kf:
+            keys_df = pd.read_csv(kf, float_precision='high')
+            keys_df = keys_df.where(keys_df.notnull(), None)
+            keys_df.columns = keys_df.columns.str.lower()
+
+        return keys_df
+
+    @classmethod
+    def write_keys_files(
+        cls,
+        records,
+        successes_fp,
+        errors_fp=None,
+        id_col='id',
+        format='oasis',
+        batch_size=DEFAULT_KEYS_WRITE_BATCH_SIZE,
+        stats=None
+    ):
+        """
+        Streams an iterable of keys records to a keys file and, optionally, a
+        keys errors file, in the given format (``oasis``, ``json`` or
+        ``bin``). For the ``bin`` format the keys file is a binary keys file
+        (see ``KeysFileWriter``), and the keys errors file, whose records
+        have messages, is an Oasis keys errors file.
+        Records with a successful lookup status are written to the keys file,
+        and all other records to the keys errors file (or dropped if no keys
+        errors file path is given). Records are buffered and appended to the
+        files in batches of at most ``batch_size`` records, so memory use
+        does not grow with the number of records.
+
+        Returns a pair ``(p, n)`` where ``p`` is the keys file path and ``n``
+        the number of records written to it, or, if a keys errors file path
+        is given, a quadruple ``(p1, n1, p2, n2)`` where ``p2`` and ``n2``
+        are the keys errors file path and records count.
+
+        If a ``LookupStats`` record ``stats`` is given then the time spent
+        writing to the files is added to its ``write`` phase time.
+        """
+        _timer = lambda: stats.timer('write') if stats is not None else NULL_TIMER
+
+        if format == 'oasis':
+            successes_writer = KeysFileWriter(successes_fp, heading_row=cls.oasis_keys_heading_row(id_col))
+            errors_writer_args = dict(heading_row=cls.oasis_keys_errors_heading_row(id_col))
+        elif format == 'json':
+            successes_writer = KeysFileWriter(successes_fp, format='json')
+            errors_writer_args = dict(format='json')
+        elif format == 'bin':
+            successes_writer = KeysFileWriter(successes_fp, format='bin', heading_row=cls.oasis_keys_heading_row(id_col))
+            errors_writer_args = dict(heading_row=cls.oasis_keys_errors_heading_row(id_col))
+        else:
+            raise OasisException("Unrecognised keys file output format - valid formats are 'oasis', 'json' or 'bin'")
+
+        errors_writer = None
+        try:
+            if errors_fp:
+                errors_writer = KeysFileWriter(errors_fp, **errors_writer_args)
+            return cls._write_keys_batches(records, successes_writer, errors_writer, batch_size, _timer)
+        except Exception:
+            successes_writer.abort()
+            if errors_writer:
+                errors_writer.abort()
+            raise
 
-            return output_file_path, len(records)
+    @classmethod
+    def _write_keys_batches(cls, records, successes_writer, errors_writer, batch_size, _timer):
+        """
+        Writes keys records in batches with the keys file writers of
+        ``write_keys_files``, and closes the writers.
+        """
+        successes = []
+        nonsuccesses = []
+        for r in records:
+            if r['status'] == KEYS_STATUS_SUCCESS:
+                successes.append(r)
+                if len(successes) == batch_size:
+                    with _timer():
+                        successes_writer.write(successes)
+                    successes = []
+            elif errors_writer:
+                nonsuccesses.append(r)
+                if len(nonsuccesses) == batch_size:
+                    with _timer():
+                        errors_writer.write(nonsuccesses)
+                    nonsuccesses = []
+
+        with _timer():
+            successes_writer.write(successes)
+            if not errors_writer:
+                return successes_writer.close()
+
+            errors_writer.write(nonsuccesses)
+            return successes_writer.close() + errors_writer.close()
 
     @classmethod
     def create(
@@ -406,7 +1201,8 @@ class OasisLookupFactory(object):
         lookup_config_json=None,
         lookup_config_fp=None,
         lookup_type='combined',
-        loc_id_col='id'
+        loc_id_col='id',
+        workers=None
     ):
         """
         Creates a keys lookup class instance for the given model and supplier -
@@ -415,6 +1211,13 @@ class OasisLookupFactory(object):
         pair ``(model_info, klc)``, where ``model_info`` is a dictionary holding
         model information from the model version file and `klc` is the lookup
         service class instance for the model.
+
+        The optional keyword argument ``workers`` only applies to model keys
+        lookup classes - if greater than 1 the lookup is a
+        ``ParallelKeysLookup`` adapter running the lookup class in that many
+        worker processes (see ``get_lookup_class_instance``). For lookups
+        created from a lookup config the number of workers is set in
+        ``get_results`` instead.
         """
         if (lookup_config or lookup_config_json or lookup_config_fp):
             lookup = OasisLookup(
@@ -445,7 +1248,7 @@ class OasisLookupFactory(object):
             model_info = cls.get_model_info(_model_version_file_path)
             lookup_package = cls.get_lookup_package(_lookup_package_path)
         
-            return model_info, cls.get_lookup_class_instance(lookup_package, _model_keys_data_path, model_info)
+            return model_info, cls.get_lookup_class_instance(lookup_package, _model_keys_data_path, model_info, workers=workers)
 
     @classmethod
     def get_keys(
@@ -453,32 +1256,87 @@ class OasisLookupFactory(object):
         lookup=None,
         model_exposures=None,
         model_exposures_file_path=None,
-        success_only=True
+        success_only=True,
+        chunksize=None
     ):
         """
         Generates keys records (JSON) for the given model and supplier -
         requires an instance of the lookup service (which can be created using
         the `create` method in this factory class), and either the model
-        location file path or the string contents of such a file.
+        location file path, the string contents of such a file or a list of
+        location records (see ``get_model_exposures``).
 
         The optional keyword argument ``success_only`` indicates whether only
         records with successful lookups should be returned (default), or all
         records.
+
+        If the optional keyword argument ``chunksize`` is given then the
+        locations are read and processed by the lookup in chunks of at most
+        that many locations (see ``get_model_exposures``).
         """
         if not (model_exposures or model_exposures_file_path):
             raise OasisException('No model exposures provided')
 
-        model_loc_df = cls.get_model_exposures(
-            model_exposures_file_path=model_exposures_file_path,
-            model_exposures=model_exposures
+        if chunksize:
+            model_loc_dfs = cls.get_model_exposures(
+                model_exposures_file_path=model_exposures_file_path,
+                model_exposures=model_exposures,
+                chunksize=chunksize
+            )
+        else:
+            model_loc_dfs = [cls.get_model_exposures(
+                model_exposures_file_path=model_exposures_file_path,
+                model_exposures=model_exposures
+            )]
+
+        for model_loc_df in model_loc_dfs:
+            for record in lookup.process_locations(model_loc_df):
+                if success_only:
+                    if record['status'].lower() == KEYS_STATUS_SUCCESS:
+                        yield record
+                else:
+                    yield record
+
+    @classmethod
+    def get_lookup_exposures(cls, lookup, model_exposures=None, model_exposures_fp=None, chunksize=None):
+        """
+        Loads the model exposures/locations data or file for a lookup created
+        from a lookup config as a dataframe, using the locations section of
+        the lookup config (non-null columns, column data types and sorting).
+
+        If the optional keyword argument ``chunksize`` is given then an
+        exposures file is read in chunks of at most that many rows, and an
+        iterator of dataframes of the chunks is returned instead (exposures
+        data is returned as a single chunk). Chunked reads can not be sorted,
+        so the lookup config must not set a locations sort column.
+        """
+        if not (model_exposures or model_exposures_fp):
+            raise OasisException('No model exposures data or file path provided')
+
+        loc_config = lookup.config.get('locations') or {}
+
+        if chunksize and model_exposures_fp:
+            if loc_config.get('sort_col'):
+                raise OasisException('Model exposures can not be read in chunks if a locations sort column is set in the lookup config')
+
+            return get_dataframe_chunks(
+                src_fp=as_path(model_exposures_fp, 'model_exposures_fp', preexists=False),
+                chunksize=chunksize,
+                non_na_cols=tuple(loc_config.get('non_na_cols') or ()),
+                col_dtypes=loc_config.get('col_dtypes') or {}
+            )
+
+        loc_df = get_dataframe(
+            src_data=model_exposures,
+            src_fp=as_path(model_exposures_fp, 'model_exposures_fp', preexists=False),
+            src_type='csv',
+            non_na_cols=tuple(loc_config.get('non_na_cols') or ()),
+            col_dtypes=loc_config.get('col_dtypes') or {},
+            sort_col=loc_config.get('sort_col'),
+            sort_ascending=loc_config.get('sort_ascending')
         )
 
-        for record in lookup.process_locations(model_loc_df):
-            if success_only:
-                if record['status'].lower() == KEYS_STATUS_SUCCESS:
-                    yield record
-            else:
-                yield record
+        return iter([loc_df]) if chunksize else loc_df
 
     @classmethod
     def get_results(
@@ -487,6 +1345,13 @@ class OasisLookupFactory(object):
         model_exposures=None,
         model_exposures_fp=None,
         successes_only=False,
+        workers=None,
+        dedupe=True,
+        stats=None,
+        model_exposures_df=None,
+        chunksize=None,
+        spatial_order=False,
+        tiled=False,
         **kwargs
     ):
         """
@@ -498,34 +1363,101 @@ class OasisLookupFactory(object):
         The optional keyword argument ``success_only`` indicates whether only
         results with successful lookup status should be returned (default),
         or all results.
+
+        The optional keyword argument ``workers`` sets the number of
+        processes to use for the lookup - if greater than 1 the exposures
+        dataframe is split into that many shards, which are looked up in
+        forked copies of the lookup (see ``bulk_lookup_in_workers``). The
+        results are generated in the original location order.
+
+        The optional keyword argument ``dedupe`` (default ``True``) indicates
+        whether locations with the same values in all the lookup columns of
+        the lookup (``lookup_cols``) should be looked up only once - the
+        results of the first of these locations are then repeated for the
+        others, with their own location IDs. It only applies to lookups
+        whose lookup columns are known.
+
+        The optional keyword argument ``stats`` is a ``LookupStats`` record
+        in which to record the exposures read and dedupe times, the overall
+        lookup time (``lookup``), and the number of results and their
+        statuses (``statuses``) - by default the lookup's own stats record is
+        used, if stats are enabled for the lookup (see
+        ``OasisBaseLookup.enable_stats``).
+
+        The optional keyword argument ``model_exposures_df`` is an already
+        loaded exposures dataframe (see ``get_lookup_exposures``) to use
+        instead of the exposures data or file.
+
+        If the optional keyword argument ``chunksize`` is given then the
+        exposures file is read and looked up in chunks of at most that many
+        locations (see ``get_lookup_exposures``), so that only one chunk is
+        held in memory at a time. Workers and dedupe then apply within each
+        chunk, and the ``lookup`` time includes the time spent reading the
+        chunks after the first.
+
+        If the optional keyword argument ``spatial_order`` is true then the
+        locations (of each chunk) are looked up in the order of the Hilbert
+        curve keys of their coordinates (see ``get_hilbert_keys``), so that
+        consecutive index queries are for nearby points and read the same
+        index pages, and worker shards cover compact areas - the results are
+        still generated in the original location order. As the results of
+        each chunk are only reordered once the whole chunk has been looked
+        up, memory use is only bounded if ``chunksize`` is also given. The
+        index locality of the queries is recorded in the lookup stats (see
+        ``OasisPerilLookup.bulk_lookup_coords_for_pairs``).
+
+        If the optional keyword argument ``tiled`` is true, and ``workers`` is
+        greater than 1, then the locations are split between the workers by
+        spatial tiles, and each worker queries a sub-index with only the peril
+        areas intersecting its tiles (see ``bulk_lookup_in_workers``) - the
+        sizes and build times of the sub-indexes are recorded in the lookup
+        stats (``peril.tile_index_entries`` and ``peril.tile_index_build``).
+        The results of each chunk are held in memory until all its tiles are
+        done, so memory use is only bounded if ``chunksize`` is also given.
         """
-        if not (model_exposures or model_exposures_fp):
+        if not (model_exposures or model_exposures_fp or model_exposures_df is not None):
             raise OasisException('No model exposures data or file path provided')
 
         peril_config = lookup.config.get('peril')
         if not peril_config:
             raise OasisException('No peril config defined in the lookup config')
 
-        _model_exposures_fp = as_path(model_exposures_fp, 'model_exposures_fp', preexists=False)
+        if stats is None:
+            stats = getattr(lookup, 'stats', None)
 
-        loc_config = lookup.config.get('locations') or {}
-        src_type = 'csv'
-
-        kwargs = {
-            'src_data': model_exposures,
-            'src_fp': _model_exposures_fp,
-            'src_type': 'csv',
-            'non_na_cols': tuple(loc_config.get('non_na_cols') or ()),
-            'col_dtypes': loc_config.get('col_dtypes') or {},
-            'sort_col': loc_config.get('sort_col'),
-            'sort_ascending': loc_config.get('sort_ascending')
-        }
+        _timer = lambda phase: stats.timer(phase) if stats is not None else NULL_TIMER
 
-        model_exposures_df =  get_dataframe(**kwargs)
+        if model_exposures_df is not None:
+            loc_dfs = [model_exposures_df]
+        elif chunksize:
+            loc_dfs = cls._read_chunks(
+                cls.get_lookup_exposures(
+                    lookup,
+                    model_exposures=model_exposures,
+                    model_exposures_fp=model_exposures_fp,
+                    chunksize=chunksize
+                ),
+                stats
+            )
+        else:
+            with _timer('locations.read'):
+                loc_dfs = [cls.get_lookup_exposures(
+                    lookup,
+                    model_exposures=model_exposures,
+                    model_exposures_fp=model_exposures_fp
+                )]
+
+        _frame_results = cls._spatially_ordered_results if spatial_order else cls._frame_results
+
+        results = itertools.chain.from_iterable(
+            _frame_results(lookup, loc_df, workers=workers, dedupe=dedupe, stats=stats, tiled=tiled)
+            for loc_df in loc_dfs
+        )
 
-        locations = (loc for _, loc in model_exposures_df.iterrows())
+        if stats is not None:
+            results = cls._recorded_results(results, stats)
 
-        for result in lookup.bulk_lookup(locations):
+        for result in results:
             if successes_only:
                 if result['status'].lower() == KEYS_STATUS_SUCCESS:
                     yield result
@@ -533,33 +1465,461 @@ class OasisLookupFactory(object):
                 yield result
 
     @classmethod
-    def save_keys(
-        cls,
-        lookup=None,
-        keys_id_col='id',
-        keys_file_path=None,
-        keys_errors_file_path=None,
-        keys_format='oasis',
-        model_exposures=None,
-        model_exposures_file_path=None,
-    ):
+    def _read_chunks(cls, chunks, stats=None):
         """
-        Writes a keys file, and optionally a keys error file, for the keys
-        generated by the lookup service for the given model, supplier and
-        exposure sfile - requires a lookup service instance (which can be
-        created using the `create` method in this factory class), the path of
-        the model location file, the path of the keys file, and the format of
-        the output file which can be an Oasis keys file (``oasis``) or a
-        simple listing of the records to file (``json``).
-
-        The optional keyword argument ``keys_error_file_path`` if present
-        indicates that all keys records, whether for locations with successful
-        or unsuccessful lookups, will be generated and written to separate
-        files. A keys record with a successful lookup will have a `status`
-        field whose value will be `success`, otherwise the record will have
-        a `status` field value of `failure` or `nomatch`.
+        Generates the chunks of a chunks iterator, adding the time spent
+        reading them to the ``locations.read`` phase time of a
+        ``LookupStats`` record, if given.
+        """
+        chunks = iter(chunks)
+        while True:
+            with (stats.timer('locations.read') if stats is not None else NULL_TIMER):
+                try:
+                    chunk = next(chunks)
+                except StopIteration:
+                    return
+            yield chunk
 
-        If ``keys_errors_file_path`` is not present then the method returns a
+    @classmethod
+    def _frame_results(cls, lookup, model_exposures_df, workers=None, dedupe=True, stats=None, tiled=False):
+        """
+        Generates the lookup results of a lookup for a locations dataframe,
+        using worker processes and deduping locations as for
+        ``get_results``, and counting the locations in the stats record
+        ``stats``, if given.
+        """
+        _timer = lambda phase: stats.timer(phase) if stats is not None else NULL_TIMER
+
+        _bulk_lookup = lambda df: (
+            bulk_lookup_in_workers(lookup, df, workers, tiled=tiled) if workers and workers > 1
+            else lookup.bulk_lookup(df)
+        )
+
+        lookup_cols = getattr(lookup, 'lookup_cols', None) if dedupe else None
+
+        first = codes = None
+        if lookup_cols:
+            with _timer('locations.dedupe'):
+                first, codes = get_location_groups(model_exposures_df, lookup_cols)
+
+        if first is None or len(first) == len(model_exposures_df):
+            results = _bulk_lookup(model_exposures_df)
+        else:
+            results = cls._fan_out_results(
+                _bulk_lookup,
+                model_exposures_df,
+                first,
+                codes,
+                lookup.loc_id_col
+            )
+
+        if stats is not None:
+            stats.incr('locations', len(model_exposures_df))
+            stats.incr('locations.looked_up', len(model_exposures_df) if first is None else len(first))
+
+        for result in results:
+            yield result
+
+    @classmethod
+    def _spatially_ordered_results(cls, lookup, model_exposures_df, stats=None, **kwargs):
+        """
+        Generates the lookup results of a lookup for a locations dataframe,
+        as for ``_frame_results``, but with the locations looked up in the
+        order of the Hilbert curve keys of their coordinates - the results
+        are generated in the original location order. Lookups without peril
+        area coordinates columns, and so without a spatial order, are run on
+        the dataframe as given.
+
+        The lookup records only carry the location ID column, so the sorted
+        locations are looked up with their IDs replaced by their positions
+        in the spatial order (from 1), which key the results, and the
+        original location IDs are then restored as they are (see
+        ``get_location_ids``). All the results of the dataframe are held in
+        memory until the lookup is done.
+        """
+        peril_lookup = getattr(lookup, 'peril_lookup', lookup)
+        try:
+            x_col, y_col = peril_lookup.loc_coords_x_col, peril_lookup.loc_coords_y_col
+            bounds = peril_lookup.peril_areas_boundary.bounds
+        except AttributeError:
+            for r in cls._frame_results(lookup, model_exposures_df, stats=stats, **kwargs):
+                yield r
+            return
+
+        loc_df = model_exposures_df
+        loc_id_col = lookup.loc_id_col
+        n = len(loc_df)
+
+        with (stats.timer('locations.spatial_order') if stats is not None else NULL_TIMER):
+            _coords = lambda col: (
+                pd.to_numeric(loc_df[col], errors='coerce').values if col in loc_df.columns
+                else np.full(n, np.nan)
+            )
+            order = np.argsort(get_hilbert_keys(_coords(x_col), _coords(y_col), bounds), kind='mergesort')
+
+            # The locations are keyed by their positions in the spatial
+            # order for the lookup, and the results regrouped by location
+            sorted_loc_df = loc_df.iloc[order].copy(deep=True)
+            sorted_loc_df[loc_id_col] = np.arange(1, n + 1)
+
+        loc_results = [[] for _ in range(n)]
+        for r in cls._frame_results(lookup, sorted_loc_df, stats=stats, **kwargs):
+            loc_results[int(r[loc_id_col]) - 1].append(r)
+
+        positions = np.empty(n, dtype=np.int64)
+        positions[order] = np.arange(n)
+
+        for loc_id, i in zip(get_location_ids(loc_df, loc_id_col), positions.tolist()):
+            for r in loc_results[i]:
+                r[loc_id_col] = loc_id
+                yield r
+
+    @classmethod
+    def _recorded_results(cls, results, stats):
+        """
+        Generates the results from a results iterable, adding the time spent
+        producing them to the ``lookup`` phase time of a ``LookupStats``
+        record, and counting them and their statuses.
+        """
+        results = iter(results)
+        while True:
+            with stats.timer('lookup'):
+                try:
+                    result = next(results)
+                except StopIteration:
+                    return
+            stats.incr('results')
+            stats.count_value('statuses', result['status'])
+            yield result
+
+    @classmethod
+    def _fan_out_results(cls, bulk_lookup, loc_df, first, codes, loc_id_col):
+        """
+        Runs a bulk lookup (a callable taking a locations dataframe) on the
+        first locations ``first`` of the location groups ``codes`` (see
+        ``get_location_groups``), and generates the results for each group
+        for every location in the group, in the original location order, with
+        the location ID replaced by that of the location.
+
+        The lookup records only carry the location ID column, so the group
+        locations are looked up with their IDs replaced by the group numbers
+        (from 1), which key the results, and the original location IDs are
+        then restored as they are - a random ID is only generated for a
+        missing ID (see ``get_location_ids``).
+        """
+        unique_loc_df = loc_df.iloc[first].copy(deep=True)
+        unique_loc_df[loc_id_col] = np.arange(1, len(first) + 1)
+
+        group_results = [[] for _ in range(len(first))]
+        for r in bulk_lookup(unique_loc_df):
+            group_results[int(r[loc_id_col]) - 1].append(r)
+
+        for loc_id, code in zip(get_location_ids(loc_df, loc_id_col), codes.tolist()):
+            for r in group_results[code]:
+                res = dict(r)
+                res[loc_id_col] = loc_id
+                yield res
+
+    @classmethod
+    def _lookup_data_file_paths(cls, config):
+        """
+        Returns the paths of the data files referenced by a lookup config -
+        the peril areas Rtree file index and its payload store, and the
+        vulnerabilities file.
+        """
+        fps = []
+
+        rtree_index_config = (config.get('peril') or {}).get('rtree_index') or {}
+        index_fp = rtree_index_config.get('filename')
+        if index_fp:
+            index_fp = os.path.abspath(index_fp)
+            fps += [
+                '{}.{}'.format(index_fp, rtree_index_config.get('idx_extension') or 'idx'),
+                '{}.{}'.format(index_fp, rtree_index_config.get('dat_extension') or 'dat')
+            ]
+            store_fp = PerilAreasPayloadStore.get_path(index_fp)
+            if os.path.isdir(store_fp):
+                fps += [os.path.join(store_fp, fn) for fn in sorted(os.listdir(store_fp))]
+
+        vulns_fp = (config.get('vulnerability') or {}).get('file_path')
+        if vulns_fp:
+            fps.append(os.path.abspath(vulns_fp))
+
+        return fps
+
+    @classmethod
+    def _lookup_config_digest(cls, lookup):
+        """
+        Returns a digest identifying a lookup and its data, for checking
+        whether keys files saved by an incremental ``save_results`` were
+        written with the same lookup.
+
+        For lookups with a config this is a digest of the config and of the
+        sizes and modification times of the data files it references (see
+        ``_lookup_data_file_paths``). For model keys lookup classes it is a
+        digest of the model version and of the path, size and modification
+        time of the module file of the lookup class.
+        """
+        try:
+            config = lookup.config
+        except AttributeError:
+            config = None
+
+        def _file_stat(fp):
+            try:
+                st = os.stat(fp)
+            except (OSError, TypeError):
+                return [fp, None, None]
+            return [fp, st.st_size, st.st_mtime]
+
+        if config is not None:
+            digest_data = [config, [_file_stat(fp) for fp in cls._lookup_data_file_paths(config)]]
+        else:
+            lookup_class = getattr(lookup, 'lookup_class', None) or type(lookup)
+            module_fp = getattr(sys.modules.get(lookup_class.__module__), '__file__', None)
+            digest_data = [
+                getattr(lookup, 'model_version', None),
+                '{}.{}'.format(lookup_class.__module__, lookup_class.__name__),
+                _file_stat(os.path.abspath(module_fp) if module_fp else None)
+            ]
+
+        return hashlib.md5(json.dumps(digest_data, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def _load_location_hashes(cls, hashes_fp, successes_fp, errors_fp, format, config_digest):
+        """
+        Loads the location IDs, location hashes and keys errors record
+        statuses saved with a keys file by an incremental ``save_results``
+        - returns ``None`` if there is no hashes file, or if the keys files or
+        the lookup they were written with do not match those given.
+        """
+        if not (os.path.exists(hashes_fp) and os.path.exists(successes_fp)):
+            return
+
+        if errors_fp and not os.path.exists(errors_fp):
+            return
+
+        try:
+            with np.load(hashes_fp, allow_pickle=False) as f:
+                if (
+                    six.text_type(f['format']) != format or
+                    six.text_type(f['config']) != config_digest or
+                    (errors_fp and six.text_type(f['errors_fp']) != errors_fp)
+                ):
+                    return
+                return f['ids'], f['hashes'], f['error_statuses']
+        except (IOError, OSError, KeyError, ValueError):
+            return
+
+    @classmethod
+    def _read_keys_records(cls, fp, format, heading_row, statuses=None):
+        """
+        Reads the records of a keys or keys errors file written by
+        ``write_keys_files`` - returns a pair ``(groups, get_record)``, where
+        ``groups`` is a dict of the positions of the records of each location
+        (keyed by the location ID as a string), in file order, and
+        ``get_record`` returns the record at a position. The records of
+        Oasis keys files are given the statuses ``statuses`` (by default
+        the successful lookup status), and those of binary keys files the
+        successful lookup status.
+        """
+        loc_id_col = list(heading_row)[0]
+
+        if format == 'bin':
+            records = read_keys_bin_file(fp)
+            rec_ids = [six.text_type(loc_id) for loc_id in records['loc_id'].tolist()]
+            cols = list(heading_row)
+            get_record = lambda i: dict(zip(cols, records[i].tolist()), status=KEYS_STATUS_SUCCESS)
+        elif format == 'json':
+            with io.open(fp, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+            rec_ids = [six.text_type(r.get(loc_id_col)) for r in records]
+            get_record = lambda i: records[i]
+        else:
+            # The values are kept as strings so that they are written back
+            # as they were read
+            df = pd.read_csv(fp, dtype=object, keep_default_na=False, encoding='utf-8')
+            df.columns = list(heading_row)
+            if statuses is None:
+                statuses = [KEYS_STATUS_SUCCESS] * len(df)
+            elif len(statuses) != len(df):
+                raise OasisException('The number of records in {} does not match the number of saved record statuses'.format(fp))
+            rec_ids = df[loc_id_col].values
+            cols = list(heading_row) + ['status']
+            values = df.values
+            get_record = lambda i: dict(zip(cols, list(values[i]) + [statuses[i]]))
+
+        groups = pd.DataFrame({'id': rec_ids}).groupby('id', sort=False).indices if len(rec_ids) else {}
+
+        return groups, get_record
+
+    @classmethod
+    def _incremental_results(
+        cls,
+        lookup,
+        hashes_fp,
+        successes_fp,
+        errors_fp=None,
+        model_exposures=None,
+        model_exposures_fp=None,
+        format='oasis',
+        workers=None,
+        stats=None,
+        loc_id_col='id',
+        spatial_order=False,
+        tiled=False
+    ):
+        """
+        Generates the keys records for an incremental ``save_results`` -
+        returns a pair ``(results, hashes)``, where ``results`` generates the
+        records carried forward from the previous keys files for the
+        unchanged locations and the lookup results for the other locations,
+        in location order, and ``hashes`` is a dict of the location IDs, the
+        location hashes and the statuses of the keys errors records (filled
+        in as the records are generated) to save with the new keys files, or
+        ``None`` if the location IDs are not usable for incremental runs.
+
+        The previous keys records are read before returning, so the keys
+        files can then be overwritten.
+        """
+        _timer = lambda phase: stats.timer(phase) if stats is not None else NULL_TIMER
+
+        config_lookup = True
+        try:
+            lookup.config
+        except AttributeError:
+            config_lookup = False
+
+        with _timer('locations.read'):
+            loc_df = (
+                cls.get_lookup_exposures(lookup, model_exposures=model_exposures, model_exposures_fp=model_exposures_fp) if config_lookup
+                else cls.get_model_exposures(model_exposures=model_exposures, model_exposures_file_path=model_exposures_fp)
+            )
+
+        n = len(loc_df)
+
+        ids = None
+        if loc_id_col in loc_df.columns and not (loc_df[loc_id_col].isnull().any() or loc_df[loc_id_col].duplicated().any()):
+            ids = np.array([six.text_type(v) for v in loc_df[loc_id_col].tolist()], dtype=object)
+
+        unchanged = np.zeros(n, dtype=bool)
+        hashes = None
+        prev = None
+
+        if ids is not None:
+            with _timer('locations.hash'):
+                lookup_cols = getattr(lookup, 'lookup_cols', None)
+                hashes = get_location_hashes(
+                    loc_df,
+                    [col for col in (lookup_cols or loc_df.columns) if col not in (loc_id_col, 'index',)]
+                )
+                prev = cls._load_location_hashes(
+                    hashes_fp,
+                    successes_fp,
+                    errors_fp,
+                    format,
+                    cls._lookup_config_digest(lookup)
+                )
+                if prev is not None and len(prev[0]):
+                    pos = pd.Index(prev[0]).get_indexer(ids)
+                    unchanged = (pos >= 0) & (prev[1][np.maximum(pos, 0)] == hashes)
+
+        carried = []
+        if unchanged.any():
+            try:
+                carried.append(cls._read_keys_records(successes_fp, format, cls.oasis_keys_heading_row(loc_id_col)))
+                if errors_fp:
+                    carried.append(cls._read_keys_records(
+                        errors_fp,
+                        'oasis' if format == 'bin' else format,
+                        cls.oasis_keys_errors_heading_row(loc_id_col),
+                        statuses=prev[2]
+                    ))
+            except (IOError, OSError, ValueError, KeyError, OasisException):
+                # Unreadable previous keys files - regenerate all the keys
+                unchanged[:] = False
+                carried = []
+
+        if stats is not None:
+            stats.incr('locations.carried_forward', int(unchanged.sum()))
+
+        changed_loc_df = loc_df[~unchanged]
+
+        error_statuses = []
+
+        def _carried_records(i):
+            for groups, get_record in carried:
+                for j in groups.get(ids[i], ()):
+                    yield get_record(j)
+
+        def _results():
+            new_results = iter(())
+            if len(changed_loc_df):
+                new_results = (
+                    cls.get_results(lookup, model_exposures_df=changed_loc_df, workers=workers, stats=stats, spatial_order=spatial_order, tiled=tiled) if config_lookup
+                    else lookup.process_locations(changed_loc_df)
+                )
+
+            rows = {loc_id: i for i, loc_id in enumerate(ids)} if ids is not None else {}
+
+            # The carried forward records of the unchanged locations before
+            # the location of each new result are generated first
+            next_row = 0
+            for r in new_results:
+                i = rows.get(six.text_type(r.get(loc_id_col)), 0)
+                for k in range(next_row, i):
+                    if unchanged[k]:
+                        for _r in _carried_records(k):
+                            yield _r
+                next_row = max(next_row, i)
+                yield r
+
+            for k in range(next_row, n):
+                if unchanged[k]:
+                    for _r in _carried_records(k):
+                        yield _r
+
+        def _recorded(results):
+            for r in results:
+                if r['status'] != KEYS_STATUS_SUCCESS:
+                    if not errors_fp:
+                        continue
+                    error_statuses.append(r['status'])
+                yield r
+
+        return _recorded(_results()), (
+            {'ids': ids, 'hashes': hashes, 'error_statuses': error_statuses} if ids is not None
+            else None
+        )
+
+    @classmethod
+    def save_keys(
+        cls,
+        lookup=None,
+        keys_id_col='id',
+        keys_file_path=None,
+        keys_errors_file_path=None,
+        keys_format='oasis',
+        model_exposures=None,
+        model_exposures_file_path=None,
+    ):
+        """
+        Writes a keys file, and optionally a keys error file, for the keys
+        generated by the lookup service for the given model, supplier and
+        exposure sfile - requires a lookup service instance (which can be
+        created using the `create` method in this factory class), the path of
+        the model location file, the path of the keys file, and the format of
+        the output file which can be an Oasis keys file (``oasis``) or a
+        simple listing of the records to file (``json``).
+
+        The optional keyword argument ``keys_error_file_path`` if present
+        indicates that all keys records, whether for locations with successful
+        or unsuccessful lookups, will be generated and written to separate
+        files. A keys record with a successful lookup will have a `status`
+        field whose value will be `success`, otherwise the record will have
+        a `status` field value of `failure` or `nomatch`.
+
+        If ``keys_errors_file_path`` is not present then the method returns a
         pair ``(p, n)`` where ``p`` is the keys file path and ``n`` is the
         number of "successful" keys records written to the keys file, otherwise
         it returns a quadruple ``(p1, n1, p2, n2)`` where ``p1`` is the keys
@@ -581,25 +1941,13 @@ class OasisLookupFactory(object):
             success_only=(True if not keys_errors_file_path else False)
         )
 
-        successes = []
-        nonsuccesses = []
-        for k in keys:
-            successes.append(k) if k['status'] == KEYS_STATUS_SUCCESS else nonsuccesses.append(k)
-
-        if keys_format == 'json':
-            if _keys_error_file_path:
-                fp1, n1 = cls.write_json_keys_file(successes, _keys_file_path)
-                fp2, n2 = cls.write_json_keys_file(nonsuccesses, _keys_errors_file_path)
-                return fp1, n1, fp2, n2
-            return cls.write_json_keys_file(successes, _keys_file_path)
-        elif keys_format == 'oasis':
-            if _keys_errors_file_path:
-                fp1, n1 = cls.write_oasis_keys_file(successes, _keys_file_path, id_col=keys_id_col)
-                fp2, n2 = cls.write_oasis_keys_errors_file(nonsuccesses, _keys_errors_file_path, id_col=keys_id_col)
-                return fp1, n1, fp2, n2
-            return cls.write_oasis_keys_file(successes, _keys_file_path, id_col=keys_id_col)
-        else:
-            raise OasisException("Unrecognised keys file output format - valid formats are 'oasis' or 'json'")
+        return cls.write_keys_files(
+            keys,
+            _keys_file_path,
+            errors_fp=_keys_errors_file_path,
+            id_col=keys_id_col,
+            format=keys_format
+        )
 
     @classmethod
     def save_results(
@@ -609,7 +1957,13 @@ class OasisLookupFactory(object):
         errors_fp=None,
         model_exposures=None,
         model_exposures_fp=None,
-        format='oasis'
+        format='oasis',
+        workers=None,
+        stats_fp=None,
+        incremental=False,
+        chunksize=None,
+        spatial_order=False,
+        tiled=False
     ):
         """
         Writes a keys file, and optionally a keys error file, for the keys
@@ -617,8 +1971,9 @@ class OasisLookupFactory(object):
         exposure sfile - requires a lookup service instance (which can be
         created using the `create` method in this factory class), the path of
         the model location file, the path of the keys file, and the format of
-        the output file which can be an Oasis keys file (``oasis``) or a
-        simple listing of the records to file (``json``).
+        the output file which can be an Oasis keys file (``oasis``), a
+        simple listing of the records to file (``json``) or a binary keys
+        file (``bin``, see ``write_keys_files``).
 
         The optional keyword argument ``keys_error_file_path`` if present
         indicates that all keys records, whether for locations with successful
@@ -634,6 +1989,42 @@ class OasisLookupFactory(object):
         file path, ``n1`` is the number of "successful" keys records written to
         the keys file, ``p2`` is the keys errors file path and ``n2`` is the
         number of "unsuccessful" keys records written to keys errors file.
+
+        The optional keyword argument ``workers`` sets the number of lookup
+        processes (see ``get_results``) - it only applies to lookups created
+        from a lookup config. Model keys lookup classes can be run in worker
+        processes with a ``ParallelKeysLookup`` adapter.
+
+        If the optional keyword argument ``stats_fp`` is given then lookup
+        stats are recorded (see ``OasisBaseLookup.enable_stats``), including
+        the time spent writing the files, and written as JSON to this path.
+
+        If the optional keyword argument ``incremental`` is true then the
+        keys are regenerated incrementally - a content hash of the lookup
+        columns of each location (see ``get_location_hashes``) is saved with
+        the keys file, in a sidecar file ``<keys file path>.hashes.npz``, and
+        on the next run only the locations which are new or whose hashes
+        have changed are looked up. The keys records of the other locations
+        are carried forward from the previous keys (and keys errors) files,
+        and the records of locations no longer in the exposures are dropped.
+        The keys are regenerated in full if there is no sidecar file, or if
+        the lookup config or the data files it references (or for a model
+        keys lookup class, the model version or the lookup module), the
+        output format or the keys errors file path have changed since it was
+        written (see ``_lookup_config_digest``). Location IDs must be unique.
+
+        The optional keyword argument ``chunksize`` sets the number of
+        locations to read and look up at a time (see ``get_results`` and
+        ``get_keys``) - it does not apply to incremental runs, which look up
+        the new and changed locations in one batch.
+
+        The optional keyword argument ``spatial_order`` sets whether the
+        locations are looked up in a spatial order (see ``get_results``) -
+        it only applies to lookups created from a lookup config.
+
+        The optional keyword argument ``tiled`` sets whether the locations
+        are split between the workers by spatial tiles (see ``get_results``)
+        - it only applies to lookups created from a lookup config.
         """
         if not (model_exposures or model_exposures_fp):
             raise OasisException('No model exposures data or file path provided')
@@ -643,51 +2034,86 @@ class OasisLookupFactory(object):
         sfp = as_path(successes_fp, 'successes_fp', preexists=False)
         efp = as_path(errors_fp, 'errors_fp', preexists=False)
 
+        stats = None
+        if stats_fp:
+            stats = lookup.enable_stats() if hasattr(lookup, 'enable_stats') else LookupStats()
+
         results = None
 
+        loc_id_col = None
         try:
-            config = lookup.config
+            loc_id_col = lookup.loc_id_col
         except AttributeError:
+            loc_id_col = 'id'
+        else:
+            loc_id_col = loc_id_col.lower()
+
+        hashes_fp = '{}.hashes.npz'.format(sfp)
+        hashes = None
+
+        config_lookup = True
+        try:
+            lookup.config
+        except AttributeError:
+            config_lookup = False
+
+        if incremental:
+            results, hashes = cls._incremental_results(
+                lookup,
+                hashes_fp,
+                sfp,
+                errors_fp=efp,
+                model_exposures=model_exposures,
+                model_exposures_fp=mfp,
+                format=format,
+                workers=workers,
+                stats=stats,
+                loc_id_col=loc_id_col,
+                spatial_order=spatial_order,
+                tiled=tiled
+            )
+            # Any previous hashes no longer match the keys files once these
+            # start being overwritten
+            if os.path.exists(hashes_fp):
+                os.remove(hashes_fp)
+        elif not config_lookup:
             results = cls.get_keys(
                 lookup=lookup,
                 model_exposures=model_exposures,
                 model_exposures_file_path=mfp,
-                success_only=(False if efp else True)
+                success_only=(False if efp else True),
+                chunksize=chunksize
             )
         else:
             results = cls.get_results(
                 lookup,
                 model_exposures=model_exposures,
                 model_exposures_fp=mfp,
-                successes_only=(False if efp else True)
+                successes_only=(False if efp else True),
+                workers=workers,
+                stats=stats,
+                chunksize=chunksize,
+                spatial_order=spatial_order,
+                tiled=tiled
             )
 
-        successes = []
-        nonsuccesses = []
-        for r in results:
-            successes.append(r) if r['status'] == KEYS_STATUS_SUCCESS else nonsuccesses.append(r)
-
-        if format == 'json':
-            if efp:
-                fp1, n1 = cls.write_json_keys_file(successes, sfp)
-                fp2, n2 = cls.write_json_keys_file(nonsuccesses, efp)
-                return fp1, n1, fp2, n2
-            return cls.write_json_keys_file(successes, sfp)
-        elif format == 'oasis':
-            loc_id_col = None
-            try:
-                loc_id_col = lookup.loc_id_col
-            except AttributeError:
-                loc_id_col = 'id'
-            else:
-                loc_id_col = loc_id_col.lower()
-            if efp:
-                fp1, n1 = cls.write_oasis_keys_file(successes, sfp, id_col=loc_id_col)
-                fp2, n2 = cls.write_oasis_keys_errors_file(nonsuccesses, efp, id_col=loc_id_col)
-                return fp1, n1, fp2, n2
-            return cls.write_oasis_keys_file(successes, sfp, id_col=loc_id_col)
-        else:
-            raise OasisException("Unrecognised lookup file output format - valid formats are 'oasis' or 'json'")
+        res = cls.write_keys_files(results, sfp, errors_fp=efp, id_col=loc_id_col, format=format, stats=stats)
+
+        if hashes is not None:
+            np.savez(
+                hashes_fp,
+                ids=np.array(hashes['ids'], dtype=six.text_type),
+                hashes=hashes['hashes'],
+                error_statuses=np.array(hashes['error_statuses'], dtype=six.text_type),
+                format=np.array(format, dtype=six.text_type),
+                errors_fp=np.array(efp or '', dtype=six.text_type),
+                config=np.array(cls._lookup_config_digest(lookup), dtype=six.text_type)
+            )
+
+        if stats is not None:
+            stats.dump(as_path(stats_fp, 'stats_fp', preexists=False))
+
+        return res
 
 
 class OasisLookup(OasisBaseLookup):
@@ -737,6 +2163,25 @@ class OasisLookup(OasisBaseLookup):
             loc_id_col=self.loc_id_col
         )
 
+    def enable_stats(self, stats=None):
+        stats = super(self.__class__, self).enable_stats(stats=stats)
+        self.peril_lookup.enable_stats(stats=stats)
+        self.vulnerability_lookup.enable_stats(stats=stats)
+        return stats
+
+    def disable_stats(self):
+        super(self.__class__, self).disable_stats()
+        self.peril_lookup.disable_stats()
+        self.vulnerability_lookup.disable_stats()
+
+    @property
+    def lookup_cols(self):
+        pcols = self.peril_lookup.lookup_cols
+        vcols = self.vulnerability_lookup.lookup_cols
+        if pcols is None or vcols is None:
+            return None
+        return pcols + tuple(col for col in vcols if col not in pcols)
+
     def lookup(self, loc, peril_id, coverage_type):
 
         loc_id_col = self.loc_id_col
@@ -782,6 +2227,76 @@ class OasisLookup(OasisBaseLookup):
             )
         }
 
+    @oasis_log()
+    def bulk_lookup(self, locs, **kwargs):
+        """
+        Bulk combined peril area and vulnerability lookup - as for the base
+        class method, but if the locations are provided as a Pandas dataframe
+        then the peril area lookup is done for all (peril ID, coverage type)
+        pairs from a single spatial query of the peril areas index (see
+        ``OasisPerilLookup.bulk_lookup_coords_for_pairs``), and the
+        vulnerability lookup by joins for each pair (see
+        ``OasisVulnerabilityLookup.bulk_lookup_frame``).
+
+        Generates results using ``yield``.
+        """
+        if not isinstance(locs, pd.DataFrame):
+            for r in super(self.__class__, self).bulk_lookup(locs, **kwargs):
+                yield r
+            return
+
+        loc_id_col = self.loc_id_col
+        peril_lookup = self.peril_lookup
+        vuln_lookup = self.vulnerability_lookup
+        key_cols = vuln_lookup.key_cols
+
+        n = len(locs)
+        _col = lambda col: locs[col].tolist() if col in locs.columns else [None] * n
+
+        loc_ids = get_location_ids(locs, loc_id_col)
+
+        pairs = tuple(itertools.product(self.peril_ids, self.coverage_types))
+
+        presults = peril_lookup.bulk_lookup_coords_for_pairs(
+            _col(peril_lookup.loc_coords_x_col), _col(peril_lookup.loc_coords_y_col), pairs
+        )
+        presults = tuple(
+            tuple(zip(*(r[col].tolist() for col in ('status', 'peril_area_id', 'message'))))
+            for r in six.itervalues(presults)
+        )
+
+        vresults = (vuln_lookup.bulk_lookup_frame(locs, peril_id, coverage_type) for peril_id, coverage_type in pairs)
+        vresults = tuple(
+            tuple(zip(*(r[col].tolist() for col in ('status', 'vulnerability_id', 'message') + key_cols)))
+            for r in vresults
+        )
+
+        for i in range(n):
+            loc_id = loc_ids[i]
+            for (peril_id, coverage_type), pres, vres in zip(pairs, presults, vresults):
+                past, paid, pamsg = pres[i]
+                vlnst, vlnid, vlnmsg = vres[i][:3]
+
+                status = (
+                    KEYS_STATUS_SUCCESS if past == vlnst == KEYS_STATUS_SUCCESS
+                    else (KEYS_STATUS_FAIL if (past == KEYS_STATUS_FAIL or vlnst == KEYS_STATUS_FAIL) else KEYS_STATUS_NOMATCH)
+                )
+
+                yield {
+                    k:v for k, v in itertools.chain(
+                        (
+                            (loc_id_col, loc_id),
+                            ('peril_id', peril_id),
+                            ('coverage_type', coverage_type),
+                            (self.peril_area_id_key, paid),
+                            (self.vulnerability_id_key, vlnid),
+                            ('status', status),
+                            ('message', '{}; {}'.format(pamsg, vlnmsg)),
+                        ),
+                        zip(key_cols, vres[i][3:])
+                    )
+                }
+
 
 class OasisPerilLookup(OasisBaseLookup):
     """
@@ -802,6 +2317,12 @@ class OasisPerilLookup(OasisBaseLookup):
     # polygons in order to be assigned an peril area ID. By default this distance
     # is 0, which means any lon/lat location outside the polygon containing all
     # peril area polygons will not be assigned a peril area ID.
+    #
+    # Locations with invalid coordinates (not numeric, or outside the
+    # configured coordinate bounds), or outside the global boundary by more
+    # than this distance, are rejected before the index is queried, with a
+    # ``fail`` status and a message containing a reason code (see the
+    # ``KEYS_ERROR_*`` codes in ``oasislmf/utils/status.py``).
     """
 
     @oasis_log()
@@ -833,6 +2354,12 @@ class OasisPerilLookup(OasisBaseLookup):
                     DEFAULT_RTREE_INDEX_PROPS
                 )
                 self.peril_areas_index = PerilAreasIndex(areas=areas, peril_areas=peril_areas, properties=self.index_props)
+            elif peril_config.get('grid_index'):
+                self.peril_areas_index = PerilAreasGridIndex(
+                    peril_ids=self.peril_ids,
+                    coverage_types=self.coverage_types,
+                    **peril_config['grid_index']
+                )
             else:
                 areas_rtree_index_config = peril_config.get('rtree_index') or {}
                 index_fp = as_path(peril_areas_index_fp or areas_rtree_index_config.get('filename'), 'index_fp', preexists=False)
@@ -841,7 +2368,7 @@ class OasisPerilLookup(OasisBaseLookup):
                     dat_ext = areas_rtree_index_config.get('dat_extension') or 'dat'
                     if not (os.path.exists('{}.{}'.format(index_fp, idx_ext)) or os.path.exists('{}.{}'.format(index_fp, dat_ext))):
                         raise OasisException('No Rtree file index {}.{{idx_ext, dat_ext}} found'.format(index_fp))
-                    self.peril_areas_index = PerilAreasIndex(fp=index_fp)
+                    self.peril_areas_index = PerilAreasIndex(fp=index_fp, in_memory=bool(areas_rtree_index_config.get('in_memory')))
                     self.peril_areas_index_props = self.peril_areas_index.properties.as_dict()
 
             self.peril_areas_boundary = box(*self.peril_areas_index.bounds, ccw=False)
@@ -854,6 +2381,16 @@ class OasisPerilLookup(OasisBaseLookup):
                 self.config['peril'].get('loc_to_global_areas_boundary_min_distance') or 0
             )
 
+        lookup_cache_config = peril_config.get('lookup_cache') or {}
+        self.lookup_cache = LRUCache(maxsize=lookup_cache_config.get('size') or DEFAULT_PERIL_LOOKUP_CACHE_SIZE) if lookup_cache_config else None
+        self.lookup_cache_precision = int(lookup_cache_config.get('precision') or DEFAULT_PERIL_LOOKUP_CACHE_PRECISION)
+
+        self.exact_containment = (
+            bool(peril_config.get('exact_containment')) and
+            not isinstance(getattr(self, 'peril_areas_index', None), PerilAreasGridIndex)
+        )
+        self._area_geometries = {}
+
         if self.config.get('locations'):
             self.loc_id_col = str.lower(str(self.config['locations'].get('id_col') or loc_id_col))
             self.loc_coords_x_col = str.lower(str(self.config['locations'].get('coords_x_col')) or 'lon')
@@ -861,6 +2398,186 @@ class OasisPerilLookup(OasisBaseLookup):
             self.loc_coords_x_bounds = tuple(self.config['locations'].get('coords_x_bounds') or ()) or (-180, 180)
             self.loc_coords_y_bounds = tuple(self.config['locations'].get('coords_y_bounds') or ()) or (-90, 90)
 
+    def enable_stats(self, stats=None):
+        """
+        As for the base class method - if the peril areas index was loaded
+        into memory (the ``in_memory`` option of the ``rtree_index`` config)
+        then the index load time (``peril.index_load``), number of entries
+        (``peril.index_load_entries``), file index size in bytes
+        (``peril.index_load_file_size``) and resident memory growth in bytes
+        (``peril.index_load_memory``) are recorded in the first stats record
+        enabled, so that they are only counted once, including in worker
+        processes.
+        """
+        stats = super(self.__class__, self).enable_stats(stats=stats)
+
+        load_stats = getattr(getattr(self, 'peril_areas_index', None), 'load_stats', None)
+        if load_stats and not getattr(self, '_index_load_recorded', False):
+            stats.add_time('peril.index_load', load_stats['time'])
+            stats.incr('peril.index_load_entries', load_stats['entries'])
+            stats.incr('peril.index_load_file_size', load_stats['file_size'])
+            if load_stats['memory'] is not None:
+                stats.incr('peril.index_load_memory', load_stats['memory'])
+            self._index_load_recorded = True
+
+        return stats
+
+    @property
+    def lookup_cols(self):
+        try:
+            return (self.loc_coords_x_col, self.loc_coords_y_col,)
+        except AttributeError:
+            return None
+
+    def _get_area_geometry(self, peril_id, coverage_type, peril_area_id, coordinates):
+        """
+        Returns a pair ``(polygon, prepared polygon)`` for a peril area, from
+        its coordinates - these are created on first use and kept for the
+        lifetime of the lookup.
+        """
+        key = (peril_id, coverage_type, peril_area_id)
+        try:
+            return self._area_geometries[key]
+        except KeyError:
+            poly = Polygon(coordinates)
+            self._area_geometries[key] = poly, prep(poly)
+            return self._area_geometries[key]
+
+    def _refine_area_candidates(self, x, y, qidxs, rows):
+        """
+        Exact containment check of bulk area candidates - the point indices
+        ``qidxs`` and areas table rows ``rows`` as returned by
+        ``_bulk_area_candidates`` - keeping only the candidates whose peril
+        area polygon covers the point. The points for each candidate area are
+        tested together against the prepared polygon of the area.
+        """
+        if not len(rows):
+            return qidxs, rows
+
+        areas = self.areas_table
+        keep = np.zeros(len(rows), dtype=bool)
+
+        order = np.argsort(rows, kind='mergesort')
+        area_rows, starts = np.unique(rows[order], return_index=True)
+        for row, idxs in zip(area_rows.tolist(), np.split(order, starts[1:])):
+            poly, prepared = self._get_area_geometry(
+                areas['peril_id'].values[row],
+                areas['coverage_type'].values[row],
+                areas['peril_area_id'].values[row],
+                self._get_area_objects([row])[1][0]
+            )
+            keep[idxs] = get_points_covered(poly, x[qidxs[idxs]], y[qidxs[idxs]], prepared=prepared)
+
+        return qidxs[keep], rows[keep]
+
+    def _lookup_nearest_area(self, x, y, peril_id, coverage_type, nearest=None):
+        """
+        Nearest peril area lookup for a valid (not rejected) lon/lat point
+        with no intersecting peril area for the given peril ID and coverage type -
+        the optional ``nearest`` argument is the list of the nearest index
+        entry objects for the point, if already queried. Returns a tuple
+
+            (status, peril area ID, area bounds, area coordinates, message)
+        """
+        if nearest is None:
+            nearest = list(self.nearest_index.nearest((x, y), objects='raw'))
+
+        if not nearest:
+            return KEYS_STATUS_NOMATCH, None, None, None, 'No peril area match'
+
+        paid = pabnds = pacoords = None
+        for _perid, _covtype, _paid, _pabnds, _pacoords in nearest:
+            if (peril_id, coverage_type) == (_perid, _covtype) and (paid is None or _paid < paid):
+                paid, pabnds, pacoords = _paid, _pabnds, _pacoords
+
+        if paid == None:
+            msg = 'No intersecting or nearest peril area found for peril ID {} and coverage type {}'.format(peril_id, coverage_type)
+            return KEYS_STATUS_NOMATCH, None, None, None, msg
+
+        # The point is within the minimum distance of the global boundary,
+        # otherwise it would have been rejected (see ``_lookup_coords``)
+        return KEYS_STATUS_SUCCESS, paid, pabnds, pacoords, 'Successful peril area lookup: {}'.format(paid)
+
+    def _lookup_coords(self, x, y, peril_id, coverage_type):
+        """
+        Area peril lookup for an individual pair of lon/lat coordinates -
+        returns a tuple
+
+            (x, y, status, peril area ID, area bounds, area coordinates, message)
+
+        where ``x`` and ``y`` are the coordinates as parsed (floats if valid).
+        Points with invalid coordinates, or outside the peril areas global
+        boundary by more than ``loc_to_global_areas_boundary_min_distance``,
+        are rejected without querying the index (see ``_rejection_message``).
+
+        If a lookup cache is configured, with a ``lookup_cache`` dict in the
+        peril config with optional keys ``size`` (maximum number of results
+        to keep) and ``precision`` (number of decimal places), results for
+        valid coordinates are cached using the coordinates rounded to the
+        given precision, and the peril ID and coverage type as the key -
+        so locations whose coordinates are the same to that precision share
+        the same result. Bulk lookups use the cache in the same way (see
+        ``bulk_lookup_coords_for_pairs``).
+        """
+        loc_x_bounds = self.loc_coords_x_bounds
+        loc_y_bounds = self.loc_coords_y_bounds
+
+        try:
+            x = float(x)
+            y = float(y)
+        except (ValueError, TypeError):
+            reason = KEYS_ERROR_INVALID_COORDS
+        else:
+            if x != x or y != y:
+                reason = KEYS_ERROR_INVALID_COORDS
+            elif not ((loc_x_bounds[0] <= x <= loc_x_bounds[1]) and (loc_y_bounds[0] <= y <= loc_y_bounds[1])):
+                reason = KEYS_ERROR_COORDS_OUT_OF_BOUNDS
+            elif self._boundary_distances(x, y) > self.loc_to_global_areas_boundary_min_distance:
+                reason = KEYS_ERROR_OUTSIDE_PERIL_AREAS
+            else:
+                reason = None
+
+        if reason:
+            return x, y, KEYS_STATUS_FAIL, None, None, None, self._rejection_message(reason)
+
+        cache = self.lookup_cache
+        if cache is not None:
+            precision = self.lookup_cache_precision
+            cache_key = (round(x, precision), round(y, precision), peril_id, coverage_type)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return (x, y,) + cached
+
+        try:
+            paid = pabnds = pacoords = None
+            entries = self.peril_areas_index.intersection((x, y), objects='raw')
+            if self.stats is not None:
+                with self.stats.timer('peril.index_query'):
+                    entries = list(entries)
+                self.stats.incr('peril.index_queries')
+                self.stats.count_value('peril.index_candidates', len(entries))
+
+            # Of several matching areas (e.g. for a point on a shared
+            # boundary) the one with the lowest ID is used, so that the
+            # result does not depend on the layout of the index tree
+            for _perid, _covtype, _paid, _pabnds, _pacoords in entries:
+                if (peril_id, coverage_type) == (_perid, _covtype) and (paid is None or _paid < paid):
+                    if self.exact_containment and not self._get_area_geometry(_perid, _covtype, _paid, _pacoords)[1].covers(Point(x, y)):
+                        continue
+                    paid, pabnds, pacoords = _paid, _pabnds, _pacoords
+
+            if paid != None:
+                st, msg = KEYS_STATUS_SUCCESS, 'Successful peril area lookup: {}'.format(paid)
+            else:
+                st, paid, pabnds, pacoords, msg = self._lookup_nearest_area(x, y, peril_id, coverage_type)
+        except RTreeError as e:
+            return x, y, KEYS_STATUS_FAIL, None, None, None, str(e)
+
+        if cache is not None:
+            cache.put(cache_key, (st, paid, pabnds, pacoords, msg))
+
+        return x, y, st, paid, pabnds, pacoords, msg
+
     def lookup(self, loc, peril_id, coverage_type):
         """
         Area peril lookup for an individual lon/lat location item, which can be
@@ -868,28 +2585,25 @@ class OasisPerilLookup(OasisBaseLookup):
         the keys `lon` or `longitude` for longitude and `lat` or `latitude` for
         latitude.
         """
-        idx = self.peril_areas_index
-        boundary = self.peril_areas_boundary
-        loc_to_areas_min_dist = self.loc_to_global_areas_boundary_min_distance
-
         loc_id_col = self.loc_id_col
 
         loc_id = loc.get(loc_id_col) or int(uuid.UUID(bytes=os.urandom(16)).hex[:16], 16)
 
         loc_x_col = self.loc_coords_x_col
         loc_y_col = self.loc_coords_y_col
-        loc_x_bounds = self.loc_coords_x_bounds
-        loc_y_bounds = self.loc_coords_y_bounds
 
-        x = loc.get(loc_x_col)
-        y = loc.get(loc_y_col)
+        with self._timer('peril.lookup'):
+            x, y, st, paid, pabnds, pacoords, msg = self._lookup_coords(loc.get(loc_x_col), loc.get(loc_y_col), peril_id, coverage_type)
 
-        _lookup = lambda loc_id, x, y, st, perid, covtype, paid, pabnds, pacoords, msg: {
+        if self.stats is not None:
+            self.stats.count_value('peril.statuses', st)
+
+        return {
             loc_id_col: loc_id,
             loc_x_col: x,
             loc_y_col: y,
-            'peril_id': perid,
-            'coverage_type': covtype,
+            'peril_id': peril_id,
+            'coverage_type': coverage_type,
             'status': st,
             'peril_area_id': paid,
             'area_peril_id': paid,
@@ -898,77 +2612,591 @@ class OasisPerilLookup(OasisBaseLookup):
             'message': msg
         }
 
-        try:
-            x = float(x)
-            y = float(y)
-            if not ((loc_x_bounds[0] <= x <= loc_x_bounds[1]) and (loc_y_bounds[0] <= y <= loc_y_bounds[1])):
-                raise ValueError('{}/{} out of bounds'.format(loc_x_col, loc_y_col))
-        except (ValueError, TypeError) as e:
+    @property
+    def areas_table(self):
+        """
+        Peril areas index entries as a dataframe (see
+        ``PerilAreasIndex.get_areas_table``) - loaded on first access. For
+        an index with a payload store the table has no ``bounds`` and
+        ``coordinates`` columns, as these are read from the store only for
+        the areas needed (see ``_get_area_objects``).
+        """
+        if getattr(self, '_areas_table', None) is None:
+            if self.payload_store is not None:
+                self._areas_table = self.peril_areas_index.get_areas_table(objects=False)
+            else:
+                self._areas_table = self.peril_areas_index.get_areas_table()
+        return self._areas_table
+
+    @property
+    def nearest_index(self):
+        """
+        The index used for nearest peril area queries - the peril areas index
+        unless the lookup is running with a sub-index of it, which only has
+        the areas around some of the locations (see
+        ``bulk_lookup_in_workers``), in which case it is the full index
+        (``peril_areas_nearest_index``), as the nearest areas of a point can
+        be anywhere.
+        """
+        index = getattr(self, 'peril_areas_nearest_index', None)
+        return index if index is not None else self.peril_areas_index
+
+    @property
+    def payload_store(self):
+        """
+        The payload store of the peril areas index, if any (see
+        ``PerilAreasPayloadStore``).
+        """
+        return getattr(self.peril_areas_index, 'payload_store', None)
+
+    def _get_area_objects(self, rows):
+        """
+        Returns a pair of object arrays of the bounds and coordinates of the
+        areas in the given rows of the areas table.
+        """
+        store = self.payload_store
+        if store is None:
+            areas = self.areas_table
+            return areas['bounds'].values[rows], areas['coordinates'].values[rows]
+
+        return (
+            pd.Series(store.get_bounds(rows), dtype=object).values,
+            pd.Series(store.get_coordinates(rows), dtype=object).values
+        )
+
+    def _boundary_distances(self, x, y):
+        """
+        Distances of lon/lat points (floats or arrays of floats) from the
+        peril areas global boundary (a box) - zero for points in the box.
+        """
+        minx, miny, maxx, maxy = self.peril_areas_boundary.bounds
+
+        dx = np.maximum(np.maximum(minx - x, x - maxx), 0)
+        dy = np.maximum(np.maximum(miny - y, y - maxy), 0)
+
+        return np.hypot(dx, dy)
+
+    def _record_index_locality(self, area_keys):
+        """
+        Records the locality of a sequence of index queries in the lookup
+        stats, if enabled - ``area_keys`` is an array of the first candidate
+        area (row or grid cell) of each query, in query order, or -1 if none.
+        The ``peril.index_locality_hits`` counter is the number of queries
+        with the same first candidate area as the previous query, which
+        read the same index pages, and so is a measure of the index page
+        buffer hits, out of ``peril.index_locality_queries`` queries.
+        """
+        if self.stats is None or not len(area_keys):
+            return
+
+        self.stats.incr('peril.index_locality_queries', len(area_keys))
+        self.stats.incr('peril.index_locality_hits', np.count_nonzero((area_keys[1:] == area_keys[:-1]) & (area_keys[1:] >= 0)))
+
+    def _rejection_message(self, reason):
+        """
+        Lookup message for a point rejected before the index query, for the
+        given reason code - ``Peril area lookup: <reason> [<reason code>]``.
+        These messages replace the earlier per-location messages, which
+        included the coordinates, so that rejected locations can be grouped
+        by reason in the keys errors file.
+        """
+        if reason == KEYS_ERROR_INVALID_COORDS:
+            msg = 'invalid {}/{} - not numeric'.format(self.loc_coords_x_col, self.loc_coords_y_col)
+        elif reason == KEYS_ERROR_COORDS_OUT_OF_BOUNDS:
+            msg = 'invalid {}/{} - out of bounds'.format(self.loc_coords_x_col, self.loc_coords_y_col)
+        else:
             msg = (
-                'Peril area lookup: invalid {}/{} ({}, {}) - {}'
-                .format(loc_x_col, loc_y_col, x, y, str(e))
+                'location is more than {} units from the peril areas '
+                'global boundary'.format(self.loc_to_global_areas_boundary_min_distance)
             )
-            return _lookup(loc_id, x, y, KEYS_STATUS_FAIL, peril_id, coverage_type, None, None, None, msg)
 
-        st = KEYS_STATUS_NOMATCH
-        msg = 'No peril area match'
-        paid = None
-        pabnds = None
-        pacoords = None
-        point = x, y
+        return 'Peril area lookup: {} [{}]'.format(msg, reason)
 
-        try:
-            results = list(idx.intersection(point, objects='raw'))
+    def _bulk_validate_coords(self, xs, ys):
+        """
+        Parses arrays of lon/lat coordinates as floats (nulls where not
+        numeric) and checks them - returns a triple ``(x, y, reasons)``
+        where ``reasons`` is an object array of the rejection reason codes
+        of the points, as in ``_lookup_coords``, with nulls for the points
+        to look up: those with numeric coordinates within the configured
+        coordinate bounds, and within ``loc_to_global_areas_boundary_min_distance``
+        of the peril areas global boundary.
+        """
+        x = pd.to_numeric(pd.Series(xs), errors='coerce').values.astype(np.float64)
+        y = pd.to_numeric(pd.Series(ys), errors='coerce').values.astype(np.float64)
 
-            if not results:
-                raise IndexError
+        loc_x_bounds = self.loc_coords_x_bounds
+        loc_y_bounds = self.loc_coords_y_bounds
 
-            for _perid, _covtype, _paid, _pabnds, _pacoords in results:
-                if (peril_id, coverage_type) == (_perid, _covtype):
-                    paid, pabnds, pacoords = _paid, _pabnds, _pacoords
-                    break
+        invalid = np.isnan(x) | np.isnan(y)
+        with np.errstate(invalid='ignore'):
+            out_of_bounds = ~invalid & ~(
+                (x >= loc_x_bounds[0]) & (x <= loc_x_bounds[1]) &
+                (y >= loc_y_bounds[0]) & (y <= loc_y_bounds[1])
+            )
 
-            if paid == None:
-                raise IndexError
-        except IndexError:
-            try:
-                results = list(idx.nearest(point, objects='raw'))
+        outside = ~(invalid | out_of_bounds)
+        outside[outside] = self._boundary_distances(x[outside], y[outside]) > self.loc_to_global_areas_boundary_min_distance
 
-                if not results:
-                    raise IndexError
+        reasons = np.full(len(x), None, dtype=object)
+        reasons[invalid] = KEYS_ERROR_INVALID_COORDS
+        reasons[out_of_bounds] = KEYS_ERROR_COORDS_OUT_OF_BOUNDS
+        reasons[outside] = KEYS_ERROR_OUTSIDE_PERIL_AREAS
 
-                for _perid, _covtype, _paid, _pabnds, _pacoords in results:
-                    if (peril_id, coverage_type) == (_perid, _covtype):
-                        paid, pabnds, pacoords = _paid, _pabnds, _pacoords
-                        break
+        return x, y, reasons
 
-                if paid == None:
-                    msg = 'No intersecting or nearest peril area found for peril ID {} and coverage type {}'.format(peril_id, coverage_type)
-                    return _lookup(loc_id, x, y, KEYS_STATUS_NOMATCH, peril_id, coverage_type, None, None, None, msg)
-            except IndexError:
-                pass
-            else:
-                p = Point(x, y)
-                min_dist = p.distance(boundary)
-                if min_dist > loc_to_areas_min_dist:
-                    msg = (
-                        'Peril area lookup: location is {} units from the '
-                        'peril areas global boundary -  the required minimum '
-                        'distance is {} units'
-                        .format(min_dist, loc_to_areas_min_dist)
-                    )
-                    return _lookup(loc_id, x, y, KEYS_STATUS_FAIL, peril_id, coverage_type, None, None, None, msg)
-                st = KEYS_STATUS_SUCCESS
-                msg = (
-                    'Successful peril area lookup: {}'.format(paid)
+    def _bulk_area_rows(self, idxs, ids, counts):
+        """
+        Resolves the IDs returned by a bulk index query for the points with
+        indices ``idxs`` - the flattened IDs ``ids`` with ``counts[i]`` IDs
+        for the ``i``-th point - to rows of the areas table with those IDs,
+        for all perils and coverage types. Returns a pair of arrays ``(qidxs,
+        rows)`` of point indices and area rows, in query order.
+        """
+        if self.payload_store is not None:
+            # The index entry IDs are the areas table (payload store) rows
+            return np.repeat(idxs, counts), ids
+
+        areas = self.areas_table
+
+        paids = areas['peril_area_id'].values.astype(np.int64)
+        order = np.argsort(paids, kind='mergesort')
+        sorted_paids = paids[order]
+
+        lo = np.searchsorted(sorted_paids, ids, side='left')
+        hi = np.searchsorted(sorted_paids, ids, side='right')
+        nrows = hi - lo
+
+        qidxs = np.repeat(np.repeat(idxs, counts), nrows)
+        offsets = np.arange(nrows.sum()) - np.repeat(np.cumsum(nrows) - nrows, nrows)
+        rows = order[np.repeat(lo, nrows) + offsets]
+
+        return qidxs, rows
+
+    def _bulk_area_candidates(self, x, y, idxs):
+        """
+        Runs a single bulk index query for the points ``(x[i], y[i])`` for
+        the indices ``i`` in ``idxs``, and resolves the IDs returned to rows
+        of the areas table whose bounds contain the points, for all perils
+        and coverage types. Returns a pair of arrays ``(qidxs, rows)`` of
+        point indices and candidate area rows, with the candidates for each
+        point in index query order. Area rows are found by area ID, so area
+        IDs should be unique for each peril and coverage type.
+        """
+        empty = np.zeros(0, dtype=np.int64)
+
+        areas = self.areas_table
+        if not (len(idxs) and len(areas)):
+            return empty, empty
+
+        with self._timer('peril.index_query'):
+            ids, counts = self.peril_areas_index.bulk_intersection(x[idxs], y[idxs])
+
+        if self.stats is not None:
+            self.stats.incr('peril.index_queries', len(idxs))
+            self.stats.add_to_histogram('peril.index_candidates', counts)
+
+        if not len(ids):
+            return empty, empty
+
+        with self._timer('peril.candidate_matching'):
+            qidxs, rows = self._bulk_area_rows(idxs, ids, counts)
+
+            qx = x[qidxs]
+            qy = y[qidxs]
+            contains = (
+                (areas['minx'].values[rows] <= qx) & (qx <= areas['maxx'].values[rows]) &
+                (areas['miny'].values[rows] <= qy) & (qy <= areas['maxy'].values[rows])
+            )
+
+            qidxs, rows = qidxs[contains], rows[contains]
+
+        if self.exact_containment:
+            with self._timer('peril.exact_containment'):
+                return self._refine_area_candidates(x, y, qidxs, rows)
+
+        return qidxs, rows
+
+    def _bulk_nearest_area_candidates(self, x, y, idxs):
+        """
+        Runs a single bulk nearest neighbour query of the index for the
+        points ``(x[i], y[i])`` for the indices ``i`` in ``idxs``, and
+        resolves the IDs returned to rows of the areas table, keeping only
+        rows at the least distance from the point (as there may be rows with
+        the same ID for other perils or coverage types). Returns a triple
+        ``(qidxs, rows, has_nearest)`` where ``qidxs`` and ``rows`` are as for
+        ``_bulk_area_candidates``, and ``has_nearest`` is a boolean array
+        indicating which points have any nearest areas.
+        """
+        empty = np.zeros(0, dtype=np.int64)
+
+        has_nearest = np.zeros(len(x), dtype=bool)
+
+        areas = self.areas_table
+        if not (len(idxs) and len(areas)):
+            return empty, empty, has_nearest
+
+        with self._timer('peril.nearest_query'):
+            ids, counts = self.nearest_index.bulk_nearest(x[idxs], y[idxs])
+
+        if self.stats is not None:
+            self.stats.incr('peril.nearest_queries', len(idxs))
+            self.stats.add_to_histogram('peril.nearest_candidates', counts)
+
+        has_nearest[idxs] = counts > 0
+        if not len(ids):
+            return empty, empty, has_nearest
+
+        qidxs, rows = self._bulk_area_rows(idxs, ids, counts)
+        if not len(rows):
+            return empty, empty, has_nearest
+
+        qx = x[qidxs]
+        qy = y[qidxs]
+        dists = np.hypot(
+            np.maximum(np.maximum(areas['minx'].values[rows] - qx, qx - areas['maxx'].values[rows]), 0),
+            np.maximum(np.maximum(areas['miny'].values[rows] - qy, qy - areas['maxy'].values[rows]), 0)
+        )
+
+        starts = np.flatnonzero(np.r_[True, qidxs[1:] != qidxs[:-1]])
+        min_dists = np.repeat(np.minimum.reduceat(dists, starts), np.diff(np.r_[starts, len(qidxs)]))
+        nearest = dists <= min_dists * (1 + 1e-9) + 1e-12
+
+        return qidxs[nearest], rows[nearest], has_nearest
+
+    def _bulk_first_pair_rows(self, n, qidxs, rows, peril_id, coverage_type):
+        """
+        Returns an array of the candidate area rows ``rows`` with the lowest
+        peril area ID for each of ``n`` points (with indices ``qidxs``) whose
+        peril ID and coverage type match the given pair, with -1 for points
+        with no matching candidates.
+        """
+        areas = self.areas_table
+        area_idxs = np.full(n, -1, dtype=np.int64)
+        if not len(rows):
+            return area_idxs
+
+        matched = (areas['peril_id'].values[rows] == peril_id) & (areas['coverage_type'].values[rows] == coverage_type)
+        qidxs, rows = qidxs[matched], rows[matched]
+        order = np.lexsort((areas['peril_area_id'].values[rows], qidxs))
+        matched_qidxs, first = np.unique(qidxs[order], return_index=True)
+        area_idxs[matched_qidxs] = rows[order][first]
+
+        return area_idxs
+
+    def bulk_lookup_coords_for_pairs(self, xs, ys, pairs):
+        """
+        Area peril lookup for arrays (or any sequences) of lon/lat coordinates
+        ``xs`` and ``ys`` for each of a sequence of (peril ID, coverage type)
+        pairs. The coordinates are parsed and checked, and the index queried
+        with all the points in one bulk query, only once for all the pairs -
+        the candidate areas of each point are then matched on peril ID and
+        coverage type for each pair using array operations. Points which fail
+        the coordinate checks, or which are outside the peril areas global
+        boundary by more than ``loc_to_global_areas_boundary_min_distance``,
+        are rejected before the index query, with the coded messages of
+        ``lookup`` (see ``_bulk_validate_coords``).
+
+        Points with no intersecting area for some pair get the nearest area
+        fallback of ``lookup`` - the nearest areas of all these points are
+        found with one bulk nearest neighbour query of the index.
+
+        If a lookup cache is configured (see ``_lookup_coords``) then it is
+        used as by individual lookups of the points, by point and then by
+        pair - only the first point with each key missing from the cache is
+        looked up, and the other points get the cached results, or the
+        result of that point. The results, and the cache hits and misses,
+        are the same as for ``lookup`` as long as the cache does not evict
+        keys of the points during the lookup - otherwise a repeated key
+        still gets the result of the first point with the key.
+
+        Returns an ordered dict of dataframes keyed by pair, each as returned
+        by ``bulk_lookup_coords``.
+        """
+        if self.lookup_cache is not None:
+            return self._cached_bulk_lookup_coords_for_pairs(xs, ys, pairs)
+
+        return self._bulk_lookup_coords_for_pairs(xs, ys, pairs)
+
+    def _cached_bulk_lookup_coords_for_pairs(self, xs, ys, pairs):
+        """
+        Cached bulk lookup (see ``bulk_lookup_coords_for_pairs``).
+        """
+        xs = np.asarray(xs, dtype=object)
+        ys = np.asarray(ys, dtype=object)
+        pairs = tuple(tuple(pair) for pair in pairs)
+        n = len(xs)
+
+        cache = self.lookup_cache
+        precision = self.lookup_cache_precision
+
+        with self._timer('peril.parse_coords'):
+            x, y, reasons = self._bulk_validate_coords(xs, ys)
+        valid = pd.isnull(reasons)
+        vidxs = np.flatnonzero(valid)
+        x, y = x.tolist(), y.tolist()
+
+        # The cache is gone through as for the individual lookups - the
+        # first point with a missing key is looked up for the key, and the
+        # later points with the key get its result (counted as cache hits).
+        # The cache itself is only updated once the points are looked up
+        sources = {}
+        misses = OrderedDict()
+        for i in vidxs.tolist():
+            qx, qy = round(x[i], precision), round(y[i], precision)
+            for pair in pairs:
+                cache_key = (qx, qy) + pair
+                if cache_key in misses:
+                    cache.hits += 1
+                    sources[(i, pair)] = misses[cache_key]
+                    continue
+                cached = cache.get(cache_key)
+                if cached is None:
+                    cached = misses[cache_key] = i
+                sources[(i, pair)] = cached
+
+        # The rejected points are looked up with the misses, for their
+        # rejection results
+        idxs = np.union1d(np.array(sorted(set(six.itervalues(misses))), dtype=np.int64), np.flatnonzero(~valid))
+        pos = dict(zip(idxs.tolist(), range(len(idxs))))
+
+        cols = ('x', 'y', 'status', 'peril_area_id', 'area_bounds', 'area_coordinates', 'message',)
+
+        looked_up = OrderedDict()
+        if len(idxs):
+            looked_up = self._bulk_lookup_coords_for_pairs(xs[idxs], ys[idxs], pairs)
+        looked_up = {
+            pair: list(zip(*(df[col].tolist() for col in cols))) for pair, df in six.iteritems(looked_up)
+        }
+
+        for cache_key, i in six.iteritems(misses):
+            cache.put(cache_key, looked_up[cache_key[2:]][pos[i]][2:])
+
+        results = OrderedDict()
+        for pair in pairs:
+            rows = []
+            # The statuses of the looked up points are already recorded
+            hit_statuses = []
+            for i in range(n):
+                source = sources.get((i, pair))
+                if source is None:
+                    rows.append(looked_up[pair][pos[i]])
+                    continue
+                if source != i:
+                    if not isinstance(source, tuple):
+                        source = looked_up[pair][pos[source]][2:]
+                    hit_statuses.append(source[0])
+                else:
+                    source = looked_up[pair][pos[i]][2:]
+                rows.append((x[i], y[i]) + source)
+
+            if self.stats is not None and hit_statuses:
+                self.stats.add_to_histogram('peril.statuses', hit_statuses)
+
+            values = list(zip(*rows)) if rows else [()] * len(cols)
+            results[pair] = pd.DataFrame(OrderedDict(
+                (col, pd.Series(list(vals), dtype=object).values) for col, vals in zip(cols, values)
+            ))
+
+        return results
+
+    def _bulk_lookup_coords_for_pairs(self, xs, ys, pairs):
+        """
+        Uncached bulk lookup (see ``bulk_lookup_coords_for_pairs``).
+        """
+        xs = np.asarray(xs, dtype=object)
+        ys = np.asarray(ys, dtype=object)
+        n = len(xs)
+
+        with self._timer('peril.parse_coords'):
+            x, y, reasons = self._bulk_validate_coords(xs, ys)
+        rejected = pd.notnull(reasons)
+        valid = ~rejected
+        vidxs = np.flatnonzero(valid)
+
+        # Rejected points keep their coordinates as given where not numeric
+        _xs = np.where(np.isnan(x), xs, x.astype(object))
+        _ys = np.where(np.isnan(y), ys, y.astype(object))
+
+        rejection_msgs = np.full(n, None, dtype=object)
+        if rejected.any():
+            for reason in set(reasons[rejected]):
+                rejection_msgs[reasons == reason] = self._rejection_message(reason)
+            if self.stats is not None:
+                self.stats.add_to_histogram('peril.rejections', reasons[rejected])
+
+        index = self.peril_areas_index
+        query_error = None
+
+        if isinstance(index, PerilAreasGridIndex):
+            cell_ids = np.full(n, -1, dtype=np.int64)
+            with self._timer('peril.index_query'):
+                cell_ids[vidxs] = index.cell_ids(x[vidxs], y[vidxs])
+            self._record_index_locality(cell_ids[vidxs])
+
+            def pair_areas(peril_id, coverage_type):
+                return np.where((peril_id, coverage_type) in index.pairs, cell_ids, -1)
+
+            def nearest_pair_areas(idxs):
+                nearest_cell_ids = np.full(n, -1, dtype=np.int64)
+                nearest_cell_ids[idxs] = index.nearest_cell_ids(x[idxs], y[idxs])
+                has_nearest = nearest_cell_ids >= 0
+                return has_nearest, lambda peril_id, coverage_type: np.where((peril_id, coverage_type) in index.pairs, nearest_cell_ids, -1)
+
+            def get_areas(ids):
+                return (
+                    ids.astype(object),
+                    pd.Series(index.cell_bounds(ids), dtype=object).values,
+                    pd.Series(index.cell_coordinates(ids), dtype=object).values
                 )
-        except RTreeError as e:
-            return _lookup(loc_id, x, y, KEYS_STATUS_FAIL, peril_id, coverage_type, None, None, None, str(e))
         else:
-            st = KEYS_STATUS_SUCCESS
-            msg = 'Successful peril area lookup: {}'.format(paid)
+            try:
+                qidxs, rows = self._bulk_area_candidates(x, y, vidxs)
+            except RTreeError as e:
+                qidxs = rows = np.zeros(0, dtype=np.int64)
+                query_error = str(e)
+            else:
+                if self.stats is not None:
+                    first_rows = np.full(n, -1, dtype=np.int64)
+                    pts, first = np.unique(qidxs, return_index=True)
+                    first_rows[pts] = rows[first]
+                    self._record_index_locality(first_rows[vidxs])
 
-        return _lookup(loc_id, x, y, st, peril_id, coverage_type, paid, pabnds, pacoords, msg)
+            areas = self.areas_table
+
+            def pair_areas(peril_id, coverage_type):
+                return self._bulk_first_pair_rows(n, qidxs, rows, peril_id, coverage_type)
+
+            def nearest_pair_areas(idxs):
+                nqidxs, nrows, has_nearest = self._bulk_nearest_area_candidates(x, y, idxs)
+                return has_nearest, lambda peril_id, coverage_type: self._bulk_first_pair_rows(n, nqidxs, nrows, peril_id, coverage_type)
+
+            def get_areas(area_idxs):
+                return (areas['peril_area_id'].values[area_idxs].astype(object),) + self._get_area_objects(area_idxs)
+
+        pair_area_idxs = OrderedDict((pair, pair_areas(*pair)) for pair in pairs)
+
+        unmatched = np.zeros(n, dtype=bool)
+        for area_idxs in six.itervalues(pair_area_idxs):
+            unmatched |= valid & (area_idxs < 0)
+        uidxs = np.flatnonzero(unmatched)
+
+        has_nearest = np.zeros(n, dtype=bool)
+        nearest_pair_area_idxs = None
+        if len(uidxs) and not query_error:
+            try:
+                has_nearest, nearest_pair_area_idxs = nearest_pair_areas(uidxs)
+            except RTreeError as e:
+                query_error = str(e)
+
+        results = OrderedDict()
+        with self._timer('peril.results'):
+            for (peril_id, coverage_type), area_idxs in six.iteritems(pair_area_idxs):
+                statuses = np.full(n, KEYS_STATUS_SUCCESS, dtype=object)
+                paids = np.full(n, None, dtype=object)
+                bounds = np.full(n, None, dtype=object)
+                coords = np.full(n, None, dtype=object)
+                msgs = rejection_msgs.copy()
+                statuses[rejected] = KEYS_STATUS_FAIL
+
+                found = valid & (area_idxs >= 0)
+                paids[found], bounds[found], coords[found] = get_areas(area_idxs[found])
+                msgs[found] = ['Successful peril area lookup: {}'.format(paid) for paid in paids[found]]
+
+                unfound = valid & ~found
+                if query_error:
+                    statuses[unfound] = KEYS_STATUS_FAIL
+                    msgs[unfound] = query_error
+                elif unfound.any():
+                    nearest_area_idxs = nearest_pair_area_idxs(peril_id, coverage_type)
+
+                    no_areas = unfound & ~has_nearest
+                    statuses[no_areas] = KEYS_STATUS_NOMATCH
+                    msgs[no_areas] = 'No peril area match'
+
+                    no_pair_areas = unfound & has_nearest & (nearest_area_idxs < 0)
+                    statuses[no_pair_areas] = KEYS_STATUS_NOMATCH
+                    msgs[no_pair_areas] = 'No intersecting or nearest peril area found for peril ID {} and coverage type {}'.format(peril_id, coverage_type)
+
+                    near = unfound & has_nearest & (nearest_area_idxs >= 0)
+                    paids[near], bounds[near], coords[near] = get_areas(nearest_area_idxs[near])
+                    msgs[near] = ['Successful peril area lookup: {}'.format(paid) for paid in paids[near]]
+
+                results[(peril_id, coverage_type)] = pd.DataFrame(OrderedDict([
+                    ('x', _xs),
+                    ('y', _ys),
+                    ('status', statuses),
+                    ('peril_area_id', paids),
+                    ('area_bounds', bounds),
+                    ('area_coordinates', coords),
+                    ('message', msgs)
+                ]))
+
+                if self.stats is not None:
+                    self.stats.add_to_histogram('peril.statuses', statuses)
+
+        return results
+
+    def bulk_lookup_coords(self, xs, ys, peril_id, coverage_type):
+        """
+        Area peril lookup for arrays (or any sequences) of lon/lat coordinates
+        ``xs`` and ``ys`` for a given peril ID and coverage type, using a
+        bulk index query (see ``bulk_lookup_coords_for_pairs``).
+
+        Returns a dataframe with the columns ``x``, ``y``, ``status``,
+        ``peril_area_id``, ``area_bounds``, ``area_coordinates`` and
+        ``message``, with one row for each point, in the order given. The
+        results are the same as those of ``lookup`` for the individual points.
+        """
+        return self.bulk_lookup_coords_for_pairs(xs, ys, ((peril_id, coverage_type),))[(peril_id, coverage_type)]
+
+    @oasis_log()
+    def bulk_lookup(self, locs, **kwargs):
+        """
+        Bulk area peril lookup - as for the base class method, but if the
+        locations are provided as a Pandas dataframe then the lookup is done
+        using ``bulk_lookup_coords_for_pairs`` for all the (peril ID,
+        coverage type) pairs.
+
+        Generates results using ``yield``.
+        """
+        if not isinstance(locs, pd.DataFrame):
+            for r in super(self.__class__, self).bulk_lookup(locs, **kwargs):
+                yield r
+            return
+
+        loc_id_col = self.loc_id_col
+        loc_x_col = self.loc_coords_x_col
+        loc_y_col = self.loc_coords_y_col
+
+        n = len(locs)
+        _col = lambda col: locs[col].tolist() if col in locs.columns else [None] * n
+
+        loc_ids = get_location_ids(locs, loc_id_col)
+
+        pairs = tuple(itertools.product(self.peril_ids, self.coverage_types))
+        results = self.bulk_lookup_coords_for_pairs(_col(loc_x_col), _col(loc_y_col), pairs)
+        results = tuple(
+            tuple(zip(*(r[col].tolist() for col in ('x', 'y', 'status', 'peril_area_id', 'area_bounds', 'area_coordinates', 'message'))))
+            for r in six.itervalues(results)
+        )
+
+        for i in range(n):
+            for (peril_id, coverage_type), res in zip(pairs, results):
+                x, y, st, paid, pabnds, pacoords, msg = res[i]
+                yield {
+                    loc_id_col: loc_ids[i],
+                    loc_x_col: x,
+                    loc_y_col: y,
+                    'peril_id': peril_id,
+                    'coverage_type': coverage_type,
+                    'status': st,
+                    'peril_area_id': paid,
+                    'area_peril_id': paid,
+                    'area_bounds': pabnds,
+                    'area_coordinates': pacoords,
+                    'message': msg
+                }
 
 
 class OasisVulnerabilityLookup(OasisBaseLookup):
@@ -993,6 +3221,13 @@ class OasisVulnerabilityLookup(OasisBaseLookup):
         if self.config.get('locations'):
             self.loc_id_col = str.lower(str(self.config['locations'].get('id_col') or loc_id_col))
 
+    @property
+    def lookup_cols(self):
+        try:
+            return tuple(self.key_cols) + tuple(['coverage'] if 'coverage_type' in self.key_cols else [])
+        except AttributeError:
+            return None
+
     @oasis_log()
     def get_vulnerabilities(self, vulnerabilities=None):
         if not self.config:
@@ -1034,6 +3269,18 @@ class OasisVulnerabilityLookup(OasisBaseLookup):
 
         vuln_id_col = str(str(self.config['vulnerability'].get('vulnerability_id_col')) or 'vulnerability_id').lower()
 
+        backend = str(vuln_config.get('backend') or 'dict').lower()
+
+        if backend not in ('dict', 'array',):
+            raise OasisException('Invalid vulnerability backend "{}" - the backend must be "dict" or "array"'.format(backend))
+
+        numeric_cols = tuple(col for col in key_cols if col_dtypes.get(col) in (int, float, bool))
+
+        def _vuln_table(vuln_df):
+            if vuln_id_col not in vuln_df.columns:
+                vuln_df = vuln_df.rename(columns={'vulnerability_id': vuln_id_col})
+            return VulnerabilityTable.from_dataframe(vuln_df, key_cols, vulnerability_id_col=vuln_id_col, numeric_cols=numeric_cols)
+
         def _vuln_dict(vulns_seq, key_cols, vuln_id_col):
             return (
                 {v[key_cols[0]]:(v.get(vuln_id_col) or v.get('vulnerability_id')) for _, v in vulns_seq} if len(key_cols) == 1
@@ -1043,6 +3290,8 @@ class OasisVulnerabilityLookup(OasisBaseLookup):
             )
 
         if vulnerabilities:
+            if backend == 'array':
+                return col_dtypes, key_cols, vuln_id_col, _vuln_table(pd.DataFrame(list(vulnerabilities)).rename(columns=lambda c: c.lower()))
             return col_dtypes, key_cols, vuln_id_col, _vuln_dict(enumerate(vulnerabilities), key_cols)
 
         src_fp = vuln_config.get('file_path')
@@ -1057,6 +3306,26 @@ class OasisVulnerabilityLookup(OasisBaseLookup):
 
         self.config['vulnerability']['file_path'] = src_fp
 
+        cache_fp = vuln_config.get('cache') if backend == 'array' and os.path.exists(src_fp) else None
+        if cache_fp:
+            cache_fp = '{}.npz'.format(src_fp) if cache_fp is True else os.path.abspath(cache_fp)
+            # The cache file is only used for the same source file, unchanged,
+            # and the same vulnerability config (key columns, column data
+            # types, vulnerability ID column etc.)
+            src_stat = os.stat(src_fp)
+            cache_metadata = {
+                'file_path': src_fp,
+                'file_size': src_stat.st_size,
+                'file_mtime': src_stat.st_mtime,
+                'config': dict((k, v) for k, v in six.iteritems(vuln_config) if k != 'cache')
+            }
+            if os.path.exists(cache_fp):
+                try:
+                    return col_dtypes, key_cols, vuln_id_col, VulnerabilityTable.load(cache_fp, key_cols=key_cols, metadata=cache_metadata)
+                except (OasisException, IOError, OSError, ValueError, KeyError, zipfile.BadZipfile):
+                    # A stale or unreadable cache file - rebuild it
+                    pass
+
         src_type = str(str(vuln_config.get('file_type')) or 'csv').lower()
 
         float_precision = 'high' if vuln_config.get('float_precision_high') else None
@@ -1078,6 +3347,16 @@ class OasisVulnerabilityLookup(OasisBaseLookup):
             sort_ascending=sort_ascending
         )
 
+        if backend == 'array':
+            table = _vuln_table(vuln_df)
+            if cache_fp:
+                try:
+                    table.save(cache_fp, metadata=cache_metadata)
+                except (IOError, OSError):
+                    # The cache is optional - e.g. the source directory may be read-only
+                    pass
+            return col_dtypes, key_cols, vuln_id_col, table
+
         return col_dtypes, key_cols, vuln_id_col, _vuln_dict((v for _, v in vuln_df.iterrows()), key_cols, vuln_id_col)
 
     def lookup(self, loc, peril_id, coverage_type):
@@ -1121,6 +3400,8 @@ class OasisVulnerabilityLookup(OasisBaseLookup):
                 key_col_dtype = col_dtypes[key_col]
                 key_col_dtype(loc_key_col_values[key_col])
         except (TypeError, ValueError):
+            if self.stats is not None:
+                self.stats.count_value('vulnerability.statuses', KEYS_STATUS_FAIL)
             return _lookup(loc_id, peril_id, coverage_type, KEYS_STATUS_FAIL, None, 'Vulnerability lookup: invalid key column value(s) for location')
 
         vlnperid = peril_id
@@ -1130,10 +3411,11 @@ class OasisVulnerabilityLookup(OasisBaseLookup):
         vlnid = None
 
         try:
-            vlnid = (
-                self.vulnerabilities[tuple(loc_key_col_values[col] for col in key_cols)] if len(key_cols) > 1
-                else self.vulnerabilities[loc[key_cols[0]]]
-            )
+            with self._timer('vulnerability.probe'):
+                vlnid = (
+                    self.vulnerabilities[tuple(loc_key_col_values[col] for col in key_cols)] if len(key_cols) > 1
+                    else self.vulnerabilities[loc[key_cols[0]]]
+                )
         except KeyError:
             pass
         else:
@@ -1142,4 +3424,190 @@ class OasisVulnerabilityLookup(OasisBaseLookup):
             vlnst = KEYS_STATUS_SUCCESS
             vlnmsg = 'Successful vulnerability lookup: {}'.format(vlnid)
 
+        if self.stats is not None:
+            self.stats.count_value('vulnerability.statuses', vlnst)
+
         return _lookup(loc_id, vlnperid, vlncovtype, vlnst, vlnid, vlnmsg)
+
+    @property
+    def vulnerabilities_table(self):
+        """
+        The vulnerabilities dict as a dataframe with the key columns and a
+        ``vulnerability_id`` column - built on first access.
+        """
+        if getattr(self, '_vulnerabilities_table', None) is None and isinstance(self.vulnerabilities, VulnerabilityTable):
+            self._vulnerabilities_table = self.vulnerabilities.to_frame()
+        elif getattr(self, '_vulnerabilities_table', None) is None:
+            key_cols = self.key_cols
+            keys = (
+                list(six.iterkeys(self.vulnerabilities)) if len(key_cols) > 1
+                else [(k,) for k in six.iterkeys(self.vulnerabilities)]
+            )
+            table = pd.DataFrame(data=keys, columns=list(key_cols))
+            for col in key_cols:
+                table[col] = self._typed_key_values(col, table[col].values)
+            table['vulnerability_id'] = pd.Series(list(six.itervalues(self.vulnerabilities)), dtype=object)
+            self._vulnerabilities_table = table.dropna(subset=list(key_cols))
+        return self._vulnerabilities_table
+
+    def _typed_key_values(self, key_col, values):
+        """
+        Converts an array of key column values to the type used for the
+        vulnerability key join - ``float64`` for numeric key columns and
+        (object) strings for all others. Values which could not match any
+        vulnerability key in a dict lookup (e.g. strings in a numeric key
+        column) are converted to nulls.
+        """
+        dtype = self.col_dtypes.get(key_col)
+
+        if dtype in (int, float, bool):
+            if values.dtype.kind in 'iufb':
+                return values.astype(np.float64)
+            return np.array([
+                float(v) if isinstance(v, (six.integer_types, float, np.number)) else np.nan
+                for v in values
+            ], dtype=np.float64)
+
+        if values.dtype.kind in 'US':
+            return values.astype(object)
+
+        return np.array([v if isinstance(v, six.string_types) else None for v in values], dtype=object)
+
+    def bulk_lookup_frame(self, loc_df, peril_id, coverage_type):
+        """
+        Vulnerability lookup for all the locations in a dataframe, for a given
+        peril ID and coverage type. The location key column values are
+        checked against the key column data types using array operations,
+        and the vulnerability IDs are resolved by a single (left) join of
+        the typed key columns with the vulnerabilities table, or, for the
+        ``array`` vulnerability backend, by a batch lookup of the
+        vulnerability table (see ``VulnerabilityTable.lookup``).
+
+        Returns a dataframe with the columns ``status``, ``vulnerability_id``,
+        ``message`` and the key columns (with the values used in the lookup),
+        with one row for each location, in the order given. The results are
+        the same as those of ``lookup`` for the individual locations.
+        """
+        n = len(loc_df)
+        key_cols = self.key_cols
+        col_dtypes = self.col_dtypes
+
+        _col = lambda col: loc_df[col].values if col in loc_df.columns else np.full(n, None, dtype=object)
+
+        key_vals = OrderedDict((col, _col(col)) for col in key_cols)
+
+        if 'peril_id' in key_vals:
+            vals = key_vals['peril_id']
+            key_vals['peril_id'] = (
+                np.where(vals == 0, peril_id, vals) if vals.dtype.kind in 'iufb'
+                else np.array([v or peril_id for v in vals], dtype=object)
+            )
+
+        if 'coverage_type' in key_vals:
+            vals = key_vals['coverage_type']
+            covs = _col('coverage')
+            key_vals['coverage_type'] = np.array(
+                [v or c or coverage_type for v, c in zip(vals, covs)], dtype=object
+            ) if (vals.dtype.kind not in 'iufb' or (vals == 0).any()) else vals
+
+        with self._timer('vulnerability.validate'):
+            invalid = np.zeros(n, dtype=bool)
+            for col, vals in six.iteritems(key_vals):
+                dtype = col_dtypes.get(col)
+                if dtype is None:
+                    continue
+                if vals.dtype.kind in 'iufb':
+                    if dtype == int and vals.dtype.kind == 'f':
+                        invalid |= ~np.isfinite(vals)
+                    continue
+                for i, v in enumerate(vals):
+                    try:
+                        dtype(v)
+                    except (TypeError, ValueError, OverflowError):
+                        invalid[i] = True
+
+        if isinstance(self.vulnerabilities, VulnerabilityTable):
+            # Array backend - batch binary search of the sorted table keys
+            with self._timer('vulnerability.probe'):
+                ids, found = self.vulnerabilities.lookup(*[vals[~invalid] for vals in six.itervalues(key_vals)])
+                matches = pd.DataFrame({
+                    '_pos': np.where(~invalid)[0][found],
+                    'vulnerability_id': pd.Series(ids[found], dtype=object)
+                })
+        else:
+            with self._timer('vulnerability.join'):
+                typed_key_vals = OrderedDict((col, self._typed_key_values(col, vals)) for col, vals in six.iteritems(key_vals))
+
+                locs = pd.DataFrame(typed_key_vals)
+                locs['_pos'] = np.arange(n)
+                locs = locs[~invalid & locs[list(key_cols)].notnull().all(axis=1).values]
+
+                matches = locs.merge(self.vulnerabilities_table, how='inner', on=list(key_cols))
+
+        vuln_ids = np.full(n, None, dtype=object)
+        vuln_ids[matches['_pos'].values] = matches['vulnerability_id'].values
+
+        matched = np.zeros(n, dtype=bool)
+        matched[matches['_pos'].values] = True
+
+        statuses = np.where(invalid, KEYS_STATUS_FAIL, np.where(matched, KEYS_STATUS_SUCCESS, KEYS_STATUS_NOMATCH)).astype(object)
+        msgs = np.full(n, 'No vulnerability match', dtype=object)
+        msgs[invalid] = 'Vulnerability lookup: invalid key column value(s) for location'
+        msgs[matched] = ['Successful vulnerability lookup: {}'.format(vlnid) for vlnid in vuln_ids[matched]]
+
+        res = pd.DataFrame(OrderedDict([
+            ('status', statuses),
+            ('vulnerability_id', vuln_ids),
+            ('message', msgs)
+        ]))
+        for col, vals in six.iteritems(key_vals):
+            res[col] = pd.Series(vals, dtype=object)
+
+        if self.stats is not None:
+            self.stats.add_to_histogram('vulnerability.statuses', statuses)
+
+        return res
+
+    @oasis_log()
+    def bulk_lookup(self, locs, **kwargs):
+        """
+        Bulk vulnerability lookup - as for the base class method, but if the
+        locations are provided as a Pandas dataframe then the lookup is done
+        using ``bulk_lookup_frame`` for each (peril ID, coverage type) pair.
+
+        Generates results using ``yield``.
+        """
+        if not isinstance(locs, pd.DataFrame):
+            for r in super(self.__class__, self).bulk_lookup(locs, **kwargs):
+                yield r
+            return
+
+        loc_id_col = self.loc_id_col
+        key_cols = self.key_cols
+
+        n = len(locs)
+        loc_ids = get_location_ids(locs, loc_id_col)
+
+        pairs = tuple(itertools.product(self.peril_ids, self.coverage_types))
+        results = tuple(self.bulk_lookup_frame(locs, peril_id, coverage_type) for peril_id, coverage_type in pairs)
+        results = tuple(
+            tuple(zip(*(r[col].tolist() for col in ('status', 'vulnerability_id', 'message') + key_cols)))
+            for r in results
+        )
+
+        for i in range(n):
+            for (peril_id, coverage_type), res in zip(pairs, results):
+                vlnst, vlnid, vlnmsg = res[i][:3]
+                yield {
+                    k:v for k, v in itertools.chain(
+                        (
+                            (loc_id_col, loc_ids[i]),
+                            ('peril_id', peril_id),
+                            ('coverage_type', coverage_type),
+                            ('status', vlnst),
+                            ('vulnerability_id', vlnid),
+                            ('message', vlnmsg)
+                        ),
+                        zip(key_cols, res[i][3:])
+                    )
+                }
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals, absolute_import
+
+__all__ = [
+    'DEFAULT_REMOTE_KEYS_BATCH_SIZE',
+    'DEFAULT_REMOTE_KEYS_MAX_IN_FLIGHT',
+    'RemoteKeysLookup'
+]
+
+import threading
+
+from multiprocessing.pool import ThreadPool
+
+import requests
+
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
+
+from ..utils.exceptions import OasisException
+from ..utils.http import (
+    HTTP_REQUEST_CONTENT_TYPE_CSV,
+    MIME_TYPE_JSON,
+)
+
+
+DEFAULT_REMOTE_KEYS_BATCH_SIZE = 1000
+DEFAULT_REMOTE_KEYS_MAX_IN_FLIGHT = 4
+
+# Responses with these status codes are treated as transient errors, and
+# the batch request is retried
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504,)
+
+
+def _retry(retries, backoff_factor):
+    kwargs = dict(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        raise_on_status=False
+    )
+    # Keys lookups are idempotent, so POST requests can be retried - the
+    # urllib3 ``method_whitelist`` argument is ``allowed_methods`` in later
+    # versions
+    try:
+        return Retry(allowed_methods=False, **kwargs)
+    except TypeError:
+        return Retry(method_whitelist=False, **kwargs)
+
+
+class RemoteKeysLookup(object):
+    """
+    Keys lookup for a model keys server - a remote HTTP service which takes
+    a batch of locations, posted as a CSV file, and responds with the keys
+    records of the locations as JSON, either a list of records or an object
+    with the records listed under ``items``. The records are as for a model
+    keys lookup class (``OasisBaseKeysLookup``).
+
+    ``process_locations`` splits the locations dataframe into batches of
+    ``batch_size`` locations and posts up to ``max_in_flight`` batches at a
+    time, from a pool of threads, each of which keeps its own HTTP session,
+    so that connections to the server are reused. Connection errors, read
+    errors and responses with the status codes ``RETRY_STATUS_CODES`` are
+    retried, up to ``retries`` times, with an exponential backoff (see
+    the ``urllib3`` ``Retry`` class). The records are generated in the
+    location order of the dataframe.
+
+    As for model keys lookup classes, keys can be generated and written to
+    file with ``OasisLookupFactory.get_keys`` or ``save_results``.
+    """
+    def __init__(
+        self,
+        url,
+        batch_size=DEFAULT_REMOTE_KEYS_BATCH_SIZE,
+        max_in_flight=DEFAULT_REMOTE_KEYS_MAX_IN_FLIGHT,
+        retries=3,
+        backoff_factor=0.5,
+        timeout=60,
+        loc_id_col='id'
+    ):
+        if not url:
+            raise OasisException('No keys server URL provided')
+
+        self.url = url
+        self.batch_size = int(batch_size) if batch_size else DEFAULT_REMOTE_KEYS_BATCH_SIZE
+        self.max_in_flight = max(int(max_in_flight or 1), 1)
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.loc_id_col = loc_id_col
+
+        self._local = threading.local()
+
+    @property
+    def session(self):
+        """
+        The HTTP session of the current thread - created on first access.
+        """
+        session = getattr(self._local, 'session', None)
+
+        if session is None:
+            session = self._local.session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=self.max_in_flight,
+                max_retries=_retry(self.retries, self.backoff_factor)
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+
+        return session
+
+    def post_batch(self, loc_df):
+        """
+        Posts a batch of locations (a dataframe) to the keys server - returns
+        the list of keys records of the response.
+        """
+        try:
+            response = self.session.post(
+                self.url,
+                data=loc_df.to_csv(index=False, encoding='utf-8').encode('utf-8'),
+                headers={'Content-Type': HTTP_REQUEST_CONTENT_TYPE_CSV, 'Accept': MIME_TYPE_JSON},
+                timeout=self.timeout
+            )
+        except requests.RequestException as e:
+            raise OasisException('Keys server request to {} failed: {}'.format(self.url, e))
+
+        if not response.ok:
+            raise OasisException('Keys server request to {} failed: {} {}'.format(self.url, response.status_code, response.text[:200]))
+
+        try:
+            records = response.json()
+        except ValueError as e:
+            raise OasisException('Invalid keys server response from {}: {}'.format(self.url, e))
+
+        if isinstance(records, dict):
+            records = records.get('items')
+
+        if not isinstance(records, list):
+            raise OasisException('Invalid keys server response from {}: no list of keys records found'.format(self.url))
+
+        return records
+
+    def process_locations(self, loc_df):
+        """
+        Generates the keys records of the keys server for a locations
+        dataframe, posted in concurrent batches.
+        """
+        n = len(loc_df)
+        if not n:
+            return
+
+        bounds = list(range(0, n, self.batch_size)) + [n]
+        batches = (loc_df.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:]))
+
+        if self.max_in_flight < 2 or len(bounds) < 3:
+            for batch in batches:
+                for r in self.post_batch(batch):
+                    yield r
+            return
+
+        pool = ThreadPool(min(self.max_in_flight, len(bounds) - 1))
+        try:
+            for records in pool.imap(self.post_batch, batches):
+                for r in records:
+                    yield r
+        finally:
+            pool.terminate()
+            pool.join()
@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals, absolute_import
+
+__all__ = [
+    'DEFAULT_LOOKUP_SERVER_BATCH_SIZE',
+    'LookupClient',
+    'LookupServer',
+    'read_message',
+    'write_message'
+]
+
+import json
+import os
+import socket
+import struct
+
+import numpy as np
+
+from six.moves import socketserver
+
+from ..utils.exceptions import OasisException
+from ..utils.stats import LookupStats
+from .lookup import (
+    as_path,
+    OasisLookupFactory,
+    _batches,
+)
+
+
+DEFAULT_LOOKUP_SERVER_BATCH_SIZE = 10000
+
+# Messages are UTF-8 encoded JSON objects, each preceded by its length in
+# bytes as a 4-byte unsigned big-endian integer
+_MESSAGE_HEADER = struct.Struct('>I')
+
+
+def _json_default(obj):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError('{} is not JSON serializable'.format(repr(obj)))
+
+
+def _recv_exactly(sock, n):
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            return None
+        buf.extend(chunk)
+    return bytes(buf)
+
+
+def write_message(sock, msg):
+    """
+    Writes a message (a JSON serializable dict) to a socket.
+    """
+    data = json.dumps(msg, default=_json_default).encode('utf-8')
+    sock.sendall(_MESSAGE_HEADER.pack(len(data)) + data)
+
+
+def read_message(sock):
+    """
+    Reads a message (dict) written by ``write_message`` from a socket -
+    returns ``None`` if the connection is closed before a message is read.
+    """
+    header = _recv_exactly(sock, _MESSAGE_HEADER.size)
+    if header is None:
+        return None
+
+    data = _recv_exactly(sock, _MESSAGE_HEADER.unpack(header)[0])
+    if data is None:
+        raise OasisException('Lookup server connection closed mid-message')
+
+    return json.loads(data.decode('utf-8'))
+
+
+class _LookupRequestHandler(socketserver.BaseRequestHandler):
+
+    def handle(self):
+        try:
+            while True:
+                request = read_message(self.request)
+                if request is None:
+                    return
+                try:
+                    self.server.handle_message(self.request, request)
+                except socket.error:
+                    raise
+                except Exception as e:
+                    write_message(self.request, {'status': 'error', 'message': '{}: {}'.format(type(e).__name__, str(e))})
+        except socket.error:
+            # The client has gone away
+            return
+
+
+class LookupServer(socketserver.UnixStreamServer):
+    """
+    Keys lookup server (daemon) - holds a lookup instance, created once (e.g.
+    with ``OasisLookupFactory.create``), so that the lookup startup cost
+    (loading the lookup package, vulnerabilities and peril areas index) is
+    paid only once, and serves lookup requests for batches of locations from
+    clients (see ``LookupClient``) on a local Unix socket.
+
+    Requests and responses are messages (see ``write_message``) with a
+    ``command`` key - the supported commands are
+
+        * ``info``: responds with the model info and the lookup location ID
+          column
+        * ``lookup``: looks up a batch of locations, given as a list of
+          location records (``model_exposures``) or the path of a model
+          exposures file (``model_exposures_fp``), as for
+          ``OasisLookupFactory.get_results`` -
+          the results are sent back in ``results`` messages of at most
+          ``batch_size`` results, in the location order, followed by a
+          ``done`` message with the number of results and, if requested with
+          ``stats``, the lookup stats
+        * ``shutdown``: stops the server after responding
+
+    Connections are handled one at a time, in the server process, so that a
+    single lookup instance (and any lookup cache) is used by all requests.
+    """
+    allow_reuse_address = True
+
+    def __init__(self, socket_path, lookup, model_info=None, workers=None, batch_size=DEFAULT_LOOKUP_SERVER_BATCH_SIZE):
+        self.socket_path = as_path(socket_path, 'socket_path', preexists=False)
+        self.lookup = lookup
+        self.model_info = model_info or {}
+        self.workers = workers
+        self.batch_size = batch_size
+        self._stopped = False
+
+        if os.path.exists(self.socket_path):
+            if LookupClient(self.socket_path).is_alive():
+                raise OasisException('A lookup server is already listening on socket {}'.format(self.socket_path))
+            os.remove(self.socket_path)
+
+        socketserver.UnixStreamServer.__init__(self, self.socket_path, _LookupRequestHandler)
+
+    def handle_message(self, sock, request):
+        command = request.get('command')
+
+        if command == 'info':
+            write_message(sock, {'status': 'ok', 'model_info': self.model_info, 'loc_id_col': getattr(self.lookup, 'loc_id_col', 'id')})
+        elif command == 'lookup':
+            self._lookup(sock, request)
+        elif command == 'shutdown':
+            self._stopped = True
+            write_message(sock, {'status': 'ok'})
+        else:
+            raise OasisException('Unrecognised lookup server command: {}'.format(command))
+
+    def _lookup(self, sock, request):
+        stats = LookupStats() if request.get('stats') else None
+
+        if not hasattr(self.lookup, 'config'):
+            results = OasisLookupFactory.get_keys(
+                lookup=self.lookup,
+                model_exposures=request.get('model_exposures'),
+                model_exposures_file_path=request.get('model_exposures_fp'),
+                success_only=request.get('successes_only', False)
+            )
+        else:
+            if stats is not None and hasattr(self.lookup, 'enable_stats'):
+                self.lookup.enable_stats(stats)
+            results = OasisLookupFactory.get_results(
+                self.lookup,
+                model_exposures=request.get('model_exposures'),
+                model_exposures_fp=request.get('model_exposures_fp'),
+                successes_only=request.get('successes_only', False),
+                workers=(request.get('workers') or self.workers),
+                stats=stats
+            )
+
+        n = 0
+        try:
+            for batch in _batches(results, int(request.get('batch_size') or self.batch_size)):
+                write_message(sock, {'status': 'results', 'results': batch})
+                n += len(batch)
+        finally:
+            if stats is not None and hasattr(self.lookup, 'disable_stats'):
+                self.lookup.disable_stats()
+
+        write_message(sock, {'status': 'done', 'count': n, 'stats': stats.as_dict() if stats is not None else None})
+
+    def serve(self, poll_interval=0.5):
+        """
+        Serves requests until a ``shutdown`` request is received or the
+        process is interrupted, then closes the server and removes the
+        socket file.
+        """
+        self.timeout = poll_interval
+        try:
+            while not self._stopped:
+                self.handle_request()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.server_close()
+
+    def server_close(self):
+        socketserver.UnixStreamServer.server_close(self)
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+class LookupClient(object):
+    """
+    Client of a keys lookup server (see ``LookupServer``) listening on a
+    local Unix socket.
+    """
+    def __init__(self, socket_path, timeout=None):
+        self.socket_path = as_path(socket_path, 'socket_path', preexists=False)
+        self.timeout = timeout
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except socket.error as e:
+            sock.close()
+            raise OasisException('Unable to connect to lookup server on socket {}: {}'.format(self.socket_path, str(e)))
+        return sock
+
+    def _request(self, sock, request):
+        write_message(sock, request)
+        return self._response(sock)
+
+    def _response(self, sock):
+        response = read_message(sock)
+        if response is None:
+            raise OasisException('Lookup server on socket {} closed the connection'.format(self.socket_path))
+        if response.get('status') == 'error':
+            raise OasisException('Lookup server error: {}'.format(response.get('message')))
+        return response
+
+    def is_alive(self):
+        """
+        Returns whether a lookup server is listening on the socket.
+        """
+        try:
+            self.info()
+        except OasisException:
+            return False
+        return True
+
+    def info(self):
+        """
+        Returns the model info of the server lookup, with the lookup location
+        ID column (``loc_id_col``).
+        """
+        sock = self._connect()
+        try:
+            response = self._request(sock, {'command': 'info'})
+        finally:
+            sock.close()
+
+        model_info = dict(response['model_info'] or {})
+        model_info.setdefault('loc_id_col', response.get('loc_id_col') or 'id')
+        return model_info
+
+    def shutdown(self):
+        """
+        Stops the server.
+        """
+        sock = self._connect()
+        try:
+            self._request(sock, {'command': 'shutdown'})
+        finally:
+            sock.close()
+
+    def get_results(
+        self,
+        model_exposures=None,
+        model_exposures_fp=None,
+        successes_only=False,
+        workers=None,
+        batch_size=None,
+        stats=None
+    ):
+        """
+        Generates the server lookup results for a batch of locations, given
+        as a list of location records (dicts) or the path of a model exposures
+        file, as for ``OasisLookupFactory.get_results``.
+        If a ``LookupStats`` record ``stats`` is given then the stats of the
+        server lookup are merged into it.
+        """
+        if not (model_exposures or model_exposures_fp):
+            raise OasisException('No model exposures data or file path provided')
+
+        request = {
+            'command': 'lookup',
+            'model_exposures': model_exposures,
+            'model_exposures_fp': as_path(model_exposures_fp, 'model_exposures_fp', preexists=True) if model_exposures_fp else None,
+            'successes_only': successes_only,
+            'workers': workers,
+            'batch_size': batch_size,
+            'stats': stats is not None
+        }
+
+        sock = self._connect()
+        try:
+            response = self._request(sock, request)
+            while response['status'] == 'results':
+                for r in response['results']:
+                    yield r
+                response = self._response(sock)
+
+            if stats is not None and response.get('stats'):
+                stats.merge(response['stats'])
+        finally:
+            sock.close()
+
+    def save_results(
+        self,
+        successes_fp,
+        errors_fp=None,
+        model_exposures=None,
+        model_exposures_fp=None,
+        format='oasis',
+        workers=None,
+        stats_fp=None,
+        loc_id_col=None
+    ):
+        """
+        Writes a keys file, and optionally a keys errors file, for the server
+        lookup results for a batch of locations - the arguments and return
+        values are as for ``OasisLookupFactory.save_results``. The location
+        ID column of the keys records is by default that of the server lookup.
+        """
+        stats = LookupStats() if stats_fp else None
+
+        loc_id_col = (loc_id_col or self.info()['loc_id_col']).lower()
+
+        results = self.get_results(
+            model_exposures=model_exposures,
+            model_exposures_fp=model_exposures_fp,
+            successes_only=(False if errors_fp else True),
+            workers=workers,
+            stats=stats
+        )
+
+        res = OasisLookupFactory.write_keys_files(
+            results,
+            as_path(successes_fp, 'successes_fp', preexists=False),
+            errors_fp=as_path(errors_fp, 'errors_fp', preexists=False),
+            id_col=loc_id_col,
+            format=format,
+            stats=stats
+        )
+
+        if stats is not None:
+            stats.dump(as_path(stats_fp, 'stats_fp', preexists=False))
+
+        return res
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+__all__ = [
+    'LRUCache'
+]
+
+from collections import OrderedDict
+
+from .exceptions import OasisException
+
+
+class LRUCache(object):
+    """
+    Simple bounded in-process cache with least recently used eviction, which
+    counts cache hits and misses - ``get`` returns ``default`` on a miss,
+    and ``put`` evicts the least recently used item once the cache holds
+    ``maxsize`` items.
+    """
+    def __init__(self, maxsize=10000):
+        try:
+            self._maxsize = int(maxsize)
+            if self._maxsize < 1:
+                raise ValueError('the cache size must be positive')
+        except (TypeError, ValueError) as e:
+            raise OasisException('Invalid cache size {}: {}'.format(maxsize, str(e)))
+
+        self._items = OrderedDict()
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    def get(self, key, default=None):
+        try:
+            value = self._items.pop(key)
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self._items[key] = value
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self._items.pop(key, None)
+        self._items[key] = value
+
+        if len(self._items) > self._maxsize:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+        self.hits = self.misses = 0
+
+    def info(self):
+        """
+        Returns the cache hits, misses, current size and maximum size as a
+        dict.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._items),
+            'maxsize': self._maxsize
+        }
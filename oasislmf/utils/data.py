@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 
 __all__ = [
-    'get_dataframe'
+    'get_dataframe',
+    'get_dataframe_chunks'
 ]
 
 import builtins
+import io
 
 import pandas as pd
 
@@ -44,11 +46,61 @@ def get_dataframe(
     elif src_data and (isinstance(src_data, list) or isinstance(src_data, pd.DataFrame)):
         df = pd.DataFrame(data=src_data, dtype=object)
 
+    df = _prepare_dataframe(df, lowercase_cols=lowercase_cols, index_col=index_col, non_na_cols=non_na_cols, col_dtypes=col_dtypes)
+
+    if sort_col:
+        _sort_col = sort_col.lower() if lowercase_cols else sort_col
+        sort_ascending = sort_ascending if sort_ascending is not None else True
+        df.sort_values(_sort_col, axis=0, ascending=sort_ascending, inplace=True)
+
+    return df
+
+
+def get_dataframe_chunks(
+    src_fp=None,
+    src_buf=None,
+    chunksize=100000,
+    float_precision='high',
+    lowercase_cols=True,
+    index_col=True,
+    non_na_cols=(),
+    col_dtypes={}
+):
+    """
+    Reads a CSV file, or a string buffer of such a file, in chunks of at most
+    ``chunksize`` rows - generates a dataframe for each chunk, processed as
+    by ``get_dataframe``. The ``index`` column (row number) runs on across
+    the chunks. The rows are not sorted, as a sort would need all the rows.
+    """
+    if not (src_fp or src_buf):
+        raise OasisException('A CSV file path or a string buffer of such a file must be provided')
+
+    reader = pd.read_csv(
+        src_fp if src_fp else io.StringIO(src_buf),
+        float_precision=float_precision,
+        chunksize=chunksize
+    )
+
+    start = 0
+    for df in reader:
+        n = len(df)
+        yield _prepare_dataframe(
+            df,
+            lowercase_cols=lowercase_cols,
+            index_col=index_col,
+            index_start=start,
+            non_na_cols=non_na_cols,
+            col_dtypes=col_dtypes
+        )
+        start += n
+
+
+def _prepare_dataframe(df, lowercase_cols=True, index_col=True, index_start=0, non_na_cols=(), col_dtypes={}):
     if lowercase_cols:
         df.columns = df.columns.str.lower()
 
     if index_col:
-        df['index'] = list(range(len(df)))
+        df['index'] = list(range(index_start, index_start + len(df)))
 
     if non_na_cols:
         _non_na_cols = tuple(col.lower() for col in non_na_cols) if lowercase_cols else non_na_cols
@@ -61,9 +113,4 @@ def get_dataframe(
         for col, dtype in six.iteritems(_col_dtypes):
             df[col] = df[col].astype(dtype) if dtype != int else df[col].astype(object)
 
-    if sort_col:
-        _sort_col = sort_col.lower() if lowercase_cols else sort_col
-        sort_ascending = sort_ascending if sort_ascending is not None else True
-        df.sort_values(_sort_col, axis=0, ascending=sort_ascending, inplace=True)
-
     return df
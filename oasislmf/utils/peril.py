@@ -3,11 +3,16 @@
 __all__ = [
     'DEFAULT_RTREE_INDEX_PROPS',
     'generate_index_entries',
+    'get_hilbert_keys',
+    'get_peril_area_index_entries',
     'get_peril_areas',
     'get_peril_areas_index',
+    'get_points_covered',
     'get_rtree_index',
     'PerilArea',
+    'PerilAreasGridIndex',
     'PerilAreasIndex',
+    'PerilAreasPayloadStore',
     'PERIL_ID_FLOOD',
     'PERIL_ID_QUAKE',
     'PERIL_ID_SURGE',
@@ -17,14 +22,20 @@ __all__ = [
 import builtins
 import copy
 import io
+import itertools
 import json
+import multiprocessing
 import os
 import re
+import shutil
+import time
 import types
 import uuid
 
 from collections import OrderedDict
 
+import numpy as np
+import pandas as pd
 import rtree
 
 from rtree.index import (
@@ -45,6 +56,15 @@ from shapely.geometry import (
     MultiPoint,
     Polygon,
 )
+from shapely.prepared import prep
+
+try:
+    from shapely.vectorized import (
+        contains as shapely_contains_xy,
+        touches as shapely_touches_xy,
+    )
+except (ImportError, ValueError):
+    shapely_contains_xy = shapely_touches_xy = None
 
 import six
 
@@ -96,6 +116,173 @@ def generate_index_entries(items, objects=None):
             yield key, poly_bounds, None
 
 
+def get_points_covered(geometry, xs, ys, prepared=None):
+    """
+    Returns a boolean array indicating which of the points with coordinates
+    in the arrays ``xs`` and ``ys`` are covered by (contained in or on the
+    boundary of) the geometry. The optional ``prepared`` argument is a
+    prepared version of the geometry.
+
+    The points are tested together using the Shapely vectorised predicates
+    if these are available, otherwise one by one against the prepared
+    geometry.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+
+    if shapely_contains_xy is not None:
+        covered = shapely_contains_xy(prepared or geometry, xs, ys)
+        rest = ~covered
+        if rest.any():
+            covered[rest] = shapely_touches_xy(geometry, xs[rest], ys[rest])
+        return covered
+
+    _prepared = prepared or prep(geometry)
+    return np.array([_prepared.covers(Point(x, y)) for x, y in zip(xs, ys)], dtype=bool)
+
+
+def get_hilbert_keys(xs, ys, bounds, order=16):
+    """
+    Returns the Hilbert curve keys (integers) of the points with coordinates
+    in the arrays ``xs`` and ``ys`` - the positions along a Hilbert curve of
+    order ``order`` of the cells of a ``2 ** order`` by ``2 ** order`` grid
+    over the box ``bounds = (minx, miny, maxx, maxy)`` containing the
+    points. Sorting points by key keeps points which are close together
+    close together in the sort order.
+
+    Points outside the box are keyed by the nearest cell of the grid, and
+    points with null coordinates get the key ``4 ** order``, i.e. they come
+    after all other points.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+
+    n = 1 << order
+    minx, miny, maxx, maxy = bounds
+
+    def _cells(v, lo, hi):
+        with np.errstate(invalid='ignore'):
+            cells = np.floor((v - lo) / ((hi - lo) or 1.0) * n)
+        return np.clip(np.nan_to_num(cells), 0, n - 1).astype(np.int64)
+
+    x = _cells(xs, minx, maxx)
+    y = _cells(ys, miny, maxy)
+    keys = np.zeros(len(x), dtype=np.int64)
+
+    s = n >> 1
+    while s > 0:
+        rx = ((x & s) > 0).astype(np.int64)
+        ry = ((y & s) > 0).astype(np.int64)
+        keys += s * s * ((3 * rx) ^ ry)
+
+        # Rotate the quadrant so that the curve in it has the standard
+        # orientation
+        rot = ry == 0
+        flip = rot & (rx == 1)
+        x[flip] = n - 1 - x[flip]
+        y[flip] = n - 1 - y[flip]
+        x[rot], y[rot] = y[rot], x[rot]
+
+        s >>= 1
+
+    keys[np.isnan(xs) | np.isnan(ys)] = n * n
+
+    return keys
+
+
+def _convex_hull_coordinates(points):
+    """
+    Returns the convex hull coordinates (as for ``PerilArea.coordinates``) of
+    each of a sequence of point arrays.
+    """
+    return [tuple(MultiPoint(pts).convex_hull.exterior.coords) for pts in points]
+
+
+def get_peril_area_index_entries(
+    peril_ids,
+    coverage_types,
+    peril_area_ids,
+    xs,
+    ys,
+    area_reg_poly_radius=0.0016,
+    workers=None
+):
+    """
+    Generates peril areas index entries
+
+        (peril area ID, bounds, (peril ID, coverage type, peril area ID, bounds, coordinates))
+
+    from arrays of peril IDs, coverage types and peril area IDs, and ``(n, k)``
+    arrays ``xs`` and ``ys`` of the coordinates of the ``k`` points defining
+    each of the ``n`` areas - the entries are the same as for ``PerilArea``
+    objects of the areas, but are computed from the arrays without creating
+    shapely objects where possible:
+
+        * the bounds of all areas are computed with array operations
+        * areas defined by one point (a square of "radius"
+          ``area_reg_poly_radius`` centred on the point), two points (the
+          box with the points as opposite corners), or by points including
+          all the corners of their bounding box, are rectangles whose
+          coordinates are generated directly from the bounds
+        * the convex hull coordinates of all other areas are computed with
+          shapely, in chunks split between ``workers`` forked processes if
+          ``workers`` is greater than 1
+
+    Areas with no (or a zero) peril area ID are given a random ID, as for
+    ``PerilArea``.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    n, k = xs.shape
+
+    if k == 1:
+        r = area_reg_poly_radius
+        xs = np.hstack([xs + r, xs + r, xs - r, xs - r])
+        ys = np.hstack([ys + r, ys - r, ys + r, ys - r])
+
+    minx, miny, maxx, maxy = xs.min(axis=1), ys.min(axis=1), xs.max(axis=1), ys.max(axis=1)
+
+    if k <= 2:
+        rect = np.ones(n, dtype=bool)
+    else:
+        rect = np.ones(n, dtype=bool)
+        for cx, cy in ((minx, miny), (minx, maxy), (maxx, maxy), (maxx, miny),):
+            rect &= ((xs == cx[:, None]) & (ys == cy[:, None])).any(axis=1)
+    rect &= (minx < maxx) & (miny < maxy)
+
+    coords = [None] * n
+
+    hull_idxs = np.flatnonzero(~rect)
+    if len(hull_idxs):
+        points = np.dstack([xs[hull_idxs], ys[hull_idxs]])
+        try:
+            ctx = multiprocessing.get_context('fork')
+        except (AttributeError, ValueError):
+            ctx = None
+        if ctx and workers and workers > 1 and len(hull_idxs) > 1:
+            chunks = np.array_split(points, min(workers, len(hull_idxs)))
+            pool = ctx.Pool(len(chunks))
+            try:
+                hulls = [h for chunk_hulls in pool.map(_convex_hull_coordinates, chunks) for h in chunk_hulls]
+            finally:
+                pool.terminate()
+                pool.join()
+        else:
+            hulls = _convex_hull_coordinates(points)
+        for i, h in zip(hull_idxs.tolist(), hulls):
+            coords[i] = h
+
+    bounds = list(zip(minx.tolist(), miny.tolist(), maxx.tolist(), maxy.tolist()))
+
+    for i in np.flatnonzero(rect).tolist():
+        x0, y0, x1, y1 = bounds[i]
+        coords[i] = ((x0, y0), (x0, y1), (x1, y1), (x1, y0), (x0, y0))
+
+    for perid, covtype, paid, bnds, _coords in zip(peril_ids, coverage_types, peril_area_ids, bounds, coords):
+        paid = paid or int(uuid.UUID(bytes=os.urandom(16)).hex[:16], 16)
+        yield paid, bnds, (perid, covtype, paid, bnds, _coords)
+
+
 def get_peril_areas(areas):
     for peril_id, coverage_type, peril_area_id, coordinates, other_props in areas:
         yield PerilArea(coordinates, peril_id=peril_id, coverage_type=coverage_type, peril_area_id=peril_area_id, **other_props)
@@ -181,12 +368,165 @@ class PerilArea(Polygon):
         return self._id
 
 
-class PerilAreasIndex(RTreeIndex):
+class PerilAreasPayloadStore(object):
+    """
+    Array-backed store of peril areas index entry objects (payloads) - the
+
+        (peril ID, coverage type, peril area ID, bounds, coordinates)
+
+    tuples - held in a directory of NumPy array files, one per fixed-width
+    column (``peril_id``, ``coverage_type``, ``peril_area_id``, ``bounds``),
+    and a flat array of all the area coordinates (``coordinates``) with an
+    array of the offsets of the coordinates of each area
+    (``coordinates_offsets``). The arrays are memory-mapped on loading, so
+    that processes using the same store (e.g. forked lookup workers) share
+    one copy of the data in the page cache, and columns are read without
+    copying or unpickling. Payloads are identified by their row (position)
+    in the store.
+    """
+    COLUMNS = ('peril_id', 'coverage_type', 'peril_area_id', 'bounds', 'coordinates_offsets', 'coordinates',)
+
+    def __init__(self, arrays):
+        self._arrays = arrays
+
+    def __len__(self):
+        return len(self._arrays['peril_area_id'])
+
+    def __getitem__(self, col):
+        return self._arrays[col]
+
+    @classmethod
+    def get_path(cls, index_fp):
+        """
+        Returns the path of the payload store directory for an index file
+        path (no extension).
+        """
+        return '{}.payload'.format(index_fp)
+
+    @classmethod
+    def exists(cls, path):
+        return os.path.exists(os.path.join(path, 'peril_area_id.npy'))
+
+    @classmethod
+    def load(cls, path, mmap_mode='r'):
+        return cls(OrderedDict(
+            (col, np.load(os.path.join(path, '{}.npy'.format(col)), mmap_mode=mmap_mode)) for col in cls.COLUMNS
+        ))
 
+    @classmethod
+    def save(cls, path, payloads):
+        """
+        Writes a payload store to the given directory from an iterable of
+        payload tuples - returns the store, loaded from file.
+        """
+        peril_ids, coverage_types, peril_area_ids, bounds, coords_counts, coords = [], [], [], [], [], []
+        for perid, covtype, paid, bnds, _coords in payloads:
+            peril_ids.append(perid)
+            coverage_types.append(covtype)
+            peril_area_ids.append(paid)
+            bounds.append(bnds)
+            coords_counts.append(len(_coords))
+            coords.extend(_coords)
+
+        try:
+            arrays = OrderedDict([
+                ('peril_id', np.array(peril_ids, dtype=np.int64)),
+                ('coverage_type', np.array(coverage_types, dtype=np.int64)),
+                ('peril_area_id', np.array(peril_area_ids, dtype=np.int64)),
+                ('bounds', np.array(bounds, dtype=np.float64).reshape(-1, 4)),
+                ('coordinates_offsets', np.r_[0, np.cumsum(coords_counts, dtype=np.int64)]),
+                ('coordinates', np.array(coords, dtype=np.float64).reshape(-1, 2)),
+            ])
+        except (TypeError, ValueError, OverflowError) as e:
+            raise OasisException(
+                'Invalid peril area payloads for a payload store - the peril IDs, '
+                'coverage types and peril area IDs must be integers: {}'.format(str(e))
+            )
+
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        os.makedirs(path)
+
+        for col, arr in six.iteritems(arrays):
+            np.save(os.path.join(path, '{}.npy'.format(col)), arr)
+
+        return cls.load(path)
+
+    def get_bounds(self, rows):
+        """
+        Returns the bounds tuples of the payloads in the given rows.
+        """
+        return [tuple(b) for b in self._arrays['bounds'][rows].tolist()]
+
+    def get_coordinates(self, rows):
+        """
+        Returns the coordinates tuples of the payloads in the given rows.
+        """
+        offsets = self._arrays['coordinates_offsets']
+        coords = self._arrays['coordinates']
+        return [
+            tuple(tuple(c) for c in coords[start:end].tolist())
+            for start, end in zip(offsets[rows].tolist(), offsets[np.asarray(rows) + 1].tolist())
+        ]
+
+    def get_payloads(self, rows):
+        """
+        Returns the payload tuples in the given rows.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        return list(zip(
+            self._arrays['peril_id'][rows].tolist(),
+            self._arrays['coverage_type'][rows].tolist(),
+            self._arrays['peril_area_id'][rows].tolist(),
+            self.get_bounds(rows),
+            self.get_coordinates(rows)
+        ))
+
+
+def _resident_memory():
+    """
+    Returns the resident memory of the current process in bytes, or ``None``
+    if it is not available (it is read from ``/proc``).
+    """
+    try:
+        with io.open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf(str('SC_PAGE_SIZE'))
+    except (IOError, OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class PerilAreasIndex(RTreeIndex):
+    """
+    Rtree index of peril areas - created from peril areas (``peril_areas``,
+    or ``areas`` as ``(peril ID, coverage type, peril area ID, coordinates,
+    properties)`` tuples), or opened from an Rtree file index (``fp``, the
+    path without extension).
+
+    A file index is normally disk based, with pages read through the small
+    page buffer of ``libspatialindex``. If ``in_memory`` is true then the
+    index entries are instead streamed from the file index and bulk loaded
+    into a memory based index when it is opened, and any payload store is
+    read into memory rather than memory mapped, so that queries do no disk
+    I/O - the load time, number of entries, file index size and the growth
+    in resident memory (where available) are then given by ``load_stats``.
+
+    A memory based index can also be bulk loaded directly from index
+    ``entries``, an iterable of ``(ID, bounds, object)`` tuples, optionally
+    with the ``payload_store`` the entry IDs refer to (see
+    ``get_sub_index``). The number of entries of a bulk loaded memory based
+    index is given by ``num_entries``.
+    """
     def __init__(self, *args, **kwargs):
 
             self._protocol = (2 if six.sys.version_info[0] < 3 else cpickle.HIGHEST_PROTOCOL)
 
+            self.load_stats = None
+            self.num_entries = None
+
+            in_memory = kwargs.pop('in_memory', False)
+            entries = kwargs.pop('entries', None)
+            payload_store = kwargs.pop('payload_store', None)
+
             idx_fp = kwargs.get('fp')
 
             areas = kwargs.get('areas')
@@ -194,7 +534,13 @@ class PerilAreasIndex(RTreeIndex):
 
             props = kwargs.get('properties') or copy.deepcopy(DEFAULT_RTREE_INDEX_PROPS)
 
-            if not (idx_fp or areas or peril_areas):
+            self._payload_store = None
+
+            if entries is not None:
+                self._peril_areas = self._stream = None
+                self._init_memory_index(list(entries), props, *args, **kwargs)
+                self._payload_store = payload_store
+            elif not (idx_fp or areas or peril_areas):
                 self._peril_areas = self._stream = None
                 kwargs['properties'] = RTreeIndexProperty(**props)
                 super(self.__class__, self).__init__(*args, **kwargs)
@@ -207,10 +553,17 @@ class PerilAreasIndex(RTreeIndex):
                 idx_ext = props.get('idx_extension') or 'idx'
                 dat_ext = props.get('dat_extension') or 'dat'
 
-                if not (os.path.exists('{}.{}'.format(_idx_fp, idx_ext)) or os.path.exists('{}.{}'.format(_idx_fp, dat_ext))):
-                    kwargs['properties'] = RTreeIndexProperty(**props)
+                if in_memory:
+                    self._load_in_memory(_idx_fp, props, *args, **kwargs)
+                else:
+                    if not (os.path.exists('{}.{}'.format(_idx_fp, idx_ext)) or os.path.exists('{}.{}'.format(_idx_fp, dat_ext))):
+                        kwargs['properties'] = RTreeIndexProperty(**props)
+
+                    super(self.__class__, self).__init__(_idx_fp, *args, **kwargs)
 
-                super(self.__class__, self).__init__(_idx_fp, *args, **kwargs)
+                payload_fp = PerilAreasPayloadStore.get_path(_idx_fp)
+                if PerilAreasPayloadStore.exists(payload_fp):
+                    self._payload_store = PerilAreasPayloadStore.load(payload_fp, mmap_mode=(None if in_memory else 'r'))
             else:
                 self._peril_areas = OrderedDict({
                     pa.id:pa for pa in (peril_areas if peril_areas else self._get_peril_areas(areas))
@@ -222,12 +575,84 @@ class PerilAreasIndex(RTreeIndex):
                 kwargs['properties'] = RTreeIndexProperty(**index_props)
                 super(self.__class__, self).__init__(self._stream, *args, **kwargs)
 
+    def _init_memory_index(self, entries, props, *args, **kwargs):
+        """
+        Initialises the index as a memory based index bulk loaded with the
+        given entries (a list).
+        """
+        self.num_entries = len(entries)
+
+        mem_props = dict(props)
+        mem_props.update({'storage': 0, 'filename': '', 'overwrite': True})
+        kwargs.pop('properties', None)
+        kwargs.pop('fp', None)
+
+        # The bulk loader fails on an empty stream
+        if entries:
+            super(self.__class__, self).__init__(iter(entries), *args, properties=RTreeIndexProperty(**mem_props), **kwargs)
+        else:
+            super(self.__class__, self).__init__(*args, properties=RTreeIndexProperty(**mem_props), **kwargs)
+
+    def _load_in_memory(self, idx_fp, props, *args, **kwargs):
+        """
+        Initialises the index as a memory based index bulk loaded with the
+        entries of the file index at ``idx_fp`` (path without extension).
+        """
+        start = time.time()
+        rss = _resident_memory()
+
+        file_index = PerilAreasIndex(fp=idx_fp)
+        try:
+            entries = [
+                (item.id, tuple(item.bbox), item.object)
+                for item in file_index.intersection(file_index.bounds, objects=True)
+            ]
+        except RTreeError:
+            entries = []
+        finally:
+            file_index.close()
+
+        self._init_memory_index(entries, props, *args, **kwargs)
+
+        end_rss = _resident_memory()
+
+        self.load_stats = OrderedDict([
+            ('time', time.time() - start),
+            ('entries', len(entries)),
+            ('file_size', sum(
+                os.path.getsize(fp) for fp in (
+                    '{}.{}'.format(idx_fp, props.get('idx_extension') or 'idx'),
+                    '{}.{}'.format(idx_fp, props.get('dat_extension') or 'dat'),
+                ) if os.path.exists(fp)
+            )),
+            ('memory', max(end_rss - rss, 0) if (rss is not None and end_rss is not None) else None)
+        ])
+
     def dumps(self, obj):
         return cpickle.dumps(obj, protocol=self.protocol)
 
     def loads(self, data):
         return cpickle.loads(data)
 
+    @property
+    def payload_store(self):
+        """
+        The payload store of the index (see ``PerilAreasPayloadStore``) if the
+        index was saved with one, in which case the index entry IDs are the
+        rows of the payloads in the store, otherwise ``None``.
+        """
+        return self._payload_store
+
+    def intersection(self, coordinates, objects=False):
+        if self._payload_store is None or objects != 'raw':
+            return super(self.__class__, self).intersection(coordinates, objects=objects)
+        return iter(self._payload_store.get_payloads(list(super(self.__class__, self).intersection(coordinates))))
+
+    def nearest(self, coordinates, num_results=1, objects=False):
+        if self._payload_store is None or objects != 'raw':
+            return super(self.__class__, self).nearest(coordinates, num_results=num_results, objects=objects)
+        return iter(self._payload_store.get_payloads(list(super(self.__class__, self).nearest(coordinates, num_results=num_results))))
+
     def _get_peril_areas(self, areas):
         for peril_id, coverage_type, peril_area_id, coordinates, other_props in areas:
             yield PerilArea(coordinates, peril_id=peril_id, coverage_type=coverage_type, peril_area_id=peril_area_id, **other_props)
@@ -240,10 +665,153 @@ class PerilAreasIndex(RTreeIndex):
             for key, poly_bounds in items:
                 yield key, poly_bounds, None
 
+    def bulk_intersection(self, xs, ys):
+        """
+        Bulk point query of the index for the arrays of point coordinates
+        ``xs`` and ``ys``. Returns a pair ``(ids, counts)`` of integer arrays
+        where ``ids`` is the flattened sequence of IDs of the index entries
+        whose bounds contain the points, in the same order as returned by
+        ``intersection`` for each point, and ``counts[i]`` is the number of
+        entries found for the ``i``-th point.
+
+        The vectorised Rtree query (``intersection_v``) is used if available,
+        otherwise the points are queried one by one.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+
+        if hasattr(self, 'intersection_v'):
+            points = np.column_stack((xs, ys))
+            ids, counts = self.intersection_v(points, points)
+            return ids.astype(np.int64), counts.astype(np.int64)
+
+        ids = []
+        counts = np.zeros(len(xs), dtype=np.int64)
+        for i, point in enumerate(zip(xs, ys)):
+            _ids = list(self.intersection(point))
+            counts[i] = len(_ids)
+            ids.extend(_ids)
+
+        return np.array(ids, dtype=np.int64), counts
+
+    def bulk_nearest(self, xs, ys):
+        """
+        Bulk nearest neighbour query of the index for the arrays of point
+        coordinates ``xs`` and ``ys`` - returns a pair ``(ids, counts)`` as
+        for ``bulk_intersection``, with the IDs of the nearest index entries
+        to each point (more than one if there are ties), in the same order as
+        returned by ``nearest``.
+
+        The vectorised Rtree query (``nearest_v``) is used if available,
+        otherwise the points are queried one by one.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+
+        if hasattr(self, 'nearest_v'):
+            points = np.column_stack((xs, ys))
+            ids, counts = self.nearest_v(points, points)
+            return ids.astype(np.int64), counts.astype(np.int64)
+
+        ids = []
+        counts = np.zeros(len(xs), dtype=np.int64)
+        for i, point in enumerate(zip(xs, ys)):
+            _ids = list(self.nearest(point))
+            counts[i] = len(_ids)
+            ids.extend(_ids)
+
+        return np.array(ids, dtype=np.int64), counts
+
+    def get_areas_table(self, objects=True):
+        """
+        Returns the index entry objects - the
+
+            (peril ID, coverage type, peril area ID, bounds, coordinates)
+
+        tuples - as a dataframe with the columns ``peril_id``,
+        ``coverage_type``, ``peril_area_id``, ``minx``, ``miny``, ``maxx``,
+        ``maxy``, ``bounds`` and ``coordinates``.
+
+        For an index with a payload store the table rows are the payload
+        store rows, and the columns other than ``bounds`` and ``coordinates``
+        are read from the store without copying - the ``bounds`` and
+        ``coordinates`` columns are omitted if ``objects`` is false.
+        """
+        store = self._payload_store
+        if store is not None:
+            bounds = store['bounds']
+            df = pd.DataFrame(OrderedDict([
+                ('peril_id', store['peril_id']),
+                ('coverage_type', store['coverage_type']),
+                ('peril_area_id', store['peril_area_id']),
+            ]), copy=False)
+            if objects:
+                rows = np.arange(len(store))
+                df['bounds'] = pd.Series(store.get_bounds(rows), dtype=object).values
+                df['coordinates'] = pd.Series(store.get_coordinates(rows), dtype=object).values
+            for i, col in enumerate(('minx', 'miny', 'maxx', 'maxy',)):
+                df[col] = bounds[:, i]
+            return df
+
+        try:
+            entries = list(self.intersection(self.bounds, objects='raw'))
+        except RTreeError:
+            entries = []
+
+        df = pd.DataFrame(
+            data=[(perid, covtype, paid, bounds, coords) for perid, covtype, paid, bounds, coords in entries],
+            columns=['peril_id', 'coverage_type', 'peril_area_id', 'bounds', 'coordinates']
+        )
+
+        bounds = np.array(df['bounds'].tolist(), dtype=np.float64).reshape(-1, 4)
+        for i, col in enumerate(('minx', 'miny', 'maxx', 'maxy',)):
+            df[col] = bounds[:, i]
+
+        return df
+
+    def get_sub_index(self, boxes, areas_table=None):
+        """
+        Returns a memory based index of the entries of the index whose bounds
+        intersect any of the given boxes ``(minx, miny, maxx, maxy)`` - the
+        entry IDs and objects are the same as in the index, and an index with
+        a payload store shares the store with the sub-index. The optional
+        ``areas_table`` is the areas table of the index, if already loaded
+        (see ``get_areas_table``).
+        """
+        store = self._payload_store
+
+        areas = areas_table if areas_table is not None else self.get_areas_table(objects=(store is None))
+
+        minx, miny, maxx, maxy = (areas[col].values for col in ('minx', 'miny', 'maxx', 'maxy',))
+
+        found = np.zeros(len(areas), dtype=bool)
+        for bminx, bminy, bmaxx, bmaxy in boxes:
+            found |= (minx <= bmaxx) & (maxx >= bminx) & (miny <= bmaxy) & (maxy >= bminy)
+        rows = np.flatnonzero(found)
+
+        bounds = list(zip(minx[rows].tolist(), miny[rows].tolist(), maxx[rows].tolist(), maxy[rows].tolist()))
+
+        if store is not None:
+            entries = [(row, bnds, None) for row, bnds in zip(rows.tolist(), bounds)]
+        else:
+            entries = [
+                (paid, bnds, (perid, covtype, paid, obnds, coords))
+                for perid, covtype, paid, obnds, coords, bnds in zip(
+                    areas['peril_id'].values[rows].tolist(),
+                    areas['coverage_type'].values[rows].tolist(),
+                    areas['peril_area_id'].values[rows].tolist(),
+                    areas['bounds'].values[rows].tolist(),
+                    areas['coordinates'].values[rows].tolist(),
+                    bounds
+                )
+            ]
+
+        return PerilAreasIndex(entries=entries, payload_store=store)
+
     @property
     def protocol(self):
         return self._protocol
-    
+
 
     @property
     def peril_areas(self):
@@ -272,8 +840,24 @@ class PerilAreasIndex(RTreeIndex):
         area_reg_poly_radius=0.00166,
         static_props={},
         index_fp=None,
-        index_props=copy.deepcopy(DEFAULT_RTREE_INDEX_PROPS)
+        index_props=copy.deepcopy(DEFAULT_RTREE_INDEX_PROPS),
+        workers=None,
+        payload_store=False
     ):
+        """
+        Creates and writes an Rtree file index of the peril areas defined in a
+        peril areas (area peril) CSV or JSON file - returns the index file
+        path.
+
+        The index entries are computed from the area coordinate columns with
+        array operations, without creating a ``PerilArea`` object for each
+        area (see ``get_peril_area_index_entries``), and written with a bulk
+        load of the index (see ``save``). The optional ``workers`` argument
+        sets the number of processes used to compute the convex hulls of
+        non-rectangular areas, and ``payload_store`` whether to write the
+        index entry objects to a memory-mapped payload store instead of the
+        index (see ``PerilAreasPayloadStore``).
+        """
         if not src_fp:
             raise OasisException(
                 'An areas source CSV or JSON file path must be provided'
@@ -314,17 +898,22 @@ class PerilAreasIndex(RTreeIndex):
 
         len_seq = sum(1 if re.match(r'x(\d+)?', k) else 0 for k in six.iterkeys(coords_cols))
 
-        peril_areas = cls()._get_peril_areas(
-            (
-                ar[_peril_id_col],
-                ar[_coverage_type_col],
-                ar[_peril_area_id_col],
-                tuple(
-                    (ar.get(coords_cols['x{}'.format(i)].lower()) or 0, ar.get(coords_cols['y{}'.format(i)].lower()) or 0)
-                    for i in range(seq_start, len_seq + 1)
-                ),
-                static_props
-            ) for _, ar in areas_df.iterrows()
+        def _coords_array(axis):
+            cols = [coords_cols['{}{}'.format(axis, i)].lower() for i in range(seq_start, len_seq + 1)]
+            return np.column_stack([
+                pd.to_numeric(areas_df[col], errors='coerce').fillna(0).values if col in areas_df.columns
+                else np.zeros(len(areas_df))
+                for col in cols
+            ]).astype(np.float64)
+
+        entries = get_peril_area_index_entries(
+            areas_df[_peril_id_col].tolist(),
+            areas_df[_coverage_type_col].tolist(),
+            areas_df[_peril_area_id_col].tolist(),
+            _coords_array('x'),
+            _coords_array('y'),
+            area_reg_poly_radius=(static_props.get('area_reg_poly_radius') or 0.0016),
+            workers=workers
         )
 
         _index_fp = index_fp
@@ -337,8 +926,9 @@ class PerilAreasIndex(RTreeIndex):
         try:
             return cls().save(
                 _index_fp,
-                peril_areas=peril_areas,
-                index_props=index_props
+                entries=entries,
+                index_props=index_props,
+                payload_store=payload_store
             )
         except OasisException as e:
             raise
@@ -347,15 +937,50 @@ class PerilAreasIndex(RTreeIndex):
         self,
         index_fp,
         peril_areas=None,
-        index_props=DEFAULT_RTREE_INDEX_PROPS
+        index_props=DEFAULT_RTREE_INDEX_PROPS,
+        bulk_load=True,
+        entries=None,
+        payload_store=False
     ):
+        """
+        Writes an Rtree file index of the peril areas, held in the instance or
+        given as an iterable (or dict) of ``PerilArea`` objects, to the given
+        file path (no extension) - returns the index file path. Alternatively
+        the index entries can be given directly, as an iterable of tuples
+
+            (peril area ID, bounds, (peril ID, coverage type, peril area ID, bounds, coordinates))
+
+        (see ``get_peril_area_index_entries``).
+
+        By default (``bulk_load=True``) the index is bulk loaded from a stream
+        of the area entries, with the sort-tile-recursive (STR) packing done
+        by ``libspatialindex``, which is much faster than inserting the
+        areas one by one, and gives a tree with fuller, less overlapping
+        nodes. The index file format is the same in either case.
+
+        If ``payload_store`` is true then the index entry objects are written
+        to a payload store (see ``PerilAreasPayloadStore``) in the directory
+        ``<index file path>.payload``, and the index only holds the entry IDs
+        (the payload rows) and bounds.
+        """
         _index_fp = index_fp
 
         if not os.path.isabs(_index_fp):
             _index_fp = os.path.abspath(_index_fp)
 
-        if os.path.exists(_index_fp):
-            os.remove(_index_fp)
+        # Existing index files are removed, as neither a bulk load nor
+        # inserts replace the contents of an existing index
+        for fp in (
+            _index_fp,
+            '{}.{}'.format(_index_fp, index_props.get('idx_extension') or 'idx'),
+            '{}.{}'.format(_index_fp, index_props.get('dat_extension') or 'dat'),
+        ):
+            if os.path.exists(fp):
+                os.remove(fp)
+
+        payload_fp = PerilAreasPayloadStore.get_path(_index_fp)
+        if os.path.exists(payload_fp):
+            shutil.rmtree(payload_fp)
 
         class myindex(RTreeIndex):
             def __init__(self, *args, **kwargs):
@@ -369,30 +994,297 @@ class PerilAreasIndex(RTreeIndex):
                 return cpickle.loads(obj)
 
         try:
-            index = myindex(_index_fp, properties=RTreeIndexProperty(**index_props))
-
             _peril_areas = self._peril_areas or peril_areas
 
-            if not _peril_areas:
+            if entries is not None:
+                entries = iter(entries)
+            elif not _peril_areas:
                 raise OasisException(
                     'No peril areas found in instance or in arguments - '
                     'this is required to write the index to file'
                 )
+            else:
+                peril_areas_seq = None
+
+                if (isinstance(_peril_areas, list) or isinstance(_peril_areas, tuple)):
+                    peril_areas_seq = (pa for pa in _peril_areas)
+                elif (isinstance(_peril_areas, dict)):
+                    peril_areas_seq = six.itervalues(_peril_areas)
+                else:
+                    peril_areas_seq = iter(_peril_areas)
+
+                entries = (
+                    (pa.id, pa.bounds, (pa.peril_id, pa.coverage_type, pa.id, pa.bounds, pa.coordinates))
+                    for pa in peril_areas_seq
+                )
 
-            peril_areas_seq = None
-
-            if (isinstance(peril_areas, list) or isinstance(peril_areas, tuple)):
-                peril_areas_seq = (pa for pa in peril_areas)
-            elif isinstance(peril_areas, types.GeneratorType):
-                peril_areas_seq = peril_areas
-            elif (isinstance(peril_areas, dict)):
-                peril_areas_seq = six.itervalues(peril_areas)
+            if payload_store:
+                store = PerilAreasPayloadStore.save(payload_fp, (obj for _, _, obj in entries))
+                entries = (
+                    (row, bounds, None)
+                    for row, bounds in enumerate(store.get_bounds(np.arange(len(store))))
+                )
 
-            for pa in peril_areas_seq:
-                index.insert(pa.id, pa.bounds, obj=(pa.peril_id, pa.coverage_type, pa.id, pa.bounds, pa.coordinates))
+            if bulk_load:
+                # The bulk loader fails on an empty stream, so check that there
+                # is at least one entry first
+                try:
+                    first = next(entries)
+                except StopIteration:
+                    raise OasisException('No peril areas to write to the index')
+                index = myindex(_index_fp, itertools.chain([first], entries), properties=RTreeIndexProperty(**index_props))
+            else:
+                index = myindex(_index_fp, properties=RTreeIndexProperty(**index_props))
+                for paid, bounds, obj in entries:
+                    index.insert(paid, bounds, obj=obj)
 
             index.close()
         except (IOError, OSError, RTreeError) as e:
             raise
 
         return _index_fp
+
+
+class PerilAreasGridIndex(object):
+    """
+    Peril areas index for models whose peril areas are the cells of a regular
+    lon/lat grid - an alternative to ``PerilAreasIndex`` which computes the
+    peril area ID of the cell containing a point from the cell's row and
+    column, with no Rtree, using
+
+        area_peril_id_start + row * nx + column    (``row_major`` true)
+        area_peril_id_start + column * ny + row    (``row_major`` false)
+
+    where ``x0``, ``y0`` are the coordinates of the bottom left corner of the
+    grid, ``dx``, ``dy`` the cell width and height, and ``nx``, ``ny`` the
+    number of columns and rows. The same cells are used for every (peril ID,
+    coverage type) pair.
+
+    The index provides the parts of the ``PerilAreasIndex`` interface used
+    by the peril lookup - ``bounds``, ``intersection``, ``nearest``,
+    ``bulk_intersection`` and ``get_areas_table`` - with index entry objects
+    of the form
+
+        (peril ID, coverage type, peril area ID, bounds, coordinates)
+
+    plus the vectorised methods ``cell_ids``, ``cell_bounds`` and
+    ``cell_coordinates``.
+    """
+    def __init__(
+        self,
+        x0=None,
+        y0=None,
+        dx=None,
+        dy=None,
+        nx=None,
+        ny=None,
+        peril_ids=(),
+        coverage_types=(),
+        area_peril_id_start=1,
+        row_major=True
+    ):
+        try:
+            self._x0, self._y0 = float(x0), float(y0)
+            self._dx, self._dy = float(dx), float(dy)
+            self._nx, self._ny = int(nx), int(ny)
+            if not (self._dx > 0 and self._dy > 0 and self._nx > 0 and self._ny > 0):
+                raise ValueError('cell sizes and numbers of rows and columns must be positive')
+        except (TypeError, ValueError) as e:
+            raise OasisException('Invalid peril areas grid definition: {}'.format(str(e)))
+
+        self._area_peril_id_start = int(area_peril_id_start)
+        self._row_major = bool(row_major)
+
+        self._pairs = tuple((peril_id, coverage_type) for peril_id in peril_ids for coverage_type in coverage_types)
+
+    @property
+    def bounds(self):
+        return [self._x0, self._y0, self._x0 + self._nx * self._dx, self._y0 + self._ny * self._dy]
+
+    @property
+    def pairs(self):
+        return self._pairs
+
+    @property
+    def num_cells(self):
+        return self._nx * self._ny
+
+    def _cell_ids_from_rows_and_cols(self, rows, cols):
+        return (
+            self._area_peril_id_start + rows * self._nx + cols if self._row_major
+            else self._area_peril_id_start + cols * self._ny + rows
+        )
+
+    def _cell_rows_and_cols(self, ids):
+        offsets = np.asarray(ids, dtype=np.int64) - self._area_peril_id_start
+        if self._row_major:
+            return offsets // self._nx, offsets % self._nx
+        return offsets % self._ny, offsets // self._ny
+
+    @staticmethod
+    def _cell_positions(vals, v0, dv, n, upper_edges=False):
+        # The columns (or rows) of the cells containing the values - a value
+        # on the shared edge of two cells is in the left (lower) cell, or in
+        # the right (upper) cell if ``upper_edges`` is set. The positions are
+        # corrected for rounding in the division, so that the cell edges are
+        # exactly those of the cell bounds (see ``cell_bounds``).
+        pos = np.clip(np.floor((vals - v0) / dv).astype(np.int64), 0, n - 1)
+        if upper_edges:
+            return np.where(
+                (pos < n - 1) & (vals >= v0 + (pos + 1) * dv), pos + 1,
+                np.where((pos > 0) & (vals < v0 + pos * dv), pos - 1, pos)
+            )
+        return np.where(
+            (pos > 0) & (vals <= (v0 + (pos - 1) * dv) + dv), pos - 1,
+            np.where((pos < n - 1) & (vals > (v0 + pos * dv) + dv), pos + 1, pos)
+        )
+
+    def _cell_ids(self, xs, ys, upper_edges=False):
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+
+        minx, miny, maxx, maxy = self.bounds
+        with np.errstate(invalid='ignore'):
+            inside = (xs >= minx) & (xs <= maxx) & (ys >= miny) & (ys <= maxy)
+
+        cols = self._cell_positions(xs[inside], self._x0, self._dx, self._nx, upper_edges=upper_edges)
+        rows = self._cell_positions(ys[inside], self._y0, self._dy, self._ny, upper_edges=upper_edges)
+
+        ids = np.full(len(xs), -1, dtype=np.int64)
+        ids[inside] = self._cell_ids_from_rows_and_cols(rows, cols)
+
+        return ids
+
+    def cell_ids(self, xs, ys):
+        """
+        Returns the peril area IDs of the cells containing the points with
+        coordinates in the arrays ``xs`` and ``ys``, as an integer array, with
+        -1 for points outside the grid (or with null coordinates). Points on
+        the shared edge (or corner) of several cells are assigned to the
+        left and lower cell, which has the lowest peril area ID of these for
+        either numbering - the same cell as a peril lookup with an Rtree
+        index of the cells, which uses the matching area with the lowest ID.
+        """
+        return self._cell_ids(xs, ys)
+
+    def nearest_cell_ids(self, xs, ys):
+        """
+        Returns the peril area IDs of the cells nearest to the points with
+        coordinates in the arrays ``xs`` and ``ys`` (see ``nearest``), with -1
+        for points with null coordinates.
+        """
+        minx, miny, maxx, maxy = self.bounds
+        return self.cell_ids(
+            np.clip(np.asarray(xs, dtype=np.float64), minx, maxx),
+            np.clip(np.asarray(ys, dtype=np.float64), miny, maxy)
+        )
+
+    def cell_bounds(self, ids):
+        """
+        Returns the bounds ``(minx, miny, maxx, maxy)`` of the cells with the
+        given peril area IDs, as a list of tuples.
+        """
+        rows, cols = self._cell_rows_and_cols(ids)
+        minxs = self._x0 + cols * self._dx
+        minys = self._y0 + rows * self._dy
+        return [
+            (minx, miny, minx + self._dx, miny + self._dy)
+            for minx, miny in zip(minxs.tolist(), minys.tolist())
+        ]
+
+    def cell_coordinates(self, ids):
+        """
+        Returns the polygon coordinates of the cells with the given peril area
+        IDs, as a list of tuples of vertices in the same order as for the
+        ``coordinates`` of a ``PerilArea`` created from the cell's corners.
+        """
+        return [
+            ((minx, miny), (minx, maxy), (maxx, maxy), (maxx, miny), (minx, miny))
+            for minx, miny, maxx, maxy in self.cell_bounds(ids)
+        ]
+
+    def _entries(self, ids, objects=False):
+        ids = list(ids)
+        if not objects:
+            for paid in ids:
+                for _ in self._pairs:
+                    yield paid
+            return
+
+        for paid, bounds, coords in zip(ids, self.cell_bounds(ids), self.cell_coordinates(ids)):
+            for peril_id, coverage_type in self._pairs:
+                yield peril_id, coverage_type, paid, bounds, coords
+
+    def intersection(self, coordinates, objects=False):
+        """
+        Generates the IDs, or the entry objects (if ``objects`` is set), of the
+        cells intersecting a point ``(x, y)`` or a box ``(minx, miny, maxx,
+        maxy)``, for each (peril ID, coverage type) pair.
+        """
+        if len(coordinates) == 2:
+            ids = self.cell_ids([coordinates[0]], [coordinates[1]])
+            return self._entries(ids[ids >= 0].tolist(), objects=objects)
+
+        minx, miny, maxx, maxy = coordinates
+        _minx, _miny, _maxx, _maxy = self.bounds
+        if maxx < _minx or minx > _maxx or maxy < _miny or miny > _maxy:
+            return self._entries((), objects=objects)
+
+        lo = self._cell_ids([max(minx, _minx)], [max(miny, _miny)])[0]
+        hi = self._cell_ids([min(maxx, _maxx)], [min(maxy, _maxy)], upper_edges=True)[0]
+        (row0,), (col0,) = self._cell_rows_and_cols([lo])
+        (row1,), (col1,) = self._cell_rows_and_cols([hi])
+        rows, cols = np.meshgrid(np.arange(row0, row1 + 1), np.arange(col0, col1 + 1), indexing='ij')
+
+        ids = np.sort(self._cell_ids_from_rows_and_cols(rows.ravel(), cols.ravel()))
+        return self._entries(ids.tolist(), objects=objects)
+
+    def nearest(self, coordinates, num_results=1, objects=False):
+        """
+        Generates the IDs, or the entry objects (if ``objects`` is set), of the
+        cell nearest to a point ``(x, y)`` for each (peril ID, coverage type)
+        pair - this is the cell containing the point if it is in the grid,
+        otherwise the cell containing the nearest point on the grid boundary.
+        """
+        ids = self.nearest_cell_ids([coordinates[0]], [coordinates[1]])
+        return self._entries(ids[ids >= 0].tolist(), objects=objects)
+
+    def bulk_intersection(self, xs, ys):
+        """
+        As for ``PerilAreasIndex.bulk_intersection`` - the ID of the cell
+        containing a point is repeated for each (peril ID, coverage type)
+        pair.
+        """
+        ids = self.cell_ids(xs, ys)
+        counts = np.where(ids >= 0, len(self._pairs), 0).astype(np.int64)
+        return np.repeat(ids, counts), counts
+
+    def bulk_nearest(self, xs, ys):
+        """
+        As for ``PerilAreasIndex.bulk_nearest`` - the ID of the cell nearest
+        to a point (see ``nearest``) is repeated for each (peril ID, coverage
+        type) pair.
+        """
+        ids = self.nearest_cell_ids(xs, ys)
+        counts = np.where(ids >= 0, len(self._pairs), 0).astype(np.int64)
+        return np.repeat(ids, counts), counts
+
+    def get_areas_table(self):
+        """
+        As for ``PerilAreasIndex.get_areas_table`` - returns the entries of
+        all the cells of the grid for all the (peril ID, coverage type) pairs.
+        """
+        ids = np.arange(self._area_peril_id_start, self._area_peril_id_start + self.num_cells, dtype=np.int64)
+        bounds = self.cell_bounds(ids)
+        coords = self.cell_coordinates(ids)
+
+        df = pd.DataFrame(
+            data=[(perid, covtype, paid, bnds, crds) for perid, covtype in self._pairs for paid, bnds, crds in zip(ids.tolist(), bounds, coords)],
+            columns=['peril_id', 'coverage_type', 'peril_area_id', 'bounds', 'coordinates']
+        )
+
+        _bounds = np.array(df['bounds'].tolist(), dtype=np.float64).reshape(-1, 4)
+        for i, col in enumerate(('minx', 'miny', 'maxx', 'maxy',)):
+            df[col] = _bounds[:, i]
+
+        return df
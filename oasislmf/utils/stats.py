@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+__all__ = [
+    'LookupStats',
+    'NULL_TIMER'
+]
+
+import io
+import json
+import time
+
+from collections import OrderedDict
+
+import numpy as np
+import six
+
+
+class _NullTimer(object):
+    """
+    No-op context manager used in place of a stats timer when stats are not
+    being recorded.
+    """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+NULL_TIMER = _NullTimer()
+
+
+class _Timer(object):
+
+    def __init__(self, stats, phase):
+        self._stats = stats
+        self._phase = phase
+
+    def __enter__(self):
+        self._start = time.time()
+        return self
+
+    def __exit__(self, *args):
+        self._stats.add_time(self._phase, time.time() - self._start)
+        return False
+
+
+class LookupStats(object):
+    """
+    Instrumentation record for keys lookups - holds
+
+        * ``timings``: cumulative time in seconds spent in each named phase
+          (e.g. ``peril.index_query``), with the number of times each phase
+          was timed in ``calls``
+        * ``counters``: named counts (e.g. ``peril.queries``)
+        * ``histograms``: named histograms, as ordered dicts of value counts
+          (e.g. the number of index candidates per query, or lookup statuses)
+
+    The record can be merged with others (e.g. from lookup worker processes)
+    and written to file as JSON.
+    """
+    def __init__(self):
+        self.timings = OrderedDict()
+        self.calls = OrderedDict()
+        self.counters = OrderedDict()
+        self.histograms = OrderedDict()
+
+    def timer(self, phase):
+        """
+        Returns a context manager which adds the time spent in its block to
+        the cumulative time of the given phase.
+        """
+        return _Timer(self, phase)
+
+    def add_time(self, phase, secs, calls=1):
+        self.timings[phase] = self.timings.get(phase, 0) + secs
+        self.calls[phase] = self.calls.get(phase, 0) + calls
+
+    def incr(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + int(n)
+
+    def count_value(self, name, value, n=1):
+        """
+        Counts a single value in a named histogram.
+        """
+        hist = self.histograms.setdefault(name, OrderedDict())
+        hist[value] = hist.get(value, 0) + n
+
+    def add_to_histogram(self, name, values, counts=None):
+        """
+        Adds values (any iterable) to a named histogram - the optional
+        ``counts`` are the number of times each value is to be counted
+        (by default once).
+        """
+        hist = self.histograms.setdefault(name, OrderedDict())
+
+        if counts is None:
+            values, counts = np.unique(np.asarray(list(values) if not isinstance(values, np.ndarray) else values), return_counts=True)
+
+        for v, c in zip(values, counts):
+            v = v.item() if isinstance(v, np.generic) else v
+            hist[v] = hist.get(v, 0) + int(c)
+
+    def merge(self, other):
+        """
+        Adds the timings, counts and histograms of another record, which
+        can be a ``LookupStats`` instance or a dict as returned by
+        ``as_dict``.
+        """
+        other = other.as_dict() if isinstance(other, LookupStats) else other
+
+        for phase, secs in six.iteritems(other.get('timings') or {}):
+            self.add_time(phase, secs, calls=(other.get('calls') or {}).get(phase, 0))
+
+        for name, n in six.iteritems(other.get('counters') or {}):
+            self.incr(name, n)
+
+        for name, hist in six.iteritems(other.get('histograms') or {}):
+            self.add_to_histogram(name, list(hist.keys()), counts=list(hist.values()))
+
+        return self
+
+    def as_dict(self):
+        return OrderedDict([
+            ('timings', OrderedDict(self.timings)),
+            ('calls', OrderedDict(self.calls)),
+            ('counters', OrderedDict(self.counters)),
+            ('histograms', OrderedDict((name, OrderedDict(hist)) for name, hist in six.iteritems(self.histograms)))
+        ])
+
+    def to_json(self, indent=4):
+        return json.dumps(self.as_dict(), indent=indent)
+
+    def dump(self, fp):
+        """
+        Writes the record to a JSON file - returns the file path.
+        """
+        with io.open(fp, 'w', encoding='utf-8') as f:
+            f.write(six.text_type(self.to_json()))
+
+        return fp
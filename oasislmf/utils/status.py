@@ -8,3 +8,9 @@ STATUS_FAILURE = "FAILURE"
 KEYS_STATUS_SUCCESS = "success"
 KEYS_STATUS_FAIL = "fail"
 KEYS_STATUS_NOMATCH = "nomatch"
+
+# Keys lookup rejection reason codes - for locations rejected before the
+# peril areas index is queried, included in the keys record messages
+KEYS_ERROR_INVALID_COORDS = "invalid_coords"
+KEYS_ERROR_COORDS_OUT_OF_BOUNDS = "coords_out_of_bounds"
+KEYS_ERROR_OUTSIDE_PERIL_AREAS = "outside_peril_areas"
@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+
+__all__ = [
+    'VulnerabilityTable'
+]
+
+import io
+import json
+import os
+import tempfile
+
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import six
+
+from .exceptions import OasisException
+
+
+class VulnerabilityTable(object):
+    """
+    Compact, array-backed vulnerability table - a mapping of vulnerability
+    keys (tuples of key column values) to vulnerability IDs, which can be
+    used instead of a dict of vulnerabilities.
+
+    The table holds, for each key column, the sorted array of its distinct
+    values, and the keys encoded as tuples of positions (codes) in these
+    arrays, packed into single ``int64`` values (or, if the number of
+    possible keys is too large for that, a structured array of codes),
+    sorted, with the vulnerability IDs in the same order. Keys are looked up
+    using binary searches (``searchsorted``) of the column values and the
+    encoded keys, either one at a time (``get`` or ``table[key]``) or for
+    arrays of key column values (``lookup``).
+
+    Numeric key columns (``int``, ``float`` or ``bool`` typed) are held as
+    ``float64`` values, so that e.g. ``1`` and ``1.0`` are the same key as
+    for a dict, and all other key columns as strings. Where a key occurs
+    more than once the last vulnerability ID given for it is used, as for a
+    dict.
+
+    The table can be saved to and loaded from a ``.npy`` file, holding the
+    table as a sorted structured array, or an ``.npz`` file holding the
+    array and metadata describing where the table came from (see ``save``
+    and ``load``).
+    """
+    def __init__(self, key_cols, key_values, vulnerability_ids, numeric_cols=None):
+        """
+        :param key_cols: The key column names
+        :type key_cols: list, tuple
+
+        :param key_values: Arrays of the key column values (in ``key_cols``
+            order), or a dict of these keyed by column name
+        :type key_values: list, tuple, dict
+
+        :param vulnerability_ids: The vulnerability IDs of the keys
+        :type vulnerability_ids: list, tuple, numpy.ndarray
+
+        :param numeric_cols: The names of the numeric key columns - by
+            default the columns whose values are numeric arrays
+        :type numeric_cols: list, tuple
+        """
+        self._key_cols = tuple(key_cols)
+
+        if isinstance(key_values, dict):
+            key_values = [key_values[col] for col in self._key_cols]
+
+        key_values = [np.asarray(vals) for vals in key_values]
+
+        if len(key_values) != len(self._key_cols):
+            raise OasisException('The number of key column value arrays does not match the number of key columns')
+
+        if numeric_cols is None:
+            numeric_cols = [col for col, vals in zip(self._key_cols, key_values) if vals.dtype.kind in 'iufb']
+        self._numeric_cols = tuple(col for col in self._key_cols if col in numeric_cols)
+
+        key_values = [self.typed_values(col, vals) for col, vals in zip(self._key_cols, key_values)]
+
+        vuln_ids = np.asarray(vulnerability_ids)
+        if vuln_ids.dtype.kind not in 'iu':
+            try:
+                vuln_ids = vuln_ids.astype(np.int64)
+            except (TypeError, ValueError):
+                vuln_ids = vuln_ids.astype(object)
+
+        valid = np.ones(len(vuln_ids), dtype=bool)
+        for vals in key_values:
+            valid &= pd.notnull(vals)
+
+        key_values = [vals[valid] for vals in key_values]
+        vuln_ids = vuln_ids[valid]
+
+        self._uniques = [np.unique(vals) for vals in key_values]
+
+        codes = [np.searchsorted(uniques, vals) for uniques, vals in zip(self._uniques, key_values)]
+
+        keys = self._encode(codes)
+
+        # Stable sort, and for keys which occur more than once keep the last
+        order = np.argsort(keys, kind='mergesort')
+        keys = keys[order]
+        last = np.ones(len(keys), dtype=bool)
+        if len(keys):
+            last[:-1] = keys[1:] != keys[:-1]
+
+        self._keys = keys[last]
+        self._vulnerability_ids = vuln_ids[order][last]
+
+    @property
+    def key_cols(self):
+        return self._key_cols
+
+    @property
+    def numeric_cols(self):
+        return self._numeric_cols
+
+    @property
+    def vulnerability_ids(self):
+        return self._vulnerability_ids
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _encode(self, codes):
+        sizes = [len(uniques) + 1 for uniques in self._uniques]
+
+        if float(np.prod(np.array(sizes, dtype=np.float64))) < 2 ** 62:
+            keys = np.zeros(len(codes[0]) if codes else 0, dtype=np.int64)
+            for size, _codes in zip(sizes, codes):
+                keys = keys * size + _codes
+            return keys
+
+        keys = np.zeros(len(codes[0]) if codes else 0, dtype=[('c{}'.format(i), np.int64) for i in range(len(codes))])
+        for i, _codes in enumerate(codes):
+            keys['c{}'.format(i)] = _codes
+        return keys
+
+    def typed_values(self, key_col, values):
+        """
+        Converts an array of values of a key column to the type used for the
+        keys - ``float64`` for numeric key columns and (object) strings for
+        all others. Values which could not match any key (e.g. strings in a
+        numeric key column) are converted to nulls.
+        """
+        values = np.asarray(values)
+
+        if key_col in self._numeric_cols:
+            if values.dtype.kind in 'iufb':
+                return values.astype(np.float64)
+            return np.array([
+                float(v) if isinstance(v, (six.integer_types, float, np.number)) else np.nan
+                for v in values
+            ], dtype=np.float64)
+
+        if values.dtype.kind in 'US':
+            return values.astype(object)
+
+        return np.array([v if isinstance(v, six.string_types) else None for v in values], dtype=object)
+
+    def lookup(self, *key_values):
+        """
+        Batch lookup of arrays of key column values, given in key column
+        order, or as a dict keyed by column name - returns a pair of arrays
+        ``(vulnerability_ids, found)``, where ``found`` indicates which keys
+        were found, and ``vulnerability_ids`` holds their vulnerability IDs
+        (with undefined values where not found).
+        """
+        if len(key_values) == 1 and isinstance(key_values[0], dict):
+            key_values = [key_values[0][col] for col in self._key_cols]
+
+        if len(key_values) != len(self._key_cols):
+            raise OasisException('The number of key column value arrays does not match the number of key columns')
+
+        key_values = [self.typed_values(col, vals) for col, vals in zip(self._key_cols, key_values)]
+        n = len(key_values[0]) if key_values else 0
+
+        found = np.ones(n, dtype=bool)
+        codes = []
+        for uniques, vals in zip(self._uniques, key_values):
+            valid = pd.notnull(vals)
+            _codes = np.zeros(n, dtype=np.int64)
+            if len(uniques) and valid.any():
+                _codes[valid] = np.minimum(np.searchsorted(uniques, vals[valid]), len(uniques) - 1)
+                valid[valid] = uniques[_codes[valid]] == vals[valid]
+            found &= valid
+            codes.append(_codes)
+
+        keys = self._encode(codes)
+
+        pos = np.minimum(np.searchsorted(self._keys, keys), max(len(self._keys) - 1, 0))
+        if len(self._keys):
+            found &= self._keys[pos] == keys
+        else:
+            found[:] = False
+
+        vuln_ids = self._vulnerability_ids[pos] if len(self._keys) else np.zeros(n, dtype=self._vulnerability_ids.dtype)
+
+        return vuln_ids, found
+
+    def get(self, key, default=None):
+        """
+        Scalar lookup of a key - a tuple of key column values, or a single
+        value for a table with one key column. Returns the vulnerability ID
+        of the key, or ``default`` if the key is not in the table.
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __getitem__(self, key):
+        _key = key if len(self._key_cols) > 1 else (key,)
+
+        try:
+            if len(_key) != len(self._key_cols):
+                raise KeyError(key)
+        except TypeError:
+            raise KeyError(key)
+
+        vals = []
+        for col, v in zip(self._key_cols, _key):
+            arr = np.empty(1, dtype=object)
+            arr[0] = v
+            vals.append(arr)
+
+        vuln_ids, found = self.lookup(*vals)
+        if not found[0]:
+            raise KeyError(key)
+
+        vuln_id = vuln_ids[0]
+        return vuln_id.item() if isinstance(vuln_id, np.generic) else vuln_id
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def to_array(self):
+        """
+        Returns the table as a structured array sorted by key, with a field
+        for each key column (``float64`` for numeric key columns, otherwise
+        unicode strings) and a ``vulnerability_id`` field.
+        """
+        codes = []
+        keys = self._keys
+        if keys.dtype.names:
+            codes = [keys[name] for name in keys.dtype.names]
+        else:
+            for uniques in reversed(self._uniques):
+                size = len(uniques) + 1
+                codes.insert(0, keys % size)
+                keys = keys // size
+
+        values = [uniques[_codes] for uniques, _codes in zip(self._uniques, codes)]
+        values = [
+            vals.astype(np.float64) if col in self._numeric_cols else vals.astype(six.text_type)
+            for col, vals in zip(self._key_cols, values)
+        ]
+
+        vuln_ids = self._vulnerability_ids
+        if vuln_ids.dtype == object:
+            vuln_ids = vuln_ids.astype(six.text_type)
+
+        arr = np.zeros(len(self), dtype=[(str(col), vals.dtype) for col, vals in zip(self._key_cols, values)] + [(str('vulnerability_id'), vuln_ids.dtype)])
+        for col, vals in zip(self._key_cols, values):
+            arr[str(col)] = vals
+        arr['vulnerability_id'] = vuln_ids
+
+        return arr
+
+    def to_frame(self):
+        """
+        Returns the table as a dataframe with the key columns and a
+        ``vulnerability_id`` column.
+        """
+        arr = self.to_array()
+        df = pd.DataFrame(OrderedDict((col, arr[str(col)]) for col in self._key_cols + ('vulnerability_id',)))
+        for col in self._key_cols:
+            if col not in self._numeric_cols:
+                df[col] = df[col].astype(object)
+        return df
+
+    def save(self, fp, metadata=None):
+        """
+        Writes the table to a ``.npy`` file (see ``to_array``) - returns the
+        file path.
+
+        If the optional keyword argument ``metadata`` (a JSON serialisable
+        dict) is given then the table is written instead to an ``.npz`` file
+        (at the given path, whatever its extension), holding the array and
+        the metadata, which ``load`` can check. The file is written to a
+        temporary file in the same directory first, and renamed when
+        complete.
+        """
+        if metadata is None:
+            np.save(fp, self.to_array(), allow_pickle=False)
+            return fp
+
+        fd, tmp_fp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(fp)), prefix='.{}.'.format(os.path.basename(fp)), suffix='.tmp')
+        try:
+            with io.open(fd, 'wb') as f:
+                np.savez(
+                    f,
+                    table=self.to_array(),
+                    metadata=np.array(json.dumps(metadata, sort_keys=True, default=str), dtype=six.text_type)
+                )
+            getattr(os, 'replace', os.rename)(tmp_fp, fp)
+        except BaseException:
+            if os.path.exists(tmp_fp):
+                os.remove(tmp_fp)
+            raise
+
+        return fp
+
+    @classmethod
+    def load(cls, fp, key_cols=None, metadata=None):
+        """
+        Loads a table from a ``.npy`` or ``.npz`` file written by ``save`` -
+        if the key columns are given they must match those of the file.
+
+        If the optional keyword argument ``metadata`` is given then the file
+        must be an ``.npz`` file saved with the same metadata, otherwise an
+        ``OasisException`` is raised.
+        """
+        data = np.load(fp, allow_pickle=False)
+
+        if hasattr(data, 'files'):
+            try:
+                arr = data['table']
+                file_metadata = json.loads(six.text_type(data['metadata'][()])) if 'metadata' in data.files else None
+            finally:
+                data.close()
+        else:
+            arr, file_metadata = data, None
+
+        if metadata is not None and file_metadata != json.loads(json.dumps(metadata, sort_keys=True, default=str)):
+            raise OasisException('Invalid vulnerability table file {}: the file metadata does not match the given metadata'.format(fp))
+
+        names = tuple(arr.dtype.names or ())
+        if not names or names[-1] != 'vulnerability_id' or (key_cols is not None and names[:-1] != tuple(key_cols)):
+            raise OasisException('Invalid vulnerability table file {}: the file columns {} do not match the key columns'.format(fp, names))
+
+        _key_cols = names[:-1]
+
+        return cls(
+            _key_cols,
+            [arr[col] for col in _key_cols],
+            arr['vulnerability_id'],
+            numeric_cols=[col for col in _key_cols if arr.dtype[col].kind == 'f']
+        )
+
+    @classmethod
+    def from_dataframe(cls, df, key_cols, vulnerability_id_col='vulnerability_id', numeric_cols=None):
+        """
+        Creates a table from a dataframe of vulnerabilities with the given
+        key columns and vulnerability ID column. Object columns listed in
+        ``numeric_cols`` are converted to numbers.
+        """
+        numeric_cols = tuple(numeric_cols) if numeric_cols is not None else None
+        key_values = []
+        for col in key_cols:
+            vals = df[col].values
+            if numeric_cols and col in numeric_cols and vals.dtype == object:
+                vals = pd.to_numeric(df[col], errors='coerce').values
+            key_values.append(vals)
+
+        return cls(key_cols, key_values, df[vulnerability_id_col].values, numeric_cols=numeric_cols)
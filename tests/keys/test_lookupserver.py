@@ -0,0 +1,151 @@
+from __future__ import unicode_literals
+
+import io
+import json
+import os
+import threading
+
+from unittest import TestCase
+
+import pandas as pd
+
+from backports.tempfile import TemporaryDirectory
+from hypothesis import (
+    given,
+    HealthCheck,
+    settings,
+)
+from hypothesis.strategies import (
+    integers,
+    lists,
+    tuples,
+)
+
+from oasislmf.keys.lookup import (
+    OasisLookup,
+    OasisLookupFactory,
+)
+from oasislmf.keys.server import (
+    LookupClient,
+    LookupServer,
+)
+from oasislmf.utils.exceptions import OasisException
+
+from .test_oasislookup import lookup_config
+from .test_oasislookupfactory import FakeKeysLookup
+from .test_oasisperillookup import (
+    coords,
+    write_grid_peril_areas_index,
+)
+from .test_oasisvulnerabilitylookup import write_vulnerabilities_file
+
+
+class LookupServerTest(TestCase):
+
+    def start_server(self, d, **kwargs):
+        index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'))
+        vulnerabilities_fp = write_vulnerabilities_file(os.path.join(d, 'vulnerabilities.csv'))
+        lookup = OasisLookup(config=lookup_config(index_fp, vulnerabilities_fp))
+
+        server = LookupServer(os.path.join(d, 'lookup.sock'), lookup, model_info={'model_id': 'TEST'}, **kwargs)
+        thread = threading.Thread(target=server.serve, kwargs={'poll_interval': 0.05})
+        thread.start()
+
+        return lookup, server, thread
+
+    def stop_server(self, client, thread):
+        client.shutdown()
+        thread.join()
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow], max_examples=10)
+    @given(locs=lists(tuples(coords, coords, integers(min_value=0, max_value=7)), min_size=1, max_size=20))
+    def test_locations_are_looked_up_by_server___results_match_local_lookup_results(self, locs):
+        with TemporaryDirectory() as d:
+            lookup, server, thread = self.start_server(d, batch_size=3)
+            client = LookupClient(server.socket_path)
+            try:
+                exposures_fp = os.path.join(d, 'exposures.csv')
+                pd.DataFrame(
+                    [{'id': i + 1, 'lon': x, 'lat': y, 'occupancy': o} for i, (x, y, o) in enumerate(locs)],
+                    columns=['id', 'lon', 'lat', 'occupancy']
+                ).to_csv(exposures_fp, index=False)
+
+                expected = json.loads(json.dumps(list(OasisLookupFactory.get_results(lookup, model_exposures_fp=exposures_fp))))
+                res = list(client.get_results(model_exposures_fp=exposures_fp))
+
+                self.assertEqual(res, expected)
+
+                records = pd.read_csv(exposures_fp).to_dict('records')
+                res = list(client.get_results(model_exposures=records, successes_only=True))
+
+                self.assertEqual(res, [r for r in expected if r['status'] == 'success'])
+            finally:
+                self.stop_server(client, thread)
+
+            self.assertFalse(os.path.exists(server.socket_path))
+
+    def test_keys_are_saved_with_server___files_are_the_same_as_for_local_lookup(self):
+        with TemporaryDirectory() as d:
+            lookup, server, thread = self.start_server(d)
+            client = LookupClient(server.socket_path)
+            try:
+                self.assertEqual(client.info(), {'model_id': 'TEST', 'loc_id_col': 'id'})
+
+                exposures_fp = os.path.join(d, 'exposures.csv')
+                pd.DataFrame(
+                    [{'id': i + 1, 'lon': 0.5 * i, 'lat': 0.5 * i, 'occupancy': i % 8} for i in range(20)],
+                    columns=['id', 'lon', 'lat', 'occupancy']
+                ).to_csv(exposures_fp, index=False)
+
+                expected = OasisLookupFactory.save_results(
+                    lookup, os.path.join(d, 'expected-keys.csv'), errors_fp=os.path.join(d, 'expected-errors.csv'), model_exposures_fp=exposures_fp
+                )
+                res = client.save_results(
+                    os.path.join(d, 'keys.csv'), errors_fp=os.path.join(d, 'errors.csv'), model_exposures_fp=exposures_fp, stats_fp=os.path.join(d, 'stats.json')
+                )
+
+                self.assertEqual((res[1], res[3]), (expected[1], expected[3]))
+                for fp, expected_fp in ((res[0], expected[0]), (res[2], expected[2])):
+                    with io.open(fp, 'r', encoding='utf-8') as f, io.open(expected_fp, 'r', encoding='utf-8') as g:
+                        self.assertEqual(f.read(), g.read())
+
+                with io.open(os.path.join(d, 'stats.json'), 'r', encoding='utf-8') as f:
+                    stats = json.load(f)
+                self.assertEqual(stats['counters']['results'], expected[1] + expected[3])
+            finally:
+                self.stop_server(client, thread)
+
+    def test_location_records_are_looked_up_by_server_with_lookup_class___results_match_local_lookup_results(self):
+        with TemporaryDirectory() as d:
+            lookup = FakeKeysLookup(supplier='TEST')
+            server = LookupServer(os.path.join(d, 'lookup.sock'), lookup)
+            thread = threading.Thread(target=server.serve, kwargs={'poll_interval': 0.05})
+            thread.start()
+            client = LookupClient(server.socket_path)
+            try:
+                exposures_fp = os.path.join(d, 'exposures.csv')
+                pd.DataFrame({'ID': [1, 2, 3, 4], 'lon': [0.5, 1.5, None, 3.5]}).to_csv(exposures_fp, index=False)
+
+                expected = list(OasisLookupFactory.get_keys(lookup=lookup, model_exposures_file_path=exposures_fp, success_only=False))
+
+                res = list(client.get_results(model_exposures=pd.read_csv(exposures_fp).to_dict('records')))
+                self.assertEqual(res, expected)
+
+                res = list(client.get_results(model_exposures=pd.read_csv(exposures_fp).to_dict('records'), successes_only=True))
+                self.assertEqual(res, [r for r in expected if r['status'] == 'success'])
+            finally:
+                self.stop_server(client, thread)
+
+    def test_lookup_request_fails___client_raises_oasis_exception_and_server_keeps_serving(self):
+        with TemporaryDirectory() as d:
+            _, server, thread = self.start_server(d)
+            client = LookupClient(server.socket_path)
+            try:
+                with self.assertRaises(OasisException):
+                    list(client.get_results(model_exposures_fp=os.path.join(d, 'lookup.sock')))
+
+                self.assertTrue(client.is_alive())
+            finally:
+                self.stop_server(client, thread)
+
+            self.assertFalse(client.is_alive())
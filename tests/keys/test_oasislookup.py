@@ -0,0 +1,194 @@
+from __future__ import unicode_literals
+
+import os
+
+from unittest import TestCase
+
+import pandas as pd
+import six
+
+from backports.tempfile import TemporaryDirectory
+from hypothesis import (
+    given,
+    HealthCheck,
+    settings,
+)
+from hypothesis.strategies import (
+    booleans,
+    integers,
+    lists,
+    tuples,
+)
+
+from oasislmf.keys.lookup import (
+    OasisLookup,
+    OasisLookupFactory,
+    OasisPerilLookup,
+    OasisVulnerabilityLookup,
+)
+
+from .test_oasisperillookup import (
+    coords,
+    peril_lookup_config,
+    write_grid_peril_areas_index,
+)
+from .test_oasisvulnerabilitylookup import (
+    vulnerability_lookup_config,
+    write_vulnerabilities_file,
+)
+
+
+def lookup_config(index_fp, vulnerabilities_fp):
+    config = peril_lookup_config(index_fp)
+    config['vulnerability'] = vulnerability_lookup_config(vulnerabilities_fp)['vulnerability']
+    return config
+
+
+class OasisLookupBulkLookup(TestCase):
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(locs=lists(tuples(coords, coords, integers(min_value=0, max_value=7)), min_size=1, max_size=10))
+    def test_dataframe_of_locations___results_match_base_class_bulk_lookup(self, locs):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'))
+            vulnerabilities_fp = write_vulnerabilities_file(os.path.join(d, 'vulnerabilities.csv'))
+            lookup = OasisLookup(config=lookup_config(index_fp, vulnerabilities_fp))
+
+            locs = [{'id': i + 1, 'lon': x, 'lat': y, 'occupancy': o} for i, (x, y, o) in enumerate(locs)]
+
+            expected = list(super(OasisLookup, lookup).bulk_lookup(locs))
+            res = list(lookup.bulk_lookup(pd.DataFrame(locs)))
+
+            self.assertEqual(res, expected)
+
+
+class OasisLookupStats(TestCase):
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow], max_examples=20)
+    @given(locs=lists(tuples(coords, coords, integers(min_value=0, max_value=7)), min_size=1, max_size=10))
+    def test_stats_are_enabled___status_counts_and_index_queries_are_recorded_for_sub_lookups(self, locs):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'))
+            vulnerabilities_fp = write_vulnerabilities_file(os.path.join(d, 'vulnerabilities.csv'))
+            lookup = OasisLookup(config=lookup_config(index_fp, vulnerabilities_fp))
+
+            stats = lookup.enable_stats()
+            self.assertIs(lookup.peril_lookup.stats, stats)
+            self.assertIs(lookup.vulnerability_lookup.stats, stats)
+
+            locs = [{'id': i + 1, 'lon': x, 'lat': y, 'occupancy': o} for i, (x, y, o) in enumerate(locs)]
+            res = list(lookup.bulk_lookup(pd.DataFrame(locs)))
+
+        self.assertEqual(sum(stats.histograms['peril.statuses'].values()), len(res))
+        self.assertEqual(sum(stats.histograms['vulnerability.statuses'].values()), len(res))
+        self.assertEqual(stats.counters.get('peril.index_queries', 0), sum(stats.histograms.get('peril.index_candidates', {}).values()))
+        self.assertIn('vulnerability.join', stats.timings)
+
+
+class OasisLookupSpatialOrder(TestCase):
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow], max_examples=20)
+    @given(
+        locs=lists(tuples(coords, coords, integers(min_value=0, max_value=7)), min_size=1, max_size=20),
+        chunksize=integers(min_value=0, max_value=5),
+        workers=integers(min_value=1, max_value=2)
+    )
+    def test_locations_looked_up_in_spatial_order___results_are_in_location_order_and_match_unordered_results(self, locs, chunksize, workers):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'))
+            vulnerabilities_fp = write_vulnerabilities_file(os.path.join(d, 'vulnerabilities.csv'))
+            lookup = OasisLookup(config=lookup_config(index_fp, vulnerabilities_fp))
+
+            exposures_fp = os.path.join(d, 'exposures.csv')
+            pd.DataFrame(
+                [{'id': i + 1, 'lon': x, 'lat': y, 'occupancy': o} for i, (x, y, o) in enumerate(locs)],
+                columns=['id', 'lon', 'lat', 'occupancy']
+            ).to_csv(exposures_fp, index=False)
+
+            expected = list(OasisLookupFactory.get_results(lookup, model_exposures_fp=exposures_fp))
+            res = list(OasisLookupFactory.get_results(
+                lookup, model_exposures_fp=exposures_fp, spatial_order=True, chunksize=(chunksize or None), workers=workers
+            ))
+
+            self.assertEqual(res, expected)
+
+    def test_scattered_locations___spatial_order_increases_index_locality_hits(self):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'))
+            vulnerabilities_fp = write_vulnerabilities_file(os.path.join(d, 'vulnerabilities.csv'))
+            lookup = OasisLookup(config=lookup_config(index_fp, vulnerabilities_fp))
+
+            # Points alternating between opposite corners of the areas grid
+            exposures_fp = os.path.join(d, 'exposures.csv')
+            pd.DataFrame(
+                [{'id': i + 1, 'lon': 0.5 + 3 * (i % 2), 'lat': 0.5 + 3 * (i % 2) + 0.001 * i, 'occupancy': 1} for i in range(20)],
+                columns=['id', 'lon', 'lat', 'occupancy']
+            ).to_csv(exposures_fp, index=False)
+
+            hits = []
+            for spatial_order in (False, True):
+                stats = lookup.enable_stats()
+                list(OasisLookupFactory.get_results(lookup, model_exposures_fp=exposures_fp, spatial_order=spatial_order, dedupe=False))
+                self.assertEqual(stats.counters['peril.index_locality_queries'], 20)
+                hits.append(stats.counters['peril.index_locality_hits'])
+
+            self.assertEqual(hits, [0, 18])
+
+
+class OasisLookupTiled(TestCase):
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow], max_examples=20)
+    @given(
+        locs=lists(tuples(coords, coords, integers(min_value=0, max_value=7)), min_size=1, max_size=20),
+        dedupe=booleans()
+    )
+    def test_locations_looked_up_in_tiled_workers___results_match_single_process_results(self, locs, dedupe):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'))
+            vulnerabilities_fp = write_vulnerabilities_file(os.path.join(d, 'vulnerabilities.csv'))
+            lookup = OasisLookup(config=lookup_config(index_fp, vulnerabilities_fp))
+
+            exposures_fp = os.path.join(d, 'exposures.csv')
+            pd.DataFrame(
+                [{'id': i + 1, 'lon': x, 'lat': y, 'occupancy': o} for i, (x, y, o) in enumerate(locs)],
+                columns=['id', 'lon', 'lat', 'occupancy']
+            ).to_csv(exposures_fp, index=False)
+
+            expected = list(OasisLookupFactory.get_results(lookup, model_exposures_fp=exposures_fp, dedupe=dedupe))
+            res = list(OasisLookupFactory.get_results(lookup, model_exposures_fp=exposures_fp, dedupe=dedupe, workers=2, tiled=True))
+
+            self.assertEqual(res, expected)
+
+
+class OasisLookupLocationIds(TestCase):
+
+    def test_location_ids_of_zero_or_null___ids_are_kept_or_generated_once_per_location_with_and_without_duplicates(self):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'))
+            vulnerabilities_fp = write_vulnerabilities_file(os.path.join(d, 'vulnerabilities.csv'))
+
+            lookups = (
+                OasisLookup(config=lookup_config(index_fp, vulnerabilities_fp)),
+                OasisPerilLookup(config=peril_lookup_config(index_fp)),
+                OasisVulnerabilityLookup(config=vulnerability_lookup_config(vulnerabilities_fp)),
+            )
+
+            for lookup in lookups:
+                for first_id in (0, None):
+                    for duplicates in (False, True):
+                        loc_df = pd.DataFrame(
+                            {'id': [first_id, 1, 2], 'lon': [0.5, 1.5, 0.5 if duplicates else 2.5], 'lat': [0.5, 1.5, 0.5 if duplicates else 2.5], 'occupancy': [1, 2, 1 if duplicates else 3]},
+                            columns=['id', 'lon', 'lat', 'occupancy']
+                        )
+
+                        res = list(OasisLookupFactory.get_results(lookup, model_exposures_df=loc_df))
+
+                        k = len(res) // 3
+                        loc_ids = [[r['id'] for r in res[i * k:(i + 1) * k]] for i in range(3)]
+
+                        self.assertEqual([len(set(ids)) for ids in loc_ids], [1, 1, 1])
+                        self.assertEqual([ids[0] for ids in loc_ids[1:]], [1, 2])
+                        if first_id is None:
+                            self.assertIsInstance(loc_ids[0][0], six.integer_types)
+                        else:
+                            self.assertEqual(loc_ids[0][0], 0)
@@ -13,6 +13,7 @@ import pandas as pd
 
 from backports.tempfile import TemporaryDirectory
 from hypothesis import (
+    example,
     given,
     HealthCheck,
     reproduce_failure,
@@ -29,10 +30,15 @@ from hypothesis.strategies import (
     tuples,
 )
 from mock import Mock, patch
+from shapely.geometry import box
 from six import StringIO
 from tempfile import NamedTemporaryFile
 
-from oasislmf.keys.lookup import OasisLookupFactory
+from oasislmf.keys.lookup import (
+    OasisLookupFactory,
+    ParallelKeysLookup,
+    read_keys_bin_file,
+)
 from oasislmf.utils.coverage import (
     BUILDING_COVERAGE_CODE,
     CONTENTS_COVERAGE_CODE,
@@ -97,6 +103,32 @@ class OasisKeysLookupFactoryCreate(TestCase):
             self.assertEqual(instance.model_version, version)
             self.assertEqual(instance.keys_data_directory, keys_path)
 
+    def test_workers_are_supplied___parallel_lookup_adapter_is_created_with_correct_model_info_and_keys_path(self):
+        with TemporaryDirectory() as d:
+            keys_path = os.path.join(d, 'keys')
+            os.mkdir(keys_path)
+
+            version_path = os.path.join(d, 'version.csv')
+            self.write_version_file('supplier', 'model', 'version', version_path)
+
+            module_path = os.path.join(d, 'model_lookup.py')
+            self.write_py_module('model', module_path)
+
+            _, instance = OasisLookupFactory.create(
+                model_keys_data_path=keys_path,
+                model_version_file_path=version_path,
+                lookup_package_path=module_path,
+                workers=2
+            )
+
+            self.assertIsInstance(instance, ParallelKeysLookup)
+            self.assertEqual(instance.lookup_class.__name__, 'modelKeysLookup')
+            self.assertEqual(instance.workers, 2)
+            self.assertEqual(instance.supplier, 'supplier')
+            self.assertEqual(instance.model_name, 'model')
+            self.assertEqual(instance.model_version, 'version')
+            self.assertEqual(instance.keys_data_directory, keys_path)
+
 
 class OasisKeysLookupFactoryGetModelExposures(TestCase):
 
@@ -129,6 +161,23 @@ class OasisKeysLookupFactoryGetModelExposures(TestCase):
 
         self.assertEqual(res, data)
 
+    @given(
+        data=lists(tuples(integers(min_value=0, max_value=100), integers(min_value=0, max_value=100)), min_size=1),
+        chunksize=integers(min_value=1, max_value=10)
+    )
+    def test_chunksize_is_provided___file_content_is_loaded_in_typed_chunks(self, data, chunksize):
+        with NamedTemporaryFile('w') as f:
+            csv.writer(f).writerows([('First', 'Second')] + data)
+            f.flush()
+
+            chunks = list(OasisLookupFactory.get_model_exposures(model_exposures_file_path=f.name, chunksize=chunksize))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [min(chunksize, len(data) - i) for i in range(0, len(data), chunksize)])
+        for chunk in chunks:
+            self.assertEqual(list(chunk.columns), ['first', 'second'])
+            self.assertEqual(chunk['first'].dtype.kind, 'i')
+        self.assertEqual([tuple(r) for chunk in chunks for r in chunk.values.tolist()], data)
+
 
 class OasisKeysLookupFactoryWriteOasisKeysFiles(TestCase):
 
@@ -253,6 +302,51 @@ class OasisKeysLookupFactoryGetKeys(TestCase):
             self.assertEqual(res, data)
 
 
+class FakeKeysLookup(object):
+
+    instances = 0
+
+    def __init__(self, keys_data_directory=None, supplier=None, model_name=None, model_version=None):
+        FakeKeysLookup.instances += 1
+        self.instance = FakeKeysLookup.instances
+        self.supplier = supplier
+
+    def process_locations(self, loc_df):
+        for _, loc in loc_df.iterrows():
+            yield {
+                'id': int(loc['id']),
+                'supplier': self.supplier,
+                'pid': os.getpid(),
+                'instance': self.instance,
+                'status': KEYS_STATUS_SUCCESS if loc['id'] % 2 else KEYS_STATUS_FAIL
+            }
+
+
+class ParallelKeysLookupProcessLocations(TestCase):
+
+    @settings(deadline=None, max_examples=10)
+    @given(
+        ids=lists(integers(min_value=1, max_value=1000), min_size=1, max_size=50),
+        workers=integers(min_value=2, max_value=4)
+    )
+    def test_workers_are_used___records_are_the_same_and_in_the_same_order_as_for_a_single_lookup_instance(self, ids, workers):
+        loc_df = pd.DataFrame({'id': ids})
+        lookup = ParallelKeysLookup(FakeKeysLookup, workers, supplier='supplier')
+
+        res = list(OasisLookupFactory.get_keys(lookup=lookup, model_exposures=loc_df.to_csv(index=False), success_only=False))
+        expected = list(FakeKeysLookup(supplier='supplier').process_locations(loc_df))
+
+        self.assertEqual(
+            [{k: v for k, v in r.items() if k not in ('pid', 'instance')} for r in res],
+            [{k: v for k, v in r.items() if k not in ('pid', 'instance')} for r in expected]
+        )
+        if len(ids) > 1:
+            self.assertNotIn(os.getpid(), set(r['pid'] for r in res))
+            # Each worker creates one lookup instance for all its locations
+            self.assertEqual(len(set((r['pid'], r['instance']) for r in res)), len(set(r['pid'] for r in res)))
+            self.assertIsNone(lookup._lookup)
+
+
 class OasisKeysLookupFactoryWriteKeys(TestCase):
 
     def create_fake_lookup(self):
@@ -267,10 +361,10 @@ class OasisKeysLookupFactoryWriteKeys(TestCase):
     @given(
         data=keys_data(from_statuses=just(KEYS_STATUS_SUCCESS), size=10)
     )
-    def test_produced_keys_are_passed_to_write_oasis_keys_file(self, data):
+    def test_produced_keys_are_passed_to_write_keys_files(self, data):
         with TemporaryDirectory() as d,\
              patch('oasislmf.keys.lookup.OasisLookupFactory.get_keys', Mock(return_value=(r for r in data))) as get_keys_mock,\
-             patch('oasislmf.keys.lookup.OasisLookupFactory.write_oasis_keys_file') as write_oasis_keys_file_mock:
+             patch('oasislmf.keys.lookup.OasisLookupFactory.write_keys_files') as write_keys_files_mock:
 
             keys_file_path = os.path.join(d, 'piwind-keys.csv')
             OasisLookupFactory.save_keys(
@@ -285,5 +379,342 @@ class OasisKeysLookupFactoryWriteKeys(TestCase):
                 model_exposures_file_path=None,
                 success_only=True
             )
-            write_oasis_keys_file_mock.assert_called_once_with(data, keys_file_path, id_col='id')
+            self.assertEqual(write_keys_files_mock.call_count, 1)
+            args, kwargs = write_keys_files_mock.call_args
+            self.assertEqual(list(args[0]), data)
+            self.assertEqual(args[1:], (keys_file_path,))
+            self.assertEqual(kwargs, {'errors_fp': None, 'id_col': 'id', 'format': 'oasis'})
+
+
+class OasisKeysLookupFactoryWriteKeysFiles(TestCase):
+
+    @settings(suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        data=keys_data(size=20),
+        batch_size=integers(min_value=1, max_value=25),
+        keys_format=sampled_from(['oasis', 'json'])
+    )
+    def test_records_are_streamed_in_batches___files_are_the_same_as_written_from_lists(self, data, batch_size, keys_format):
+        successes = [r for r in data if r['status'] == KEYS_STATUS_SUCCESS]
+        nonsuccesses = [r for r in data if r['status'] != KEYS_STATUS_SUCCESS]
+
+        with TemporaryDirectory() as d:
+            keys_fp, errors_fp = os.path.join(d, 'keys'), os.path.join(d, 'errors')
+            expected_keys_fp, expected_errors_fp = os.path.join(d, 'expected-keys'), os.path.join(d, 'expected-errors')
+
+            if keys_format == 'oasis':
+                OasisLookupFactory.write_oasis_keys_file(successes, expected_keys_fp)
+                OasisLookupFactory.write_oasis_keys_errors_file(nonsuccesses, expected_errors_fp)
+            else:
+                OasisLookupFactory.write_json_keys_file(successes, expected_keys_fp)
+                OasisLookupFactory.write_json_keys_file(nonsuccesses, expected_errors_fp)
+
+            res = OasisLookupFactory.write_keys_files(
+                (r for r in data), keys_fp, errors_fp=errors_fp, format=keys_format, batch_size=batch_size
+            )
+
+            self.assertEqual(res, (keys_fp, len(successes), errors_fp, len(nonsuccesses)))
+            for fp, expected_fp in ((keys_fp, expected_keys_fp), (errors_fp, expected_errors_fp)):
+                with io.open(fp, 'r', encoding='utf-8') as f1, io.open(expected_fp, 'r', encoding='utf-8') as f2:
+                    self.assertEqual(f1.read(), f2.read())
+            if keys_format == 'json':
+                with io.open(keys_fp, 'r', encoding='utf-8') as f:
+                    self.assertEqual(json.load(f), successes)
+
+
+class OasisKeysLookupFactoryWriteBinKeysFiles(TestCase):
+
+    @settings(suppress_health_check=[HealthCheck.too_slow])
+    @given(data=keys_data(size=20), batch_size=integers(min_value=1, max_value=25))
+    def test_records_are_given___binary_keys_file_is_read_back_as_the_oasis_keys_file(self, data, batch_size):
+        successes = [r for r in data if r['status'] == KEYS_STATUS_SUCCESS]
+        nonsuccesses = [r for r in data if r['status'] != KEYS_STATUS_SUCCESS]
+
+        with TemporaryDirectory() as d:
+            keys_fp, errors_fp = os.path.join(d, 'keys.bin'), os.path.join(d, 'errors.csv')
+            expected_keys_fp, expected_errors_fp = os.path.join(d, 'expected-keys.csv'), os.path.join(d, 'expected-errors.csv')
+
+            OasisLookupFactory.write_oasis_keys_file(successes, expected_keys_fp)
+            OasisLookupFactory.write_oasis_keys_errors_file(nonsuccesses, expected_errors_fp)
+
+            res = OasisLookupFactory.write_keys_files(
+                (r for r in data), keys_fp, errors_fp=errors_fp, format='bin', batch_size=batch_size
+            )
+
+            self.assertEqual(res, (keys_fp, len(successes), errors_fp, len(nonsuccesses)))
+            self.assertEqual(
+                read_keys_bin_file(keys_fp).tolist(),
+                [(r['id'], r['peril_id'], r['coverage_type'], r['area_peril_id'], r['vulnerability_id']) for r in successes]
+            )
+
+            keys_df = OasisLookupFactory.read_keys_file(keys_fp)
+            expected_keys_df = OasisLookupFactory.read_keys_file(expected_keys_fp)
+            self.assertEqual(list(keys_df.columns), list(expected_keys_df.columns))
+            self.assertEqual(keys_df.values.tolist(), expected_keys_df.values.tolist())
+
+            with io.open(errors_fp, 'r', encoding='utf-8') as f1, io.open(expected_errors_fp, 'r', encoding='utf-8') as f2:
+                self.assertEqual(f1.read(), f2.read())
+
+    def test_records_with_generated_location_ids___ids_up_to_the_largest_64_bit_id_are_written(self):
+        records = [
+            {'id': loc_id, 'peril_id': 1, 'coverage_type': 1, 'area_peril_id': 2, 'vulnerability_id': 3, 'status': KEYS_STATUS_SUCCESS}
+            for loc_id in (0, 2 ** 63, 2 ** 64 - 1)
+        ]
+
+        with TemporaryDirectory() as d:
+            keys_fp = os.path.join(d, 'keys.bin')
+
+            OasisLookupFactory.write_keys_files(records, keys_fp, format='bin')
+
+            self.assertEqual(read_keys_bin_file(keys_fp)['loc_id'].tolist(), [0, 2 ** 63, 2 ** 64 - 1])
+
+    def test_records_cannot_be_written___oasis_exception_is_raised_and_existing_files_are_left_as_they_were(self):
+        records = [
+            {'id': loc_id, 'peril_id': 1, 'coverage_type': 1, 'area_peril_id': 2, 'vulnerability_id': 3, 'status': KEYS_STATUS_SUCCESS}
+            for loc_id in (1, float('nan'))
+        ]
+
+        with TemporaryDirectory() as d:
+            keys_fp, errors_fp = os.path.join(d, 'keys.bin'), os.path.join(d, 'errors.csv')
+            OasisLookupFactory.write_keys_files(records[:1], keys_fp, errors_fp=errors_fp, format='bin')
+            with io.open(keys_fp, 'rb') as f:
+                expected = f.read()
+
+            with self.assertRaises(OasisException):
+                OasisLookupFactory.write_keys_files(records, keys_fp, errors_fp=errors_fp, format='bin', batch_size=1)
+
+            with io.open(keys_fp, 'rb') as f:
+                self.assertEqual(f.read(), expected)
+            self.assertEqual(sorted(os.listdir(d)), ['errors.csv', 'keys.bin'])
+
+            os.remove(keys_fp)
+            with self.assertRaises(OasisException):
+                OasisLookupFactory.write_keys_files(records, keys_fp, format='bin')
+
+            self.assertFalse(os.path.exists(keys_fp))
+            self.assertEqual(os.listdir(d), ['errors.csv'])
+
+    def test_file_is_not_a_binary_keys_file___oasis_exception_is_raised(self):
+        with TemporaryDirectory() as d:
+            fp = os.path.join(d, 'keys.bin')
+            with io.open(fp, 'wb') as f:
+                f.write(b'LocID,PerilID,CoverageTypeID,AreaPerilID,VulnerabilityID\n')
+
+            with self.assertRaises(OasisException):
+                read_keys_bin_file(fp)
+
+
+class FakeConfigLookup(object):
+
+    def __init__(self):
+        self.config = {'peril': {'peril_ids': [PERIL_ID_WIND]}, 'locations': {}}
+
+    def bulk_lookup(self, locs, **kwargs):
+        for _, loc in locs.iterrows():
+            for coverage_type in (BUILDING_COVERAGE_CODE, CONTENTS_COVERAGE_CODE):
+                yield {
+                    'id': int(loc['id']),
+                    'coverage_type': coverage_type,
+                    'pid': os.getpid(),
+                    'status': KEYS_STATUS_SUCCESS if loc['id'] % 2 else KEYS_STATUS_FAIL
+                }
+
+
+class FakeDedupeLookup(FakeConfigLookup):
+
+    loc_id_col = 'id'
+
+    lookup_cols = ('x',)
+
+    num_looked_up = 0
+
+    def bulk_lookup(self, locs, **kwargs):
+        for _, loc in locs.iterrows():
+            self.num_looked_up += 1
+            for coverage_type in (BUILDING_COVERAGE_CODE, CONTENTS_COVERAGE_CODE):
+                yield {
+                    'id': int(loc['id']),
+                    'coverage_type': coverage_type,
+                    'x': int(loc['x']),
+                    'status': KEYS_STATUS_SUCCESS if loc['x'] % 2 else KEYS_STATUS_FAIL
+                }
+
+
+class FakeSpatialLookup(FakeDedupeLookup):
+
+    loc_coords_x_col = loc_coords_y_col = 'x'
+
+    peril_areas_boundary = box(0, 0, 20, 20)
+
+
+class OasisKeysLookupFactoryGetResults(TestCase):
+
+    @settings(deadline=None, max_examples=10)
+    @given(
+        ids=lists(integers(min_value=1, max_value=1000), min_size=1, max_size=50),
+        workers=integers(min_value=2, max_value=4)
+    )
+    def test_workers_are_used___results_are_the_same_and_in_the_same_order_as_for_a_single_process(self, ids, workers):
+        with TemporaryDirectory() as d:
+            exposures_fp = os.path.join(d, 'exposures.csv')
+            pd.DataFrame({'id': ids}).to_csv(exposures_fp, index=False)
+
+            expected = list(OasisLookupFactory.get_results(FakeConfigLookup(), model_exposures_fp=exposures_fp))
+            res = list(OasisLookupFactory.get_results(FakeConfigLookup(), model_exposures_fp=exposures_fp, workers=workers))
+
+        self.assertEqual([{k: v for k, v in r.items() if k != 'pid'} for r in res], [{k: v for k, v in r.items() if k != 'pid'} for r in expected])
+        if len(ids) > 1:
+            self.assertNotIn(os.getpid(), set(r['pid'] for r in res))
+
+    @settings(deadline=None, max_examples=20)
+    @given(
+        xs=lists(integers(min_value=0, max_value=3), min_size=1, max_size=30),
+        workers=sampled_from([None, 2])
+    )
+    def test_locations_with_the_same_lookup_cols___each_group_is_looked_up_once_and_results_are_fanned_out(self, xs, workers):
+        with TemporaryDirectory() as d:
+            exposures_fp = os.path.join(d, 'exposures.csv')
+            # Location IDs from 0, as a falsy ID must also be kept as it is
+            pd.DataFrame({'id': range(len(xs)), 'x': xs}).to_csv(exposures_fp, index=False)
+
+            lookup = FakeDedupeLookup()
+            res = list(OasisLookupFactory.get_results(lookup, model_exposures_fp=exposures_fp, workers=workers))
+            expected = list(OasisLookupFactory.get_results(FakeDedupeLookup(), model_exposures_fp=exposures_fp, dedupe=False))
+
+        self.assertEqual(res, expected)
+        if not workers:
+            self.assertEqual(lookup.num_looked_up, len(set(xs)))
+
+    @settings(deadline=None, max_examples=20)
+    @given(
+        xs=lists(integers(min_value=0, max_value=20), min_size=1, max_size=30),
+        dedupe=sampled_from([False, True])
+    )
+    def test_locations_looked_up_in_spatial_order___results_and_location_ids_match_unordered_results(self, xs, dedupe):
+        with TemporaryDirectory() as d:
+            exposures_fp = os.path.join(d, 'exposures.csv')
+            pd.DataFrame({'id': range(len(xs)), 'x': xs}).to_csv(exposures_fp, index=False)
+
+            res = list(OasisLookupFactory.get_results(FakeSpatialLookup(), model_exposures_fp=exposures_fp, dedupe=dedupe, spatial_order=True))
+            expected = list(OasisLookupFactory.get_results(FakeSpatialLookup(), model_exposures_fp=exposures_fp, dedupe=dedupe))
+
+        self.assertEqual(res, expected)
+
+    @settings(deadline=None, max_examples=20)
+    @given(
+        xs=lists(integers(min_value=0, max_value=3), min_size=1, max_size=30),
+        chunksize=integers(min_value=1, max_value=10),
+        workers=sampled_from([None, 2])
+    )
+    def test_chunksize_is_provided___results_are_the_same_and_in_the_same_order_as_for_an_unchunked_lookup(self, xs, chunksize, workers):
+        with TemporaryDirectory() as d:
+            exposures_fp = os.path.join(d, 'exposures.csv')
+            pd.DataFrame({'id': range(1, len(xs) + 1), 'x': xs}).to_csv(exposures_fp, index=False)
+
+            res = list(OasisLookupFactory.get_results(FakeDedupeLookup(), model_exposures_fp=exposures_fp, workers=workers, chunksize=chunksize))
+            expected = list(OasisLookupFactory.get_results(FakeDedupeLookup(), model_exposures_fp=exposures_fp))
+
+        self.assertEqual(res, expected)
+
+    def test_chunksize_is_provided_with_a_locations_sort_col___oasis_exception_is_raised(self):
+        lookup = FakeConfigLookup()
+        lookup.config['locations'] = {'sort_col': 'id'}
+
+        with TemporaryDirectory() as d:
+            exposures_fp = os.path.join(d, 'exposures.csv')
+            pd.DataFrame({'id': [1, 2]}).to_csv(exposures_fp, index=False)
+
+            with self.assertRaises(OasisException):
+                list(OasisLookupFactory.get_results(lookup, model_exposures_fp=exposures_fp, chunksize=1))
+
+
+
+class OasisKeysLookupFactorySaveResultsIncrementally(TestCase):
+
+    @settings(deadline=None, max_examples=20, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        xs=lists(integers(min_value=0, max_value=20), min_size=1, max_size=30),
+        changes=lists(tuples(integers(min_value=0, max_value=40), integers(min_value=0, max_value=20)), max_size=10),
+        deletions=lists(integers(min_value=1, max_value=30), max_size=5),
+        keys_format=sampled_from(['oasis', 'json'])
+    )
+    # A location ID of 0, looked up in the full run with the location of ID
+    # 1, whose keys are carried forward in the incremental run
+    @example(xs=[0], changes=[(0, 0)], deletions=[], keys_format='oasis')
+    def test_exposures_are_changed___only_changed_locations_are_looked_up_and_files_match_a_full_run(self, xs, changes, deletions, keys_format):
+        with TemporaryDirectory() as d:
+            exposures_fp = os.path.join(d, 'exposures.csv')
+            keys_fp, errors_fp = os.path.join(d, 'keys'), os.path.join(d, 'errors')
+            expected_keys_fp, expected_errors_fp = os.path.join(d, 'expected-keys'), os.path.join(d, 'expected-errors')
+
+            locs = OrderedDict((i + 1, x) for i, x in enumerate(xs))
+            pd.DataFrame({'id': list(locs), 'x': list(locs.values())}).to_csv(exposures_fp, index=False)
+
+            OasisLookupFactory.save_results(FakeDedupeLookup(), keys_fp, errors_fp=errors_fp, model_exposures_fp=exposures_fp, format=keys_format, incremental=True)
+            self.assertTrue(os.path.exists('{}.hashes.npz'.format(keys_fp)))
+
+            new_locs = OrderedDict((loc_id, x) for loc_id, x in locs.items() if loc_id not in deletions)
+            for loc_id, x in changes:
+                new_locs[loc_id] = x
+            if not new_locs:
+                return
+            pd.DataFrame({'id': list(new_locs), 'x': list(new_locs.values())}).to_csv(exposures_fp, index=False)
+
+            lookup = FakeDedupeLookup()
+            res = OasisLookupFactory.save_results(lookup, keys_fp, errors_fp=errors_fp, model_exposures_fp=exposures_fp, format=keys_format, incremental=True)
+            expected = OasisLookupFactory.save_results(FakeDedupeLookup(), expected_keys_fp, errors_fp=expected_errors_fp, model_exposures_fp=exposures_fp, format=keys_format)
+
+            changed_xs = set(x for loc_id, x in new_locs.items() if locs.get(loc_id) != x)
+            self.assertEqual(lookup.num_looked_up, len(changed_xs))
+
+            self.assertEqual((res[1], res[3]), (expected[1], expected[3]))
+            for fp, expected_fp in ((keys_fp, expected_keys_fp), (errors_fp, expected_errors_fp)):
+                with io.open(fp, 'r', encoding='utf-8') as f1, io.open(expected_fp, 'r', encoding='utf-8') as f2:
+                    self.assertEqual(f1.read(), f2.read())
+
+    def test_errors_file_is_added___keys_are_regenerated_in_full(self):
+        with TemporaryDirectory() as d:
+            exposures_fp = os.path.join(d, 'exposures.csv')
+            keys_fp, errors_fp = os.path.join(d, 'keys'), os.path.join(d, 'errors')
+            pd.DataFrame({'id': [1, 2, 3], 'x': [1, 2, 3]}).to_csv(exposures_fp, index=False)
+
+            OasisLookupFactory.save_results(FakeDedupeLookup(), keys_fp, model_exposures_fp=exposures_fp, incremental=True)
+
+            lookup = FakeDedupeLookup()
+            res = OasisLookupFactory.save_results(lookup, keys_fp, errors_fp=errors_fp, model_exposures_fp=exposures_fp, incremental=True)
+
+            self.assertEqual(lookup.num_looked_up, 3)
+            self.assertEqual(res, (keys_fp, 4, errors_fp, 2))
+
+            lookup = FakeDedupeLookup()
+            res = OasisLookupFactory.save_results(lookup, keys_fp, errors_fp=errors_fp, model_exposures_fp=exposures_fp, incremental=True)
+
+            self.assertEqual(lookup.num_looked_up, 0)
+            self.assertEqual(res, (keys_fp, 4, errors_fp, 2))
+
+    def test_vulnerabilities_file_is_edited___keys_are_regenerated_in_full(self):
+        with TemporaryDirectory() as d:
+            exposures_fp = os.path.join(d, 'exposures.csv')
+            vulns_fp = os.path.join(d, 'vulnerabilities.csv')
+            keys_fp, errors_fp = os.path.join(d, 'keys'), os.path.join(d, 'errors')
+            pd.DataFrame({'id': [1, 2, 3], 'x': [1, 2, 3]}).to_csv(exposures_fp, index=False)
+            pd.DataFrame({'x': [1, 2, 3], 'vulnerability_id': [1, 2, 3]}).to_csv(vulns_fp, index=False)
+
+            def _lookup():
+                lookup = FakeDedupeLookup()
+                lookup.config['vulnerability'] = {'file_path': vulns_fp}
+                return lookup
+
+            OasisLookupFactory.save_results(_lookup(), keys_fp, errors_fp=errors_fp, model_exposures_fp=exposures_fp, incremental=True)
+
+            lookup = _lookup()
+            OasisLookupFactory.save_results(lookup, keys_fp, errors_fp=errors_fp, model_exposures_fp=exposures_fp, incremental=True)
+            self.assertEqual(lookup.num_looked_up, 0)
+
+            pd.DataFrame({'x': [1, 2, 3], 'vulnerability_id': [10, 20, 30]}).to_csv(vulns_fp, index=False)
+
+            lookup = _lookup()
+            res = OasisLookupFactory.save_results(lookup, keys_fp, errors_fp=errors_fp, model_exposures_fp=exposures_fp, incremental=True)
 
+            self.assertEqual(lookup.num_looked_up, 3)
+            self.assertEqual(res, (keys_fp, 4, errors_fp, 2))
@@ -0,0 +1,432 @@
+from __future__ import unicode_literals
+
+import os
+
+from unittest import TestCase
+
+import pandas as pd
+
+from backports.tempfile import TemporaryDirectory
+from hypothesis import (
+    given,
+    HealthCheck,
+    settings,
+)
+from hypothesis.strategies import (
+    floats,
+    lists,
+    one_of,
+    sampled_from,
+    tuples,
+)
+from mock import patch
+from rtree.core import RTreeError
+from shapely.geometry import (
+    Point,
+    Polygon,
+)
+
+from oasislmf.keys.lookup import OasisPerilLookup
+from oasislmf.utils.coverage import (
+    BUILDING_COVERAGE_CODE,
+    CONTENTS_COVERAGE_CODE,
+)
+from oasislmf.utils.peril import (
+    DEFAULT_RTREE_INDEX_PROPS,
+    PERIL_ID_WIND,
+    PerilArea,
+    PerilAreasIndex,
+)
+from oasislmf.utils.status import (
+    KEYS_ERROR_COORDS_OUT_OF_BOUNDS,
+    KEYS_ERROR_INVALID_COORDS,
+    KEYS_ERROR_OUTSIDE_PERIL_AREAS,
+    KEYS_STATUS_FAIL,
+    KEYS_STATUS_SUCCESS,
+)
+
+
+def write_grid_peril_areas_index(index_fp, nx=4, ny=4, x0=0.0, y0=0.0, d=1.0, coverage_types=(BUILDING_COVERAGE_CODE, CONTENTS_COVERAGE_CODE), payload_store=False):
+    peril_areas = []
+    paid = 1
+    for coverage_type in coverage_types:
+        for i in range(nx):
+            for j in range(ny):
+                x, y = x0 + i * d, y0 + j * d
+                peril_areas.append(
+                    PerilArea(
+                        ((x, y), (x, y + d), (x + d, y + d), (x + d, y)),
+                        peril_id=PERIL_ID_WIND,
+                        coverage_type=coverage_type,
+                        peril_area_id=paid
+                    )
+                )
+                paid += 1
+
+    return PerilAreasIndex().save(index_fp, peril_areas=peril_areas, index_props=dict(DEFAULT_RTREE_INDEX_PROPS), payload_store=payload_store)
+
+
+def peril_lookup_config(index_fp, coverage_types=(BUILDING_COVERAGE_CODE, CONTENTS_COVERAGE_CODE)):
+    return {
+        'peril': {
+            'peril_ids': [PERIL_ID_WIND],
+            'rtree_index': {'filename': index_fp}
+        },
+        'coverage': {'coverage_types': list(coverage_types)},
+        'locations': {'id_col': 'id', 'coords_x_col': 'lon', 'coords_y_col': 'lat'}
+    }
+
+
+coords = one_of(floats(min_value=-1, max_value=5, allow_nan=False), sampled_from([0.0, 1.0, 2.0, 4.0, 200.0]))
+
+
+class OasisPerilLookupBulkLookupCoords(TestCase):
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(points=lists(tuples(coords, coords), min_size=1, max_size=20))
+    def test_bulk_lookup_of_coords___results_match_individual_lookups(self, points):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'))
+            lookup = OasisPerilLookup(config=peril_lookup_config(index_fp))
+
+            xs, ys = zip(*points)
+            res = lookup.bulk_lookup_coords(xs, ys, PERIL_ID_WIND, CONTENTS_COVERAGE_CODE)
+
+            self.assertEqual(len(res), len(points))
+            for i, (x, y) in enumerate(points):
+                expected = lookup.lookup({'id': i + 1, 'lon': x, 'lat': y}, PERIL_ID_WIND, CONTENTS_COVERAGE_CODE)
+                self.assertEqual(res['status'][i], expected['status'])
+                self.assertEqual(res['peril_area_id'][i], expected['peril_area_id'])
+                self.assertEqual(res['area_bounds'][i], expected['area_bounds'])
+                self.assertEqual(res['message'][i], expected['message'])
+
+    def test_invalid_coords___status_is_fail_with_same_message_as_individual_lookup(self):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'))
+            lookup = OasisPerilLookup(config=peril_lookup_config(index_fp))
+
+            xs, ys = ['abc', None, 500, 1.5], [1.5, 1.5, 1.5, 1.5]
+            res = lookup.bulk_lookup_coords(xs, ys, PERIL_ID_WIND, BUILDING_COVERAGE_CODE)
+
+            self.assertEqual(res['status'].tolist(), [KEYS_STATUS_FAIL] * 3 + [KEYS_STATUS_SUCCESS])
+            for i, (x, y) in enumerate(zip(xs, ys)):
+                expected = lookup.lookup({'id': i + 1, 'lon': x, 'lat': y}, PERIL_ID_WIND, BUILDING_COVERAGE_CODE)
+                self.assertEqual(res['message'][i], expected['message'])
+
+    def test_points_rejected_by_validation___index_is_not_queried_for_them_and_messages_have_reason_codes(self):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'))
+            config = peril_lookup_config(index_fp)
+            config['peril']['loc_to_global_areas_boundary_min_distance'] = 0.5
+            lookup = OasisPerilLookup(config=config)
+            stats = lookup.enable_stats()
+
+            xs, ys = ['abc', None, 500, 1.5, 4.25, 6.0, float('nan')], [1.5, 1.5, 1.5, 1.5, 2.5, 2.5, 1.5]
+
+            with patch.object(lookup.peril_areas_index, 'bulk_intersection', wraps=lookup.peril_areas_index.bulk_intersection) as bulk_intersection:
+                res = lookup.bulk_lookup_coords(xs, ys, PERIL_ID_WIND, BUILDING_COVERAGE_CODE)
+
+            self.assertEqual(len(bulk_intersection.call_args[0][0]), 2)
+            self.assertEqual(res['status'].tolist(), [KEYS_STATUS_FAIL] * 3 + [KEYS_STATUS_SUCCESS] * 2 + [KEYS_STATUS_FAIL] * 2)
+            reasons = [
+                KEYS_ERROR_INVALID_COORDS, KEYS_ERROR_INVALID_COORDS, KEYS_ERROR_COORDS_OUT_OF_BOUNDS, None, None,
+                KEYS_ERROR_OUTSIDE_PERIL_AREAS, KEYS_ERROR_INVALID_COORDS
+            ]
+            for msg, reason in zip(res['message'], reasons):
+                if reason:
+                    self.assertTrue(msg.endswith('[{}]'.format(reason)))
+            self.assertEqual(
+                dict(stats.histograms['peril.rejections']),
+                {KEYS_ERROR_INVALID_COORDS: 3, KEYS_ERROR_COORDS_OUT_OF_BOUNDS: 1, KEYS_ERROR_OUTSIDE_PERIL_AREAS: 1}
+            )
+
+
+class OasisPerilLookupBulkLookup(TestCase):
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(points=lists(tuples(coords, coords), min_size=1, max_size=10))
+    def test_dataframe_of_locations___results_match_base_class_bulk_lookup(self, points):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'))
+            lookup = OasisPerilLookup(config=peril_lookup_config(index_fp))
+
+            locs = [{'id': i + 1, 'lon': x, 'lat': y} for i, (x, y) in enumerate(points)]
+
+            expected = list(super(OasisPerilLookup, lookup).bulk_lookup(locs))
+            res = list(lookup.bulk_lookup(pd.DataFrame(locs)))
+
+            self.assertEqual(res, expected)
+
+
+class OasisPerilLookupBulkLookupCoordsForPairs(TestCase):
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(points=lists(tuples(coords, coords), min_size=1, max_size=20))
+    def test_several_pairs___index_is_queried_once_and_results_match_single_pair_lookups(self, points):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'))
+            lookup = OasisPerilLookup(config=peril_lookup_config(index_fp))
+
+            xs, ys = zip(*points)
+            pairs = ((PERIL_ID_WIND, BUILDING_COVERAGE_CODE), (PERIL_ID_WIND, CONTENTS_COVERAGE_CODE))
+
+            with patch.object(lookup.peril_areas_index, 'bulk_intersection', wraps=lookup.peril_areas_index.bulk_intersection) as bulk_intersection:
+                res = lookup.bulk_lookup_coords_for_pairs(xs, ys, pairs)
+
+            self.assertLessEqual(bulk_intersection.call_count, 1)
+            self.assertEqual(list(res), list(pairs))
+            for peril_id, coverage_type in pairs:
+                expected = lookup.bulk_lookup_coords(xs, ys, peril_id, coverage_type)
+                self.assertTrue(res[(peril_id, coverage_type)].equals(expected))
+
+
+class OasisPerilLookupInMemoryIndex(TestCase):
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow], max_examples=20)
+    @given(points=lists(tuples(coords, coords), min_size=1, max_size=20))
+    def test_index_is_loaded_in_memory___results_match_file_index_lookup(self, points):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'))
+            lookup = OasisPerilLookup(config=peril_lookup_config(index_fp))
+            config = peril_lookup_config(index_fp)
+            config['peril']['rtree_index']['in_memory'] = True
+            mem_lookup = OasisPerilLookup(config=config)
+
+            locs = pd.DataFrame([{'id': i + 1, 'lon': x, 'lat': y} for i, (x, y) in enumerate(points)], columns=['id', 'lon', 'lat'])
+
+            self.assertEqual(list(mem_lookup.bulk_lookup(locs)), list(lookup.bulk_lookup(locs)))
+
+    def test_index_is_loaded_in_memory___load_stats_are_recorded_once(self):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'))
+            config = peril_lookup_config(index_fp)
+            config['peril']['rtree_index']['in_memory'] = True
+            lookup = OasisPerilLookup(config=config)
+
+            stats = lookup.enable_stats()
+            later_stats = lookup.enable_stats()
+
+            self.assertIn('peril.index_load', stats.timings)
+            self.assertEqual(stats.counters['peril.index_load_entries'], 32)
+            self.assertNotIn('peril.index_load', later_stats.timings)
+
+            file_lookup_stats = OasisPerilLookup(config=peril_lookup_config(index_fp)).enable_stats()
+            self.assertNotIn('peril.index_load', file_lookup_stats.timings)
+
+
+class OasisPerilLookupGridIndex(TestCase):
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(points=lists(tuples(coords, coords), min_size=1, max_size=20))
+    def test_grid_index_is_configured___results_match_lookup_with_rtree_index_of_the_same_cells(self, points):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'), coverage_types=(BUILDING_COVERAGE_CODE,))
+            rtree_lookup = OasisPerilLookup(config=peril_lookup_config(index_fp, coverage_types=(BUILDING_COVERAGE_CODE,)))
+
+            config = peril_lookup_config(None, coverage_types=(BUILDING_COVERAGE_CODE,))
+            config['peril'].pop('rtree_index')
+            config['peril']['grid_index'] = {'x0': 0, 'y0': 0, 'dx': 1, 'dy': 1, 'nx': 4, 'ny': 4, 'row_major': False}
+            grid_lookup = OasisPerilLookup(config=config)
+
+            locs = pd.DataFrame([{'id': i + 1, 'lon': x, 'lat': y} for i, (x, y) in enumerate(points)], columns=['id', 'lon', 'lat'])
+
+            expected = list(rtree_lookup.bulk_lookup(locs))
+            res = list(grid_lookup.bulk_lookup(locs))
+            individual = [grid_lookup.lookup(loc, PERIL_ID_WIND, BUILDING_COVERAGE_CODE) for _, loc in locs.iterrows()]
+
+            self.assertEqual(len(res), len(expected))
+            for r, i, e in zip(res, individual, expected):
+                self.assertEqual(r['status'], e['status'])
+                self.assertEqual(r['peril_area_id'], e['peril_area_id'])
+                self.assertEqual(r['area_bounds'], e['area_bounds'])
+                self.assertEqual(r['message'], e['message'])
+                self.assertEqual((r['status'], r['peril_area_id']), (i['status'], i['peril_area_id']))
+
+
+class OasisPerilLookupCache(TestCase):
+
+    def test_lookup_cache_is_configured___repeated_quantized_coords_are_cache_hits_with_same_results(self):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'))
+            config = peril_lookup_config(index_fp)
+            config['peril']['lookup_cache'] = {'size': 2, 'precision': 3}
+            lookup = OasisPerilLookup(config=config)
+            uncached_lookup = OasisPerilLookup(config=peril_lookup_config(index_fp))
+
+            self.assertIsNone(uncached_lookup.lookup_cache)
+
+            points = [(1.5, 1.5), (1.50001, 1.49999), (2.5, 2.5), (1.5, 1.5), (3.5, 3.5), (3.5, 3.5), ('abc', 1.5), (10, 10)]
+            for i, (x, y) in enumerate(points):
+                res = lookup.lookup({'id': i + 1, 'lon': x, 'lat': y}, PERIL_ID_WIND, CONTENTS_COVERAGE_CODE)
+                expected = uncached_lookup.lookup({'id': i + 1, 'lon': x, 'lat': y}, PERIL_ID_WIND, CONTENTS_COVERAGE_CODE)
+                self.assertEqual(res, expected)
+
+            self.assertEqual((lookup.lookup_cache.hits, lookup.lookup_cache.misses), (3, 3))
+            self.assertEqual(len(lookup.lookup_cache), 2)
+
+    def test_lookup_cache_is_configured___bulk_results_and_cache_hits_match_individual_lookups(self):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'))
+            config = peril_lookup_config(index_fp)
+            config['peril']['lookup_cache'] = {'size': 100, 'precision': 1}
+            lookup = OasisPerilLookup(config=config)
+            bulk_lookup = OasisPerilLookup(config=config)
+
+            points = [(1.5, 1.5), (1.52, 1.48), (2.5, 2.5), (1.5, 1.5), (3.5, 3.5), (0.5, 3.5), ('abc', 1.5), (1.46, 1.54), (10, 10), (2.5, 2.54)]
+            pairs = ((PERIL_ID_WIND, BUILDING_COVERAGE_CODE), (PERIL_ID_WIND, CONTENTS_COVERAGE_CODE),)
+
+            # Area coordinates are left out, as their sequence types may differ
+            _fields = lambda r: tuple(r[:5]) + (r[6],)
+
+            expected = {pair: [] for pair in pairs}
+            for x, y in points:
+                for pair in pairs:
+                    expected[pair].append(_fields(lookup._lookup_coords(x, y, *pair)))
+
+            res = bulk_lookup.bulk_lookup_coords_for_pairs([p[0] for p in points], [p[1] for p in points], pairs)
+
+            for pair in pairs:
+                self.assertEqual([_fields(tuple(r)) for r in res[pair].itertuples(index=False)], expected[pair])
+            self.assertEqual(bulk_lookup.lookup_cache.info(), lookup.lookup_cache.info())
+
+            # Cached results from the bulk lookup are used by later lookups
+            res = bulk_lookup.bulk_lookup_coords([1.54], [1.46], PERIL_ID_WIND, CONTENTS_COVERAGE_CODE)
+            self.assertEqual(_fields(tuple(res.iloc[0])), _fields(lookup._lookup_coords(1.54, 1.46, PERIL_ID_WIND, CONTENTS_COVERAGE_CODE)))
+            self.assertEqual(bulk_lookup.lookup_cache.info(), lookup.lookup_cache.info())
+
+    def test_lookup_cache_is_smaller_than_the_keys_of_a_bulk_lookup___repeated_keys_get_the_results_of_the_first_points(self):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'))
+            config = peril_lookup_config(index_fp)
+            config['peril']['lookup_cache'] = {'size': 1, 'precision': 1}
+            lookup = OasisPerilLookup(config=config)
+            uncached_lookup = OasisPerilLookup(config=peril_lookup_config(index_fp))
+
+            # The key of the first point is evicted by the second point's
+            # before it is repeated
+            xs, ys = [1.5, 2.5, 1.52], [1.5, 2.5, 1.48]
+            pair = (PERIL_ID_WIND, CONTENTS_COVERAGE_CODE)
+
+            res = lookup.bulk_lookup_coords_for_pairs(xs, ys, (pair,))[pair]
+            expected = uncached_lookup.bulk_lookup_coords_for_pairs(xs, ys, (pair,))[pair]
+
+            self.assertEqual(res['peril_area_id'].tolist(), expected['peril_area_id'].tolist())
+            self.assertEqual(res['status'].tolist(), expected['status'].tolist())
+            self.assertEqual(res['x'].tolist(), xs)
+            self.assertEqual(lookup.lookup_cache.info(), {'hits': 1, 'misses': 2, 'size': 1, 'maxsize': 1})
+            self.assertIn((2.5, 2.5) + pair, lookup.lookup_cache)
+
+            # Results are only cached once looked up - a failed lookup leaves
+            # the cache as it was
+            with patch.object(OasisPerilLookup, '_bulk_lookup_coords_for_pairs', side_effect=RTreeError('failed')):
+                with self.assertRaises(RTreeError):
+                    lookup.bulk_lookup_coords_for_pairs([0.5], [0.5], (pair,))
+            self.assertEqual(len(lookup.lookup_cache), 1)
+            self.assertIn((2.5, 2.5) + pair, lookup.lookup_cache)
+
+
+def write_triangles_peril_areas_index(index_fp, n=4):
+    peril_areas = []
+    paid = 1
+    for i in range(n):
+        for j in range(n):
+            for triangle in (((i, j), (i + 1, j), (i, j + 1)), ((i + 1, j), (i + 1, j + 1), (i, j + 1))):
+                peril_areas.append(
+                    PerilArea(triangle, peril_id=PERIL_ID_WIND, coverage_type=BUILDING_COVERAGE_CODE, peril_area_id=paid)
+                )
+                paid += 1
+
+    return PerilAreasIndex().save(index_fp, peril_areas=peril_areas, index_props=dict(DEFAULT_RTREE_INDEX_PROPS))
+
+
+class OasisPerilLookupExactContainment(TestCase):
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(points=lists(tuples(floats(min_value=0.01, max_value=3.99), floats(min_value=0.01, max_value=3.99)), min_size=1, max_size=20))
+    def test_non_rectangular_areas___matched_areas_contain_the_points_and_bulk_results_match_individual_lookups(self, points):
+        points = [(x, y) for x, y in points if abs((x % 1) + (y % 1) - 1) > 1e-6]
+        with TemporaryDirectory() as d:
+            index_fp = write_triangles_peril_areas_index(os.path.join(d, 'index'))
+            config = peril_lookup_config(index_fp, coverage_types=(BUILDING_COVERAGE_CODE,))
+            config['peril']['exact_containment'] = True
+            lookup = OasisPerilLookup(config=config)
+
+            xs, ys = tuple(x for x, _ in points), tuple(y for _, y in points)
+            res = lookup.bulk_lookup_coords(xs, ys, PERIL_ID_WIND, BUILDING_COVERAGE_CODE)
+
+            for i, (x, y) in enumerate(points):
+                expected = lookup.lookup({'id': i + 1, 'lon': x, 'lat': y}, PERIL_ID_WIND, BUILDING_COVERAGE_CODE)
+                self.assertEqual(res['status'][i], KEYS_STATUS_SUCCESS)
+                self.assertEqual(res['peril_area_id'][i], expected['peril_area_id'])
+                self.assertTrue(Polygon(res['area_coordinates'][i]).covers(Point(x, y)))
+
+
+class OasisPerilLookupBulkNearestAreaFallback(TestCase):
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        points=lists(tuples(floats(min_value=-1, max_value=6, allow_nan=False), floats(min_value=-1, max_value=6, allow_nan=False)), min_size=1, max_size=20),
+        min_dist=sampled_from([0, 0.5])
+    )
+    def test_points_outside_all_areas___nearest_areas_are_found_in_one_query_with_the_same_results_as_individual_lookups(self, points, min_dist):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'), nx=2, ny=2, d=2.0, coverage_types=(BUILDING_COVERAGE_CODE,))
+            config = peril_lookup_config(index_fp)
+            config['peril']['loc_to_global_areas_boundary_min_distance'] = min_dist
+            lookup = OasisPerilLookup(config=config)
+
+            xs, ys = zip(*points)
+            pairs = ((PERIL_ID_WIND, BUILDING_COVERAGE_CODE), (PERIL_ID_WIND, CONTENTS_COVERAGE_CODE))
+
+            with patch.object(lookup.peril_areas_index, 'bulk_nearest', wraps=lookup.peril_areas_index.bulk_nearest) as bulk_nearest:
+                res = lookup.bulk_lookup_coords_for_pairs(xs, ys, pairs)
+
+            self.assertLessEqual(bulk_nearest.call_count, 1)
+            for peril_id, coverage_type in pairs:
+                for i, (x, y) in enumerate(points):
+                    expected = lookup.lookup({'id': i + 1, 'lon': x, 'lat': y}, peril_id, coverage_type)
+                    self.assertEqual(res[(peril_id, coverage_type)]['status'][i], expected['status'])
+                    self.assertEqual(res[(peril_id, coverage_type)]['peril_area_id'][i], expected['peril_area_id'])
+                    self.assertEqual(res[(peril_id, coverage_type)]['message'][i], expected['message'])
+
+
+class OasisPerilLookupSharedBoundary(TestCase):
+
+    def test_point_on_shared_corner___area_with_lowest_id_is_matched_by_individual_and_bulk_lookups(self):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'), coverage_types=(BUILDING_COVERAGE_CODE,))
+            lookup = OasisPerilLookup(config=peril_lookup_config(index_fp, coverage_types=(BUILDING_COVERAGE_CODE,)))
+
+            res = lookup.lookup({'id': 1, 'lon': 2.0, 'lat': 2.0}, PERIL_ID_WIND, BUILDING_COVERAGE_CODE)
+            bulk_res = lookup.bulk_lookup_coords([2.0], [2.0], PERIL_ID_WIND, BUILDING_COVERAGE_CODE)
+
+            self.assertEqual(res['peril_area_id'], 6)
+            self.assertEqual(bulk_res['peril_area_id'][0], 6)
+
+
+class OasisPerilLookupPayloadStore(TestCase):
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(points=lists(tuples(coords, coords), min_size=1, max_size=20))
+    def test_index_with_payload_store___individual_and_bulk_results_match_those_for_index_with_pickled_payloads(self, points):
+        with TemporaryDirectory() as d:
+            index_fp = write_grid_peril_areas_index(os.path.join(d, 'index'))
+            lookup = OasisPerilLookup(config=peril_lookup_config(index_fp))
+
+            payload_index_fp = write_grid_peril_areas_index(os.path.join(d, 'payload_index'), payload_store=True)
+            payload_lookup = OasisPerilLookup(config=peril_lookup_config(payload_index_fp))
+
+            self.assertIsNone(lookup.payload_store)
+            self.assertIsNotNone(payload_lookup.payload_store)
+
+            xs, ys = zip(*points)
+            pairs = ((PERIL_ID_WIND, BUILDING_COVERAGE_CODE), (PERIL_ID_WIND, CONTENTS_COVERAGE_CODE))
+
+            res = payload_lookup.bulk_lookup_coords_for_pairs(xs, ys, pairs)
+            expected = lookup.bulk_lookup_coords_for_pairs(xs, ys, pairs)
+
+            for pair in pairs:
+                self.assertEqual(res[pair].to_dict('records'), expected[pair].to_dict('records'))
+                for i, (x, y) in enumerate(points):
+                    loc = {'id': i + 1, 'lon': x, 'lat': y}
+                    self.assertEqual(payload_lookup.lookup(loc, *pair), lookup.lookup(loc, *pair))
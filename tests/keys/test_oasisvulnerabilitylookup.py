@@ -0,0 +1,197 @@
+from __future__ import unicode_literals
+
+import os
+
+from unittest import TestCase
+
+import pandas as pd
+
+from backports.tempfile import TemporaryDirectory
+from mock import patch
+from hypothesis import (
+    given,
+    HealthCheck,
+    settings,
+)
+from hypothesis.strategies import (
+    floats,
+    integers,
+    lists,
+    none,
+    one_of,
+    text,
+)
+
+from oasislmf.keys.lookup import OasisVulnerabilityLookup
+from oasislmf.utils.coverage import (
+    BUILDING_COVERAGE_CODE,
+    CONTENTS_COVERAGE_CODE,
+)
+from oasislmf.utils.peril import PERIL_ID_WIND
+from oasislmf.utils.status import (
+    KEYS_STATUS_FAIL,
+    KEYS_STATUS_NOMATCH,
+    KEYS_STATUS_SUCCESS,
+)
+from oasislmf.utils.vulnerability import VulnerabilityTable
+
+
+def write_vulnerabilities_file(fp, occupancies=range(1, 6), coverage_types=(BUILDING_COVERAGE_CODE, CONTENTS_COVERAGE_CODE)):
+    pd.DataFrame(
+        data=[
+            (PERIL_ID_WIND, coverage_type, occupancy, i + 1)
+            for i, (coverage_type, occupancy) in enumerate((c, o) for c in coverage_types for o in occupancies)
+        ],
+        columns=['peril_id', 'coverage_type', 'occupancy', 'vulnerability_id']
+    ).to_csv(fp, index=False)
+    return fp
+
+
+def vulnerability_lookup_config(vulnerabilities_fp, coverage_types=(BUILDING_COVERAGE_CODE, CONTENTS_COVERAGE_CODE), **vulnerability_config):
+    config = {
+        'peril': {'peril_ids': [PERIL_ID_WIND]},
+        'coverage': {'coverage_types': list(coverage_types)},
+        'vulnerability': {
+            'file_path': vulnerabilities_fp,
+            'file_type': 'csv',
+            'col_dtypes': {'peril_id': 'int', 'coverage_type': 'int', 'occupancy': 'int', 'vulnerability_id': 'int'},
+            'key_cols': ['peril_id', 'coverage_type', 'occupancy'],
+            'vulnerability_id_col': 'vulnerability_id'
+        },
+        'locations': {'id_col': 'id'}
+    }
+    config['vulnerability'].update(vulnerability_config)
+    return config
+
+
+occupancies = one_of(integers(min_value=0, max_value=7), floats(min_value=0, max_value=7), none(), text(max_size=2, alphabet='12a'))
+
+
+class OasisVulnerabilityLookupBulkLookupFrame(TestCase):
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(occupancies=lists(occupancies, min_size=1, max_size=20))
+    def test_bulk_lookup_of_frame___results_match_individual_lookups(self, occupancies):
+        with TemporaryDirectory() as d:
+            vulnerabilities_fp = write_vulnerabilities_file(os.path.join(d, 'vulnerabilities.csv'))
+            lookup = OasisVulnerabilityLookup(config=vulnerability_lookup_config(vulnerabilities_fp))
+
+            locs = [{'id': i + 1, 'occupancy': o} for i, o in enumerate(occupancies)]
+            loc_df = pd.DataFrame(locs)
+
+            res = lookup.bulk_lookup_frame(loc_df, PERIL_ID_WIND, CONTENTS_COVERAGE_CODE)
+
+            self.assertEqual(len(res), len(locs))
+            for i, loc in enumerate(loc_df.to_dict('records')):
+                expected = lookup.lookup(loc, PERIL_ID_WIND, CONTENTS_COVERAGE_CODE)
+                self.assertEqual(res['status'][i], expected['status'])
+                self.assertEqual(res['vulnerability_id'][i], expected['vulnerability_id'])
+                self.assertEqual(res['message'][i], expected['message'])
+
+    def test_locations_with_invalid_or_unmatched_keys___statuses_are_fail_and_nomatch(self):
+        with TemporaryDirectory() as d:
+            vulnerabilities_fp = write_vulnerabilities_file(os.path.join(d, 'vulnerabilities.csv'))
+            lookup = OasisVulnerabilityLookup(config=vulnerability_lookup_config(vulnerabilities_fp))
+
+            loc_df = pd.DataFrame({'id': [1, 2, 3, 4], 'occupancy': [2, None, 9, 2.5]})
+
+            res = lookup.bulk_lookup_frame(loc_df, PERIL_ID_WIND, BUILDING_COVERAGE_CODE)
+
+            self.assertEqual(res['status'].tolist(), [KEYS_STATUS_SUCCESS, KEYS_STATUS_FAIL, KEYS_STATUS_NOMATCH, KEYS_STATUS_NOMATCH])
+            self.assertEqual(res['vulnerability_id'].tolist(), [2, None, None, None])
+
+
+class OasisVulnerabilityLookupBulkLookup(TestCase):
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(occupancies=lists(integers(min_value=0, max_value=7), min_size=1, max_size=10))
+    def test_dataframe_of_locations___results_match_base_class_bulk_lookup(self, occupancies):
+        with TemporaryDirectory() as d:
+            vulnerabilities_fp = write_vulnerabilities_file(os.path.join(d, 'vulnerabilities.csv'))
+            lookup = OasisVulnerabilityLookup(config=vulnerability_lookup_config(vulnerabilities_fp))
+
+            locs = [{'id': i + 1, 'occupancy': o} for i, o in enumerate(occupancies)]
+
+            expected = list(super(OasisVulnerabilityLookup, lookup).bulk_lookup(locs))
+            res = list(lookup.bulk_lookup(pd.DataFrame(locs)))
+
+            self.assertEqual(res, expected)
+
+
+class OasisVulnerabilityLookupArrayBackend(TestCase):
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(occupancies=lists(occupancies, min_size=1, max_size=20))
+    def test_array_backend___results_match_dict_backend(self, occupancies):
+        with TemporaryDirectory() as d:
+            vulnerabilities_fp = write_vulnerabilities_file(os.path.join(d, 'vulnerabilities.csv'))
+            dict_lookup = OasisVulnerabilityLookup(config=vulnerability_lookup_config(vulnerabilities_fp))
+            array_lookup = OasisVulnerabilityLookup(config=vulnerability_lookup_config(vulnerabilities_fp, backend='array'))
+
+            self.assertIsInstance(array_lookup.vulnerabilities, VulnerabilityTable)
+
+            locs = [{'id': i + 1, 'occupancy': o} for i, o in enumerate(occupancies)]
+            loc_df = pd.DataFrame(locs)
+
+            for coverage_type in (BUILDING_COVERAGE_CODE, CONTENTS_COVERAGE_CODE):
+                res = array_lookup.bulk_lookup_frame(loc_df, PERIL_ID_WIND, coverage_type)
+                expected = dict_lookup.bulk_lookup_frame(loc_df, PERIL_ID_WIND, coverage_type)
+                self.assertEqual(res['status'].tolist(), expected['status'].tolist())
+                self.assertEqual(res['vulnerability_id'].tolist(), expected['vulnerability_id'].tolist())
+                self.assertEqual(res['message'].tolist(), expected['message'].tolist())
+
+                for loc in loc_df.to_dict('records'):
+                    self.assertEqual(
+                        array_lookup.lookup(loc, PERIL_ID_WIND, coverage_type),
+                        dict_lookup.lookup(loc, PERIL_ID_WIND, coverage_type)
+                    )
+
+    def test_array_backend_with_cache___cache_file_is_written_and_reused_until_source_changes(self):
+        with TemporaryDirectory() as d:
+            vulnerabilities_fp = write_vulnerabilities_file(os.path.join(d, 'vulnerabilities.csv'))
+            config = vulnerability_lookup_config(vulnerabilities_fp, backend='array', cache=True)
+            cache_fp = '{}.npz'.format(vulnerabilities_fp)
+
+            lookup = OasisVulnerabilityLookup(config=config)
+
+            self.assertTrue(os.path.exists(cache_fp))
+            cached = VulnerabilityTable.load(cache_fp)
+            self.assertEqual(cached.to_frame().values.tolist(), lookup.vulnerabilities.to_frame().values.tolist())
+
+            # An unchanged source file is not read again
+            with patch('oasislmf.keys.lookup.get_dataframe', side_effect=AssertionError('The vulnerabilities file was read')):
+                lookup = OasisVulnerabilityLookup(config=vulnerability_lookup_config(vulnerabilities_fp, backend='array', cache=True))
+            self.assertEqual(len(lookup.vulnerabilities), 10)
+
+            # A source file changed in place causes the cache to be rebuilt,
+            # even if it is older than the cache file
+            mtime = os.path.getmtime(cache_fp)
+            write_vulnerabilities_file(vulnerabilities_fp, occupancies=range(1, 4))
+            os.utime(vulnerabilities_fp, (mtime - 10, mtime - 10))
+            lookup = OasisVulnerabilityLookup(config=vulnerability_lookup_config(vulnerabilities_fp, backend='array', cache=True))
+            self.assertEqual(len(lookup.vulnerabilities), 6)
+            self.assertEqual(len(VulnerabilityTable.load(cache_fp)), 6)
+
+    def test_array_backend_with_cache___cache_file_is_rebuilt_when_column_data_types_change(self):
+        with TemporaryDirectory() as d:
+            vulnerabilities_fp = write_vulnerabilities_file(os.path.join(d, 'vulnerabilities.csv'))
+            col_dtypes = {'peril_id': 'str', 'coverage_type': 'int', 'occupancy': 'str', 'vulnerability_id': 'int'}
+
+            OasisVulnerabilityLookup(config=vulnerability_lookup_config(vulnerabilities_fp, backend='array', cache=True))
+            lookup = OasisVulnerabilityLookup(config=vulnerability_lookup_config(vulnerabilities_fp, backend='array', cache=True, col_dtypes=col_dtypes))
+            expected = OasisVulnerabilityLookup(config=vulnerability_lookup_config(vulnerabilities_fp, backend='array', col_dtypes=col_dtypes))
+
+            self.assertEqual(lookup.vulnerabilities.numeric_cols, ('coverage_type',))
+            self.assertEqual(lookup.vulnerabilities.to_frame().values.tolist(), expected.vulnerabilities.to_frame().values.tolist())
+
+    def test_array_backend_with_cache_path_shared_by_source_files___each_lookup_gets_its_own_source_table(self):
+        with TemporaryDirectory() as d:
+            cache_fp = os.path.join(d, 'vulnerabilities-cache.npz')
+            vulnerabilities_fps = [
+                write_vulnerabilities_file(os.path.join(d, 'vulnerabilities-1.csv')),
+                write_vulnerabilities_file(os.path.join(d, 'vulnerabilities-2.csv'), occupancies=range(1, 3))
+            ]
+
+            for vulnerabilities_fp, num_vulns in zip(vulnerabilities_fps * 2, (10, 4) * 2):
+                lookup = OasisVulnerabilityLookup(config=vulnerability_lookup_config(vulnerabilities_fp, backend='array', cache=cache_fp))
+                self.assertEqual(len(lookup.vulnerabilities), num_vulns)
@@ -0,0 +1,196 @@
+from __future__ import unicode_literals
+
+import io
+import json
+import os
+import threading
+
+from unittest import TestCase
+
+import pandas as pd
+
+from backports.tempfile import TemporaryDirectory
+from hypothesis import (
+    given,
+    HealthCheck,
+    settings,
+)
+from hypothesis.strategies import (
+    integers,
+    lists,
+)
+from six.moves import socketserver
+from six.moves.BaseHTTPServer import (
+    BaseHTTPRequestHandler,
+    HTTPServer,
+)
+
+from oasislmf.keys.lookup import OasisLookupFactory
+from oasislmf.keys.remote import RemoteKeysLookup
+from oasislmf.utils.exceptions import OasisException
+from oasislmf.utils.status import (
+    KEYS_STATUS_FAIL,
+    KEYS_STATUS_SUCCESS,
+)
+
+
+def keys_records(loc_df):
+    return [
+        {
+            'id': int(loc_id),
+            'peril_id': 1,
+            'coverage': 1,
+            'area_peril_id': int(loc_id) * 10,
+            'vulnerability_id': int(occupancy),
+            'message': '',
+            'status': KEYS_STATUS_SUCCESS if occupancy else KEYS_STATUS_FAIL
+        } for loc_id, occupancy in zip(loc_df['id'], loc_df['occupancy'])
+    ]
+
+
+class _KeysServer(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _KeysRequestHandler(BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            fail = server.failures > 0
+            if fail:
+                server.failures -= 1
+
+        data = self.rfile.read(int(self.headers['Content-Length']))
+
+        if fail:
+            self.send_response(503)
+            self.end_headers()
+            return
+
+        records = keys_records(pd.read_csv(io.BytesIO(data)))
+        body = json.dumps({'items': records} if server.wrap_items else records).encode('utf-8')
+
+        self.send_response(server.status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class RemoteKeysLookupTest(TestCase):
+
+    def start_server(self, failures=0, status=200, wrap_items=False):
+        server = _KeysServer(('127.0.0.1', 0), _KeysRequestHandler)
+        server.lock = threading.Lock()
+        server.requests = 0
+        server.failures = failures
+        server.status = status
+        server.wrap_items = wrap_items
+
+        thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05})
+        thread.start()
+
+        return server, thread, 'http://127.0.0.1:{}/keys'.format(server.server_address[1])
+
+    def stop_server(self, server, thread):
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    def locations(self, occupancies):
+        return pd.DataFrame(
+            [{'id': i + 1, 'lon': 0.5 * i, 'lat': 0.5 * i, 'occupancy': o} for i, o in enumerate(occupancies)],
+            columns=['id', 'lon', 'lat', 'occupancy']
+        )
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow], max_examples=10)
+    @given(
+        occupancies=lists(integers(min_value=0, max_value=7), min_size=0, max_size=30),
+        batch_size=integers(min_value=1, max_value=7),
+        max_in_flight=integers(min_value=1, max_value=4)
+    )
+    def test_locations_are_posted_in_batches___results_are_in_location_order(self, occupancies, batch_size, max_in_flight):
+        server, thread, url = self.start_server(wrap_items=bool(batch_size % 2))
+        try:
+            loc_df = self.locations(occupancies)
+            lookup = RemoteKeysLookup(url, batch_size=batch_size, max_in_flight=max_in_flight)
+
+            res = list(lookup.process_locations(loc_df))
+
+            self.assertEqual(res, keys_records(loc_df))
+            self.assertEqual(server.requests, -(-len(occupancies) // batch_size))
+        finally:
+            self.stop_server(server, thread)
+
+    def test_server_responds_with_transient_errors___batches_are_retried(self):
+        server, thread, url = self.start_server(failures=2)
+        try:
+            loc_df = self.locations([i % 8 for i in range(10)])
+            lookup = RemoteKeysLookup(url, batch_size=4, max_in_flight=2, retries=3, backoff_factor=0)
+
+            res = list(lookup.process_locations(loc_df))
+
+            self.assertEqual(res, keys_records(loc_df))
+            self.assertEqual(server.requests, 5)
+        finally:
+            self.stop_server(server, thread)
+
+    def test_server_errors_persist___oasis_exception_is_raised(self):
+        server, thread, url = self.start_server(failures=10)
+        try:
+            lookup = RemoteKeysLookup(url, batch_size=4, retries=1, backoff_factor=0)
+
+            with self.assertRaises(OasisException):
+                list(lookup.process_locations(self.locations([1, 2, 3])))
+        finally:
+            self.stop_server(server, thread)
+
+        with self.assertRaises(OasisException):
+            list(lookup.process_locations(self.locations([1, 2, 3])))
+
+    def test_server_responds_with_client_error___oasis_exception_is_raised(self):
+        server, thread, url = self.start_server(status=400)
+        try:
+            lookup = RemoteKeysLookup(url, retries=3, backoff_factor=0)
+
+            with self.assertRaises(OasisException):
+                list(lookup.process_locations(self.locations([1, 2, 3])))
+
+            self.assertEqual(server.requests, 1)
+        finally:
+            self.stop_server(server, thread)
+
+    def test_keys_are_saved_with_remote_lookup___files_contain_server_keys(self):
+        server, thread, url = self.start_server()
+        try:
+            with TemporaryDirectory() as d:
+                exposures_fp = os.path.join(d, 'exposures.csv')
+                loc_df = self.locations([i % 8 for i in range(20)])
+                loc_df.to_csv(exposures_fp, index=False)
+
+                lookup = RemoteKeysLookup(url, batch_size=3, max_in_flight=3)
+
+                keys_fp, n1, errors_fp, n2 = OasisLookupFactory.save_results(
+                    lookup, os.path.join(d, 'keys.csv'), errors_fp=os.path.join(d, 'errors.csv'), model_exposures_fp=exposures_fp
+                )
+
+                records = keys_records(loc_df)
+                self.assertEqual(n1, len([r for r in records if r['status'] == KEYS_STATUS_SUCCESS]))
+                self.assertEqual(n2, len(records) - n1)
+
+                keys_df = pd.read_csv(keys_fp)
+                self.assertEqual(
+                    keys_df['LocID'].tolist(),
+                    [r['id'] for r in records if r['status'] == KEYS_STATUS_SUCCESS]
+                )
+                self.assertEqual(
+                    keys_df['AreaPerilID'].tolist(),
+                    [r['area_peril_id'] for r in records if r['status'] == KEYS_STATUS_SUCCESS]
+                )
+        finally:
+            self.stop_server(server, thread)
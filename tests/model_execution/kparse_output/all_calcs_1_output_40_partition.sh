@@ -0,0 +1,2416 @@
+#!/bin/bash
+
+rm -R -f output/*
+rm -R -f fifo/*
+rm -R -f work/*
+
+mkdir work/kat
+mkfifo fifo/gul_P1
+
+mkfifo fifo/gul_S1_summary_P1
+mkfifo fifo/gul_S1_summaryeltcalc_P1
+mkfifo fifo/gul_S1_eltcalc_P1
+mkfifo fifo/gul_S1_summarysummarycalc_P1
+mkfifo fifo/gul_S1_summarycalc_P1
+mkfifo fifo/gul_S1_summarypltcalc_P1
+mkfifo fifo/gul_S1_pltcalc_P1
+mkfifo fifo/gul_S1_summaryaalcalc_P1
+
+mkfifo fifo/gul_P2
+
+mkfifo fifo/gul_S1_summary_P2
+mkfifo fifo/gul_S1_summaryeltcalc_P2
+mkfifo fifo/gul_S1_eltcalc_P2
+mkfifo fifo/gul_S1_summarysummarycalc_P2
+mkfifo fifo/gul_S1_summarycalc_P2
+mkfifo fifo/gul_S1_summarypltcalc_P2
+mkfifo fifo/gul_S1_pltcalc_P2
+mkfifo fifo/gul_S1_summaryaalcalc_P2
+
+mkfifo fifo/gul_P3
+
+mkfifo fifo/gul_S1_summary_P3
+mkfifo fifo/gul_S1_summaryeltcalc_P3
+mkfifo fifo/gul_S1_eltcalc_P3
+mkfifo fifo/gul_S1_summarysummarycalc_P3
+mkfifo fifo/gul_S1_summarycalc_P3
+mkfifo fifo/gul_S1_summarypltcalc_P3
+mkfifo fifo/gul_S1_pltcalc_P3
+mkfifo fifo/gul_S1_summaryaalcalc_P3
+
+mkfifo fifo/gul_P4
+
+mkfifo fifo/gul_S1_summary_P4
+mkfifo fifo/gul_S1_summaryeltcalc_P4
+mkfifo fifo/gul_S1_eltcalc_P4
+mkfifo fifo/gul_S1_summarysummarycalc_P4
+mkfifo fifo/gul_S1_summarycalc_P4
+mkfifo fifo/gul_S1_summarypltcalc_P4
+mkfifo fifo/gul_S1_pltcalc_P4
+mkfifo fifo/gul_S1_summaryaalcalc_P4
+
+mkfifo fifo/gul_P5
+
+mkfifo fifo/gul_S1_summary_P5
+mkfifo fifo/gul_S1_summaryeltcalc_P5
+mkfifo fifo/gul_S1_eltcalc_P5
+mkfifo fifo/gul_S1_summarysummarycalc_P5
+mkfifo fifo/gul_S1_summarycalc_P5
+mkfifo fifo/gul_S1_summarypltcalc_P5
+mkfifo fifo/gul_S1_pltcalc_P5
+mkfifo fifo/gul_S1_summaryaalcalc_P5
+
+mkfifo fifo/gul_P6
+
+mkfifo fifo/gul_S1_summary_P6
+mkfifo fifo/gul_S1_summaryeltcalc_P6
+mkfifo fifo/gul_S1_eltcalc_P6
+mkfifo fifo/gul_S1_summarysummarycalc_P6
+mkfifo fifo/gul_S1_summarycalc_P6
+mkfifo fifo/gul_S1_summarypltcalc_P6
+mkfifo fifo/gul_S1_pltcalc_P6
+mkfifo fifo/gul_S1_summaryaalcalc_P6
+
+mkfifo fifo/gul_P7
+
+mkfifo fifo/gul_S1_summary_P7
+mkfifo fifo/gul_S1_summaryeltcalc_P7
+mkfifo fifo/gul_S1_eltcalc_P7
+mkfifo fifo/gul_S1_summarysummarycalc_P7
+mkfifo fifo/gul_S1_summarycalc_P7
+mkfifo fifo/gul_S1_summarypltcalc_P7
+mkfifo fifo/gul_S1_pltcalc_P7
+mkfifo fifo/gul_S1_summaryaalcalc_P7
+
+mkfifo fifo/gul_P8
+
+mkfifo fifo/gul_S1_summary_P8
+mkfifo fifo/gul_S1_summaryeltcalc_P8
+mkfifo fifo/gul_S1_eltcalc_P8
+mkfifo fifo/gul_S1_summarysummarycalc_P8
+mkfifo fifo/gul_S1_summarycalc_P8
+mkfifo fifo/gul_S1_summarypltcalc_P8
+mkfifo fifo/gul_S1_pltcalc_P8
+mkfifo fifo/gul_S1_summaryaalcalc_P8
+
+mkfifo fifo/gul_P9
+
+mkfifo fifo/gul_S1_summary_P9
+mkfifo fifo/gul_S1_summaryeltcalc_P9
+mkfifo fifo/gul_S1_eltcalc_P9
+mkfifo fifo/gul_S1_summarysummarycalc_P9
+mkfifo fifo/gul_S1_summarycalc_P9
+mkfifo fifo/gul_S1_summarypltcalc_P9
+mkfifo fifo/gul_S1_pltcalc_P9
+mkfifo fifo/gul_S1_summaryaalcalc_P9
+
+mkfifo fifo/gul_P10
+
+mkfifo fifo/gul_S1_summary_P10
+mkfifo fifo/gul_S1_summaryeltcalc_P10
+mkfifo fifo/gul_S1_eltcalc_P10
+mkfifo fifo/gul_S1_summarysummarycalc_P10
+mkfifo fifo/gul_S1_summarycalc_P10
+mkfifo fifo/gul_S1_summarypltcalc_P10
+mkfifo fifo/gul_S1_pltcalc_P10
+mkfifo fifo/gul_S1_summaryaalcalc_P10
+
+mkfifo fifo/gul_P11
+
+mkfifo fifo/gul_S1_summary_P11
+mkfifo fifo/gul_S1_summaryeltcalc_P11
+mkfifo fifo/gul_S1_eltcalc_P11
+mkfifo fifo/gul_S1_summarysummarycalc_P11
+mkfifo fifo/gul_S1_summarycalc_P11
+mkfifo fifo/gul_S1_summarypltcalc_P11
+mkfifo fifo/gul_S1_pltcalc_P11
+mkfifo fifo/gul_S1_summaryaalcalc_P11
+
+mkfifo fifo/gul_P12
+
+mkfifo fifo/gul_S1_summary_P12
+mkfifo fifo/gul_S1_summaryeltcalc_P12
+mkfifo fifo/gul_S1_eltcalc_P12
+mkfifo fifo/gul_S1_summarysummarycalc_P12
+mkfifo fifo/gul_S1_summarycalc_P12
+mkfifo fifo/gul_S1_summarypltcalc_P12
+mkfifo fifo/gul_S1_pltcalc_P12
+mkfifo fifo/gul_S1_summaryaalcalc_P12
+
+mkfifo fifo/gul_P13
+
+mkfifo fifo/gul_S1_summary_P13
+mkfifo fifo/gul_S1_summaryeltcalc_P13
+mkfifo fifo/gul_S1_eltcalc_P13
+mkfifo fifo/gul_S1_summarysummarycalc_P13
+mkfifo fifo/gul_S1_summarycalc_P13
+mkfifo fifo/gul_S1_summarypltcalc_P13
+mkfifo fifo/gul_S1_pltcalc_P13
+mkfifo fifo/gul_S1_summaryaalcalc_P13
+
+mkfifo fifo/gul_P14
+
+mkfifo fifo/gul_S1_summary_P14
+mkfifo fifo/gul_S1_summaryeltcalc_P14
+mkfifo fifo/gul_S1_eltcalc_P14
+mkfifo fifo/gul_S1_summarysummarycalc_P14
+mkfifo fifo/gul_S1_summarycalc_P14
+mkfifo fifo/gul_S1_summarypltcalc_P14
+mkfifo fifo/gul_S1_pltcalc_P14
+mkfifo fifo/gul_S1_summaryaalcalc_P14
+
+mkfifo fifo/gul_P15
+
+mkfifo fifo/gul_S1_summary_P15
+mkfifo fifo/gul_S1_summaryeltcalc_P15
+mkfifo fifo/gul_S1_eltcalc_P15
+mkfifo fifo/gul_S1_summarysummarycalc_P15
+mkfifo fifo/gul_S1_summarycalc_P15
+mkfifo fifo/gul_S1_summarypltcalc_P15
+mkfifo fifo/gul_S1_pltcalc_P15
+mkfifo fifo/gul_S1_summaryaalcalc_P15
+
+mkfifo fifo/gul_P16
+
+mkfifo fifo/gul_S1_summary_P16
+mkfifo fifo/gul_S1_summaryeltcalc_P16
+mkfifo fifo/gul_S1_eltcalc_P16
+mkfifo fifo/gul_S1_summarysummarycalc_P16
+mkfifo fifo/gul_S1_summarycalc_P16
+mkfifo fifo/gul_S1_summarypltcalc_P16
+mkfifo fifo/gul_S1_pltcalc_P16
+mkfifo fifo/gul_S1_summaryaalcalc_P16
+
+mkfifo fifo/gul_P17
+
+mkfifo fifo/gul_S1_summary_P17
+mkfifo fifo/gul_S1_summaryeltcalc_P17
+mkfifo fifo/gul_S1_eltcalc_P17
+mkfifo fifo/gul_S1_summarysummarycalc_P17
+mkfifo fifo/gul_S1_summarycalc_P17
+mkfifo fifo/gul_S1_summarypltcalc_P17
+mkfifo fifo/gul_S1_pltcalc_P17
+mkfifo fifo/gul_S1_summaryaalcalc_P17
+
+mkfifo fifo/gul_P18
+
+mkfifo fifo/gul_S1_summary_P18
+mkfifo fifo/gul_S1_summaryeltcalc_P18
+mkfifo fifo/gul_S1_eltcalc_P18
+mkfifo fifo/gul_S1_summarysummarycalc_P18
+mkfifo fifo/gul_S1_summarycalc_P18
+mkfifo fifo/gul_S1_summarypltcalc_P18
+mkfifo fifo/gul_S1_pltcalc_P18
+mkfifo fifo/gul_S1_summaryaalcalc_P18
+
+mkfifo fifo/gul_P19
+
+mkfifo fifo/gul_S1_summary_P19
+mkfifo fifo/gul_S1_summaryeltcalc_P19
+mkfifo fifo/gul_S1_eltcalc_P19
+mkfifo fifo/gul_S1_summarysummarycalc_P19
+mkfifo fifo/gul_S1_summarycalc_P19
+mkfifo fifo/gul_S1_summarypltcalc_P19
+mkfifo fifo/gul_S1_pltcalc_P19
+mkfifo fifo/gul_S1_summaryaalcalc_P19
+
+mkfifo fifo/gul_P20
+
+mkfifo fifo/gul_S1_summary_P20
+mkfifo fifo/gul_S1_summaryeltcalc_P20
+mkfifo fifo/gul_S1_eltcalc_P20
+mkfifo fifo/gul_S1_summarysummarycalc_P20
+mkfifo fifo/gul_S1_summarycalc_P20
+mkfifo fifo/gul_S1_summarypltcalc_P20
+mkfifo fifo/gul_S1_pltcalc_P20
+mkfifo fifo/gul_S1_summaryaalcalc_P20
+
+mkfifo fifo/gul_P21
+
+mkfifo fifo/gul_S1_summary_P21
+mkfifo fifo/gul_S1_summaryeltcalc_P21
+mkfifo fifo/gul_S1_eltcalc_P21
+mkfifo fifo/gul_S1_summarysummarycalc_P21
+mkfifo fifo/gul_S1_summarycalc_P21
+mkfifo fifo/gul_S1_summarypltcalc_P21
+mkfifo fifo/gul_S1_pltcalc_P21
+mkfifo fifo/gul_S1_summaryaalcalc_P21
+
+mkfifo fifo/gul_P22
+
+mkfifo fifo/gul_S1_summary_P22
+mkfifo fifo/gul_S1_summaryeltcalc_P22
+mkfifo fifo/gul_S1_eltcalc_P22
+mkfifo fifo/gul_S1_summarysummarycalc_P22
+mkfifo fifo/gul_S1_summarycalc_P22
+mkfifo fifo/gul_S1_summarypltcalc_P22
+mkfifo fifo/gul_S1_pltcalc_P22
+mkfifo fifo/gul_S1_summaryaalcalc_P22
+
+mkfifo fifo/gul_P23
+
+mkfifo fifo/gul_S1_summary_P23
+mkfifo fifo/gul_S1_summaryeltcalc_P23
+mkfifo fifo/gul_S1_eltcalc_P23
+mkfifo fifo/gul_S1_summarysummarycalc_P23
+mkfifo fifo/gul_S1_summarycalc_P23
+mkfifo fifo/gul_S1_summarypltcalc_P23
+mkfifo fifo/gul_S1_pltcalc_P23
+mkfifo fifo/gul_S1_summaryaalcalc_P23
+
+mkfifo fifo/gul_P24
+
+mkfifo fifo/gul_S1_summary_P24
+mkfifo fifo/gul_S1_summaryeltcalc_P24
+mkfifo fifo/gul_S1_eltcalc_P24
+mkfifo fifo/gul_S1_summarysummarycalc_P24
+mkfifo fifo/gul_S1_summarycalc_P24
+mkfifo fifo/gul_S1_summarypltcalc_P24
+mkfifo fifo/gul_S1_pltcalc_P24
+mkfifo fifo/gul_S1_summaryaalcalc_P24
+
+mkfifo fifo/gul_P25
+
+mkfifo fifo/gul_S1_summary_P25
+mkfifo fifo/gul_S1_summaryeltcalc_P25
+mkfifo fifo/gul_S1_eltcalc_P25
+mkfifo fifo/gul_S1_summarysummarycalc_P25
+mkfifo fifo/gul_S1_summarycalc_P25
+mkfifo fifo/gul_S1_summarypltcalc_P25
+mkfifo fifo/gul_S1_pltcalc_P25
+mkfifo fifo/gul_S1_summaryaalcalc_P25
+
+mkfifo fifo/gul_P26
+
+mkfifo fifo/gul_S1_summary_P26
+mkfifo fifo/gul_S1_summaryeltcalc_P26
+mkfifo fifo/gul_S1_eltcalc_P26
+mkfifo fifo/gul_S1_summarysummarycalc_P26
+mkfifo fifo/gul_S1_summarycalc_P26
+mkfifo fifo/gul_S1_summarypltcalc_P26
+mkfifo fifo/gul_S1_pltcalc_P26
+mkfifo fifo/gul_S1_summaryaalcalc_P26
+
+mkfifo fifo/gul_P27
+
+mkfifo fifo/gul_S1_summary_P27
+mkfifo fifo/gul_S1_summaryeltcalc_P27
+mkfifo fifo/gul_S1_eltcalc_P27
+mkfifo fifo/gul_S1_summarysummarycalc_P27
+mkfifo fifo/gul_S1_summarycalc_P27
+mkfifo fifo/gul_S1_summarypltcalc_P27
+mkfifo fifo/gul_S1_pltcalc_P27
+mkfifo fifo/gul_S1_summaryaalcalc_P27
+
+mkfifo fifo/gul_P28
+
+mkfifo fifo/gul_S1_summary_P28
+mkfifo fifo/gul_S1_summaryeltcalc_P28
+mkfifo fifo/gul_S1_eltcalc_P28
+mkfifo fifo/gul_S1_summarysummarycalc_P28
+mkfifo fifo/gul_S1_summarycalc_P28
+mkfifo fifo/gul_S1_summarypltcalc_P28
+mkfifo fifo/gul_S1_pltcalc_P28
+mkfifo fifo/gul_S1_summaryaalcalc_P28
+
+mkfifo fifo/gul_P29
+
+mkfifo fifo/gul_S1_summary_P29
+mkfifo fifo/gul_S1_summaryeltcalc_P29
+mkfifo fifo/gul_S1_eltcalc_P29
+mkfifo fifo/gul_S1_summarysummarycalc_P29
+mkfifo fifo/gul_S1_summarycalc_P29
+mkfifo fifo/gul_S1_summarypltcalc_P29
+mkfifo fifo/gul_S1_pltcalc_P29
+mkfifo fifo/gul_S1_summaryaalcalc_P29
+
+mkfifo fifo/gul_P30
+
+mkfifo fifo/gul_S1_summary_P30
+mkfifo fifo/gul_S1_summaryeltcalc_P30
+mkfifo fifo/gul_S1_eltcalc_P30
+mkfifo fifo/gul_S1_summarysummarycalc_P30
+mkfifo fifo/gul_S1_summarycalc_P30
+mkfifo fifo/gul_S1_summarypltcalc_P30
+mkfifo fifo/gul_S1_pltcalc_P30
+mkfifo fifo/gul_S1_summaryaalcalc_P30
+
+mkfifo fifo/gul_P31
+
+mkfifo fifo/gul_S1_summary_P31
+mkfifo fifo/gul_S1_summaryeltcalc_P31
+mkfifo fifo/gul_S1_eltcalc_P31
+mkfifo fifo/gul_S1_summarysummarycalc_P31
+mkfifo fifo/gul_S1_summarycalc_P31
+mkfifo fifo/gul_S1_summarypltcalc_P31
+mkfifo fifo/gul_S1_pltcalc_P31
+mkfifo fifo/gul_S1_summaryaalcalc_P31
+
+mkfifo fifo/gul_P32
+
+mkfifo fifo/gul_S1_summary_P32
+mkfifo fifo/gul_S1_summaryeltcalc_P32
+mkfifo fifo/gul_S1_eltcalc_P32
+mkfifo fifo/gul_S1_summarysummarycalc_P32
+mkfifo fifo/gul_S1_summarycalc_P32
+mkfifo fifo/gul_S1_summarypltcalc_P32
+mkfifo fifo/gul_S1_pltcalc_P32
+mkfifo fifo/gul_S1_summaryaalcalc_P32
+
+mkfifo fifo/gul_P33
+
+mkfifo fifo/gul_S1_summary_P33
+mkfifo fifo/gul_S1_summaryeltcalc_P33
+mkfifo fifo/gul_S1_eltcalc_P33
+mkfifo fifo/gul_S1_summarysummarycalc_P33
+mkfifo fifo/gul_S1_summarycalc_P33
+mkfifo fifo/gul_S1_summarypltcalc_P33
+mkfifo fifo/gul_S1_pltcalc_P33
+mkfifo fifo/gul_S1_summaryaalcalc_P33
+
+mkfifo fifo/gul_P34
+
+mkfifo fifo/gul_S1_summary_P34
+mkfifo fifo/gul_S1_summaryeltcalc_P34
+mkfifo fifo/gul_S1_eltcalc_P34
+mkfifo fifo/gul_S1_summarysummarycalc_P34
+mkfifo fifo/gul_S1_summarycalc_P34
+mkfifo fifo/gul_S1_summarypltcalc_P34
+mkfifo fifo/gul_S1_pltcalc_P34
+mkfifo fifo/gul_S1_summaryaalcalc_P34
+
+mkfifo fifo/gul_P35
+
+mkfifo fifo/gul_S1_summary_P35
+mkfifo fifo/gul_S1_summaryeltcalc_P35
+mkfifo fifo/gul_S1_eltcalc_P35
+mkfifo fifo/gul_S1_summarysummarycalc_P35
+mkfifo fifo/gul_S1_summarycalc_P35
+mkfifo fifo/gul_S1_summarypltcalc_P35
+mkfifo fifo/gul_S1_pltcalc_P35
+mkfifo fifo/gul_S1_summaryaalcalc_P35
+
+mkfifo fifo/gul_P36
+
+mkfifo fifo/gul_S1_summary_P36
+mkfifo fifo/gul_S1_summaryeltcalc_P36
+mkfifo fifo/gul_S1_eltcalc_P36
+mkfifo fifo/gul_S1_summarysummarycalc_P36
+mkfifo fifo/gul_S1_summarycalc_P36
+mkfifo fifo/gul_S1_summarypltcalc_P36
+mkfifo fifo/gul_S1_pltcalc_P36
+mkfifo fifo/gul_S1_summaryaalcalc_P36
+
+mkfifo fifo/gul_P37
+
+mkfifo fifo/gul_S1_summary_P37
+mkfifo fifo/gul_S1_summaryeltcalc_P37
+mkfifo fifo/gul_S1_eltcalc_P37
+mkfifo fifo/gul_S1_summarysummarycalc_P37
+mkfifo fifo/gul_S1_summarycalc_P37
+mkfifo fifo/gul_S1_summarypltcalc_P37
+mkfifo fifo/gul_S1_pltcalc_P37
+mkfifo fifo/gul_S1_summaryaalcalc_P37
+
+mkfifo fifo/gul_P38
+
+mkfifo fifo/gul_S1_summary_P38
+mkfifo fifo/gul_S1_summaryeltcalc_P38
+mkfifo fifo/gul_S1_eltcalc_P38
+mkfifo fifo/gul_S1_summarysummarycalc_P38
+mkfifo fifo/gul_S1_summarycalc_P38
+mkfifo fifo/gul_S1_summarypltcalc_P38
+mkfifo fifo/gul_S1_pltcalc_P38
+mkfifo fifo/gul_S1_summaryaalcalc_P38
+
+mkfifo fifo/gul_P39
+
+mkfifo fifo/gul_S1_summary_P39
+mkfifo fifo/gul_S1_summaryeltcalc_P39
+mkfifo fifo/gul_S1_eltcalc_P39
+mkfifo fifo/gul_S1_summarysummarycalc_P39
+mkfifo fifo/gul_S1_summarycalc_P39
+mkfifo fifo/gul_S1_summarypltcalc_P39
+mkfifo fifo/gul_S1_pltcalc_P39
+mkfifo fifo/gul_S1_summaryaalcalc_P39
+
+mkfifo fifo/gul_P40
+
+mkfifo fifo/gul_S1_summary_P40
+mkfifo fifo/gul_S1_summaryeltcalc_P40
+mkfifo fifo/gul_S1_eltcalc_P40
+mkfifo fifo/gul_S1_summarysummarycalc_P40
+mkfifo fifo/gul_S1_summarycalc_P40
+mkfifo fifo/gul_S1_summarypltcalc_P40
+mkfifo fifo/gul_S1_pltcalc_P40
+mkfifo fifo/gul_S1_summaryaalcalc_P40
+
+mkdir work/gul_S1_summaryleccalc
+mkdir work/gul_S1_aalcalc
+
+mkfifo fifo/il_P1
+
+mkfifo fifo/il_S1_summary_P1
+mkfifo fifo/il_S1_summaryeltcalc_P1
+mkfifo fifo/il_S1_eltcalc_P1
+mkfifo fifo/il_S1_summarysummarycalc_P1
+mkfifo fifo/il_S1_summarycalc_P1
+mkfifo fifo/il_S1_summarypltcalc_P1
+mkfifo fifo/il_S1_pltcalc_P1
+mkfifo fifo/il_S1_summaryaalcalc_P1
+
+mkfifo fifo/il_P2
+
+mkfifo fifo/il_S1_summary_P2
+mkfifo fifo/il_S1_summaryeltcalc_P2
+mkfifo fifo/il_S1_eltcalc_P2
+mkfifo fifo/il_S1_summarysummarycalc_P2
+mkfifo fifo/il_S1_summarycalc_P2
+mkfifo fifo/il_S1_summarypltcalc_P2
+mkfifo fifo/il_S1_pltcalc_P2
+mkfifo fifo/il_S1_summaryaalcalc_P2
+
+mkfifo fifo/il_P3
+
+mkfifo fifo/il_S1_summary_P3
+mkfifo fifo/il_S1_summaryeltcalc_P3
+mkfifo fifo/il_S1_eltcalc_P3
+mkfifo fifo/il_S1_summarysummarycalc_P3
+mkfifo fifo/il_S1_summarycalc_P3
+mkfifo fifo/il_S1_summarypltcalc_P3
+mkfifo fifo/il_S1_pltcalc_P3
+mkfifo fifo/il_S1_summaryaalcalc_P3
+
+mkfifo fifo/il_P4
+
+mkfifo fifo/il_S1_summary_P4
+mkfifo fifo/il_S1_summaryeltcalc_P4
+mkfifo fifo/il_S1_eltcalc_P4
+mkfifo fifo/il_S1_summarysummarycalc_P4
+mkfifo fifo/il_S1_summarycalc_P4
+mkfifo fifo/il_S1_summarypltcalc_P4
+mkfifo fifo/il_S1_pltcalc_P4
+mkfifo fifo/il_S1_summaryaalcalc_P4
+
+mkfifo fifo/il_P5
+
+mkfifo fifo/il_S1_summary_P5
+mkfifo fifo/il_S1_summaryeltcalc_P5
+mkfifo fifo/il_S1_eltcalc_P5
+mkfifo fifo/il_S1_summarysummarycalc_P5
+mkfifo fifo/il_S1_summarycalc_P5
+mkfifo fifo/il_S1_summarypltcalc_P5
+mkfifo fifo/il_S1_pltcalc_P5
+mkfifo fifo/il_S1_summaryaalcalc_P5
+
+mkfifo fifo/il_P6
+
+mkfifo fifo/il_S1_summary_P6
+mkfifo fifo/il_S1_summaryeltcalc_P6
+mkfifo fifo/il_S1_eltcalc_P6
+mkfifo fifo/il_S1_summarysummarycalc_P6
+mkfifo fifo/il_S1_summarycalc_P6
+mkfifo fifo/il_S1_summarypltcalc_P6
+mkfifo fifo/il_S1_pltcalc_P6
+mkfifo fifo/il_S1_summaryaalcalc_P6
+
+mkfifo fifo/il_P7
+
+mkfifo fifo/il_S1_summary_P7
+mkfifo fifo/il_S1_summaryeltcalc_P7
+mkfifo fifo/il_S1_eltcalc_P7
+mkfifo fifo/il_S1_summarysummarycalc_P7
+mkfifo fifo/il_S1_summarycalc_P7
+mkfifo fifo/il_S1_summarypltcalc_P7
+mkfifo fifo/il_S1_pltcalc_P7
+mkfifo fifo/il_S1_summaryaalcalc_P7
+
+mkfifo fifo/il_P8
+
+mkfifo fifo/il_S1_summary_P8
+mkfifo fifo/il_S1_summaryeltcalc_P8
+mkfifo fifo/il_S1_eltcalc_P8
+mkfifo fifo/il_S1_summarysummarycalc_P8
+mkfifo fifo/il_S1_summarycalc_P8
+mkfifo fifo/il_S1_summarypltcalc_P8
+mkfifo fifo/il_S1_pltcalc_P8
+mkfifo fifo/il_S1_summaryaalcalc_P8
+
+mkfifo fifo/il_P9
+
+mkfifo fifo/il_S1_summary_P9
+mkfifo fifo/il_S1_summaryeltcalc_P9
+mkfifo fifo/il_S1_eltcalc_P9
+mkfifo fifo/il_S1_summarysummarycalc_P9
+mkfifo fifo/il_S1_summarycalc_P9
+mkfifo fifo/il_S1_summarypltcalc_P9
+mkfifo fifo/il_S1_pltcalc_P9
+mkfifo fifo/il_S1_summaryaalcalc_P9
+
+mkfifo fifo/il_P10
+
+mkfifo fifo/il_S1_summary_P10
+mkfifo fifo/il_S1_summaryeltcalc_P10
+mkfifo fifo/il_S1_eltcalc_P10
+mkfifo fifo/il_S1_summarysummarycalc_P10
+mkfifo fifo/il_S1_summarycalc_P10
+mkfifo fifo/il_S1_summarypltcalc_P10
+mkfifo fifo/il_S1_pltcalc_P10
+mkfifo fifo/il_S1_summaryaalcalc_P10
+
+mkfifo fifo/il_P11
+
+mkfifo fifo/il_S1_summary_P11
+mkfifo fifo/il_S1_summaryeltcalc_P11
+mkfifo fifo/il_S1_eltcalc_P11
+mkfifo fifo/il_S1_summarysummarycalc_P11
+mkfifo fifo/il_S1_summarycalc_P11
+mkfifo fifo/il_S1_summarypltcalc_P11
+mkfifo fifo/il_S1_pltcalc_P11
+mkfifo fifo/il_S1_summaryaalcalc_P11
+
+mkfifo fifo/il_P12
+
+mkfifo fifo/il_S1_summary_P12
+mkfifo fifo/il_S1_summaryeltcalc_P12
+mkfifo fifo/il_S1_eltcalc_P12
+mkfifo fifo/il_S1_summarysummarycalc_P12
+mkfifo fifo/il_S1_summarycalc_P12
+mkfifo fifo/il_S1_summarypltcalc_P12
+mkfifo fifo/il_S1_pltcalc_P12
+mkfifo fifo/il_S1_summaryaalcalc_P12
+
+mkfifo fifo/il_P13
+
+mkfifo fifo/il_S1_summary_P13
+mkfifo fifo/il_S1_summaryeltcalc_P13
+mkfifo fifo/il_S1_eltcalc_P13
+mkfifo fifo/il_S1_summarysummarycalc_P13
+mkfifo fifo/il_S1_summarycalc_P13
+mkfifo fifo/il_S1_summarypltcalc_P13
+mkfifo fifo/il_S1_pltcalc_P13
+mkfifo fifo/il_S1_summaryaalcalc_P13
+
+mkfifo fifo/il_P14
+
+mkfifo fifo/il_S1_summary_P14
+mkfifo fifo/il_S1_summaryeltcalc_P14
+mkfifo fifo/il_S1_eltcalc_P14
+mkfifo fifo/il_S1_summarysummarycalc_P14
+mkfifo fifo/il_S1_summarycalc_P14
+mkfifo fifo/il_S1_summarypltcalc_P14
+mkfifo fifo/il_S1_pltcalc_P14
+mkfifo fifo/il_S1_summaryaalcalc_P14
+
+mkfifo fifo/il_P15
+
+mkfifo fifo/il_S1_summary_P15
+mkfifo fifo/il_S1_summaryeltcalc_P15
+mkfifo fifo/il_S1_eltcalc_P15
+mkfifo fifo/il_S1_summarysummarycalc_P15
+mkfifo fifo/il_S1_summarycalc_P15
+mkfifo fifo/il_S1_summarypltcalc_P15
+mkfifo fifo/il_S1_pltcalc_P15
+mkfifo fifo/il_S1_summaryaalcalc_P15
+
+mkfifo fifo/il_P16
+
+mkfifo fifo/il_S1_summary_P16
+mkfifo fifo/il_S1_summaryeltcalc_P16
+mkfifo fifo/il_S1_eltcalc_P16
+mkfifo fifo/il_S1_summarysummarycalc_P16
+mkfifo fifo/il_S1_summarycalc_P16
+mkfifo fifo/il_S1_summarypltcalc_P16
+mkfifo fifo/il_S1_pltcalc_P16
+mkfifo fifo/il_S1_summaryaalcalc_P16
+
+mkfifo fifo/il_P17
+
+mkfifo fifo/il_S1_summary_P17
+mkfifo fifo/il_S1_summaryeltcalc_P17
+mkfifo fifo/il_S1_eltcalc_P17
+mkfifo fifo/il_S1_summarysummarycalc_P17
+mkfifo fifo/il_S1_summarycalc_P17
+mkfifo fifo/il_S1_summarypltcalc_P17
+mkfifo fifo/il_S1_pltcalc_P17
+mkfifo fifo/il_S1_summaryaalcalc_P17
+
+mkfifo fifo/il_P18
+
+mkfifo fifo/il_S1_summary_P18
+mkfifo fifo/il_S1_summaryeltcalc_P18
+mkfifo fifo/il_S1_eltcalc_P18
+mkfifo fifo/il_S1_summarysummarycalc_P18
+mkfifo fifo/il_S1_summarycalc_P18
+mkfifo fifo/il_S1_summarypltcalc_P18
+mkfifo fifo/il_S1_pltcalc_P18
+mkfifo fifo/il_S1_summaryaalcalc_P18
+
+mkfifo fifo/il_P19
+
+mkfifo fifo/il_S1_summary_P19
+mkfifo fifo/il_S1_summaryeltcalc_P19
+mkfifo fifo/il_S1_eltcalc_P19
+mkfifo fifo/il_S1_summarysummarycalc_P19
+mkfifo fifo/il_S1_summarycalc_P19
+mkfifo fifo/il_S1_summarypltcalc_P19
+mkfifo fifo/il_S1_pltcalc_P19
+mkfifo fifo/il_S1_summaryaalcalc_P19
+
+mkfifo fifo/il_P20
+
+mkfifo fifo/il_S1_summary_P20
+mkfifo fifo/il_S1_summaryeltcalc_P20
+mkfifo fifo/il_S1_eltcalc_P20
+mkfifo fifo/il_S1_summarysummarycalc_P20
+mkfifo fifo/il_S1_summarycalc_P20
+mkfifo fifo/il_S1_summarypltcalc_P20
+mkfifo fifo/il_S1_pltcalc_P20
+mkfifo fifo/il_S1_summaryaalcalc_P20
+
+mkfifo fifo/il_P21
+
+mkfifo fifo/il_S1_summary_P21
+mkfifo fifo/il_S1_summaryeltcalc_P21
+mkfifo fifo/il_S1_eltcalc_P21
+mkfifo fifo/il_S1_summarysummarycalc_P21
+mkfifo fifo/il_S1_summarycalc_P21
+mkfifo fifo/il_S1_summarypltcalc_P21
+mkfifo fifo/il_S1_pltcalc_P21
+mkfifo fifo/il_S1_summaryaalcalc_P21
+
+mkfifo fifo/il_P22
+
+mkfifo fifo/il_S1_summary_P22
+mkfifo fifo/il_S1_summaryeltcalc_P22
+mkfifo fifo/il_S1_eltcalc_P22
+mkfifo fifo/il_S1_summarysummarycalc_P22
+mkfifo fifo/il_S1_summarycalc_P22
+mkfifo fifo/il_S1_summarypltcalc_P22
+mkfifo fifo/il_S1_pltcalc_P22
+mkfifo fifo/il_S1_summaryaalcalc_P22
+
+mkfifo fifo/il_P23
+
+mkfifo fifo/il_S1_summary_P23
+mkfifo fifo/il_S1_summaryeltcalc_P23
+mkfifo fifo/il_S1_eltcalc_P23
+mkfifo fifo/il_S1_summarysummarycalc_P23
+mkfifo fifo/il_S1_summarycalc_P23
+mkfifo fifo/il_S1_summarypltcalc_P23
+mkfifo fifo/il_S1_pltcalc_P23
+mkfifo fifo/il_S1_summaryaalcalc_P23
+
+mkfifo fifo/il_P24
+
+mkfifo fifo/il_S1_summary_P24
+mkfifo fifo/il_S1_summaryeltcalc_P24
+mkfifo fifo/il_S1_eltcalc_P24
+mkfifo fifo/il_S1_summarysummarycalc_P24
+mkfifo fifo/il_S1_summarycalc_P24
+mkfifo fifo/il_S1_summarypltcalc_P24
+mkfifo fifo/il_S1_pltcalc_P24
+mkfifo fifo/il_S1_summaryaalcalc_P24
+
+mkfifo fifo/il_P25
+
+mkfifo fifo/il_S1_summary_P25
+mkfifo fifo/il_S1_summaryeltcalc_P25
+mkfifo fifo/il_S1_eltcalc_P25
+mkfifo fifo/il_S1_summarysummarycalc_P25
+mkfifo fifo/il_S1_summarycalc_P25
+mkfifo fifo/il_S1_summarypltcalc_P25
+mkfifo fifo/il_S1_pltcalc_P25
+mkfifo fifo/il_S1_summaryaalcalc_P25
+
+mkfifo fifo/il_P26
+
+mkfifo fifo/il_S1_summary_P26
+mkfifo fifo/il_S1_summaryeltcalc_P26
+mkfifo fifo/il_S1_eltcalc_P26
+mkfifo fifo/il_S1_summarysummarycalc_P26
+mkfifo fifo/il_S1_summarycalc_P26
+mkfifo fifo/il_S1_summarypltcalc_P26
+mkfifo fifo/il_S1_pltcalc_P26
+mkfifo fifo/il_S1_summaryaalcalc_P26
+
+mkfifo fifo/il_P27
+
+mkfifo fifo/il_S1_summary_P27
+mkfifo fifo/il_S1_summaryeltcalc_P27
+mkfifo fifo/il_S1_eltcalc_P27
+mkfifo fifo/il_S1_summarysummarycalc_P27
+mkfifo fifo/il_S1_summarycalc_P27
+mkfifo fifo/il_S1_summarypltcalc_P27
+mkfifo fifo/il_S1_pltcalc_P27
+mkfifo fifo/il_S1_summaryaalcalc_P27
+
+mkfifo fifo/il_P28
+
+mkfifo fifo/il_S1_summary_P28
+mkfifo fifo/il_S1_summaryeltcalc_P28
+mkfifo fifo/il_S1_eltcalc_P28
+mkfifo fifo/il_S1_summarysummarycalc_P28
+mkfifo fifo/il_S1_summarycalc_P28
+mkfifo fifo/il_S1_summarypltcalc_P28
+mkfifo fifo/il_S1_pltcalc_P28
+mkfifo fifo/il_S1_summaryaalcalc_P28
+
+mkfifo fifo/il_P29
+
+mkfifo fifo/il_S1_summary_P29
+mkfifo fifo/il_S1_summaryeltcalc_P29
+mkfifo fifo/il_S1_eltcalc_P29
+mkfifo fifo/il_S1_summarysummarycalc_P29
+mkfifo fifo/il_S1_summarycalc_P29
+mkfifo fifo/il_S1_summarypltcalc_P29
+mkfifo fifo/il_S1_pltcalc_P29
+mkfifo fifo/il_S1_summaryaalcalc_P29
+
+mkfifo fifo/il_P30
+
+mkfifo fifo/il_S1_summary_P30
+mkfifo fifo/il_S1_summaryeltcalc_P30
+mkfifo fifo/il_S1_eltcalc_P30
+mkfifo fifo/il_S1_summarysummarycalc_P30
+mkfifo fifo/il_S1_summarycalc_P30
+mkfifo fifo/il_S1_summarypltcalc_P30
+mkfifo fifo/il_S1_pltcalc_P30
+mkfifo fifo/il_S1_summaryaalcalc_P30
+
+mkfifo fifo/il_P31
+
+mkfifo fifo/il_S1_summary_P31
+mkfifo fifo/il_S1_summaryeltcalc_P31
+mkfifo fifo/il_S1_eltcalc_P31
+mkfifo fifo/il_S1_summarysummarycalc_P31
+mkfifo fifo/il_S1_summarycalc_P31
+mkfifo fifo/il_S1_summarypltcalc_P31
+mkfifo fifo/il_S1_pltcalc_P31
+mkfifo fifo/il_S1_summaryaalcalc_P31
+
+mkfifo fifo/il_P32
+
+mkfifo fifo/il_S1_summary_P32
+mkfifo fifo/il_S1_summaryeltcalc_P32
+mkfifo fifo/il_S1_eltcalc_P32
+mkfifo fifo/il_S1_summarysummarycalc_P32
+mkfifo fifo/il_S1_summarycalc_P32
+mkfifo fifo/il_S1_summarypltcalc_P32
+mkfifo fifo/il_S1_pltcalc_P32
+mkfifo fifo/il_S1_summaryaalcalc_P32
+
+mkfifo fifo/il_P33
+
+mkfifo fifo/il_S1_summary_P33
+mkfifo fifo/il_S1_summaryeltcalc_P33
+mkfifo fifo/il_S1_eltcalc_P33
+mkfifo fifo/il_S1_summarysummarycalc_P33
+mkfifo fifo/il_S1_summarycalc_P33
+mkfifo fifo/il_S1_summarypltcalc_P33
+mkfifo fifo/il_S1_pltcalc_P33
+mkfifo fifo/il_S1_summaryaalcalc_P33
+
+mkfifo fifo/il_P34
+
+mkfifo fifo/il_S1_summary_P34
+mkfifo fifo/il_S1_summaryeltcalc_P34
+mkfifo fifo/il_S1_eltcalc_P34
+mkfifo fifo/il_S1_summarysummarycalc_P34
+mkfifo fifo/il_S1_summarycalc_P34
+mkfifo fifo/il_S1_summarypltcalc_P34
+mkfifo fifo/il_S1_pltcalc_P34
+mkfifo fifo/il_S1_summaryaalcalc_P34
+
+mkfifo fifo/il_P35
+
+mkfifo fifo/il_S1_summary_P35
+mkfifo fifo/il_S1_summaryeltcalc_P35
+mkfifo fifo/il_S1_eltcalc_P35
+mkfifo fifo/il_S1_summarysummarycalc_P35
+mkfifo fifo/il_S1_summarycalc_P35
+mkfifo fifo/il_S1_summarypltcalc_P35
+mkfifo fifo/il_S1_pltcalc_P35
+mkfifo fifo/il_S1_summaryaalcalc_P35
+
+mkfifo fifo/il_P36
+
+mkfifo fifo/il_S1_summary_P36
+mkfifo fifo/il_S1_summaryeltcalc_P36
+mkfifo fifo/il_S1_eltcalc_P36
+mkfifo fifo/il_S1_summarysummarycalc_P36
+mkfifo fifo/il_S1_summarycalc_P36
+mkfifo fifo/il_S1_summarypltcalc_P36
+mkfifo fifo/il_S1_pltcalc_P36
+mkfifo fifo/il_S1_summaryaalcalc_P36
+
+mkfifo fifo/il_P37
+
+mkfifo fifo/il_S1_summary_P37
+mkfifo fifo/il_S1_summaryeltcalc_P37
+mkfifo fifo/il_S1_eltcalc_P37
+mkfifo fifo/il_S1_summarysummarycalc_P37
+mkfifo fifo/il_S1_summarycalc_P37
+mkfifo fifo/il_S1_summarypltcalc_P37
+mkfifo fifo/il_S1_pltcalc_P37
+mkfifo fifo/il_S1_summaryaalcalc_P37
+
+mkfifo fifo/il_P38
+
+mkfifo fifo/il_S1_summary_P38
+mkfifo fifo/il_S1_summaryeltcalc_P38
+mkfifo fifo/il_S1_eltcalc_P38
+mkfifo fifo/il_S1_summarysummarycalc_P38
+mkfifo fifo/il_S1_summarycalc_P38
+mkfifo fifo/il_S1_summarypltcalc_P38
+mkfifo fifo/il_S1_pltcalc_P38
+mkfifo fifo/il_S1_summaryaalcalc_P38
+
+mkfifo fifo/il_P39
+
+mkfifo fifo/il_S1_summary_P39
+mkfifo fifo/il_S1_summaryeltcalc_P39
+mkfifo fifo/il_S1_eltcalc_P39
+mkfifo fifo/il_S1_summarysummarycalc_P39
+mkfifo fifo/il_S1_summarycalc_P39
+mkfifo fifo/il_S1_summarypltcalc_P39
+mkfifo fifo/il_S1_pltcalc_P39
+mkfifo fifo/il_S1_summaryaalcalc_P39
+
+mkfifo fifo/il_P40
+
+mkfifo fifo/il_S1_summary_P40
+mkfifo fifo/il_S1_summaryeltcalc_P40
+mkfifo fifo/il_S1_eltcalc_P40
+mkfifo fifo/il_S1_summarysummarycalc_P40
+mkfifo fifo/il_S1_summarycalc_P40
+mkfifo fifo/il_S1_summarypltcalc_P40
+mkfifo fifo/il_S1_pltcalc_P40
+mkfifo fifo/il_S1_summaryaalcalc_P40
+
+mkdir work/il_S1_summaryleccalc
+mkdir work/il_S1_aalcalc
+
+# --- Do insured loss computes ---
+
+eltcalc < fifo/il_S1_summaryeltcalc_P1 > work/kat/il_S1_eltcalc_P1 & pid1=$!
+summarycalctocsv < fifo/il_S1_summarysummarycalc_P1 > work/kat/il_S1_summarycalc_P1 & pid2=$!
+pltcalc < fifo/il_S1_summarypltcalc_P1 > work/kat/il_S1_pltcalc_P1 & pid3=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P1 > work/il_S1_aalcalc/P1.bin & pid4=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P2 > work/kat/il_S1_eltcalc_P2 & pid5=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P2 > work/kat/il_S1_summarycalc_P2 & pid6=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P2 > work/kat/il_S1_pltcalc_P2 & pid7=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P2 > work/il_S1_aalcalc/P2.bin & pid8=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P3 > work/kat/il_S1_eltcalc_P3 & pid9=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P3 > work/kat/il_S1_summarycalc_P3 & pid10=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P3 > work/kat/il_S1_pltcalc_P3 & pid11=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P3 > work/il_S1_aalcalc/P3.bin & pid12=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P4 > work/kat/il_S1_eltcalc_P4 & pid13=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P4 > work/kat/il_S1_summarycalc_P4 & pid14=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P4 > work/kat/il_S1_pltcalc_P4 & pid15=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P4 > work/il_S1_aalcalc/P4.bin & pid16=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P5 > work/kat/il_S1_eltcalc_P5 & pid17=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P5 > work/kat/il_S1_summarycalc_P5 & pid18=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P5 > work/kat/il_S1_pltcalc_P5 & pid19=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P5 > work/il_S1_aalcalc/P5.bin & pid20=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P6 > work/kat/il_S1_eltcalc_P6 & pid21=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P6 > work/kat/il_S1_summarycalc_P6 & pid22=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P6 > work/kat/il_S1_pltcalc_P6 & pid23=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P6 > work/il_S1_aalcalc/P6.bin & pid24=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P7 > work/kat/il_S1_eltcalc_P7 & pid25=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P7 > work/kat/il_S1_summarycalc_P7 & pid26=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P7 > work/kat/il_S1_pltcalc_P7 & pid27=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P7 > work/il_S1_aalcalc/P7.bin & pid28=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P8 > work/kat/il_S1_eltcalc_P8 & pid29=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P8 > work/kat/il_S1_summarycalc_P8 & pid30=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P8 > work/kat/il_S1_pltcalc_P8 & pid31=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P8 > work/il_S1_aalcalc/P8.bin & pid32=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P9 > work/kat/il_S1_eltcalc_P9 & pid33=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P9 > work/kat/il_S1_summarycalc_P9 & pid34=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P9 > work/kat/il_S1_pltcalc_P9 & pid35=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P9 > work/il_S1_aalcalc/P9.bin & pid36=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P10 > work/kat/il_S1_eltcalc_P10 & pid37=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P10 > work/kat/il_S1_summarycalc_P10 & pid38=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P10 > work/kat/il_S1_pltcalc_P10 & pid39=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P10 > work/il_S1_aalcalc/P10.bin & pid40=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P11 > work/kat/il_S1_eltcalc_P11 & pid41=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P11 > work/kat/il_S1_summarycalc_P11 & pid42=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P11 > work/kat/il_S1_pltcalc_P11 & pid43=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P11 > work/il_S1_aalcalc/P11.bin & pid44=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P12 > work/kat/il_S1_eltcalc_P12 & pid45=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P12 > work/kat/il_S1_summarycalc_P12 & pid46=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P12 > work/kat/il_S1_pltcalc_P12 & pid47=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P12 > work/il_S1_aalcalc/P12.bin & pid48=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P13 > work/kat/il_S1_eltcalc_P13 & pid49=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P13 > work/kat/il_S1_summarycalc_P13 & pid50=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P13 > work/kat/il_S1_pltcalc_P13 & pid51=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P13 > work/il_S1_aalcalc/P13.bin & pid52=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P14 > work/kat/il_S1_eltcalc_P14 & pid53=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P14 > work/kat/il_S1_summarycalc_P14 & pid54=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P14 > work/kat/il_S1_pltcalc_P14 & pid55=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P14 > work/il_S1_aalcalc/P14.bin & pid56=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P15 > work/kat/il_S1_eltcalc_P15 & pid57=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P15 > work/kat/il_S1_summarycalc_P15 & pid58=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P15 > work/kat/il_S1_pltcalc_P15 & pid59=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P15 > work/il_S1_aalcalc/P15.bin & pid60=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P16 > work/kat/il_S1_eltcalc_P16 & pid61=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P16 > work/kat/il_S1_summarycalc_P16 & pid62=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P16 > work/kat/il_S1_pltcalc_P16 & pid63=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P16 > work/il_S1_aalcalc/P16.bin & pid64=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P17 > work/kat/il_S1_eltcalc_P17 & pid65=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P17 > work/kat/il_S1_summarycalc_P17 & pid66=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P17 > work/kat/il_S1_pltcalc_P17 & pid67=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P17 > work/il_S1_aalcalc/P17.bin & pid68=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P18 > work/kat/il_S1_eltcalc_P18 & pid69=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P18 > work/kat/il_S1_summarycalc_P18 & pid70=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P18 > work/kat/il_S1_pltcalc_P18 & pid71=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P18 > work/il_S1_aalcalc/P18.bin & pid72=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P19 > work/kat/il_S1_eltcalc_P19 & pid73=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P19 > work/kat/il_S1_summarycalc_P19 & pid74=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P19 > work/kat/il_S1_pltcalc_P19 & pid75=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P19 > work/il_S1_aalcalc/P19.bin & pid76=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P20 > work/kat/il_S1_eltcalc_P20 & pid77=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P20 > work/kat/il_S1_summarycalc_P20 & pid78=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P20 > work/kat/il_S1_pltcalc_P20 & pid79=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P20 > work/il_S1_aalcalc/P20.bin & pid80=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P21 > work/kat/il_S1_eltcalc_P21 & pid81=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P21 > work/kat/il_S1_summarycalc_P21 & pid82=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P21 > work/kat/il_S1_pltcalc_P21 & pid83=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P21 > work/il_S1_aalcalc/P21.bin & pid84=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P22 > work/kat/il_S1_eltcalc_P22 & pid85=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P22 > work/kat/il_S1_summarycalc_P22 & pid86=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P22 > work/kat/il_S1_pltcalc_P22 & pid87=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P22 > work/il_S1_aalcalc/P22.bin & pid88=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P23 > work/kat/il_S1_eltcalc_P23 & pid89=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P23 > work/kat/il_S1_summarycalc_P23 & pid90=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P23 > work/kat/il_S1_pltcalc_P23 & pid91=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P23 > work/il_S1_aalcalc/P23.bin & pid92=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P24 > work/kat/il_S1_eltcalc_P24 & pid93=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P24 > work/kat/il_S1_summarycalc_P24 & pid94=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P24 > work/kat/il_S1_pltcalc_P24 & pid95=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P24 > work/il_S1_aalcalc/P24.bin & pid96=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P25 > work/kat/il_S1_eltcalc_P25 & pid97=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P25 > work/kat/il_S1_summarycalc_P25 & pid98=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P25 > work/kat/il_S1_pltcalc_P25 & pid99=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P25 > work/il_S1_aalcalc/P25.bin & pid100=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P26 > work/kat/il_S1_eltcalc_P26 & pid101=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P26 > work/kat/il_S1_summarycalc_P26 & pid102=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P26 > work/kat/il_S1_pltcalc_P26 & pid103=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P26 > work/il_S1_aalcalc/P26.bin & pid104=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P27 > work/kat/il_S1_eltcalc_P27 & pid105=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P27 > work/kat/il_S1_summarycalc_P27 & pid106=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P27 > work/kat/il_S1_pltcalc_P27 & pid107=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P27 > work/il_S1_aalcalc/P27.bin & pid108=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P28 > work/kat/il_S1_eltcalc_P28 & pid109=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P28 > work/kat/il_S1_summarycalc_P28 & pid110=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P28 > work/kat/il_S1_pltcalc_P28 & pid111=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P28 > work/il_S1_aalcalc/P28.bin & pid112=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P29 > work/kat/il_S1_eltcalc_P29 & pid113=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P29 > work/kat/il_S1_summarycalc_P29 & pid114=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P29 > work/kat/il_S1_pltcalc_P29 & pid115=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P29 > work/il_S1_aalcalc/P29.bin & pid116=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P30 > work/kat/il_S1_eltcalc_P30 & pid117=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P30 > work/kat/il_S1_summarycalc_P30 & pid118=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P30 > work/kat/il_S1_pltcalc_P30 & pid119=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P30 > work/il_S1_aalcalc/P30.bin & pid120=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P31 > work/kat/il_S1_eltcalc_P31 & pid121=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P31 > work/kat/il_S1_summarycalc_P31 & pid122=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P31 > work/kat/il_S1_pltcalc_P31 & pid123=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P31 > work/il_S1_aalcalc/P31.bin & pid124=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P32 > work/kat/il_S1_eltcalc_P32 & pid125=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P32 > work/kat/il_S1_summarycalc_P32 & pid126=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P32 > work/kat/il_S1_pltcalc_P32 & pid127=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P32 > work/il_S1_aalcalc/P32.bin & pid128=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P33 > work/kat/il_S1_eltcalc_P33 & pid129=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P33 > work/kat/il_S1_summarycalc_P33 & pid130=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P33 > work/kat/il_S1_pltcalc_P33 & pid131=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P33 > work/il_S1_aalcalc/P33.bin & pid132=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P34 > work/kat/il_S1_eltcalc_P34 & pid133=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P34 > work/kat/il_S1_summarycalc_P34 & pid134=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P34 > work/kat/il_S1_pltcalc_P34 & pid135=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P34 > work/il_S1_aalcalc/P34.bin & pid136=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P35 > work/kat/il_S1_eltcalc_P35 & pid137=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P35 > work/kat/il_S1_summarycalc_P35 & pid138=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P35 > work/kat/il_S1_pltcalc_P35 & pid139=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P35 > work/il_S1_aalcalc/P35.bin & pid140=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P36 > work/kat/il_S1_eltcalc_P36 & pid141=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P36 > work/kat/il_S1_summarycalc_P36 & pid142=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P36 > work/kat/il_S1_pltcalc_P36 & pid143=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P36 > work/il_S1_aalcalc/P36.bin & pid144=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P37 > work/kat/il_S1_eltcalc_P37 & pid145=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P37 > work/kat/il_S1_summarycalc_P37 & pid146=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P37 > work/kat/il_S1_pltcalc_P37 & pid147=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P37 > work/il_S1_aalcalc/P37.bin & pid148=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P38 > work/kat/il_S1_eltcalc_P38 & pid149=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P38 > work/kat/il_S1_summarycalc_P38 & pid150=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P38 > work/kat/il_S1_pltcalc_P38 & pid151=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P38 > work/il_S1_aalcalc/P38.bin & pid152=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P39 > work/kat/il_S1_eltcalc_P39 & pid153=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P39 > work/kat/il_S1_summarycalc_P39 & pid154=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P39 > work/kat/il_S1_pltcalc_P39 & pid155=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P39 > work/il_S1_aalcalc/P39.bin & pid156=$!
+
+eltcalc -s < fifo/il_S1_summaryeltcalc_P40 > work/kat/il_S1_eltcalc_P40 & pid157=$!
+summarycalctocsv -s < fifo/il_S1_summarysummarycalc_P40 > work/kat/il_S1_summarycalc_P40 & pid158=$!
+pltcalc -s < fifo/il_S1_summarypltcalc_P40 > work/kat/il_S1_pltcalc_P40 & pid159=$!
+aalcalc < fifo/il_S1_summaryaalcalc_P40 > work/il_S1_aalcalc/P40.bin & pid160=$!
+
+tee < fifo/il_S1_summary_P1 fifo/il_S1_summaryeltcalc_P1 fifo/il_S1_summarypltcalc_P1 fifo/il_S1_summarysummarycalc_P1 fifo/il_S1_summaryaalcalc_P1 work/il_S1_summaryleccalc/P1.bin > /dev/null & pid161=$!
+tee < fifo/il_S1_summary_P2 fifo/il_S1_summaryeltcalc_P2 fifo/il_S1_summarypltcalc_P2 fifo/il_S1_summarysummarycalc_P2 fifo/il_S1_summaryaalcalc_P2 work/il_S1_summaryleccalc/P2.bin > /dev/null & pid162=$!
+tee < fifo/il_S1_summary_P3 fifo/il_S1_summaryeltcalc_P3 fifo/il_S1_summarypltcalc_P3 fifo/il_S1_summarysummarycalc_P3 fifo/il_S1_summaryaalcalc_P3 work/il_S1_summaryleccalc/P3.bin > /dev/null & pid163=$!
+tee < fifo/il_S1_summary_P4 fifo/il_S1_summaryeltcalc_P4 fifo/il_S1_summarypltcalc_P4 fifo/il_S1_summarysummarycalc_P4 fifo/il_S1_summaryaalcalc_P4 work/il_S1_summaryleccalc/P4.bin > /dev/null & pid164=$!
+tee < fifo/il_S1_summary_P5 fifo/il_S1_summaryeltcalc_P5 fifo/il_S1_summarypltcalc_P5 fifo/il_S1_summarysummarycalc_P5 fifo/il_S1_summaryaalcalc_P5 work/il_S1_summaryleccalc/P5.bin > /dev/null & pid165=$!
+tee < fifo/il_S1_summary_P6 fifo/il_S1_summaryeltcalc_P6 fifo/il_S1_summarypltcalc_P6 fifo/il_S1_summarysummarycalc_P6 fifo/il_S1_summaryaalcalc_P6 work/il_S1_summaryleccalc/P6.bin > /dev/null & pid166=$!
+tee < fifo/il_S1_summary_P7 fifo/il_S1_summaryeltcalc_P7 fifo/il_S1_summarypltcalc_P7 fifo/il_S1_summarysummarycalc_P7 fifo/il_S1_summaryaalcalc_P7 work/il_S1_summaryleccalc/P7.bin > /dev/null & pid167=$!
+tee < fifo/il_S1_summary_P8 fifo/il_S1_summaryeltcalc_P8 fifo/il_S1_summarypltcalc_P8 fifo/il_S1_summarysummarycalc_P8 fifo/il_S1_summaryaalcalc_P8 work/il_S1_summaryleccalc/P8.bin > /dev/null & pid168=$!
+tee < fifo/il_S1_summary_P9 fifo/il_S1_summaryeltcalc_P9 fifo/il_S1_summarypltcalc_P9 fifo/il_S1_summarysummarycalc_P9 fifo/il_S1_summaryaalcalc_P9 work/il_S1_summaryleccalc/P9.bin > /dev/null & pid169=$!
+tee < fifo/il_S1_summary_P10 fifo/il_S1_summaryeltcalc_P10 fifo/il_S1_summarypltcalc_P10 fifo/il_S1_summarysummarycalc_P10 fifo/il_S1_summaryaalcalc_P10 work/il_S1_summaryleccalc/P10.bin > /dev/null & pid170=$!
+tee < fifo/il_S1_summary_P11 fifo/il_S1_summaryeltcalc_P11 fifo/il_S1_summarypltcalc_P11 fifo/il_S1_summarysummarycalc_P11 fifo/il_S1_summaryaalcalc_P11 work/il_S1_summaryleccalc/P11.bin > /dev/null & pid171=$!
+tee < fifo/il_S1_summary_P12 fifo/il_S1_summaryeltcalc_P12 fifo/il_S1_summarypltcalc_P12 fifo/il_S1_summarysummarycalc_P12 fifo/il_S1_summaryaalcalc_P12 work/il_S1_summaryleccalc/P12.bin > /dev/null & pid172=$!
+tee < fifo/il_S1_summary_P13 fifo/il_S1_summaryeltcalc_P13 fifo/il_S1_summarypltcalc_P13 fifo/il_S1_summarysummarycalc_P13 fifo/il_S1_summaryaalcalc_P13 work/il_S1_summaryleccalc/P13.bin > /dev/null & pid173=$!
+tee < fifo/il_S1_summary_P14 fifo/il_S1_summaryeltcalc_P14 fifo/il_S1_summarypltcalc_P14 fifo/il_S1_summarysummarycalc_P14 fifo/il_S1_summaryaalcalc_P14 work/il_S1_summaryleccalc/P14.bin > /dev/null & pid174=$!
+tee < fifo/il_S1_summary_P15 fifo/il_S1_summaryeltcalc_P15 fifo/il_S1_summarypltcalc_P15 fifo/il_S1_summarysummarycalc_P15 fifo/il_S1_summaryaalcalc_P15 work/il_S1_summaryleccalc/P15.bin > /dev/null & pid175=$!
+tee < fifo/il_S1_summary_P16 fifo/il_S1_summaryeltcalc_P16 fifo/il_S1_summarypltcalc_P16 fifo/il_S1_summarysummarycalc_P16 fifo/il_S1_summaryaalcalc_P16 work/il_S1_summaryleccalc/P16.bin > /dev/null & pid176=$!
+tee < fifo/il_S1_summary_P17 fifo/il_S1_summaryeltcalc_P17 fifo/il_S1_summarypltcalc_P17 fifo/il_S1_summarysummarycalc_P17 fifo/il_S1_summaryaalcalc_P17 work/il_S1_summaryleccalc/P17.bin > /dev/null & pid177=$!
+tee < fifo/il_S1_summary_P18 fifo/il_S1_summaryeltcalc_P18 fifo/il_S1_summarypltcalc_P18 fifo/il_S1_summarysummarycalc_P18 fifo/il_S1_summaryaalcalc_P18 work/il_S1_summaryleccalc/P18.bin > /dev/null & pid178=$!
+tee < fifo/il_S1_summary_P19 fifo/il_S1_summaryeltcalc_P19 fifo/il_S1_summarypltcalc_P19 fifo/il_S1_summarysummarycalc_P19 fifo/il_S1_summaryaalcalc_P19 work/il_S1_summaryleccalc/P19.bin > /dev/null & pid179=$!
+tee < fifo/il_S1_summary_P20 fifo/il_S1_summaryeltcalc_P20 fifo/il_S1_summarypltcalc_P20 fifo/il_S1_summarysummarycalc_P20 fifo/il_S1_summaryaalcalc_P20 work/il_S1_summaryleccalc/P20.bin > /dev/null & pid180=$!
+tee < fifo/il_S1_summary_P21 fifo/il_S1_summaryeltcalc_P21 fifo/il_S1_summarypltcalc_P21 fifo/il_S1_summarysummarycalc_P21 fifo/il_S1_summaryaalcalc_P21 work/il_S1_summaryleccalc/P21.bin > /dev/null & pid181=$!
+tee < fifo/il_S1_summary_P22 fifo/il_S1_summaryeltcalc_P22 fifo/il_S1_summarypltcalc_P22 fifo/il_S1_summarysummarycalc_P22 fifo/il_S1_summaryaalcalc_P22 work/il_S1_summaryleccalc/P22.bin > /dev/null & pid182=$!
+tee < fifo/il_S1_summary_P23 fifo/il_S1_summaryeltcalc_P23 fifo/il_S1_summarypltcalc_P23 fifo/il_S1_summarysummarycalc_P23 fifo/il_S1_summaryaalcalc_P23 work/il_S1_summaryleccalc/P23.bin > /dev/null & pid183=$!
+tee < fifo/il_S1_summary_P24 fifo/il_S1_summaryeltcalc_P24 fifo/il_S1_summarypltcalc_P24 fifo/il_S1_summarysummarycalc_P24 fifo/il_S1_summaryaalcalc_P24 work/il_S1_summaryleccalc/P24.bin > /dev/null & pid184=$!
+tee < fifo/il_S1_summary_P25 fifo/il_S1_summaryeltcalc_P25 fifo/il_S1_summarypltcalc_P25 fifo/il_S1_summarysummarycalc_P25 fifo/il_S1_summaryaalcalc_P25 work/il_S1_summaryleccalc/P25.bin > /dev/null & pid185=$!
+tee < fifo/il_S1_summary_P26 fifo/il_S1_summaryeltcalc_P26 fifo/il_S1_summarypltcalc_P26 fifo/il_S1_summarysummarycalc_P26 fifo/il_S1_summaryaalcalc_P26 work/il_S1_summaryleccalc/P26.bin > /dev/null & pid186=$!
+tee < fifo/il_S1_summary_P27 fifo/il_S1_summaryeltcalc_P27 fifo/il_S1_summarypltcalc_P27 fifo/il_S1_summarysummarycalc_P27 fifo/il_S1_summaryaalcalc_P27 work/il_S1_summaryleccalc/P27.bin > /dev/null & pid187=$!
+tee < fifo/il_S1_summary_P28 fifo/il_S1_summaryeltcalc_P28 fifo/il_S1_summarypltcalc_P28 fifo/il_S1_summarysummarycalc_P28 fifo/il_S1_summaryaalcalc_P28 work/il_S1_summaryleccalc/P28.bin > /dev/null & pid188=$!
+tee < fifo/il_S1_summary_P29 fifo/il_S1_summaryeltcalc_P29 fifo/il_S1_summarypltcalc_P29 fifo/il_S1_summarysummarycalc_P29 fifo/il_S1_summaryaalcalc_P29 work/il_S1_summaryleccalc/P29.bin > /dev/null & pid189=$!
+tee < fifo/il_S1_summary_P30 fifo/il_S1_summaryeltcalc_P30 fifo/il_S1_summarypltcalc_P30 fifo/il_S1_summarysummarycalc_P30 fifo/il_S1_summaryaalcalc_P30 work/il_S1_summaryleccalc/P30.bin > /dev/null & pid190=$!
+tee < fifo/il_S1_summary_P31 fifo/il_S1_summaryeltcalc_P31 fifo/il_S1_summarypltcalc_P31 fifo/il_S1_summarysummarycalc_P31 fifo/il_S1_summaryaalcalc_P31 work/il_S1_summaryleccalc/P31.bin > /dev/null & pid191=$!
+tee < fifo/il_S1_summary_P32 fifo/il_S1_summaryeltcalc_P32 fifo/il_S1_summarypltcalc_P32 fifo/il_S1_summarysummarycalc_P32 fifo/il_S1_summaryaalcalc_P32 work/il_S1_summaryleccalc/P32.bin > /dev/null & pid192=$!
+tee < fifo/il_S1_summary_P33 fifo/il_S1_summaryeltcalc_P33 fifo/il_S1_summarypltcalc_P33 fifo/il_S1_summarysummarycalc_P33 fifo/il_S1_summaryaalcalc_P33 work/il_S1_summaryleccalc/P33.bin > /dev/null & pid193=$!
+tee < fifo/il_S1_summary_P34 fifo/il_S1_summaryeltcalc_P34 fifo/il_S1_summarypltcalc_P34 fifo/il_S1_summarysummarycalc_P34 fifo/il_S1_summaryaalcalc_P34 work/il_S1_summaryleccalc/P34.bin > /dev/null & pid194=$!
+tee < fifo/il_S1_summary_P35 fifo/il_S1_summaryeltcalc_P35 fifo/il_S1_summarypltcalc_P35 fifo/il_S1_summarysummarycalc_P35 fifo/il_S1_summaryaalcalc_P35 work/il_S1_summaryleccalc/P35.bin > /dev/null & pid195=$!
+tee < fifo/il_S1_summary_P36 fifo/il_S1_summaryeltcalc_P36 fifo/il_S1_summarypltcalc_P36 fifo/il_S1_summarysummarycalc_P36 fifo/il_S1_summaryaalcalc_P36 work/il_S1_summaryleccalc/P36.bin > /dev/null & pid196=$!
+tee < fifo/il_S1_summary_P37 fifo/il_S1_summaryeltcalc_P37 fifo/il_S1_summarypltcalc_P37 fifo/il_S1_summarysummarycalc_P37 fifo/il_S1_summaryaalcalc_P37 work/il_S1_summaryleccalc/P37.bin > /dev/null & pid197=$!
+tee < fifo/il_S1_summary_P38 fifo/il_S1_summaryeltcalc_P38 fifo/il_S1_summarypltcalc_P38 fifo/il_S1_summarysummarycalc_P38 fifo/il_S1_summaryaalcalc_P38 work/il_S1_summaryleccalc/P38.bin > /dev/null & pid198=$!
+tee < fifo/il_S1_summary_P39 fifo/il_S1_summaryeltcalc_P39 fifo/il_S1_summarypltcalc_P39 fifo/il_S1_summarysummarycalc_P39 fifo/il_S1_summaryaalcalc_P39 work/il_S1_summaryleccalc/P39.bin > /dev/null & pid199=$!
+tee < fifo/il_S1_summary_P40 fifo/il_S1_summaryeltcalc_P40 fifo/il_S1_summarypltcalc_P40 fifo/il_S1_summarysummarycalc_P40 fifo/il_S1_summaryaalcalc_P40 work/il_S1_summaryleccalc/P40.bin > /dev/null & pid200=$!
+summarycalc -f -1 fifo/il_S1_summary_P1 < fifo/il_P1 &
+summarycalc -f -1 fifo/il_S1_summary_P2 < fifo/il_P2 &
+summarycalc -f -1 fifo/il_S1_summary_P3 < fifo/il_P3 &
+summarycalc -f -1 fifo/il_S1_summary_P4 < fifo/il_P4 &
+summarycalc -f -1 fifo/il_S1_summary_P5 < fifo/il_P5 &
+summarycalc -f -1 fifo/il_S1_summary_P6 < fifo/il_P6 &
+summarycalc -f -1 fifo/il_S1_summary_P7 < fifo/il_P7 &
+summarycalc -f -1 fifo/il_S1_summary_P8 < fifo/il_P8 &
+summarycalc -f -1 fifo/il_S1_summary_P9 < fifo/il_P9 &
+summarycalc -f -1 fifo/il_S1_summary_P10 < fifo/il_P10 &
+summarycalc -f -1 fifo/il_S1_summary_P11 < fifo/il_P11 &
+summarycalc -f -1 fifo/il_S1_summary_P12 < fifo/il_P12 &
+summarycalc -f -1 fifo/il_S1_summary_P13 < fifo/il_P13 &
+summarycalc -f -1 fifo/il_S1_summary_P14 < fifo/il_P14 &
+summarycalc -f -1 fifo/il_S1_summary_P15 < fifo/il_P15 &
+summarycalc -f -1 fifo/il_S1_summary_P16 < fifo/il_P16 &
+summarycalc -f -1 fifo/il_S1_summary_P17 < fifo/il_P17 &
+summarycalc -f -1 fifo/il_S1_summary_P18 < fifo/il_P18 &
+summarycalc -f -1 fifo/il_S1_summary_P19 < fifo/il_P19 &
+summarycalc -f -1 fifo/il_S1_summary_P20 < fifo/il_P20 &
+summarycalc -f -1 fifo/il_S1_summary_P21 < fifo/il_P21 &
+summarycalc -f -1 fifo/il_S1_summary_P22 < fifo/il_P22 &
+summarycalc -f -1 fifo/il_S1_summary_P23 < fifo/il_P23 &
+summarycalc -f -1 fifo/il_S1_summary_P24 < fifo/il_P24 &
+summarycalc -f -1 fifo/il_S1_summary_P25 < fifo/il_P25 &
+summarycalc -f -1 fifo/il_S1_summary_P26 < fifo/il_P26 &
+summarycalc -f -1 fifo/il_S1_summary_P27 < fifo/il_P27 &
+summarycalc -f -1 fifo/il_S1_summary_P28 < fifo/il_P28 &
+summarycalc -f -1 fifo/il_S1_summary_P29 < fifo/il_P29 &
+summarycalc -f -1 fifo/il_S1_summary_P30 < fifo/il_P30 &
+summarycalc -f -1 fifo/il_S1_summary_P31 < fifo/il_P31 &
+summarycalc -f -1 fifo/il_S1_summary_P32 < fifo/il_P32 &
+summarycalc -f -1 fifo/il_S1_summary_P33 < fifo/il_P33 &
+summarycalc -f -1 fifo/il_S1_summary_P34 < fifo/il_P34 &
+summarycalc -f -1 fifo/il_S1_summary_P35 < fifo/il_P35 &
+summarycalc -f -1 fifo/il_S1_summary_P36 < fifo/il_P36 &
+summarycalc -f -1 fifo/il_S1_summary_P37 < fifo/il_P37 &
+summarycalc -f -1 fifo/il_S1_summary_P38 < fifo/il_P38 &
+summarycalc -f -1 fifo/il_S1_summary_P39 < fifo/il_P39 &
+summarycalc -f -1 fifo/il_S1_summary_P40 < fifo/il_P40 &
+
+# --- Do ground up loss  computes ---
+
+eltcalc < fifo/gul_S1_summaryeltcalc_P1 > work/kat/gul_S1_eltcalc_P1 & pid201=$!
+summarycalctocsv < fifo/gul_S1_summarysummarycalc_P1 > work/kat/gul_S1_summarycalc_P1 & pid202=$!
+pltcalc < fifo/gul_S1_summarypltcalc_P1 > work/kat/gul_S1_pltcalc_P1 & pid203=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P1 > work/gul_S1_aalcalc/P1.bin & pid204=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P2 > work/kat/gul_S1_eltcalc_P2 & pid205=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P2 > work/kat/gul_S1_summarycalc_P2 & pid206=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P2 > work/kat/gul_S1_pltcalc_P2 & pid207=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P2 > work/gul_S1_aalcalc/P2.bin & pid208=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P3 > work/kat/gul_S1_eltcalc_P3 & pid209=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P3 > work/kat/gul_S1_summarycalc_P3 & pid210=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P3 > work/kat/gul_S1_pltcalc_P3 & pid211=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P3 > work/gul_S1_aalcalc/P3.bin & pid212=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P4 > work/kat/gul_S1_eltcalc_P4 & pid213=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P4 > work/kat/gul_S1_summarycalc_P4 & pid214=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P4 > work/kat/gul_S1_pltcalc_P4 & pid215=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P4 > work/gul_S1_aalcalc/P4.bin & pid216=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P5 > work/kat/gul_S1_eltcalc_P5 & pid217=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P5 > work/kat/gul_S1_summarycalc_P5 & pid218=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P5 > work/kat/gul_S1_pltcalc_P5 & pid219=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P5 > work/gul_S1_aalcalc/P5.bin & pid220=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P6 > work/kat/gul_S1_eltcalc_P6 & pid221=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P6 > work/kat/gul_S1_summarycalc_P6 & pid222=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P6 > work/kat/gul_S1_pltcalc_P6 & pid223=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P6 > work/gul_S1_aalcalc/P6.bin & pid224=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P7 > work/kat/gul_S1_eltcalc_P7 & pid225=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P7 > work/kat/gul_S1_summarycalc_P7 & pid226=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P7 > work/kat/gul_S1_pltcalc_P7 & pid227=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P7 > work/gul_S1_aalcalc/P7.bin & pid228=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P8 > work/kat/gul_S1_eltcalc_P8 & pid229=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P8 > work/kat/gul_S1_summarycalc_P8 & pid230=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P8 > work/kat/gul_S1_pltcalc_P8 & pid231=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P8 > work/gul_S1_aalcalc/P8.bin & pid232=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P9 > work/kat/gul_S1_eltcalc_P9 & pid233=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P9 > work/kat/gul_S1_summarycalc_P9 & pid234=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P9 > work/kat/gul_S1_pltcalc_P9 & pid235=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P9 > work/gul_S1_aalcalc/P9.bin & pid236=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P10 > work/kat/gul_S1_eltcalc_P10 & pid237=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P10 > work/kat/gul_S1_summarycalc_P10 & pid238=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P10 > work/kat/gul_S1_pltcalc_P10 & pid239=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P10 > work/gul_S1_aalcalc/P10.bin & pid240=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P11 > work/kat/gul_S1_eltcalc_P11 & pid241=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P11 > work/kat/gul_S1_summarycalc_P11 & pid242=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P11 > work/kat/gul_S1_pltcalc_P11 & pid243=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P11 > work/gul_S1_aalcalc/P11.bin & pid244=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P12 > work/kat/gul_S1_eltcalc_P12 & pid245=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P12 > work/kat/gul_S1_summarycalc_P12 & pid246=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P12 > work/kat/gul_S1_pltcalc_P12 & pid247=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P12 > work/gul_S1_aalcalc/P12.bin & pid248=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P13 > work/kat/gul_S1_eltcalc_P13 & pid249=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P13 > work/kat/gul_S1_summarycalc_P13 & pid250=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P13 > work/kat/gul_S1_pltcalc_P13 & pid251=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P13 > work/gul_S1_aalcalc/P13.bin & pid252=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P14 > work/kat/gul_S1_eltcalc_P14 & pid253=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P14 > work/kat/gul_S1_summarycalc_P14 & pid254=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P14 > work/kat/gul_S1_pltcalc_P14 & pid255=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P14 > work/gul_S1_aalcalc/P14.bin & pid256=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P15 > work/kat/gul_S1_eltcalc_P15 & pid257=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P15 > work/kat/gul_S1_summarycalc_P15 & pid258=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P15 > work/kat/gul_S1_pltcalc_P15 & pid259=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P15 > work/gul_S1_aalcalc/P15.bin & pid260=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P16 > work/kat/gul_S1_eltcalc_P16 & pid261=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P16 > work/kat/gul_S1_summarycalc_P16 & pid262=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P16 > work/kat/gul_S1_pltcalc_P16 & pid263=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P16 > work/gul_S1_aalcalc/P16.bin & pid264=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P17 > work/kat/gul_S1_eltcalc_P17 & pid265=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P17 > work/kat/gul_S1_summarycalc_P17 & pid266=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P17 > work/kat/gul_S1_pltcalc_P17 & pid267=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P17 > work/gul_S1_aalcalc/P17.bin & pid268=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P18 > work/kat/gul_S1_eltcalc_P18 & pid269=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P18 > work/kat/gul_S1_summarycalc_P18 & pid270=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P18 > work/kat/gul_S1_pltcalc_P18 & pid271=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P18 > work/gul_S1_aalcalc/P18.bin & pid272=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P19 > work/kat/gul_S1_eltcalc_P19 & pid273=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P19 > work/kat/gul_S1_summarycalc_P19 & pid274=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P19 > work/kat/gul_S1_pltcalc_P19 & pid275=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P19 > work/gul_S1_aalcalc/P19.bin & pid276=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P20 > work/kat/gul_S1_eltcalc_P20 & pid277=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P20 > work/kat/gul_S1_summarycalc_P20 & pid278=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P20 > work/kat/gul_S1_pltcalc_P20 & pid279=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P20 > work/gul_S1_aalcalc/P20.bin & pid280=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P21 > work/kat/gul_S1_eltcalc_P21 & pid281=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P21 > work/kat/gul_S1_summarycalc_P21 & pid282=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P21 > work/kat/gul_S1_pltcalc_P21 & pid283=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P21 > work/gul_S1_aalcalc/P21.bin & pid284=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P22 > work/kat/gul_S1_eltcalc_P22 & pid285=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P22 > work/kat/gul_S1_summarycalc_P22 & pid286=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P22 > work/kat/gul_S1_pltcalc_P22 & pid287=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P22 > work/gul_S1_aalcalc/P22.bin & pid288=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P23 > work/kat/gul_S1_eltcalc_P23 & pid289=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P23 > work/kat/gul_S1_summarycalc_P23 & pid290=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P23 > work/kat/gul_S1_pltcalc_P23 & pid291=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P23 > work/gul_S1_aalcalc/P23.bin & pid292=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P24 > work/kat/gul_S1_eltcalc_P24 & pid293=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P24 > work/kat/gul_S1_summarycalc_P24 & pid294=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P24 > work/kat/gul_S1_pltcalc_P24 & pid295=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P24 > work/gul_S1_aalcalc/P24.bin & pid296=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P25 > work/kat/gul_S1_eltcalc_P25 & pid297=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P25 > work/kat/gul_S1_summarycalc_P25 & pid298=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P25 > work/kat/gul_S1_pltcalc_P25 & pid299=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P25 > work/gul_S1_aalcalc/P25.bin & pid300=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P26 > work/kat/gul_S1_eltcalc_P26 & pid301=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P26 > work/kat/gul_S1_summarycalc_P26 & pid302=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P26 > work/kat/gul_S1_pltcalc_P26 & pid303=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P26 > work/gul_S1_aalcalc/P26.bin & pid304=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P27 > work/kat/gul_S1_eltcalc_P27 & pid305=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P27 > work/kat/gul_S1_summarycalc_P27 & pid306=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P27 > work/kat/gul_S1_pltcalc_P27 & pid307=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P27 > work/gul_S1_aalcalc/P27.bin & pid308=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P28 > work/kat/gul_S1_eltcalc_P28 & pid309=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P28 > work/kat/gul_S1_summarycalc_P28 & pid310=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P28 > work/kat/gul_S1_pltcalc_P28 & pid311=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P28 > work/gul_S1_aalcalc/P28.bin & pid312=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P29 > work/kat/gul_S1_eltcalc_P29 & pid313=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P29 > work/kat/gul_S1_summarycalc_P29 & pid314=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P29 > work/kat/gul_S1_pltcalc_P29 & pid315=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P29 > work/gul_S1_aalcalc/P29.bin & pid316=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P30 > work/kat/gul_S1_eltcalc_P30 & pid317=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P30 > work/kat/gul_S1_summarycalc_P30 & pid318=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P30 > work/kat/gul_S1_pltcalc_P30 & pid319=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P30 > work/gul_S1_aalcalc/P30.bin & pid320=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P31 > work/kat/gul_S1_eltcalc_P31 & pid321=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P31 > work/kat/gul_S1_summarycalc_P31 & pid322=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P31 > work/kat/gul_S1_pltcalc_P31 & pid323=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P31 > work/gul_S1_aalcalc/P31.bin & pid324=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P32 > work/kat/gul_S1_eltcalc_P32 & pid325=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P32 > work/kat/gul_S1_summarycalc_P32 & pid326=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P32 > work/kat/gul_S1_pltcalc_P32 & pid327=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P32 > work/gul_S1_aalcalc/P32.bin & pid328=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P33 > work/kat/gul_S1_eltcalc_P33 & pid329=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P33 > work/kat/gul_S1_summarycalc_P33 & pid330=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P33 > work/kat/gul_S1_pltcalc_P33 & pid331=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P33 > work/gul_S1_aalcalc/P33.bin & pid332=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P34 > work/kat/gul_S1_eltcalc_P34 & pid333=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P34 > work/kat/gul_S1_summarycalc_P34 & pid334=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P34 > work/kat/gul_S1_pltcalc_P34 & pid335=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P34 > work/gul_S1_aalcalc/P34.bin & pid336=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P35 > work/kat/gul_S1_eltcalc_P35 & pid337=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P35 > work/kat/gul_S1_summarycalc_P35 & pid338=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P35 > work/kat/gul_S1_pltcalc_P35 & pid339=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P35 > work/gul_S1_aalcalc/P35.bin & pid340=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P36 > work/kat/gul_S1_eltcalc_P36 & pid341=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P36 > work/kat/gul_S1_summarycalc_P36 & pid342=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P36 > work/kat/gul_S1_pltcalc_P36 & pid343=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P36 > work/gul_S1_aalcalc/P36.bin & pid344=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P37 > work/kat/gul_S1_eltcalc_P37 & pid345=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P37 > work/kat/gul_S1_summarycalc_P37 & pid346=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P37 > work/kat/gul_S1_pltcalc_P37 & pid347=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P37 > work/gul_S1_aalcalc/P37.bin & pid348=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P38 > work/kat/gul_S1_eltcalc_P38 & pid349=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P38 > work/kat/gul_S1_summarycalc_P38 & pid350=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P38 > work/kat/gul_S1_pltcalc_P38 & pid351=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P38 > work/gul_S1_aalcalc/P38.bin & pid352=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P39 > work/kat/gul_S1_eltcalc_P39 & pid353=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P39 > work/kat/gul_S1_summarycalc_P39 & pid354=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P39 > work/kat/gul_S1_pltcalc_P39 & pid355=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P39 > work/gul_S1_aalcalc/P39.bin & pid356=$!
+
+eltcalc -s < fifo/gul_S1_summaryeltcalc_P40 > work/kat/gul_S1_eltcalc_P40 & pid357=$!
+summarycalctocsv -s < fifo/gul_S1_summarysummarycalc_P40 > work/kat/gul_S1_summarycalc_P40 & pid358=$!
+pltcalc -s < fifo/gul_S1_summarypltcalc_P40 > work/kat/gul_S1_pltcalc_P40 & pid359=$!
+aalcalc < fifo/gul_S1_summaryaalcalc_P40 > work/gul_S1_aalcalc/P40.bin & pid360=$!
+
+tee < fifo/gul_S1_summary_P1 fifo/gul_S1_summaryeltcalc_P1 fifo/gul_S1_summarypltcalc_P1 fifo/gul_S1_summarysummarycalc_P1 fifo/gul_S1_summaryaalcalc_P1 work/gul_S1_summaryleccalc/P1.bin > /dev/null & pid361=$!
+tee < fifo/gul_S1_summary_P2 fifo/gul_S1_summaryeltcalc_P2 fifo/gul_S1_summarypltcalc_P2 fifo/gul_S1_summarysummarycalc_P2 fifo/gul_S1_summaryaalcalc_P2 work/gul_S1_summaryleccalc/P2.bin > /dev/null & pid362=$!
+tee < fifo/gul_S1_summary_P3 fifo/gul_S1_summaryeltcalc_P3 fifo/gul_S1_summarypltcalc_P3 fifo/gul_S1_summarysummarycalc_P3 fifo/gul_S1_summaryaalcalc_P3 work/gul_S1_summaryleccalc/P3.bin > /dev/null & pid363=$!
+tee < fifo/gul_S1_summary_P4 fifo/gul_S1_summaryeltcalc_P4 fifo/gul_S1_summarypltcalc_P4 fifo/gul_S1_summarysummarycalc_P4 fifo/gul_S1_summaryaalcalc_P4 work/gul_S1_summaryleccalc/P4.bin > /dev/null & pid364=$!
+tee < fifo/gul_S1_summary_P5 fifo/gul_S1_summaryeltcalc_P5 fifo/gul_S1_summarypltcalc_P5 fifo/gul_S1_summarysummarycalc_P5 fifo/gul_S1_summaryaalcalc_P5 work/gul_S1_summaryleccalc/P5.bin > /dev/null & pid365=$!
+tee < fifo/gul_S1_summary_P6 fifo/gul_S1_summaryeltcalc_P6 fifo/gul_S1_summarypltcalc_P6 fifo/gul_S1_summarysummarycalc_P6 fifo/gul_S1_summaryaalcalc_P6 work/gul_S1_summaryleccalc/P6.bin > /dev/null & pid366=$!
+tee < fifo/gul_S1_summary_P7 fifo/gul_S1_summaryeltcalc_P7 fifo/gul_S1_summarypltcalc_P7 fifo/gul_S1_summarysummarycalc_P7 fifo/gul_S1_summaryaalcalc_P7 work/gul_S1_summaryleccalc/P7.bin > /dev/null & pid367=$!
+tee < fifo/gul_S1_summary_P8 fifo/gul_S1_summaryeltcalc_P8 fifo/gul_S1_summarypltcalc_P8 fifo/gul_S1_summarysummarycalc_P8 fifo/gul_S1_summaryaalcalc_P8 work/gul_S1_summaryleccalc/P8.bin > /dev/null & pid368=$!
+tee < fifo/gul_S1_summary_P9 fifo/gul_S1_summaryeltcalc_P9 fifo/gul_S1_summarypltcalc_P9 fifo/gul_S1_summarysummarycalc_P9 fifo/gul_S1_summaryaalcalc_P9 work/gul_S1_summaryleccalc/P9.bin > /dev/null & pid369=$!
+tee < fifo/gul_S1_summary_P10 fifo/gul_S1_summaryeltcalc_P10 fifo/gul_S1_summarypltcalc_P10 fifo/gul_S1_summarysummarycalc_P10 fifo/gul_S1_summaryaalcalc_P10 work/gul_S1_summaryleccalc/P10.bin > /dev/null & pid370=$!
+tee < fifo/gul_S1_summary_P11 fifo/gul_S1_summaryeltcalc_P11 fifo/gul_S1_summarypltcalc_P11 fifo/gul_S1_summarysummarycalc_P11 fifo/gul_S1_summaryaalcalc_P11 work/gul_S1_summaryleccalc/P11.bin > /dev/null & pid371=$!
+tee < fifo/gul_S1_summary_P12 fifo/gul_S1_summaryeltcalc_P12 fifo/gul_S1_summarypltcalc_P12 fifo/gul_S1_summarysummarycalc_P12 fifo/gul_S1_summaryaalcalc_P12 work/gul_S1_summaryleccalc/P12.bin > /dev/null & pid372=$!
+tee < fifo/gul_S1_summary_P13 fifo/gul_S1_summaryeltcalc_P13 fifo/gul_S1_summarypltcalc_P13 fifo/gul_S1_summarysummarycalc_P13 fifo/gul_S1_summaryaalcalc_P13 work/gul_S1_summaryleccalc/P13.bin > /dev/null & pid373=$!
+tee < fifo/gul_S1_summary_P14 fifo/gul_S1_summaryeltcalc_P14 fifo/gul_S1_summarypltcalc_P14 fifo/gul_S1_summarysummarycalc_P14 fifo/gul_S1_summaryaalcalc_P14 work/gul_S1_summaryleccalc/P14.bin > /dev/null & pid374=$!
+tee < fifo/gul_S1_summary_P15 fifo/gul_S1_summaryeltcalc_P15 fifo/gul_S1_summarypltcalc_P15 fifo/gul_S1_summarysummarycalc_P15 fifo/gul_S1_summaryaalcalc_P15 work/gul_S1_summaryleccalc/P15.bin > /dev/null & pid375=$!
+tee < fifo/gul_S1_summary_P16 fifo/gul_S1_summaryeltcalc_P16 fifo/gul_S1_summarypltcalc_P16 fifo/gul_S1_summarysummarycalc_P16 fifo/gul_S1_summaryaalcalc_P16 work/gul_S1_summaryleccalc/P16.bin > /dev/null & pid376=$!
+tee < fifo/gul_S1_summary_P17 fifo/gul_S1_summaryeltcalc_P17 fifo/gul_S1_summarypltcalc_P17 fifo/gul_S1_summarysummarycalc_P17 fifo/gul_S1_summaryaalcalc_P17 work/gul_S1_summaryleccalc/P17.bin > /dev/null & pid377=$!
+tee < fifo/gul_S1_summary_P18 fifo/gul_S1_summaryeltcalc_P18 fifo/gul_S1_summarypltcalc_P18 fifo/gul_S1_summarysummarycalc_P18 fifo/gul_S1_summaryaalcalc_P18 work/gul_S1_summaryleccalc/P18.bin > /dev/null & pid378=$!
+tee < fifo/gul_S1_summary_P19 fifo/gul_S1_summaryeltcalc_P19 fifo/gul_S1_summarypltcalc_P19 fifo/gul_S1_summarysummarycalc_P19 fifo/gul_S1_summaryaalcalc_P19 work/gul_S1_summaryleccalc/P19.bin > /dev/null & pid379=$!
+tee < fifo/gul_S1_summary_P20 fifo/gul_S1_summaryeltcalc_P20 fifo/gul_S1_summarypltcalc_P20 fifo/gul_S1_summarysummarycalc_P20 fifo/gul_S1_summaryaalcalc_P20 work/gul_S1_summaryleccalc/P20.bin > /dev/null & pid380=$!
+tee < fifo/gul_S1_summary_P21 fifo/gul_S1_summaryeltcalc_P21 fifo/gul_S1_summarypltcalc_P21 fifo/gul_S1_summarysummarycalc_P21 fifo/gul_S1_summaryaalcalc_P21 work/gul_S1_summaryleccalc/P21.bin > /dev/null & pid381=$!
+tee < fifo/gul_S1_summary_P22 fifo/gul_S1_summaryeltcalc_P22 fifo/gul_S1_summarypltcalc_P22 fifo/gul_S1_summarysummarycalc_P22 fifo/gul_S1_summaryaalcalc_P22 work/gul_S1_summaryleccalc/P22.bin > /dev/null & pid382=$!
+tee < fifo/gul_S1_summary_P23 fifo/gul_S1_summaryeltcalc_P23 fifo/gul_S1_summarypltcalc_P23 fifo/gul_S1_summarysummarycalc_P23 fifo/gul_S1_summaryaalcalc_P23 work/gul_S1_summaryleccalc/P23.bin > /dev/null & pid383=$!
+tee < fifo/gul_S1_summary_P24 fifo/gul_S1_summaryeltcalc_P24 fifo/gul_S1_summarypltcalc_P24 fifo/gul_S1_summarysummarycalc_P24 fifo/gul_S1_summaryaalcalc_P24 work/gul_S1_summaryleccalc/P24.bin > /dev/null & pid384=$!
+tee < fifo/gul_S1_summary_P25 fifo/gul_S1_summaryeltcalc_P25 fifo/gul_S1_summarypltcalc_P25 fifo/gul_S1_summarysummarycalc_P25 fifo/gul_S1_summaryaalcalc_P25 work/gul_S1_summaryleccalc/P25.bin > /dev/null & pid385=$!
+tee < fifo/gul_S1_summary_P26 fifo/gul_S1_summaryeltcalc_P26 fifo/gul_S1_summarypltcalc_P26 fifo/gul_S1_summarysummarycalc_P26 fifo/gul_S1_summaryaalcalc_P26 work/gul_S1_summaryleccalc/P26.bin > /dev/null & pid386=$!
+tee < fifo/gul_S1_summary_P27 fifo/gul_S1_summaryeltcalc_P27 fifo/gul_S1_summarypltcalc_P27 fifo/gul_S1_summarysummarycalc_P27 fifo/gul_S1_summaryaalcalc_P27 work/gul_S1_summaryleccalc/P27.bin > /dev/null & pid387=$!
+tee < fifo/gul_S1_summary_P28 fifo/gul_S1_summaryeltcalc_P28 fifo/gul_S1_summarypltcalc_P28 fifo/gul_S1_summarysummarycalc_P28 fifo/gul_S1_summaryaalcalc_P28 work/gul_S1_summaryleccalc/P28.bin > /dev/null & pid388=$!
+tee < fifo/gul_S1_summary_P29 fifo/gul_S1_summaryeltcalc_P29 fifo/gul_S1_summarypltcalc_P29 fifo/gul_S1_summarysummarycalc_P29 fifo/gul_S1_summaryaalcalc_P29 work/gul_S1_summaryleccalc/P29.bin > /dev/null & pid389=$!
+tee < fifo/gul_S1_summary_P30 fifo/gul_S1_summaryeltcalc_P30 fifo/gul_S1_summarypltcalc_P30 fifo/gul_S1_summarysummarycalc_P30 fifo/gul_S1_summaryaalcalc_P30 work/gul_S1_summaryleccalc/P30.bin > /dev/null & pid390=$!
+tee < fifo/gul_S1_summary_P31 fifo/gul_S1_summaryeltcalc_P31 fifo/gul_S1_summarypltcalc_P31 fifo/gul_S1_summarysummarycalc_P31 fifo/gul_S1_summaryaalcalc_P31 work/gul_S1_summaryleccalc/P31.bin > /dev/null & pid391=$!
+tee < fifo/gul_S1_summary_P32 fifo/gul_S1_summaryeltcalc_P32 fifo/gul_S1_summarypltcalc_P32 fifo/gul_S1_summarysummarycalc_P32 fifo/gul_S1_summaryaalcalc_P32 work/gul_S1_summaryleccalc/P32.bin > /dev/null & pid392=$!
+tee < fifo/gul_S1_summary_P33 fifo/gul_S1_summaryeltcalc_P33 fifo/gul_S1_summarypltcalc_P33 fifo/gul_S1_summarysummarycalc_P33 fifo/gul_S1_summaryaalcalc_P33 work/gul_S1_summaryleccalc/P33.bin > /dev/null & pid393=$!
+tee < fifo/gul_S1_summary_P34 fifo/gul_S1_summaryeltcalc_P34 fifo/gul_S1_summarypltcalc_P34 fifo/gul_S1_summarysummarycalc_P34 fifo/gul_S1_summaryaalcalc_P34 work/gul_S1_summaryleccalc/P34.bin > /dev/null & pid394=$!
+tee < fifo/gul_S1_summary_P35 fifo/gul_S1_summaryeltcalc_P35 fifo/gul_S1_summarypltcalc_P35 fifo/gul_S1_summarysummarycalc_P35 fifo/gul_S1_summaryaalcalc_P35 work/gul_S1_summaryleccalc/P35.bin > /dev/null & pid395=$!
+tee < fifo/gul_S1_summary_P36 fifo/gul_S1_summaryeltcalc_P36 fifo/gul_S1_summarypltcalc_P36 fifo/gul_S1_summarysummarycalc_P36 fifo/gul_S1_summaryaalcalc_P36 work/gul_S1_summaryleccalc/P36.bin > /dev/null & pid396=$!
+tee < fifo/gul_S1_summary_P37 fifo/gul_S1_summaryeltcalc_P37 fifo/gul_S1_summarypltcalc_P37 fifo/gul_S1_summarysummarycalc_P37 fifo/gul_S1_summaryaalcalc_P37 work/gul_S1_summaryleccalc/P37.bin > /dev/null & pid397=$!
+tee < fifo/gul_S1_summary_P38 fifo/gul_S1_summaryeltcalc_P38 fifo/gul_S1_summarypltcalc_P38 fifo/gul_S1_summarysummarycalc_P38 fifo/gul_S1_summaryaalcalc_P38 work/gul_S1_summaryleccalc/P38.bin > /dev/null & pid398=$!
+tee < fifo/gul_S1_summary_P39 fifo/gul_S1_summaryeltcalc_P39 fifo/gul_S1_summarypltcalc_P39 fifo/gul_S1_summarysummarycalc_P39 fifo/gul_S1_summaryaalcalc_P39 work/gul_S1_summaryleccalc/P39.bin > /dev/null & pid399=$!
+tee < fifo/gul_S1_summary_P40 fifo/gul_S1_summaryeltcalc_P40 fifo/gul_S1_summarypltcalc_P40 fifo/gul_S1_summarysummarycalc_P40 fifo/gul_S1_summaryaalcalc_P40 work/gul_S1_summaryleccalc/P40.bin > /dev/null & pid400=$!
+summarycalc -g -1 fifo/gul_S1_summary_P1 < fifo/gul_P1 &
+summarycalc -g -1 fifo/gul_S1_summary_P2 < fifo/gul_P2 &
+summarycalc -g -1 fifo/gul_S1_summary_P3 < fifo/gul_P3 &
+summarycalc -g -1 fifo/gul_S1_summary_P4 < fifo/gul_P4 &
+summarycalc -g -1 fifo/gul_S1_summary_P5 < fifo/gul_P5 &
+summarycalc -g -1 fifo/gul_S1_summary_P6 < fifo/gul_P6 &
+summarycalc -g -1 fifo/gul_S1_summary_P7 < fifo/gul_P7 &
+summarycalc -g -1 fifo/gul_S1_summary_P8 < fifo/gul_P8 &
+summarycalc -g -1 fifo/gul_S1_summary_P9 < fifo/gul_P9 &
+summarycalc -g -1 fifo/gul_S1_summary_P10 < fifo/gul_P10 &
+summarycalc -g -1 fifo/gul_S1_summary_P11 < fifo/gul_P11 &
+summarycalc -g -1 fifo/gul_S1_summary_P12 < fifo/gul_P12 &
+summarycalc -g -1 fifo/gul_S1_summary_P13 < fifo/gul_P13 &
+summarycalc -g -1 fifo/gul_S1_summary_P14 < fifo/gul_P14 &
+summarycalc -g -1 fifo/gul_S1_summary_P15 < fifo/gul_P15 &
+summarycalc -g -1 fifo/gul_S1_summary_P16 < fifo/gul_P16 &
+summarycalc -g -1 fifo/gul_S1_summary_P17 < fifo/gul_P17 &
+summarycalc -g -1 fifo/gul_S1_summary_P18 < fifo/gul_P18 &
+summarycalc -g -1 fifo/gul_S1_summary_P19 < fifo/gul_P19 &
+summarycalc -g -1 fifo/gul_S1_summary_P20 < fifo/gul_P20 &
+summarycalc -g -1 fifo/gul_S1_summary_P21 < fifo/gul_P21 &
+summarycalc -g -1 fifo/gul_S1_summary_P22 < fifo/gul_P22 &
+summarycalc -g -1 fifo/gul_S1_summary_P23 < fifo/gul_P23 &
+summarycalc -g -1 fifo/gul_S1_summary_P24 < fifo/gul_P24 &
+summarycalc -g -1 fifo/gul_S1_summary_P25 < fifo/gul_P25 &
+summarycalc -g -1 fifo/gul_S1_summary_P26 < fifo/gul_P26 &
+summarycalc -g -1 fifo/gul_S1_summary_P27 < fifo/gul_P27 &
+summarycalc -g -1 fifo/gul_S1_summary_P28 < fifo/gul_P28 &
+summarycalc -g -1 fifo/gul_S1_summary_P29 < fifo/gul_P29 &
+summarycalc -g -1 fifo/gul_S1_summary_P30 < fifo/gul_P30 &
+summarycalc -g -1 fifo/gul_S1_summary_P31 < fifo/gul_P31 &
+summarycalc -g -1 fifo/gul_S1_summary_P32 < fifo/gul_P32 &
+summarycalc -g -1 fifo/gul_S1_summary_P33 < fifo/gul_P33 &
+summarycalc -g -1 fifo/gul_S1_summary_P34 < fifo/gul_P34 &
+summarycalc -g -1 fifo/gul_S1_summary_P35 < fifo/gul_P35 &
+summarycalc -g -1 fifo/gul_S1_summary_P36 < fifo/gul_P36 &
+summarycalc -g -1 fifo/gul_S1_summary_P37 < fifo/gul_P37 &
+summarycalc -g -1 fifo/gul_S1_summary_P38 < fifo/gul_P38 &
+summarycalc -g -1 fifo/gul_S1_summary_P39 < fifo/gul_P39 &
+summarycalc -g -1 fifo/gul_S1_summary_P40 < fifo/gul_P40 &
+
+eve 1 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P1 -i - | fmcalc > fifo/il_P1  &
+eve 2 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P2 -i - | fmcalc > fifo/il_P2  &
+eve 3 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P3 -i - | fmcalc > fifo/il_P3  &
+eve 4 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P4 -i - | fmcalc > fifo/il_P4  &
+eve 5 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P5 -i - | fmcalc > fifo/il_P5  &
+eve 6 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P6 -i - | fmcalc > fifo/il_P6  &
+eve 7 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P7 -i - | fmcalc > fifo/il_P7  &
+eve 8 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P8 -i - | fmcalc > fifo/il_P8  &
+eve 9 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P9 -i - | fmcalc > fifo/il_P9  &
+eve 10 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P10 -i - | fmcalc > fifo/il_P10  &
+eve 11 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P11 -i - | fmcalc > fifo/il_P11  &
+eve 12 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P12 -i - | fmcalc > fifo/il_P12  &
+eve 13 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P13 -i - | fmcalc > fifo/il_P13  &
+eve 14 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P14 -i - | fmcalc > fifo/il_P14  &
+eve 15 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P15 -i - | fmcalc > fifo/il_P15  &
+eve 16 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P16 -i - | fmcalc > fifo/il_P16  &
+eve 17 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P17 -i - | fmcalc > fifo/il_P17  &
+eve 18 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P18 -i - | fmcalc > fifo/il_P18  &
+eve 19 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P19 -i - | fmcalc > fifo/il_P19  &
+eve 20 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P20 -i - | fmcalc > fifo/il_P20  &
+eve 21 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P21 -i - | fmcalc > fifo/il_P21  &
+eve 22 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P22 -i - | fmcalc > fifo/il_P22  &
+eve 23 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P23 -i - | fmcalc > fifo/il_P23  &
+eve 24 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P24 -i - | fmcalc > fifo/il_P24  &
+eve 25 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P25 -i - | fmcalc > fifo/il_P25  &
+eve 26 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P26 -i - | fmcalc > fifo/il_P26  &
+eve 27 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P27 -i - | fmcalc > fifo/il_P27  &
+eve 28 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P28 -i - | fmcalc > fifo/il_P28  &
+eve 29 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P29 -i - | fmcalc > fifo/il_P29  &
+eve 30 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P30 -i - | fmcalc > fifo/il_P30  &
+eve 31 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P31 -i - | fmcalc > fifo/il_P31  &
+eve 32 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P32 -i - | fmcalc > fifo/il_P32  &
+eve 33 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P33 -i - | fmcalc > fifo/il_P33  &
+eve 34 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P34 -i - | fmcalc > fifo/il_P34  &
+eve 35 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P35 -i - | fmcalc > fifo/il_P35  &
+eve 36 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P36 -i - | fmcalc > fifo/il_P36  &
+eve 37 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P37 -i - | fmcalc > fifo/il_P37  &
+eve 38 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P38 -i - | fmcalc > fifo/il_P38  &
+eve 39 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P39 -i - | fmcalc > fifo/il_P39  &
+eve 40 40 | getmodel | gulcalc -S100 -L100 -r -c fifo/gul_P40 -i - | fmcalc > fifo/il_P40  &
+
+wait $pid1 $pid2 $pid3 $pid4 $pid5 $pid6 $pid7 $pid8 $pid9 $pid10 $pid11 $pid12 $pid13 $pid14 $pid15 $pid16 $pid17 $pid18 $pid19 $pid20 $pid21 $pid22 $pid23 $pid24 $pid25 $pid26 $pid27 $pid28 $pid29 $pid30 $pid31 $pid32 $pid33 $pid34 $pid35 $pid36 $pid37 $pid38 $pid39 $pid40 $pid41 $pid42 $pid43 $pid44 $pid45 $pid46 $pid47 $pid48 $pid49 $pid50 $pid51 $pid52 $pid53 $pid54 $pid55 $pid56 $pid57 $pid58 $pid59 $pid60 $pid61 $pid62 $pid63 $pid64 $pid65 $pid66 $pid67 $pid68 $pid69 $pid70 $pid71 $pid72 $pid73 $pid74 $pid75 $pid76 $pid77 $pid78 $pid79 $pid80 $pid81 $pid82 $pid83 $pid84 $pid85 $pid86 $pid87 $pid88 $pid89 $pid90 $pid91 $pid92 $pid93 $pid94 $pid95 $pid96 $pid97 $pid98 $pid99 $pid100 $pid101 $pid102 $pid103 $pid104 $pid105 $pid106 $pid107 $pid108 $pid109 $pid110 $pid111 $pid112 $pid113 $pid114 $pid115 $pid116 $pid117 $pid118 $pid119 $pid120 $pid121 $pid122 $pid123 $pid124 $pid125 $pid126 $pid127 $pid128 $pid129 $pid130 $pid131 $pid132 $pid133 $pid134 $pid135 $pid136 $pid137 $pid138 $pid139 $pid140 $pid141 $pid142 $pid143 $pid144 $pid145 $pid146 $pid147 $pid148 $pid149 $pid150 $pid151 $pid152 $pid153 $pid154 $pid155 $pid156 $pid157 $pid158 $pid159 $pid160 $pid161 $pid162 $pid163 $pid164 $pid165 $pid166 $pid167 $pid168 $pid169 $pid170 $pid171 $pid172 $pid173 $pid174 $pid175 $pid176 $pid177 $pid178 $pid179 $pid180 $pid181 $pid182 $pid183 $pid184 $pid185 $pid186 $pid187 $pid188 $pid189 $pid190 $pid191 $pid192 $pid193 $pid194 $pid195 $pid196 $pid197 $pid198 $pid199 $pid200 $pid201 $pid202 $pid203 $pid204 $pid205 $pid206 $pid207 $pid208 $pid209 $pid210 $pid211 $pid212 $pid213 $pid214 $pid215 $pid216 $pid217 $pid218 $pid219 $pid220 $pid221 $pid222 $pid223 $pid224 $pid225 $pid226 $pid227 $pid228 $pid229 $pid230 $pid231 $pid232 $pid233 $pid234 $pid235 $pid236 $pid237 $pid238 $pid239 $pid240 $pid241 $pid242 $pid243 $pid244 $pid245 $pid246 $pid247 $pid248 $pid249 $pid250 $pid251 $pid252 $pid253 $pid254 $pid255 $pid256 $pid257 $pid258 $pid259 $pid260 $pid261 $pid262 $pid263 $pid264 $pid265 $pid266 $pid267 $pid268 $pid269 $pid270 $pid271 $pid272 $pid273 $pid274 $pid275 $pid276 $pid277 $pid278 $pid279 $pid280 $pid281 $pid282 $pid283 $pid284 $pid285 $pid286 $pid287 $pid288 $pid289 $pid290 $pid291 $pid292 $pid293 $pid294 $pid295 $pid296 $pid297 $pid298 $pid299 $pid300 $pid301 $pid302 $pid303 $pid304 $pid305 $pid306 $pid307 $pid308 $pid309 $pid310 $pid311 $pid312 $pid313 $pid314 $pid315 $pid316 $pid317 $pid318 $pid319 $pid320 $pid321 $pid322 $pid323 $pid324 $pid325 $pid326 $pid327 $pid328 $pid329 $pid330 $pid331 $pid332 $pid333 $pid334 $pid335 $pid336 $pid337 $pid338 $pid339 $pid340 $pid341 $pid342 $pid343 $pid344 $pid345 $pid346 $pid347 $pid348 $pid349 $pid350 $pid351 $pid352 $pid353 $pid354 $pid355 $pid356 $pid357 $pid358 $pid359 $pid360 $pid361 $pid362 $pid363 $pid364 $pid365 $pid366 $pid367 $pid368 $pid369 $pid370 $pid371 $pid372 $pid373 $pid374 $pid375 $pid376 $pid377 $pid378 $pid379 $pid380 $pid381 $pid382 $pid383 $pid384 $pid385 $pid386 $pid387 $pid388 $pid389 $pid390 $pid391 $pid392 $pid393 $pid394 $pid395 $pid396 $pid397 $pid398 $pid399 $pid400
+
+
+# --- Do insured loss kats ---
+
+kat work/kat/il_S1_eltcalc_P1 work/kat/il_S1_eltcalc_P2 work/kat/il_S1_eltcalc_P3 work/kat/il_S1_eltcalc_P4 work/kat/il_S1_eltcalc_P5 work/kat/il_S1_eltcalc_P6 work/kat/il_S1_eltcalc_P7 work/kat/il_S1_eltcalc_P8 work/kat/il_S1_eltcalc_P9 work/kat/il_S1_eltcalc_P10 work/kat/il_S1_eltcalc_P11 work/kat/il_S1_eltcalc_P12 work/kat/il_S1_eltcalc_P13 work/kat/il_S1_eltcalc_P14 work/kat/il_S1_eltcalc_P15 work/kat/il_S1_eltcalc_P16 work/kat/il_S1_eltcalc_P17 work/kat/il_S1_eltcalc_P18 work/kat/il_S1_eltcalc_P19 work/kat/il_S1_eltcalc_P20 work/kat/il_S1_eltcalc_P21 work/kat/il_S1_eltcalc_P22 work/kat/il_S1_eltcalc_P23 work/kat/il_S1_eltcalc_P24 work/kat/il_S1_eltcalc_P25 work/kat/il_S1_eltcalc_P26 work/kat/il_S1_eltcalc_P27 work/kat/il_S1_eltcalc_P28 work/kat/il_S1_eltcalc_P29 work/kat/il_S1_eltcalc_P30 work/kat/il_S1_eltcalc_P31 work/kat/il_S1_eltcalc_P32 work/kat/il_S1_eltcalc_P33 work/kat/il_S1_eltcalc_P34 work/kat/il_S1_eltcalc_P35 work/kat/il_S1_eltcalc_P36 work/kat/il_S1_eltcalc_P37 work/kat/il_S1_eltcalc_P38 work/kat/il_S1_eltcalc_P39 work/kat/il_S1_eltcalc_P40 > output/il_S1_eltcalc.csv & kpid1=$!
+kat work/kat/il_S1_pltcalc_P1 work/kat/il_S1_pltcalc_P2 work/kat/il_S1_pltcalc_P3 work/kat/il_S1_pltcalc_P4 work/kat/il_S1_pltcalc_P5 work/kat/il_S1_pltcalc_P6 work/kat/il_S1_pltcalc_P7 work/kat/il_S1_pltcalc_P8 work/kat/il_S1_pltcalc_P9 work/kat/il_S1_pltcalc_P10 work/kat/il_S1_pltcalc_P11 work/kat/il_S1_pltcalc_P12 work/kat/il_S1_pltcalc_P13 work/kat/il_S1_pltcalc_P14 work/kat/il_S1_pltcalc_P15 work/kat/il_S1_pltcalc_P16 work/kat/il_S1_pltcalc_P17 work/kat/il_S1_pltcalc_P18 work/kat/il_S1_pltcalc_P19 work/kat/il_S1_pltcalc_P20 work/kat/il_S1_pltcalc_P21 work/kat/il_S1_pltcalc_P22 work/kat/il_S1_pltcalc_P23 work/kat/il_S1_pltcalc_P24 work/kat/il_S1_pltcalc_P25 work/kat/il_S1_pltcalc_P26 work/kat/il_S1_pltcalc_P27 work/kat/il_S1_pltcalc_P28 work/kat/il_S1_pltcalc_P29 work/kat/il_S1_pltcalc_P30 work/kat/il_S1_pltcalc_P31 work/kat/il_S1_pltcalc_P32 work/kat/il_S1_pltcalc_P33 work/kat/il_S1_pltcalc_P34 work/kat/il_S1_pltcalc_P35 work/kat/il_S1_pltcalc_P36 work/kat/il_S1_pltcalc_P37 work/kat/il_S1_pltcalc_P38 work/kat/il_S1_pltcalc_P39 work/kat/il_S1_pltcalc_P40 > output/il_S1_pltcalc.csv & kpid2=$!
+kat work/kat/il_S1_summarycalc_P1 work/kat/il_S1_summarycalc_P2 work/kat/il_S1_summarycalc_P3 work/kat/il_S1_summarycalc_P4 work/kat/il_S1_summarycalc_P5 work/kat/il_S1_summarycalc_P6 work/kat/il_S1_summarycalc_P7 work/kat/il_S1_summarycalc_P8 work/kat/il_S1_summarycalc_P9 work/kat/il_S1_summarycalc_P10 work/kat/il_S1_summarycalc_P11 work/kat/il_S1_summarycalc_P12 work/kat/il_S1_summarycalc_P13 work/kat/il_S1_summarycalc_P14 work/kat/il_S1_summarycalc_P15 work/kat/il_S1_summarycalc_P16 work/kat/il_S1_summarycalc_P17 work/kat/il_S1_summarycalc_P18 work/kat/il_S1_summarycalc_P19 work/kat/il_S1_summarycalc_P20 work/kat/il_S1_summarycalc_P21 work/kat/il_S1_summarycalc_P22 work/kat/il_S1_summarycalc_P23 work/kat/il_S1_summarycalc_P24 work/kat/il_S1_summarycalc_P25 work/kat/il_S1_summarycalc_P26 work/kat/il_S1_summarycalc_P27 work/kat/il_S1_summarycalc_P28 work/kat/il_S1_summarycalc_P29 work/kat/il_S1_summarycalc_P30 work/kat/il_S1_summarycalc_P31 work/kat/il_S1_summarycalc_P32 work/kat/il_S1_summarycalc_P33 work/kat/il_S1_summarycalc_P34 work/kat/il_S1_summarycalc_P35 work/kat/il_S1_summarycalc_P36 work/kat/il_S1_summarycalc_P37 work/kat/il_S1_summarycalc_P38 work/kat/il_S1_summarycalc_P39 work/kat/il_S1_summarycalc_P40 > output/il_S1_summarycalc.csv & kpid3=$!
+
+# --- Do ground up loss kats ---
+
+kat work/kat/gul_S1_eltcalc_P1 work/kat/gul_S1_eltcalc_P2 work/kat/gul_S1_eltcalc_P3 work/kat/gul_S1_eltcalc_P4 work/kat/gul_S1_eltcalc_P5 work/kat/gul_S1_eltcalc_P6 work/kat/gul_S1_eltcalc_P7 work/kat/gul_S1_eltcalc_P8 work/kat/gul_S1_eltcalc_P9 work/kat/gul_S1_eltcalc_P10 work/kat/gul_S1_eltcalc_P11 work/kat/gul_S1_eltcalc_P12 work/kat/gul_S1_eltcalc_P13 work/kat/gul_S1_eltcalc_P14 work/kat/gul_S1_eltcalc_P15 work/kat/gul_S1_eltcalc_P16 work/kat/gul_S1_eltcalc_P17 work/kat/gul_S1_eltcalc_P18 work/kat/gul_S1_eltcalc_P19 work/kat/gul_S1_eltcalc_P20 work/kat/gul_S1_eltcalc_P21 work/kat/gul_S1_eltcalc_P22 work/kat/gul_S1_eltcalc_P23 work/kat/gul_S1_eltcalc_P24 work/kat/gul_S1_eltcalc_P25 work/kat/gul_S1_eltcalc_P26 work/kat/gul_S1_eltcalc_P27 work/kat/gul_S1_eltcalc_P28 work/kat/gul_S1_eltcalc_P29 work/kat/gul_S1_eltcalc_P30 work/kat/gul_S1_eltcalc_P31 work/kat/gul_S1_eltcalc_P32 work/kat/gul_S1_eltcalc_P33 work/kat/gul_S1_eltcalc_P34 work/kat/gul_S1_eltcalc_P35 work/kat/gul_S1_eltcalc_P36 work/kat/gul_S1_eltcalc_P37 work/kat/gul_S1_eltcalc_P38 work/kat/gul_S1_eltcalc_P39 work/kat/gul_S1_eltcalc_P40 > output/gul_S1_eltcalc.csv & kpid4=$!
+kat work/kat/gul_S1_pltcalc_P1 work/kat/gul_S1_pltcalc_P2 work/kat/gul_S1_pltcalc_P3 work/kat/gul_S1_pltcalc_P4 work/kat/gul_S1_pltcalc_P5 work/kat/gul_S1_pltcalc_P6 work/kat/gul_S1_pltcalc_P7 work/kat/gul_S1_pltcalc_P8 work/kat/gul_S1_pltcalc_P9 work/kat/gul_S1_pltcalc_P10 work/kat/gul_S1_pltcalc_P11 work/kat/gul_S1_pltcalc_P12 work/kat/gul_S1_pltcalc_P13 work/kat/gul_S1_pltcalc_P14 work/kat/gul_S1_pltcalc_P15 work/kat/gul_S1_pltcalc_P16 work/kat/gul_S1_pltcalc_P17 work/kat/gul_S1_pltcalc_P18 work/kat/gul_S1_pltcalc_P19 work/kat/gul_S1_pltcalc_P20 work/kat/gul_S1_pltcalc_P21 work/kat/gul_S1_pltcalc_P22 work/kat/gul_S1_pltcalc_P23 work/kat/gul_S1_pltcalc_P24 work/kat/gul_S1_pltcalc_P25 work/kat/gul_S1_pltcalc_P26 work/kat/gul_S1_pltcalc_P27 work/kat/gul_S1_pltcalc_P28 work/kat/gul_S1_pltcalc_P29 work/kat/gul_S1_pltcalc_P30 work/kat/gul_S1_pltcalc_P31 work/kat/gul_S1_pltcalc_P32 work/kat/gul_S1_pltcalc_P33 work/kat/gul_S1_pltcalc_P34 work/kat/gul_S1_pltcalc_P35 work/kat/gul_S1_pltcalc_P36 work/kat/gul_S1_pltcalc_P37 work/kat/gul_S1_pltcalc_P38 work/kat/gul_S1_pltcalc_P39 work/kat/gul_S1_pltcalc_P40 > output/gul_S1_pltcalc.csv & kpid5=$!
+kat work/kat/gul_S1_summarycalc_P1 work/kat/gul_S1_summarycalc_P2 work/kat/gul_S1_summarycalc_P3 work/kat/gul_S1_summarycalc_P4 work/kat/gul_S1_summarycalc_P5 work/kat/gul_S1_summarycalc_P6 work/kat/gul_S1_summarycalc_P7 work/kat/gul_S1_summarycalc_P8 work/kat/gul_S1_summarycalc_P9 work/kat/gul_S1_summarycalc_P10 work/kat/gul_S1_summarycalc_P11 work/kat/gul_S1_summarycalc_P12 work/kat/gul_S1_summarycalc_P13 work/kat/gul_S1_summarycalc_P14 work/kat/gul_S1_summarycalc_P15 work/kat/gul_S1_summarycalc_P16 work/kat/gul_S1_summarycalc_P17 work/kat/gul_S1_summarycalc_P18 work/kat/gul_S1_summarycalc_P19 work/kat/gul_S1_summarycalc_P20 work/kat/gul_S1_summarycalc_P21 work/kat/gul_S1_summarycalc_P22 work/kat/gul_S1_summarycalc_P23 work/kat/gul_S1_summarycalc_P24 work/kat/gul_S1_summarycalc_P25 work/kat/gul_S1_summarycalc_P26 work/kat/gul_S1_summarycalc_P27 work/kat/gul_S1_summarycalc_P28 work/kat/gul_S1_summarycalc_P29 work/kat/gul_S1_summarycalc_P30 work/kat/gul_S1_summarycalc_P31 work/kat/gul_S1_summarycalc_P32 work/kat/gul_S1_summarycalc_P33 work/kat/gul_S1_summarycalc_P34 work/kat/gul_S1_summarycalc_P35 work/kat/gul_S1_summarycalc_P36 work/kat/gul_S1_summarycalc_P37 work/kat/gul_S1_summarycalc_P38 work/kat/gul_S1_summarycalc_P39 work/kat/gul_S1_summarycalc_P40 > output/gul_S1_summarycalc.csv & kpid6=$!
+wait $kpid1 $kpid2 $kpid3 $kpid4 $kpid5 $kpid6
+
+
+aalsummary -Kil_S1_aalcalc > output/il_S1_aalcalc.csv & apid1=$!
+leccalc -r -Kil_S1_summaryleccalc -F output/il_S1_leccalc_full_uncertainty_aep.csv -f output/il_S1_leccalc_full_uncertainty_oep.csv -S output/il_S1_leccalc_sample_mean_aep.csv -s output/il_S1_leccalc_sample_mean_oep.csv -W output/il_S1_leccalc_wheatsheaf_aep.csv -M output/il_S1_leccalc_wheatsheaf_mean_aep.csv -m output/il_S1_leccalc_wheatsheaf_mean_oep.csv -w output/il_S1_leccalc_wheatsheaf_oep.csv & lpid1=$!
+aalsummary -Kgul_S1_aalcalc > output/gul_S1_aalcalc.csv & apid2=$!
+leccalc -r -Kgul_S1_summaryleccalc -F output/gul_S1_leccalc_full_uncertainty_aep.csv -f output/gul_S1_leccalc_full_uncertainty_oep.csv -S output/gul_S1_leccalc_sample_mean_aep.csv -s output/gul_S1_leccalc_sample_mean_oep.csv -W output/gul_S1_leccalc_wheatsheaf_aep.csv -M output/gul_S1_leccalc_wheatsheaf_mean_aep.csv -m output/gul_S1_leccalc_wheatsheaf_mean_oep.csv -w output/gul_S1_leccalc_wheatsheaf_oep.csv & lpid2=$!
+wait $apid1 $apid2
+
+wait $lpid1 $lpid2
+
+rm fifo/gul_P1
+
+rm fifo/gul_S1_summary_P1
+rm fifo/gul_S1_summaryeltcalc_P1
+rm fifo/gul_S1_eltcalc_P1
+rm fifo/gul_S1_summarysummarycalc_P1
+rm fifo/gul_S1_summarycalc_P1
+rm fifo/gul_S1_summarypltcalc_P1
+rm fifo/gul_S1_pltcalc_P1
+rm fifo/gul_S1_summaryaalcalc_P1
+
+rm fifo/gul_P2
+
+rm fifo/gul_S1_summary_P2
+rm fifo/gul_S1_summaryeltcalc_P2
+rm fifo/gul_S1_eltcalc_P2
+rm fifo/gul_S1_summarysummarycalc_P2
+rm fifo/gul_S1_summarycalc_P2
+rm fifo/gul_S1_summarypltcalc_P2
+rm fifo/gul_S1_pltcalc_P2
+rm fifo/gul_S1_summaryaalcalc_P2
+
+rm fifo/gul_P3
+
+rm fifo/gul_S1_summary_P3
+rm fifo/gul_S1_summaryeltcalc_P3
+rm fifo/gul_S1_eltcalc_P3
+rm fifo/gul_S1_summarysummarycalc_P3
+rm fifo/gul_S1_summarycalc_P3
+rm fifo/gul_S1_summarypltcalc_P3
+rm fifo/gul_S1_pltcalc_P3
+rm fifo/gul_S1_summaryaalcalc_P3
+
+rm fifo/gul_P4
+
+rm fifo/gul_S1_summary_P4
+rm fifo/gul_S1_summaryeltcalc_P4
+rm fifo/gul_S1_eltcalc_P4
+rm fifo/gul_S1_summarysummarycalc_P4
+rm fifo/gul_S1_summarycalc_P4
+rm fifo/gul_S1_summarypltcalc_P4
+rm fifo/gul_S1_pltcalc_P4
+rm fifo/gul_S1_summaryaalcalc_P4
+
+rm fifo/gul_P5
+
+rm fifo/gul_S1_summary_P5
+rm fifo/gul_S1_summaryeltcalc_P5
+rm fifo/gul_S1_eltcalc_P5
+rm fifo/gul_S1_summarysummarycalc_P5
+rm fifo/gul_S1_summarycalc_P5
+rm fifo/gul_S1_summarypltcalc_P5
+rm fifo/gul_S1_pltcalc_P5
+rm fifo/gul_S1_summaryaalcalc_P5
+
+rm fifo/gul_P6
+
+rm fifo/gul_S1_summary_P6
+rm fifo/gul_S1_summaryeltcalc_P6
+rm fifo/gul_S1_eltcalc_P6
+rm fifo/gul_S1_summarysummarycalc_P6
+rm fifo/gul_S1_summarycalc_P6
+rm fifo/gul_S1_summarypltcalc_P6
+rm fifo/gul_S1_pltcalc_P6
+rm fifo/gul_S1_summaryaalcalc_P6
+
+rm fifo/gul_P7
+
+rm fifo/gul_S1_summary_P7
+rm fifo/gul_S1_summaryeltcalc_P7
+rm fifo/gul_S1_eltcalc_P7
+rm fifo/gul_S1_summarysummarycalc_P7
+rm fifo/gul_S1_summarycalc_P7
+rm fifo/gul_S1_summarypltcalc_P7
+rm fifo/gul_S1_pltcalc_P7
+rm fifo/gul_S1_summaryaalcalc_P7
+
+rm fifo/gul_P8
+
+rm fifo/gul_S1_summary_P8
+rm fifo/gul_S1_summaryeltcalc_P8
+rm fifo/gul_S1_eltcalc_P8
+rm fifo/gul_S1_summarysummarycalc_P8
+rm fifo/gul_S1_summarycalc_P8
+rm fifo/gul_S1_summarypltcalc_P8
+rm fifo/gul_S1_pltcalc_P8
+rm fifo/gul_S1_summaryaalcalc_P8
+
+rm fifo/gul_P9
+
+rm fifo/gul_S1_summary_P9
+rm fifo/gul_S1_summaryeltcalc_P9
+rm fifo/gul_S1_eltcalc_P9
+rm fifo/gul_S1_summarysummarycalc_P9
+rm fifo/gul_S1_summarycalc_P9
+rm fifo/gul_S1_summarypltcalc_P9
+rm fifo/gul_S1_pltcalc_P9
+rm fifo/gul_S1_summaryaalcalc_P9
+
+rm fifo/gul_P10
+
+rm fifo/gul_S1_summary_P10
+rm fifo/gul_S1_summaryeltcalc_P10
+rm fifo/gul_S1_eltcalc_P10
+rm fifo/gul_S1_summarysummarycalc_P10
+rm fifo/gul_S1_summarycalc_P10
+rm fifo/gul_S1_summarypltcalc_P10
+rm fifo/gul_S1_pltcalc_P10
+rm fifo/gul_S1_summaryaalcalc_P10
+
+rm fifo/gul_P11
+
+rm fifo/gul_S1_summary_P11
+rm fifo/gul_S1_summaryeltcalc_P11
+rm fifo/gul_S1_eltcalc_P11
+rm fifo/gul_S1_summarysummarycalc_P11
+rm fifo/gul_S1_summarycalc_P11
+rm fifo/gul_S1_summarypltcalc_P11
+rm fifo/gul_S1_pltcalc_P11
+rm fifo/gul_S1_summaryaalcalc_P11
+
+rm fifo/gul_P12
+
+rm fifo/gul_S1_summary_P12
+rm fifo/gul_S1_summaryeltcalc_P12
+rm fifo/gul_S1_eltcalc_P12
+rm fifo/gul_S1_summarysummarycalc_P12
+rm fifo/gul_S1_summarycalc_P12
+rm fifo/gul_S1_summarypltcalc_P12
+rm fifo/gul_S1_pltcalc_P12
+rm fifo/gul_S1_summaryaalcalc_P12
+
+rm fifo/gul_P13
+
+rm fifo/gul_S1_summary_P13
+rm fifo/gul_S1_summaryeltcalc_P13
+rm fifo/gul_S1_eltcalc_P13
+rm fifo/gul_S1_summarysummarycalc_P13
+rm fifo/gul_S1_summarycalc_P13
+rm fifo/gul_S1_summarypltcalc_P13
+rm fifo/gul_S1_pltcalc_P13
+rm fifo/gul_S1_summaryaalcalc_P13
+
+rm fifo/gul_P14
+
+rm fifo/gul_S1_summary_P14
+rm fifo/gul_S1_summaryeltcalc_P14
+rm fifo/gul_S1_eltcalc_P14
+rm fifo/gul_S1_summarysummarycalc_P14
+rm fifo/gul_S1_summarycalc_P14
+rm fifo/gul_S1_summarypltcalc_P14
+rm fifo/gul_S1_pltcalc_P14
+rm fifo/gul_S1_summaryaalcalc_P14
+
+rm fifo/gul_P15
+
+rm fifo/gul_S1_summary_P15
+rm fifo/gul_S1_summaryeltcalc_P15
+rm fifo/gul_S1_eltcalc_P15
+rm fifo/gul_S1_summarysummarycalc_P15
+rm fifo/gul_S1_summarycalc_P15
+rm fifo/gul_S1_summarypltcalc_P15
+rm fifo/gul_S1_pltcalc_P15
+rm fifo/gul_S1_summaryaalcalc_P15
+
+rm fifo/gul_P16
+
+rm fifo/gul_S1_summary_P16
+rm fifo/gul_S1_summaryeltcalc_P16
+rm fifo/gul_S1_eltcalc_P16
+rm fifo/gul_S1_summarysummarycalc_P16
+rm fifo/gul_S1_summarycalc_P16
+rm fifo/gul_S1_summarypltcalc_P16
+rm fifo/gul_S1_pltcalc_P16
+rm fifo/gul_S1_summaryaalcalc_P16
+
+rm fifo/gul_P17
+
+rm fifo/gul_S1_summary_P17
+rm fifo/gul_S1_summaryeltcalc_P17
+rm fifo/gul_S1_eltcalc_P17
+rm fifo/gul_S1_summarysummarycalc_P17
+rm fifo/gul_S1_summarycalc_P17
+rm fifo/gul_S1_summarypltcalc_P17
+rm fifo/gul_S1_pltcalc_P17
+rm fifo/gul_S1_summaryaalcalc_P17
+
+rm fifo/gul_P18
+
+rm fifo/gul_S1_summary_P18
+rm fifo/gul_S1_summaryeltcalc_P18
+rm fifo/gul_S1_eltcalc_P18
+rm fifo/gul_S1_summarysummarycalc_P18
+rm fifo/gul_S1_summarycalc_P18
+rm fifo/gul_S1_summarypltcalc_P18
+rm fifo/gul_S1_pltcalc_P18
+rm fifo/gul_S1_summaryaalcalc_P18
+
+rm fifo/gul_P19
+
+rm fifo/gul_S1_summary_P19
+rm fifo/gul_S1_summaryeltcalc_P19
+rm fifo/gul_S1_eltcalc_P19
+rm fifo/gul_S1_summarysummarycalc_P19
+rm fifo/gul_S1_summarycalc_P19
+rm fifo/gul_S1_summarypltcalc_P19
+rm fifo/gul_S1_pltcalc_P19
+rm fifo/gul_S1_summaryaalcalc_P19
+
+rm fifo/gul_P20
+
+rm fifo/gul_S1_summary_P20
+rm fifo/gul_S1_summaryeltcalc_P20
+rm fifo/gul_S1_eltcalc_P20
+rm fifo/gul_S1_summarysummarycalc_P20
+rm fifo/gul_S1_summarycalc_P20
+rm fifo/gul_S1_summarypltcalc_P20
+rm fifo/gul_S1_pltcalc_P20
+rm fifo/gul_S1_summaryaalcalc_P20
+
+rm fifo/gul_P21
+
+rm fifo/gul_S1_summary_P21
+rm fifo/gul_S1_summaryeltcalc_P21
+rm fifo/gul_S1_eltcalc_P21
+rm fifo/gul_S1_summarysummarycalc_P21
+rm fifo/gul_S1_summarycalc_P21
+rm fifo/gul_S1_summarypltcalc_P21
+rm fifo/gul_S1_pltcalc_P21
+rm fifo/gul_S1_summaryaalcalc_P21
+
+rm fifo/gul_P22
+
+rm fifo/gul_S1_summary_P22
+rm fifo/gul_S1_summaryeltcalc_P22
+rm fifo/gul_S1_eltcalc_P22
+rm fifo/gul_S1_summarysummarycalc_P22
+rm fifo/gul_S1_summarycalc_P22
+rm fifo/gul_S1_summarypltcalc_P22
+rm fifo/gul_S1_pltcalc_P22
+rm fifo/gul_S1_summaryaalcalc_P22
+
+rm fifo/gul_P23
+
+rm fifo/gul_S1_summary_P23
+rm fifo/gul_S1_summaryeltcalc_P23
+rm fifo/gul_S1_eltcalc_P23
+rm fifo/gul_S1_summarysummarycalc_P23
+rm fifo/gul_S1_summarycalc_P23
+rm fifo/gul_S1_summarypltcalc_P23
+rm fifo/gul_S1_pltcalc_P23
+rm fifo/gul_S1_summaryaalcalc_P23
+
+rm fifo/gul_P24
+
+rm fifo/gul_S1_summary_P24
+rm fifo/gul_S1_summaryeltcalc_P24
+rm fifo/gul_S1_eltcalc_P24
+rm fifo/gul_S1_summarysummarycalc_P24
+rm fifo/gul_S1_summarycalc_P24
+rm fifo/gul_S1_summarypltcalc_P24
+rm fifo/gul_S1_pltcalc_P24
+rm fifo/gul_S1_summaryaalcalc_P24
+
+rm fifo/gul_P25
+
+rm fifo/gul_S1_summary_P25
+rm fifo/gul_S1_summaryeltcalc_P25
+rm fifo/gul_S1_eltcalc_P25
+rm fifo/gul_S1_summarysummarycalc_P25
+rm fifo/gul_S1_summarycalc_P25
+rm fifo/gul_S1_summarypltcalc_P25
+rm fifo/gul_S1_pltcalc_P25
+rm fifo/gul_S1_summaryaalcalc_P25
+
+rm fifo/gul_P26
+
+rm fifo/gul_S1_summary_P26
+rm fifo/gul_S1_summaryeltcalc_P26
+rm fifo/gul_S1_eltcalc_P26
+rm fifo/gul_S1_summarysummarycalc_P26
+rm fifo/gul_S1_summarycalc_P26
+rm fifo/gul_S1_summarypltcalc_P26
+rm fifo/gul_S1_pltcalc_P26
+rm fifo/gul_S1_summaryaalcalc_P26
+
+rm fifo/gul_P27
+
+rm fifo/gul_S1_summary_P27
+rm fifo/gul_S1_summaryeltcalc_P27
+rm fifo/gul_S1_eltcalc_P27
+rm fifo/gul_S1_summarysummarycalc_P27
+rm fifo/gul_S1_summarycalc_P27
+rm fifo/gul_S1_summarypltcalc_P27
+rm fifo/gul_S1_pltcalc_P27
+rm fifo/gul_S1_summaryaalcalc_P27
+
+rm fifo/gul_P28
+
+rm fifo/gul_S1_summary_P28
+rm fifo/gul_S1_summaryeltcalc_P28
+rm fifo/gul_S1_eltcalc_P28
+rm fifo/gul_S1_summarysummarycalc_P28
+rm fifo/gul_S1_summarycalc_P28
+rm fifo/gul_S1_summarypltcalc_P28
+rm fifo/gul_S1_pltcalc_P28
+rm fifo/gul_S1_summaryaalcalc_P28
+
+rm fifo/gul_P29
+
+rm fifo/gul_S1_summary_P29
+rm fifo/gul_S1_summaryeltcalc_P29
+rm fifo/gul_S1_eltcalc_P29
+rm fifo/gul_S1_summarysummarycalc_P29
+rm fifo/gul_S1_summarycalc_P29
+rm fifo/gul_S1_summarypltcalc_P29
+rm fifo/gul_S1_pltcalc_P29
+rm fifo/gul_S1_summaryaalcalc_P29
+
+rm fifo/gul_P30
+
+rm fifo/gul_S1_summary_P30
+rm fifo/gul_S1_summaryeltcalc_P30
+rm fifo/gul_S1_eltcalc_P30
+rm fifo/gul_S1_summarysummarycalc_P30
+rm fifo/gul_S1_summarycalc_P30
+rm fifo/gul_S1_summarypltcalc_P30
+rm fifo/gul_S1_pltcalc_P30
+rm fifo/gul_S1_summaryaalcalc_P30
+
+rm fifo/gul_P31
+
+rm fifo/gul_S1_summary_P31
+rm fifo/gul_S1_summaryeltcalc_P31
+rm fifo/gul_S1_eltcalc_P31
+rm fifo/gul_S1_summarysummarycalc_P31
+rm fifo/gul_S1_summarycalc_P31
+rm fifo/gul_S1_summarypltcalc_P31
+rm fifo/gul_S1_pltcalc_P31
+rm fifo/gul_S1_summaryaalcalc_P31
+
+rm fifo/gul_P32
+
+rm fifo/gul_S1_summary_P32
+rm fifo/gul_S1_summaryeltcalc_P32
+rm fifo/gul_S1_eltcalc_P32
+rm fifo/gul_S1_summarysummarycalc_P32
+rm fifo/gul_S1_summarycalc_P32
+rm fifo/gul_S1_summarypltcalc_P32
+rm fifo/gul_S1_pltcalc_P32
+rm fifo/gul_S1_summaryaalcalc_P32
+
+rm fifo/gul_P33
+
+rm fifo/gul_S1_summary_P33
+rm fifo/gul_S1_summaryeltcalc_P33
+rm fifo/gul_S1_eltcalc_P33
+rm fifo/gul_S1_summarysummarycalc_P33
+rm fifo/gul_S1_summarycalc_P33
+rm fifo/gul_S1_summarypltcalc_P33
+rm fifo/gul_S1_pltcalc_P33
+rm fifo/gul_S1_summaryaalcalc_P33
+
+rm fifo/gul_P34
+
+rm fifo/gul_S1_summary_P34
+rm fifo/gul_S1_summaryeltcalc_P34
+rm fifo/gul_S1_eltcalc_P34
+rm fifo/gul_S1_summarysummarycalc_P34
+rm fifo/gul_S1_summarycalc_P34
+rm fifo/gul_S1_summarypltcalc_P34
+rm fifo/gul_S1_pltcalc_P34
+rm fifo/gul_S1_summaryaalcalc_P34
+
+rm fifo/gul_P35
+
+rm fifo/gul_S1_summary_P35
+rm fifo/gul_S1_summaryeltcalc_P35
+rm fifo/gul_S1_eltcalc_P35
+rm fifo/gul_S1_summarysummarycalc_P35
+rm fifo/gul_S1_summarycalc_P35
+rm fifo/gul_S1_summarypltcalc_P35
+rm fifo/gul_S1_pltcalc_P35
+rm fifo/gul_S1_summaryaalcalc_P35
+
+rm fifo/gul_P36
+
+rm fifo/gul_S1_summary_P36
+rm fifo/gul_S1_summaryeltcalc_P36
+rm fifo/gul_S1_eltcalc_P36
+rm fifo/gul_S1_summarysummarycalc_P36
+rm fifo/gul_S1_summarycalc_P36
+rm fifo/gul_S1_summarypltcalc_P36
+rm fifo/gul_S1_pltcalc_P36
+rm fifo/gul_S1_summaryaalcalc_P36
+
+rm fifo/gul_P37
+
+rm fifo/gul_S1_summary_P37
+rm fifo/gul_S1_summaryeltcalc_P37
+rm fifo/gul_S1_eltcalc_P37
+rm fifo/gul_S1_summarysummarycalc_P37
+rm fifo/gul_S1_summarycalc_P37
+rm fifo/gul_S1_summarypltcalc_P37
+rm fifo/gul_S1_pltcalc_P37
+rm fifo/gul_S1_summaryaalcalc_P37
+
+rm fifo/gul_P38
+
+rm fifo/gul_S1_summary_P38
+rm fifo/gul_S1_summaryeltcalc_P38
+rm fifo/gul_S1_eltcalc_P38
+rm fifo/gul_S1_summarysummarycalc_P38
+rm fifo/gul_S1_summarycalc_P38
+rm fifo/gul_S1_summarypltcalc_P38
+rm fifo/gul_S1_pltcalc_P38
+rm fifo/gul_S1_summaryaalcalc_P38
+
+rm fifo/gul_P39
+
+rm fifo/gul_S1_summary_P39
+rm fifo/gul_S1_summaryeltcalc_P39
+rm fifo/gul_S1_eltcalc_P39
+rm fifo/gul_S1_summarysummarycalc_P39
+rm fifo/gul_S1_summarycalc_P39
+rm fifo/gul_S1_summarypltcalc_P39
+rm fifo/gul_S1_pltcalc_P39
+rm fifo/gul_S1_summaryaalcalc_P39
+
+rm fifo/gul_P40
+
+rm fifo/gul_S1_summary_P40
+rm fifo/gul_S1_summaryeltcalc_P40
+rm fifo/gul_S1_eltcalc_P40
+rm fifo/gul_S1_summarysummarycalc_P40
+rm fifo/gul_S1_summarycalc_P40
+rm fifo/gul_S1_summarypltcalc_P40
+rm fifo/gul_S1_pltcalc_P40
+rm fifo/gul_S1_summaryaalcalc_P40
+
+rm -rf work/kat
+rm work/gul_S1_summaryleccalc/*
+rmdir work/gul_S1_summaryleccalc
+rm work/gul_S1_aalcalc/*
+rmdir work/gul_S1_aalcalc
+
+rm fifo/il_P1
+
+rm fifo/il_S1_summary_P1
+rm fifo/il_S1_summaryeltcalc_P1
+rm fifo/il_S1_eltcalc_P1
+rm fifo/il_S1_summarysummarycalc_P1
+rm fifo/il_S1_summarycalc_P1
+rm fifo/il_S1_summarypltcalc_P1
+rm fifo/il_S1_pltcalc_P1
+rm fifo/il_S1_summaryaalcalc_P1
+
+rm fifo/il_P2
+
+rm fifo/il_S1_summary_P2
+rm fifo/il_S1_summaryeltcalc_P2
+rm fifo/il_S1_eltcalc_P2
+rm fifo/il_S1_summarysummarycalc_P2
+rm fifo/il_S1_summarycalc_P2
+rm fifo/il_S1_summarypltcalc_P2
+rm fifo/il_S1_pltcalc_P2
+rm fifo/il_S1_summaryaalcalc_P2
+
+rm fifo/il_P3
+
+rm fifo/il_S1_summary_P3
+rm fifo/il_S1_summaryeltcalc_P3
+rm fifo/il_S1_eltcalc_P3
+rm fifo/il_S1_summarysummarycalc_P3
+rm fifo/il_S1_summarycalc_P3
+rm fifo/il_S1_summarypltcalc_P3
+rm fifo/il_S1_pltcalc_P3
+rm fifo/il_S1_summaryaalcalc_P3
+
+rm fifo/il_P4
+
+rm fifo/il_S1_summary_P4
+rm fifo/il_S1_summaryeltcalc_P4
+rm fifo/il_S1_eltcalc_P4
+rm fifo/il_S1_summarysummarycalc_P4
+rm fifo/il_S1_summarycalc_P4
+rm fifo/il_S1_summarypltcalc_P4
+rm fifo/il_S1_pltcalc_P4
+rm fifo/il_S1_summaryaalcalc_P4
+
+rm fifo/il_P5
+
+rm fifo/il_S1_summary_P5
+rm fifo/il_S1_summaryeltcalc_P5
+rm fifo/il_S1_eltcalc_P5
+rm fifo/il_S1_summarysummarycalc_P5
+rm fifo/il_S1_summarycalc_P5
+rm fifo/il_S1_summarypltcalc_P5
+rm fifo/il_S1_pltcalc_P5
+rm fifo/il_S1_summaryaalcalc_P5
+
+rm fifo/il_P6
+
+rm fifo/il_S1_summary_P6
+rm fifo/il_S1_summaryeltcalc_P6
+rm fifo/il_S1_eltcalc_P6
+rm fifo/il_S1_summarysummarycalc_P6
+rm fifo/il_S1_summarycalc_P6
+rm fifo/il_S1_summarypltcalc_P6
+rm fifo/il_S1_pltcalc_P6
+rm fifo/il_S1_summaryaalcalc_P6
+
+rm fifo/il_P7
+
+rm fifo/il_S1_summary_P7
+rm fifo/il_S1_summaryeltcalc_P7
+rm fifo/il_S1_eltcalc_P7
+rm fifo/il_S1_summarysummarycalc_P7
+rm fifo/il_S1_summarycalc_P7
+rm fifo/il_S1_summarypltcalc_P7
+rm fifo/il_S1_pltcalc_P7
+rm fifo/il_S1_summaryaalcalc_P7
+
+rm fifo/il_P8
+
+rm fifo/il_S1_summary_P8
+rm fifo/il_S1_summaryeltcalc_P8
+rm fifo/il_S1_eltcalc_P8
+rm fifo/il_S1_summarysummarycalc_P8
+rm fifo/il_S1_summarycalc_P8
+rm fifo/il_S1_summarypltcalc_P8
+rm fifo/il_S1_pltcalc_P8
+rm fifo/il_S1_summaryaalcalc_P8
+
+rm fifo/il_P9
+
+rm fifo/il_S1_summary_P9
+rm fifo/il_S1_summaryeltcalc_P9
+rm fifo/il_S1_eltcalc_P9
+rm fifo/il_S1_summarysummarycalc_P9
+rm fifo/il_S1_summarycalc_P9
+rm fifo/il_S1_summarypltcalc_P9
+rm fifo/il_S1_pltcalc_P9
+rm fifo/il_S1_summaryaalcalc_P9
+
+rm fifo/il_P10
+
+rm fifo/il_S1_summary_P10
+rm fifo/il_S1_summaryeltcalc_P10
+rm fifo/il_S1_eltcalc_P10
+rm fifo/il_S1_summarysummarycalc_P10
+rm fifo/il_S1_summarycalc_P10
+rm fifo/il_S1_summarypltcalc_P10
+rm fifo/il_S1_pltcalc_P10
+rm fifo/il_S1_summaryaalcalc_P10
+
+rm fifo/il_P11
+
+rm fifo/il_S1_summary_P11
+rm fifo/il_S1_summaryeltcalc_P11
+rm fifo/il_S1_eltcalc_P11
+rm fifo/il_S1_summarysummarycalc_P11
+rm fifo/il_S1_summarycalc_P11
+rm fifo/il_S1_summarypltcalc_P11
+rm fifo/il_S1_pltcalc_P11
+rm fifo/il_S1_summaryaalcalc_P11
+
+rm fifo/il_P12
+
+rm fifo/il_S1_summary_P12
+rm fifo/il_S1_summaryeltcalc_P12
+rm fifo/il_S1_eltcalc_P12
+rm fifo/il_S1_summarysummarycalc_P12
+rm fifo/il_S1_summarycalc_P12
+rm fifo/il_S1_summarypltcalc_P12
+rm fifo/il_S1_pltcalc_P12
+rm fifo/il_S1_summaryaalcalc_P12
+
+rm fifo/il_P13
+
+rm fifo/il_S1_summary_P13
+rm fifo/il_S1_summaryeltcalc_P13
+rm fifo/il_S1_eltcalc_P13
+rm fifo/il_S1_summarysummarycalc_P13
+rm fifo/il_S1_summarycalc_P13
+rm fifo/il_S1_summarypltcalc_P13
+rm fifo/il_S1_pltcalc_P13
+rm fifo/il_S1_summaryaalcalc_P13
+
+rm fifo/il_P14
+
+rm fifo/il_S1_summary_P14
+rm fifo/il_S1_summaryeltcalc_P14
+rm fifo/il_S1_eltcalc_P14
+rm fifo/il_S1_summarysummarycalc_P14
+rm fifo/il_S1_summarycalc_P14
+rm fifo/il_S1_summarypltcalc_P14
+rm fifo/il_S1_pltcalc_P14
+rm fifo/il_S1_summaryaalcalc_P14
+
+rm fifo/il_P15
+
+rm fifo/il_S1_summary_P15
+rm fifo/il_S1_summaryeltcalc_P15
+rm fifo/il_S1_eltcalc_P15
+rm fifo/il_S1_summarysummarycalc_P15
+rm fifo/il_S1_summarycalc_P15
+rm fifo/il_S1_summarypltcalc_P15
+rm fifo/il_S1_pltcalc_P15
+rm fifo/il_S1_summaryaalcalc_P15
+
+rm fifo/il_P16
+
+rm fifo/il_S1_summary_P16
+rm fifo/il_S1_summaryeltcalc_P16
+rm fifo/il_S1_eltcalc_P16
+rm fifo/il_S1_summarysummarycalc_P16
+rm fifo/il_S1_summarycalc_P16
+rm fifo/il_S1_summarypltcalc_P16
+rm fifo/il_S1_pltcalc_P16
+rm fifo/il_S1_summaryaalcalc_P16
+
+rm fifo/il_P17
+
+rm fifo/il_S1_summary_P17
+rm fifo/il_S1_summaryeltcalc_P17
+rm fifo/il_S1_eltcalc_P17
+rm fifo/il_S1_summarysummarycalc_P17
+rm fifo/il_S1_summarycalc_P17
+rm fifo/il_S1_summarypltcalc_P17
+rm fifo/il_S1_pltcalc_P17
+rm fifo/il_S1_summaryaalcalc_P17
+
+rm fifo/il_P18
+
+rm fifo/il_S1_summary_P18
+rm fifo/il_S1_summaryeltcalc_P18
+rm fifo/il_S1_eltcalc_P18
+rm fifo/il_S1_summarysummarycalc_P18
+rm fifo/il_S1_summarycalc_P18
+rm fifo/il_S1_summarypltcalc_P18
+rm fifo/il_S1_pltcalc_P18
+rm fifo/il_S1_summaryaalcalc_P18
+
+rm fifo/il_P19
+
+rm fifo/il_S1_summary_P19
+rm fifo/il_S1_summaryeltcalc_P19
+rm fifo/il_S1_eltcalc_P19
+rm fifo/il_S1_summarysummarycalc_P19
+rm fifo/il_S1_summarycalc_P19
+rm fifo/il_S1_summarypltcalc_P19
+rm fifo/il_S1_pltcalc_P19
+rm fifo/il_S1_summaryaalcalc_P19
+
+rm fifo/il_P20
+
+rm fifo/il_S1_summary_P20
+rm fifo/il_S1_summaryeltcalc_P20
+rm fifo/il_S1_eltcalc_P20
+rm fifo/il_S1_summarysummarycalc_P20
+rm fifo/il_S1_summarycalc_P20
+rm fifo/il_S1_summarypltcalc_P20
+rm fifo/il_S1_pltcalc_P20
+rm fifo/il_S1_summaryaalcalc_P20
+
+rm fifo/il_P21
+
+rm fifo/il_S1_summary_P21
+rm fifo/il_S1_summaryeltcalc_P21
+rm fifo/il_S1_eltcalc_P21
+rm fifo/il_S1_summarysummarycalc_P21
+rm fifo/il_S1_summarycalc_P21
+rm fifo/il_S1_summarypltcalc_P21
+rm fifo/il_S1_pltcalc_P21
+rm fifo/il_S1_summaryaalcalc_P21
+
+rm fifo/il_P22
+
+rm fifo/il_S1_summary_P22
+rm fifo/il_S1_summaryeltcalc_P22
+rm fifo/il_S1_eltcalc_P22
+rm fifo/il_S1_summarysummarycalc_P22
+rm fifo/il_S1_summarycalc_P22
+rm fifo/il_S1_summarypltcalc_P22
+rm fifo/il_S1_pltcalc_P22
+rm fifo/il_S1_summaryaalcalc_P22
+
+rm fifo/il_P23
+
+rm fifo/il_S1_summary_P23
+rm fifo/il_S1_summaryeltcalc_P23
+rm fifo/il_S1_eltcalc_P23
+rm fifo/il_S1_summarysummarycalc_P23
+rm fifo/il_S1_summarycalc_P23
+rm fifo/il_S1_summarypltcalc_P23
+rm fifo/il_S1_pltcalc_P23
+rm fifo/il_S1_summaryaalcalc_P23
+
+rm fifo/il_P24
+
+rm fifo/il_S1_summary_P24
+rm fifo/il_S1_summaryeltcalc_P24
+rm fifo/il_S1_eltcalc_P24
+rm fifo/il_S1_summarysummarycalc_P24
+rm fifo/il_S1_summarycalc_P24
+rm fifo/il_S1_summarypltcalc_P24
+rm fifo/il_S1_pltcalc_P24
+rm fifo/il_S1_summaryaalcalc_P24
+
+rm fifo/il_P25
+
+rm fifo/il_S1_summary_P25
+rm fifo/il_S1_summaryeltcalc_P25
+rm fifo/il_S1_eltcalc_P25
+rm fifo/il_S1_summarysummarycalc_P25
+rm fifo/il_S1_summarycalc_P25
+rm fifo/il_S1_summarypltcalc_P25
+rm fifo/il_S1_pltcalc_P25
+rm fifo/il_S1_summaryaalcalc_P25
+
+rm fifo/il_P26
+
+rm fifo/il_S1_summary_P26
+rm fifo/il_S1_summaryeltcalc_P26
+rm fifo/il_S1_eltcalc_P26
+rm fifo/il_S1_summarysummarycalc_P26
+rm fifo/il_S1_summarycalc_P26
+rm fifo/il_S1_summarypltcalc_P26
+rm fifo/il_S1_pltcalc_P26
+rm fifo/il_S1_summaryaalcalc_P26
+
+rm fifo/il_P27
+
+rm fifo/il_S1_summary_P27
+rm fifo/il_S1_summaryeltcalc_P27
+rm fifo/il_S1_eltcalc_P27
+rm fifo/il_S1_summarysummarycalc_P27
+rm fifo/il_S1_summarycalc_P27
+rm fifo/il_S1_summarypltcalc_P27
+rm fifo/il_S1_pltcalc_P27
+rm fifo/il_S1_summaryaalcalc_P27
+
+rm fifo/il_P28
+
+rm fifo/il_S1_summary_P28
+rm fifo/il_S1_summaryeltcalc_P28
+rm fifo/il_S1_eltcalc_P28
+rm fifo/il_S1_summarysummarycalc_P28
+rm fifo/il_S1_summarycalc_P28
+rm fifo/il_S1_summarypltcalc_P28
+rm fifo/il_S1_pltcalc_P28
+rm fifo/il_S1_summaryaalcalc_P28
+
+rm fifo/il_P29
+
+rm fifo/il_S1_summary_P29
+rm fifo/il_S1_summaryeltcalc_P29
+rm fifo/il_S1_eltcalc_P29
+rm fifo/il_S1_summarysummarycalc_P29
+rm fifo/il_S1_summarycalc_P29
+rm fifo/il_S1_summarypltcalc_P29
+rm fifo/il_S1_pltcalc_P29
+rm fifo/il_S1_summaryaalcalc_P29
+
+rm fifo/il_P30
+
+rm fifo/il_S1_summary_P30
+rm fifo/il_S1_summaryeltcalc_P30
+rm fifo/il_S1_eltcalc_P30
+rm fifo/il_S1_summarysummarycalc_P30
+rm fifo/il_S1_summarycalc_P30
+rm fifo/il_S1_summarypltcalc_P30
+rm fifo/il_S1_pltcalc_P30
+rm fifo/il_S1_summaryaalcalc_P30
+
+rm fifo/il_P31
+
+rm fifo/il_S1_summary_P31
+rm fifo/il_S1_summaryeltcalc_P31
+rm fifo/il_S1_eltcalc_P31
+rm fifo/il_S1_summarysummarycalc_P31
+rm fifo/il_S1_summarycalc_P31
+rm fifo/il_S1_summarypltcalc_P31
+rm fifo/il_S1_pltcalc_P31
+rm fifo/il_S1_summaryaalcalc_P31
+
+rm fifo/il_P32
+
+rm fifo/il_S1_summary_P32
+rm fifo/il_S1_summaryeltcalc_P32
+rm fifo/il_S1_eltcalc_P32
+rm fifo/il_S1_summarysummarycalc_P32
+rm fifo/il_S1_summarycalc_P32
+rm fifo/il_S1_summarypltcalc_P32
+rm fifo/il_S1_pltcalc_P32
+rm fifo/il_S1_summaryaalcalc_P32
+
+rm fifo/il_P33
+
+rm fifo/il_S1_summary_P33
+rm fifo/il_S1_summaryeltcalc_P33
+rm fifo/il_S1_eltcalc_P33
+rm fifo/il_S1_summarysummarycalc_P33
+rm fifo/il_S1_summarycalc_P33
+rm fifo/il_S1_summarypltcalc_P33
+rm fifo/il_S1_pltcalc_P33
+rm fifo/il_S1_summaryaalcalc_P33
+
+rm fifo/il_P34
+
+rm fifo/il_S1_summary_P34
+rm fifo/il_S1_summaryeltcalc_P34
+rm fifo/il_S1_eltcalc_P34
+rm fifo/il_S1_summarysummarycalc_P34
+rm fifo/il_S1_summarycalc_P34
+rm fifo/il_S1_summarypltcalc_P34
+rm fifo/il_S1_pltcalc_P34
+rm fifo/il_S1_summaryaalcalc_P34
+
+rm fifo/il_P35
+
+rm fifo/il_S1_summary_P35
+rm fifo/il_S1_summaryeltcalc_P35
+rm fifo/il_S1_eltcalc_P35
+rm fifo/il_S1_summarysummarycalc_P35
+rm fifo/il_S1_summarycalc_P35
+rm fifo/il_S1_summarypltcalc_P35
+rm fifo/il_S1_pltcalc_P35
+rm fifo/il_S1_summaryaalcalc_P35
+
+rm fifo/il_P36
+
+rm fifo/il_S1_summary_P36
+rm fifo/il_S1_summaryeltcalc_P36
+rm fifo/il_S1_eltcalc_P36
+rm fifo/il_S1_summarysummarycalc_P36
+rm fifo/il_S1_summarycalc_P36
+rm fifo/il_S1_summarypltcalc_P36
+rm fifo/il_S1_pltcalc_P36
+rm fifo/il_S1_summaryaalcalc_P36
+
+rm fifo/il_P37
+
+rm fifo/il_S1_summary_P37
+rm fifo/il_S1_summaryeltcalc_P37
+rm fifo/il_S1_eltcalc_P37
+rm fifo/il_S1_summarysummarycalc_P37
+rm fifo/il_S1_summarycalc_P37
+rm fifo/il_S1_summarypltcalc_P37
+rm fifo/il_S1_pltcalc_P37
+rm fifo/il_S1_summaryaalcalc_P37
+
+rm fifo/il_P38
+
+rm fifo/il_S1_summary_P38
+rm fifo/il_S1_summaryeltcalc_P38
+rm fifo/il_S1_eltcalc_P38
+rm fifo/il_S1_summarysummarycalc_P38
+rm fifo/il_S1_summarycalc_P38
+rm fifo/il_S1_summarypltcalc_P38
+rm fifo/il_S1_pltcalc_P38
+rm fifo/il_S1_summaryaalcalc_P38
+
+rm fifo/il_P39
+
+rm fifo/il_S1_summary_P39
+rm fifo/il_S1_summaryeltcalc_P39
+rm fifo/il_S1_eltcalc_P39
+rm fifo/il_S1_summarysummarycalc_P39
+rm fifo/il_S1_summarycalc_P39
+rm fifo/il_S1_summarypltcalc_P39
+rm fifo/il_S1_pltcalc_P39
+rm fifo/il_S1_summaryaalcalc_P39
+
+rm fifo/il_P40
+
+rm fifo/il_S1_summary_P40
+rm fifo/il_S1_summaryeltcalc_P40
+rm fifo/il_S1_eltcalc_P40
+rm fifo/il_S1_summarysummarycalc_P40
+rm fifo/il_S1_summarycalc_P40
+rm fifo/il_S1_summarypltcalc_P40
+rm fifo/il_S1_pltcalc_P40
+rm fifo/il_S1_summaryaalcalc_P40
+
+rm -rf work/kat
+rm work/il_S1_summaryleccalc/*
+rmdir work/il_S1_summaryleccalc
+rm work/il_S1_aalcalc/*
+rmdir work/il_S1_aalcalc
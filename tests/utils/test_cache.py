@@ -0,0 +1,51 @@
+from __future__ import unicode_literals
+
+from unittest import TestCase
+
+from hypothesis import given
+from hypothesis.strategies import (
+    integers,
+    lists,
+)
+
+from oasislmf.utils.cache import LRUCache
+from oasislmf.utils.exceptions import OasisException
+
+
+class LRUCacheTest(TestCase):
+
+    def test_invalid_size___oasis_exception_is_raised(self):
+        with self.assertRaises(OasisException):
+            LRUCache(maxsize=0)
+
+    def test_items_are_put_and_got___hits_and_misses_are_counted(self):
+        cache = LRUCache(maxsize=2)
+
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('b', 'x'), 'x')
+
+        self.assertEqual(cache.info(), {'hits': 1, 'misses': 2, 'size': 1, 'maxsize': 2})
+
+    def test_cache_is_full___least_recently_used_item_is_evicted(self):
+        cache = LRUCache(maxsize=2)
+
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+
+    @given(maxsize=integers(min_value=1, max_value=10), keys=lists(integers(min_value=0, max_value=20), max_size=50))
+    def test_any_sequence_of_puts___size_never_exceeds_maximum(self, maxsize, keys):
+        cache = LRUCache(maxsize=maxsize)
+
+        for k in keys:
+            cache.put(k, k)
+            self.assertLessEqual(len(cache), maxsize)
+
+        self.assertEqual(len(cache), min(maxsize, len(set(keys))))
@@ -0,0 +1,355 @@
+from __future__ import unicode_literals
+
+import os
+
+from unittest import TestCase
+
+import numpy as np
+
+from backports.tempfile import TemporaryDirectory
+from hypothesis import (
+    given,
+    HealthCheck,
+    settings,
+)
+from hypothesis.strategies import (
+    booleans,
+    floats,
+    integers,
+    lists,
+    sampled_from,
+    tuples,
+)
+
+from oasislmf.utils.exceptions import OasisException
+from oasislmf.utils.peril import (
+    DEFAULT_RTREE_INDEX_PROPS,
+    get_hilbert_keys,
+    get_peril_area_index_entries,
+    PerilArea,
+    PerilAreasGridIndex,
+    PerilAreasIndex,
+    PerilAreasPayloadStore,
+)
+
+
+class GetHilbertKeys(TestCase):
+
+    @given(order=integers(min_value=1, max_value=5))
+    def test_grid_cell_centres___keys_are_a_permutation_and_consecutive_cells_are_adjacent(self, order):
+        n = 2 ** order
+        i, j = np.meshgrid(np.arange(n), np.arange(n))
+        i, j = i.ravel(), j.ravel()
+
+        keys = get_hilbert_keys((i + 0.5) / n, (j + 0.5) / n, (0, 0, 1, 1), order=order)
+
+        self.assertEqual(sorted(keys.tolist()), list(range(n * n)))
+        order_idxs = np.argsort(keys)
+        steps = np.abs(np.diff(i[order_idxs])) + np.abs(np.diff(j[order_idxs]))
+        self.assertTrue((steps == 1).all())
+
+    def test_points_outside_bounds_or_null___keys_are_those_of_nearest_cells_or_last(self):
+        keys = get_hilbert_keys([-5, 0.1, 5, np.nan, 0.1], [-5, 0.1, 0.1, 0.1, np.nan], (0, 0, 1, 1), order=2)
+
+        self.assertEqual(keys[0], keys[1])
+        self.assertEqual(keys[2], get_hilbert_keys([0.9], [0.1], (0, 0, 1, 1), order=2)[0])
+        self.assertEqual(keys[3:].tolist(), [16, 16])
+
+
+class PerilAreasGridIndexCellIds(TestCase):
+
+    def test_invalid_grid_definition___oasis_exception_is_raised(self):
+        with self.assertRaises(OasisException):
+            PerilAreasGridIndex(x0=0, y0=0, dx=0, dy=1, nx=2, ny=2)
+
+        with self.assertRaises(OasisException):
+            PerilAreasGridIndex(x0=0, y0=0, dx=1, dy=1, nx=None, ny=2)
+
+    @settings(deadline=None)
+    @given(
+        nx=integers(min_value=1, max_value=10),
+        ny=integers(min_value=1, max_value=10),
+        row_major=booleans(),
+        points=lists(tuples(floats(min_value=-1, max_value=12), floats(min_value=-1, max_value=12)), min_size=1, max_size=20)
+    )
+    def test_points_are_given___ids_are_those_of_the_cells_containing_the_points(self, nx, ny, row_major, points):
+        index = PerilAreasGridIndex(x0=0, y0=0, dx=1, dy=1, nx=nx, ny=ny, area_peril_id_start=5, row_major=row_major)
+
+        xs, ys = zip(*points)
+        ids = index.cell_ids(xs, ys)
+
+        for (x, y), paid in zip(points, ids.tolist()):
+            if not (0 <= x <= nx and 0 <= y <= ny):
+                self.assertEqual(paid, -1)
+                continue
+            # Points on shared cell edges are in the left and lower cell
+            col, row = min(max(int(np.ceil(x)) - 1, 0), nx - 1), min(max(int(np.ceil(y)) - 1, 0), ny - 1)
+            self.assertEqual(paid, 5 + (row * nx + col if row_major else col * ny + row))
+            minx, miny, maxx, maxy = index.cell_bounds([paid])[0]
+            self.assertTrue(minx <= x <= maxx and miny <= y <= maxy)
+
+    def test_points_on_shared_cell_edges___ids_are_the_lowest_of_the_cells_sharing_the_edges(self):
+        for row_major in (True, False):
+            self._check_cell_edges(PerilAreasGridIndex(x0=-0.3, y0=0.1, dx=0.1, dy=0.2, nx=5, ny=4, peril_ids=(1,), coverage_types=(1,), row_major=row_major))
+
+    def _check_cell_edges(self, index):
+        for col in range(5):
+            for row in range(4):
+                minx, miny, maxx, maxy = index.cell_bounds(index.cell_ids([-0.3 + (col + 0.5) * 0.1], [0.1 + (row + 0.5) * 0.2]))[0]
+                for x, y in ((minx, miny), (minx, maxy), (maxx, miny), (maxx, maxy)):
+                    expected = min(
+                        paid for paid in range(1, 21)
+                        for _minx, _miny, _maxx, _maxy in index.cell_bounds([paid])
+                        if _minx <= x <= _maxx and _miny <= y <= _maxy
+                    )
+                    self.assertEqual(index.cell_ids([x], [y]).tolist(), [expected])
+
+        minx, miny, maxx, maxy = box = index.cell_bounds(index.cell_ids([0.05], [0.3]))[0]
+        self.assertEqual(sorted(set(index.intersection(box))), sorted(
+            paid for paid in range(1, 21)
+            for _minx, _miny, _maxx, _maxy in index.cell_bounds([paid])
+            if _minx <= maxx and _maxx >= minx and _miny <= maxy and _maxy >= miny
+        ))
+
+    def test_null_coords___id_is_minus_one(self):
+        index = PerilAreasGridIndex(x0=0, y0=0, dx=1, dy=1, nx=2, ny=2)
+
+        self.assertEqual(index.cell_ids([np.nan, 0.5], [0.5, np.nan]).tolist(), [-1, -1])
+
+
+class PerilAreasGridIndexQueries(TestCase):
+
+    def setUp(self):
+        self.index = PerilAreasGridIndex(x0=0, y0=0, dx=1, dy=1, nx=3, ny=2, peril_ids=(1,), coverage_types=(1, 3))
+
+    def test_point_intersection___entries_are_returned_for_each_pair(self):
+        entries = list(self.index.intersection((1.5, 0.5), objects='raw'))
+
+        coords = ((1.0, 0.0), (1.0, 1.0), (2.0, 1.0), (2.0, 0.0), (1.0, 0.0))
+        self.assertEqual(entries, [(1, 1, 2, (1.0, 0.0, 2.0, 1.0), coords), (1, 3, 2, (1.0, 0.0, 2.0, 1.0), coords)])
+
+    def test_box_intersection___ids_of_overlapped_cells_are_returned(self):
+        self.assertEqual(sorted(set(self.index.intersection((0.5, 0.5, 1.5, 1.5)))), [1, 2, 4, 5])
+        self.assertEqual(list(self.index.intersection((5, 5, 6, 6))), [])
+        self.assertEqual(len(self.index.get_areas_table()), 12)
+
+    def test_point_outside_grid___nearest_is_the_nearest_boundary_cell(self):
+        self.assertEqual(list(self.index.nearest((10, 10))), [6, 6])
+        self.assertEqual(list(self.index.nearest((-1, 0.5))), [1, 1])
+
+    def test_bulk_intersection___ids_are_repeated_for_each_pair(self):
+        ids, counts = self.index.bulk_intersection([0.5, 10, 2.5], [0.5, 10, 1.5])
+
+        self.assertEqual(ids.tolist(), [1, 1, 6, 6])
+        self.assertEqual(counts.tolist(), [2, 0, 2])
+
+
+class PerilAreasIndexSave(TestCase):
+
+    def peril_areas(self, n):
+        return [
+            PerilArea(((i, j), (i, j + 1), (i + 1, j + 1), (i + 1, j)), peril_id=1, coverage_type=1, peril_area_id=i * n + j + 1)
+            for i in range(n) for j in range(n)
+        ]
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow], max_examples=20)
+    @given(
+        n=integers(min_value=1, max_value=20),
+        points=lists(tuples(floats(min_value=-1, max_value=21), floats(min_value=-1, max_value=21)), min_size=1, max_size=20)
+    )
+    def test_index_is_bulk_loaded___queries_and_entries_match_index_built_by_insertion(self, n, points):
+        with TemporaryDirectory() as d:
+            bulk_index = PerilAreasIndex(
+                fp=PerilAreasIndex().save(os.path.join(d, 'bulk'), peril_areas=self.peril_areas(n), index_props=dict(DEFAULT_RTREE_INDEX_PROPS))
+            )
+            index = PerilAreasIndex(
+                fp=PerilAreasIndex().save(os.path.join(d, 'insert'), peril_areas=self.peril_areas(n), index_props=dict(DEFAULT_RTREE_INDEX_PROPS), bulk_load=False)
+            )
+
+            for x, y in points:
+                self.assertEqual(
+                    sorted(bulk_index.intersection((x, y), objects='raw')),
+                    sorted(index.intersection((x, y), objects='raw'))
+                )
+
+            table = bulk_index.get_areas_table().sort_values('peril_area_id').reset_index(drop=True)
+            expected = index.get_areas_table().sort_values('peril_area_id').reset_index(drop=True)
+            self.assertTrue(table.equals(expected))
+
+    def test_no_peril_areas___oasis_exception_is_raised(self):
+        with TemporaryDirectory() as d:
+            with self.assertRaises(OasisException):
+                PerilAreasIndex().save(os.path.join(d, 'index'), peril_areas=(pa for pa in []))
+
+
+class GetPerilAreaIndexEntries(TestCase):
+
+    def peril_area_entries(self, xs, ys, paids, r=0.0016):
+        entries = []
+        for i, paid in enumerate(paids):
+            pa = PerilArea(tuple(zip(xs[i], ys[i])), peril_id=1, coverage_type=3, peril_area_id=paid, area_reg_poly_radius=r)
+            entries.append((pa.id, pa.bounds, (pa.peril_id, pa.coverage_type, pa.id, pa.bounds, pa.coordinates)))
+        return entries
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        k=integers(min_value=3, max_value=6),
+        areas=lists(tuples(integers(min_value=0, max_value=10), integers(min_value=0, max_value=10), integers(min_value=1, max_value=5), integers(min_value=1, max_value=5)), min_size=1, max_size=10),
+        rects=lists(booleans(), min_size=10, max_size=10),
+        workers=sampled_from([None, 2])
+    )
+    def test_areas_given_by_points___entries_match_peril_area_entries(self, k, areas, rects, workers):
+        xs, ys = [], []
+        for (x, y, w, h), rect in zip(areas, rects):
+            if rect:
+                pts = [(x, y), (x + w, y + h), (x, y + h), (x + w, y)] + [(x + w / 2.0, y)] * (k - 4)
+            else:
+                pts = [(x, y), (x + w, y), (x + w / 2.0, y + h)] + [(x + w / 3.0, y + h / 3.0)] * (k - 3)
+            pts = (pts + [(x, y)] * k)[:k]
+            xs.append([p[0] for p in pts])
+            ys.append([p[1] for p in pts])
+
+        paids = list(range(1, len(xs) + 1))
+
+        entries = list(get_peril_area_index_entries([1] * len(xs), [3] * len(xs), paids, xs, ys, workers=workers))
+
+        self.assertEqual(entries, self.peril_area_entries(xs, ys, paids))
+
+    def test_areas_given_by_one_or_two_points___entries_match_peril_area_entries(self):
+        for xs, ys in (([[0.5], [2.0]], [[0.5], [-1.0]]), ([[0, 2], [3, 1]], [[0, 1], [2, 0]])):
+            entries = list(get_peril_area_index_entries([1, 1], [3, 3], [1, 2], xs, ys, area_reg_poly_radius=0.1))
+
+            self.assertEqual(entries, self.peril_area_entries(xs, ys, [1, 2], r=0.1))
+
+    def test_no_peril_area_ids___random_ids_are_generated(self):
+        entries = list(get_peril_area_index_entries([1, 1], [3, 3], [None, 0], [[0, 1], [1, 2]], [[0, 1], [1, 2]]))
+
+        self.assertTrue(all(paid and obj[2] == paid for paid, _, obj in entries))
+
+
+class PerilAreasIndexPayloadStore(TestCase):
+
+    def peril_areas(self, n, paid_offset=0):
+        return [
+            PerilArea(((i, 0), (i, 1), (i + 1, 1), (i + 0.5, 0)), peril_id=1, coverage_type=cov, peril_area_id=paid_offset + i + 1)
+            for cov in (1, 3) for i in range(n)
+        ]
+
+    def test_index_saved_with_payload_store___raw_entries_and_areas_table_match_index_with_pickled_payloads(self):
+        with TemporaryDirectory() as d:
+            index = PerilAreasIndex(fp=PerilAreasIndex().save(os.path.join(d, 'index'), peril_areas=self.peril_areas(10)))
+            payload_index = PerilAreasIndex(
+                fp=PerilAreasIndex().save(os.path.join(d, 'payload_index'), peril_areas=self.peril_areas(10), payload_store=True)
+            )
+
+            self.assertIsNone(index.payload_store)
+            self.assertEqual(len(payload_index.payload_store), 20)
+
+            for point in ((0.5, 0.5), (3, 0.5), (20, 20)):
+                self.assertEqual(
+                    sorted(payload_index.intersection(point, objects='raw')),
+                    sorted(index.intersection(point, objects='raw'))
+                )
+                self.assertEqual(
+                    sorted(payload_index.nearest(point, objects='raw')),
+                    sorted(index.nearest(point, objects='raw'))
+                )
+
+            cols = ['peril_id', 'coverage_type', 'peril_area_id', 'minx', 'miny', 'maxx', 'maxy', 'bounds', 'coordinates']
+            table = payload_index.get_areas_table()[cols].sort_values(['coverage_type', 'peril_area_id']).reset_index(drop=True)
+            expected = index.get_areas_table()[cols].sort_values(['coverage_type', 'peril_area_id']).reset_index(drop=True)
+            self.assertTrue(table.equals(expected))
+
+            self.assertNotIn('coordinates', payload_index.get_areas_table(objects=False).columns)
+
+    def test_payload_store_is_saved___arrays_are_memory_mapped_on_loading(self):
+        with TemporaryDirectory() as d:
+            payloads = [(1, 1, 5, (0.0, 0.0, 1.0, 1.0), ((0.0, 0.0), (1.0, 1.0), (1.0, 0.0), (0.0, 0.0))), (1, 3, 6, (2.0, 2.0, 2.5, 3.0), ((2.0, 2.0), (2.5, 3.0), (2.0, 2.0)))]
+            store = PerilAreasPayloadStore.save(os.path.join(d, 'payload'), payloads)
+
+            self.assertIsInstance(store['bounds'], np.memmap)
+            self.assertEqual(store.get_payloads([1, 0]), payloads[::-1])
+
+    def test_index_is_saved_over_existing_index___index_only_has_new_entries(self):
+        with TemporaryDirectory() as d:
+            for payload_store, bulk_load in ((False, True), (False, False), (True, True)):
+                index_fp = os.path.join(d, 'index')
+                PerilAreasIndex().save(index_fp, peril_areas=self.peril_areas(5), payload_store=not payload_store)
+                PerilAreasIndex().save(index_fp, peril_areas=self.peril_areas(5, paid_offset=100), payload_store=payload_store, bulk_load=bulk_load)
+
+                index = PerilAreasIndex(fp=index_fp)
+
+                self.assertEqual(index.payload_store is not None, payload_store)
+                self.assertEqual(sorted(set(e[2] for e in index.intersection(index.bounds, objects='raw'))), list(range(101, 106)))
+
+
+class PerilAreasIndexInMemory(TestCase):
+
+    def peril_areas(self, n):
+        return [
+            PerilArea(((i, 0), (i, 1), (i + 1, 1), (i + 0.5, 0)), peril_id=1, coverage_type=cov, peril_area_id=i + 1)
+            for cov in (1, 3) for i in range(n)
+        ]
+
+    def test_file_index_is_loaded_in_memory___query_results_match_file_index_and_load_stats_are_set(self):
+        with TemporaryDirectory() as d:
+            for payload_store in (False, True):
+                index_fp = PerilAreasIndex().save(os.path.join(d, 'index'), peril_areas=self.peril_areas(10), payload_store=payload_store)
+
+                index = PerilAreasIndex(fp=index_fp)
+                mem_index = PerilAreasIndex(fp=index_fp, in_memory=True)
+
+                self.assertIsNone(index.load_stats)
+                self.assertEqual(mem_index.load_stats['entries'], 20)
+                self.assertGreater(mem_index.load_stats['file_size'], 0)
+                self.assertGreaterEqual(mem_index.load_stats['time'], 0)
+                self.assertEqual(mem_index.properties.storage, 0)
+                self.assertEqual(list(mem_index.bounds), list(index.bounds))
+                if payload_store:
+                    self.assertNotIsInstance(mem_index.payload_store['bounds'], np.memmap)
+
+                for point in ((0.5, 0.5), (3, 0.5), (20, 20)):
+                    self.assertEqual(
+                        sorted(mem_index.intersection(point, objects='raw')),
+                        sorted(index.intersection(point, objects='raw'))
+                    )
+                    self.assertEqual(
+                        sorted(mem_index.nearest(point, objects='raw')),
+                        sorted(index.nearest(point, objects='raw'))
+                    )
+
+                index.close()
+                mem_index.close()
+
+
+class PerilAreasIndexSubIndex(TestCase):
+
+    def peril_areas(self, n):
+        return [
+            PerilArea(((i, 0), (i, 1), (i + 1, 1), (i + 0.5, 0)), peril_id=1, coverage_type=cov, peril_area_id=i + 1)
+            for cov in (1, 3) for i in range(n)
+        ]
+
+    def test_sub_index_for_boxes___entries_are_those_intersecting_the_boxes(self):
+        with TemporaryDirectory() as d:
+            for payload_store in (False, True):
+                index = PerilAreasIndex(
+                    fp=PerilAreasIndex().save(os.path.join(d, 'index'), peril_areas=self.peril_areas(10), payload_store=payload_store)
+                )
+                boxes = [(2.2, 0.2, 2.4, 0.4), (7.5, 0.5, 8.5, 0.5)]
+
+                sub_index = index.get_sub_index(boxes)
+
+                self.assertEqual(sub_index.num_entries, 6)
+                self.assertIs(sub_index.payload_store, index.payload_store)
+                self.assertEqual(
+                    sorted(e[:3] for e in sub_index.intersection(sub_index.bounds, objects='raw')),
+                    sorted(set(e[:3] for b in boxes for e in index.intersection(b, objects='raw')))
+                )
+                self.assertEqual(
+                    sorted(sub_index.intersection((2.3, 0.3), objects='raw')),
+                    sorted(index.intersection((2.3, 0.3), objects='raw'))
+                )
+                self.assertEqual(list(index.get_sub_index([(20, 20, 21, 21)]).intersection((2.5, 0.5))), [])
+
+                index.close()
@@ -0,0 +1,71 @@
+from __future__ import unicode_literals
+
+import io
+import json
+import os
+
+from unittest import TestCase
+
+from backports.tempfile import TemporaryDirectory
+from hypothesis import given
+from hypothesis.strategies import (
+    lists,
+    sampled_from,
+)
+
+from oasislmf.utils.stats import LookupStats
+
+
+class LookupStatsTest(TestCase):
+
+    def test_phases_are_timed___times_and_calls_are_cumulative(self):
+        stats = LookupStats()
+
+        for _ in range(3):
+            with stats.timer('phase'):
+                pass
+
+        self.assertEqual(stats.calls['phase'], 3)
+        self.assertGreaterEqual(stats.timings['phase'], 0)
+
+    @given(values=lists(sampled_from(['success', 'fail', 'nomatch']), max_size=20))
+    def test_values_are_added_to_histogram___counts_match_individually_counted_values(self, values):
+        stats = LookupStats()
+        expected = LookupStats()
+
+        stats.add_to_histogram('statuses', values)
+        for v in values:
+            expected.count_value('statuses', v)
+
+        self.assertEqual(dict(stats.histograms.get('statuses', {})), dict(expected.histograms.get('statuses', {})))
+
+    def test_records_are_merged___timings_counters_and_histograms_are_added(self):
+        stats1 = LookupStats()
+        stats1.add_time('phase', 1.0)
+        stats1.incr('queries', 2)
+        stats1.add_to_histogram('candidates', [0, 1, 1])
+
+        stats2 = LookupStats()
+        stats2.add_time('phase', 2.0, calls=2)
+        stats2.incr('queries', 3)
+        stats2.add_to_histogram('candidates', [1, 2])
+
+        stats1.merge(stats2.as_dict())
+
+        self.assertEqual(stats1.timings['phase'], 3.0)
+        self.assertEqual(stats1.calls['phase'], 3)
+        self.assertEqual(stats1.counters['queries'], 5)
+        self.assertEqual(dict(stats1.histograms['candidates']), {0: 1, 1: 3, 2: 1})
+
+    def test_record_is_dumped___file_contains_record_as_json(self):
+        stats = LookupStats()
+        stats.incr('results', 10)
+        stats.count_value('statuses', 'success')
+
+        with TemporaryDirectory() as d:
+            fp = stats.dump(os.path.join(d, 'stats.json'))
+            with io.open(fp, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+        self.assertEqual(data['counters'], {'results': 10})
+        self.assertEqual(data['histograms'], {'statuses': {'success': 1}})
@@ -0,0 +1,113 @@
+from __future__ import unicode_literals
+
+import os
+
+from unittest import TestCase
+
+import numpy as np
+
+from backports.tempfile import TemporaryDirectory
+from hypothesis import (
+    given,
+    HealthCheck,
+    settings,
+)
+from hypothesis.strategies import (
+    integers,
+    lists,
+    one_of,
+    sampled_from,
+    text,
+    tuples,
+)
+
+from oasislmf.utils.exceptions import OasisException
+from oasislmf.utils.vulnerability import VulnerabilityTable
+
+
+keys = tuples(integers(min_value=0, max_value=5), sampled_from(['a', 'b', 'c']), integers(min_value=-3, max_value=3))
+
+
+class VulnerabilityTableTest(TestCase):
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    @given(
+        vulns=lists(tuples(keys, integers(min_value=1, max_value=1000)), max_size=30),
+        queries=lists(one_of(keys, tuples(text(max_size=1), sampled_from(['a', 'd']), integers(min_value=0, max_value=1))), max_size=30)
+    )
+    def test_scalar_and_batch_lookups___results_match_dict_lookups(self, vulns, queries):
+        expected = {k: v for k, v in vulns}
+
+        table = VulnerabilityTable(
+            ('x', 'y', 'z'),
+            [np.array([k[i] for k, _ in vulns], dtype=(object if i == 1 else np.int64)) for i in range(3)],
+            [v for _, v in vulns],
+            numeric_cols=('x', 'z')
+        )
+
+        self.assertEqual(len(table), len(expected))
+
+        for q in queries:
+            self.assertEqual(table.get(q), expected.get(q))
+            self.assertEqual(q in table, q in expected)
+
+        ids, found = table.lookup(*[np.array([q[i] for q in queries], dtype=object) for i in range(3)])
+        self.assertEqual(found.tolist(), [q in expected for q in queries])
+        self.assertEqual(ids[found].tolist(), [expected[q] for q in queries if q in expected])
+
+    def test_missing_key___get_returns_default_and_getitem_raises_key_error(self):
+        table = VulnerabilityTable(('x',), [[1, 2]], [10, 20])
+
+        self.assertEqual(table[2], 20)
+        self.assertEqual(table[2.0], 20)
+        self.assertEqual(table.get(3, -1), -1)
+        with self.assertRaises(KeyError):
+            table[3]
+
+    def test_too_many_possible_keys_for_int64_packing___structured_keys_are_used(self):
+        n = 3000
+        table = VulnerabilityTable(
+            ('a', 'b', 'c', 'd', 'e', 'f'),
+            [np.arange(n) + i for i in range(6)],
+            np.arange(n)
+        )
+
+        self.assertIsNotNone(table._keys.dtype.names)
+        self.assertEqual(table[tuple(10 + i for i in range(6))], 10)
+        self.assertIsNone(table.get(tuple(10 for i in range(6))))
+
+    @given(vulns=lists(tuples(keys, integers(min_value=1, max_value=1000)), min_size=1, max_size=30))
+    def test_save_and_load___loaded_table_matches_saved_table(self, vulns):
+        table = VulnerabilityTable(
+            ('x', 'y', 'z'),
+            [np.array([k[i] for k, _ in vulns], dtype=(object if i == 1 else np.int64)) for i in range(3)],
+            [v for _, v in vulns]
+        )
+
+        with TemporaryDirectory() as d:
+            fp = table.save(os.path.join(d, 'vulnerabilities.npy'))
+            loaded = VulnerabilityTable.load(fp, key_cols=('x', 'y', 'z'))
+
+            self.assertEqual(loaded.numeric_cols, ('x', 'z'))
+            self.assertEqual(loaded.to_frame().values.tolist(), table.to_frame().values.tolist())
+
+            with self.assertRaises(OasisException):
+                VulnerabilityTable.load(fp, key_cols=('x', 'y'))
+
+    def test_save_and_load_with_metadata___metadata_must_match(self):
+        table = VulnerabilityTable(('x',), [np.array([1, 2, 3])], [10, 20, 30])
+        metadata = {'file_path': '/tmp/vulnerabilities.csv', 'file_size': 100, 'config': {'key_cols': ('x',)}}
+
+        with TemporaryDirectory() as d:
+            fp = table.save(os.path.join(d, 'vulnerabilities.cache'), metadata=metadata)
+
+            self.assertEqual(os.listdir(d), ['vulnerabilities.cache'])
+            self.assertEqual(VulnerabilityTable.load(fp, key_cols=('x',), metadata=metadata).to_frame().values.tolist(), table.to_frame().values.tolist())
+            self.assertEqual(len(VulnerabilityTable.load(fp)), 3)
+
+            with self.assertRaises(OasisException):
+                VulnerabilityTable.load(fp, metadata=dict(metadata, file_size=101))
+
+            npy_fp = table.save(os.path.join(d, 'vulnerabilities.npy'))
+            with self.assertRaises(OasisException):
+                VulnerabilityTable.load(npy_fp, metadata=metadata)